@@ -18,28 +18,18 @@ from utils.version import APP_VERSION
 
 DependenciesChecker.check_and_configure_imagemagick()  # This function must be called before any other operations that require ImageMagick (DO NOT MOVE THIS IMPORT LINE)
 from utils.app_config import AppConfig  # noqa: E402
-from utils.update_checker import UpdateChecker  # noqa: E402
+from utils.persistence import OverrideStore  # noqa: E402
 from utils.settings_manager import SettingsManager  # noqa: E402
 from utils.translation_manager import (  # noqa: E402
     get_translation_manager,
     tr as translate,
 )
-from utils.FNF.character_data import CharacterData  # noqa: E402
-from core.extractor import Extractor  # noqa: E402
 from gui.app_ui import Ui_TextureAtlasToolboxApp  # noqa: E402
-from gui.app_config_window import AppConfigWindow  # noqa: E402
-from gui.settings_window import SettingsWindow  # noqa: E402
-from gui.extractor.find_replace_window import FindReplaceWindow  # noqa: E402
-from gui.help_window import HelpWindow  # noqa: E402
-from gui.contributors_window import ContributorsWindow  # noqa: E402
-from gui.extractor.processing_window import ProcessingWindow  # noqa: E402
-from gui.extractor.compression_settings_window import (  # noqa: E402
-    CompressionSettingsWindow,
-)
-from gui.machine_translation_disclaimer_dialog import (  # noqa: E402
-    MachineTranslationDisclaimerDialog,
-)
-from gui.first_start_dialog import show_first_start_dialog  # noqa: E402
+
+# Only the shell window and the extract tab load at startup. The extractor
+# core, the other tabs, dialogs, the update checker and Wand (pulled in by the
+# animation exporter) are imported where they are first used, which keeps
+# cold start short.
 
 
 class ExtractorWorker(QThread):
@@ -92,6 +82,26 @@ class ExtractorWorker(QThread):
         )
 
 
+class FnfModImportWorker(QThread):
+    """Worker thread that indexes and parses the character files of a mod."""
+
+    import_completed = Signal(object)  # ModImportResult
+    import_failed = Signal(str)
+
+    def __init__(self, mod_directory):
+        super().__init__()
+        self.mod_directory = mod_directory
+
+    def run(self):
+        from utils.FNF.mod_importer import collect_mod_characters
+
+        try:
+            self.import_completed.emit(collect_mod_characters(self.mod_directory))
+        except Exception as e:
+            print(f"[FnfModImportWorker] Import failed: {str(e)}")
+            self.import_failed.emit(str(e))
+
+
 class TextureAtlasExtractorApp(QMainWindow):
     """
     A Qt/PySide6 GUI application for extracting textures from a texture atlas and converting them to GIF, WebP, and APNG formats.
@@ -109,7 +119,14 @@ class TextureAtlasExtractorApp(QMainWindow):
         # Initialize core attributes
         self.current_version = APP_VERSION
         self.app_config = AppConfig()
-        self.settings_manager = SettingsManager()
+        self.settings_manager = SettingsManager(
+            store=OverrideStore(self.app_config.get_overrides_store_path())
+        )
+        from core.extractor.metadata_cache import get_metadata_cache
+
+        metadata_cache = get_metadata_cache()
+        metadata_cache.cache_dir = self.app_config.get_metadata_cache_dir()
+        metadata_cache.prune_disk()
         self.temp_dir = tempfile.mkdtemp()
         self.manual_selection_temp_dir = (
             None  # For storing temp directory used in manual file selection
@@ -121,7 +138,7 @@ class TextureAtlasExtractorApp(QMainWindow):
         effective_language = self.app_config.get_effective_language()
         self.translation_manager.load_translation(effective_language)
 
-        self.fnf_character_data = CharacterData()
+        self._fnf_character_data = None
         self.fnf_char_json_directory = ""
         self.replace_rules = []
         self.linkSourceCode = (
@@ -149,8 +166,7 @@ class TextureAtlasExtractorApp(QMainWindow):
         self.setup_advanced_menu()
         self.setup_gui()
         self.setup_extract_tab()
-        self.setup_generate_tab()
-        self.setup_editor_tab()
+        self._editor_tab_index = self.ui.tools_tab.indexOf(self.ui.tool_editor)
         self.setup_connections()
         self.ui.retranslateUi(self)
 
@@ -163,10 +179,21 @@ class TextureAtlasExtractorApp(QMainWindow):
         self._on_tools_tab_changed(self.ui.tools_tab.currentIndex())
 
         # Show first-start dialog for new users
+        from gui.first_start_dialog import show_first_start_dialog
+
         show_first_start_dialog(self, self.translation_manager, self.app_config)
 
         QTimer.singleShot(250, self.check_version)
 
+    @property
+    def fnf_character_data(self):
+        """FNF character data helper, created on first use."""
+        if self._fnf_character_data is None:
+            from utils.FNF.character_data import CharacterData
+
+            self._fnf_character_data = CharacterData()
+        return self._fnf_character_data
+
     def setup_advanced_menu(self):
         """Set up the advanced menu with variable delay and FNF options."""
         # Create variable delay action
@@ -200,8 +227,21 @@ class TextureAtlasExtractorApp(QMainWindow):
         self.ui.options_menu.addSeparator()
         self.ui.options_menu.addAction(self.language_action)
 
+        # Add bulk FNF mod import next to the single-file import
+        self.fnf_import_mod_action = QAction(
+            self.tr("FNF: Import settings from mod folder..."), self, checkable=False
+        )
+        self.fnf_import_mod_action.setStatusTip(
+            self.tr("Import animation settings for every character in a mod folder")
+        )
+        self.fnf_import_mod_action.triggered.connect(self.fnf_import_mod_folder)
+        self.ui.import_menu.addAction(self.fnf_import_mod_action)
+
     def setup_generate_tab(self):
-        """Set up the Generate tab with proper functionality."""
+        """Set up the Generate tab with proper functionality.
+
+        Called the first time the tab is shown.
+        """
         from gui.generate_tab_widget import GenerateTabWidget
 
         # Remove old label if it exists
@@ -214,7 +254,11 @@ class TextureAtlasExtractorApp(QMainWindow):
         print("Generate tab setup completed successfully")
 
     def setup_editor_tab(self):
-        """Add the editor tab for manual alignment workflows."""
+        """Add the editor tab for manual alignment workflows.
+
+        Called the first time the tab is shown or an animation is sent to
+        the editor.
+        """
         from gui.editor_tab_widget import EditorTabWidget
 
         use_existing_ui = (
@@ -347,7 +391,24 @@ class TextureAtlasExtractorApp(QMainWindow):
                 format_index = 3  # Default to PNG
             self.ui.frame_format_combobox.setCurrentIndex(format_index)
 
+    def ensure_generate_tab(self):
+        """Return the Generate tab widget, setting it up on first use."""
+        if getattr(self, "generate_tab_widget", None) is None:
+            self.setup_generate_tab()
+        return self.generate_tab_widget
+
+    def ensure_editor_tab(self):
+        """Return the editor tab widget, setting it up on first use."""
+        if getattr(self, "editor_tab_widget", None) is None:
+            self.setup_editor_tab()
+        return self.editor_tab_widget
+
     def _on_tools_tab_changed(self, index: int):
+        page = self.ui.tools_tab.widget(index)
+        if page is getattr(self.ui, "tool_generate", None):
+            self.ensure_generate_tab()
+        elif page is getattr(self.ui, "tool_editor", None):
+            self.ensure_editor_tab()
         editor_active = hasattr(self, "_editor_tab_index") and index == getattr(
             self, "_editor_tab_index", -1
         )
@@ -432,6 +493,8 @@ class TextureAtlasExtractorApp(QMainWindow):
     def create_app_config_window(self):
         """Creates the preferences/app config window."""
         try:
+            from gui.app_config_window import AppConfigWindow
+
             dialog = AppConfigWindow(self, self.app_config)
             if dialog.exec():
                 # Update extract tab's frame rate display after settings change
@@ -449,6 +512,8 @@ class TextureAtlasExtractorApp(QMainWindow):
     def show_help_manual(self):
         """Shows the main help window with application manual."""
         try:
+            from gui.help_window import HelpWindow
+
             HelpWindow.create_main_help_window(self)
         except Exception as e:
             QMessageBox.warning(
@@ -460,6 +525,8 @@ class TextureAtlasExtractorApp(QMainWindow):
     def show_help_fnf(self):
         """Shows the FNF-specific help window."""
         try:
+            from gui.help_window import HelpWindow
+
             HelpWindow.create_fnf_help_window(self)
         except Exception as e:
             QMessageBox.warning(
@@ -471,6 +538,8 @@ class TextureAtlasExtractorApp(QMainWindow):
     def show_contributors_window(self):
         """Shows the contributors window."""
         try:
+            from gui.contributors_window import ContributorsWindow
+
             ContributorsWindow.show_contributors(self)
         except Exception as e:
             QMessageBox.warning(
@@ -484,6 +553,10 @@ class TextureAtlasExtractorApp(QMainWindow):
     def show_compression_settings(self):
         """Shows the compression settings window for the current frame format."""
         try:
+            from gui.extractor.compression_settings_window import (
+                CompressionSettingsWindow,
+            )
+
             current_format = self.ui.frame_format_combobox.currentText()
             dialog = CompressionSettingsWindow(
                 parent=self,
@@ -504,6 +577,8 @@ class TextureAtlasExtractorApp(QMainWindow):
     def create_find_and_replace_window(self):
         """Creates the Find and Replace window."""
         try:
+            from gui.extractor.find_replace_window import FindReplaceWindow
+
             dialog = FindReplaceWindow(
                 self.store_replace_rules, self.replace_rules, self
             )
@@ -520,6 +595,8 @@ class TextureAtlasExtractorApp(QMainWindow):
     def create_settings_window(self):
         """Creates the settings overview window."""
         try:
+            from gui.settings_window import SettingsWindow
+
             dialog = SettingsWindow(self, self.settings_manager)
             dialog.exec()
         except Exception as e:
@@ -562,14 +639,10 @@ class TextureAtlasExtractorApp(QMainWindow):
                     self.tr("Success"),
                     self.tr("FNF settings imported successfully!"),
                 )
-                if (
-                    hasattr(self, "editor_tab_widget")
-                    and self.editor_tab_widget is not None
-                ):
-                    try:
-                        self.editor_tab_widget.enable_flxsprite_origin_mode()
-                    except AttributeError:
-                        pass
+                try:
+                    self.ensure_editor_tab().enable_flxsprite_origin_mode()
+                except AttributeError:
+                    pass
             except Exception as e:
                 QMessageBox.warning(
                     self,
@@ -579,6 +652,78 @@ class TextureAtlasExtractorApp(QMainWindow):
                     ),
                 )
 
+    def fnf_import_mod_folder(self):
+        """Imports settings for every character in an FNF mod folder.
+
+        Character files are indexed and parsed in a background thread; the
+        settings are applied in one batch when parsing finishes.
+        """
+        if getattr(self, "_fnf_mod_import_worker", None) is not None:
+            return
+
+        directory = QFileDialog.getExistingDirectory(
+            self,
+            self.tr("Select FNF Mod Folder"),
+            self.app_config.get_last_input_directory(),
+        )
+        if not directory:
+            return
+
+        self.app_config.set_last_input_directory(directory)
+        self.fnf_import_mod_action.setEnabled(False)
+        worker = FnfModImportWorker(directory)
+        worker.import_completed.connect(self.on_fnf_mod_import_completed)
+        worker.import_failed.connect(self.on_fnf_mod_import_failed)
+        worker.finished.connect(self._on_fnf_mod_import_finished)
+        self._fnf_mod_import_worker = worker
+        worker.start()
+
+    def on_fnf_mod_import_completed(self, result):
+        """Applies parsed mod settings and reports the outcome."""
+        from utils.FNF.mod_importer import apply_mod_import
+
+        if not result.characters:
+            QMessageBox.warning(
+                self,
+                self.tr("Error"),
+                self.tr("No FNF character data files were found in this folder."),
+            )
+            return
+
+        apply_mod_import(result, self.settings_manager)
+        message = self.tr(
+            "Imported settings for {animations} animations from {characters} characters."
+        ).format(
+            animations=result.animation_count, characters=len(result.characters)
+        )
+        missing = len(result.missing_atlases)
+        if missing:
+            message += "\n" + self.tr(
+                "{count} characters have no matching spritesheet in the mod."
+            ).format(count=missing)
+        QMessageBox.information(self, self.tr("Success"), message)
+        try:
+            self.ensure_editor_tab().enable_flxsprite_origin_mode()
+        except AttributeError:
+            pass
+
+    def on_fnf_mod_import_failed(self, error_message):
+        """Reports a failed mod import."""
+        QMessageBox.warning(
+            self,
+            self.tr("Error"),
+            self.tr("Failed to import FNF settings: {error}").format(
+                error=error_message
+            ),
+        )
+
+    def _on_fnf_mod_import_finished(self):
+        worker = self._fnf_mod_import_worker
+        self._fnf_mod_import_worker = None
+        self.fnf_import_mod_action.setEnabled(True)
+        if worker is not None:
+            worker.deleteLater()
+
     def check_version(self, force=False):
         """Checks for updates to the application.
 
@@ -586,6 +731,8 @@ class TextureAtlasExtractorApp(QMainWindow):
         When force=True (user-initiated), uses synchronous check for immediate feedback.
         """
         try:
+            from utils.update_checker import UpdateChecker
+
             update_checker = UpdateChecker(self.current_version)
 
             if force:
@@ -743,6 +890,9 @@ class TextureAtlasExtractorApp(QMainWindow):
             QMessageBox.warning(self, self.tr("Error"), error_message)
             return
 
+        from core.extractor import Extractor
+        from gui.extractor.processing_window import ProcessingWindow
+
         # Create a temporary extractor instance with required arguments
         temp_extractor = Extractor(
             progress_callback=None,
@@ -813,6 +963,9 @@ class TextureAtlasExtractorApp(QMainWindow):
                 if hasattr(self.worker, "debug_message"):
                     self.worker.debug_message.emit(message)
 
+            from core.extractor import Extractor
+            from core.extractor.work_scheduler import format_schedule_report
+
             # Create extractor instance
             extractor = Extractor(
                 progress_callback,
@@ -839,6 +992,10 @@ class TextureAtlasExtractorApp(QMainWindow):
                 spritesheet_list=spritesheet_list,
             )
 
+            schedule_report = extractor.get_schedule_report()
+            if schedule_report is not None:
+                debug_callback(format_schedule_report(schedule_report))
+
             return "Extraction completed successfully!"
 
         except Exception as e:
@@ -908,6 +1065,13 @@ class TextureAtlasExtractorApp(QMainWindow):
 
     def closeEvent(self, event):
         """Handles the window close event."""
+        if hasattr(self, "extract_tab_widget"):
+            self.extract_tab_widget.stop_spritesheet_scan(wait=True)
+            self.extract_tab_widget.cancel_unknown_detection(wait=True)
+        mod_import_worker = getattr(self, "_fnf_mod_import_worker", None)
+        if mod_import_worker is not None:
+            mod_import_worker.wait()
+
         # Clean up temporary files
         try:
             shutil.rmtree(self.temp_dir, ignore_errors=True)
@@ -917,9 +1081,10 @@ class TextureAtlasExtractorApp(QMainWindow):
         except Exception:
             pass
 
-        # Save settings if needed
+        # Write settings changes that are still waiting to be saved
         try:
-            self.app_config.save_settings()
+            self.app_config.flush()
+            self.settings_manager.flush()
         except Exception:
             pass
 
@@ -928,6 +1093,10 @@ class TextureAtlasExtractorApp(QMainWindow):
     def change_language(self, language_code):
         """Change the application language and refresh the UI."""
         try:
+            from gui.machine_translation_disclaimer_dialog import (
+                MachineTranslationDisclaimerDialog,
+            )
+
             # Check if machine translation disclaimer should be shown
             if hasattr(self, "translation_manager"):
                 # Get language display name
@@ -996,8 +1165,8 @@ class TextureAtlasExtractorApp(QMainWindow):
         full_animation_name = f"{spritesheet_name}/{animation_name}"
 
         # Get merged settings using the settings manager
-        complete_settings = self.settings_manager.get_settings(
-            spritesheet_name, full_animation_name
+        complete_settings = dict(
+            self.settings_manager.get_settings(spritesheet_name, full_animation_name)
         )
 
         # For preview, force certain settings to ensure good preview experience
@@ -1139,7 +1308,12 @@ class TextureAtlasExtractorApp(QMainWindow):
         spritemap_target: Optional[dict] = None,
     ):
         """Send an animation to the editor tab for manual alignment."""
-        if not hasattr(self, "editor_tab_widget") or not self.editor_tab_widget:
+        try:
+            editor_tab_widget = self.ensure_editor_tab()
+        except Exception as e:
+            print(f"Could not set up the editor tab: {e}")
+            editor_tab_widget = None
+        if not editor_tab_widget:
             QMessageBox.warning(
                 self,
                 self.tr("Editor"),
@@ -1147,7 +1321,7 @@ class TextureAtlasExtractorApp(QMainWindow):
             )
             return
 
-        self.editor_tab_widget.add_animation_from_extractor(
+        editor_tab_widget.add_animation_from_extractor(
             spritesheet_name,
             animation_name,
             spritesheet_path,
@@ -1155,7 +1329,7 @@ class TextureAtlasExtractorApp(QMainWindow):
             spritemap_info,
             spritemap_target,
         )
-        self.ui.tools_tab.setCurrentWidget(self.editor_tab_widget)
+        self.ui.tools_tab.setCurrentIndex(self._editor_tab_index)
 
 
 def main():
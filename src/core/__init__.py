@@ -10,20 +10,33 @@ Modules:
 
 This module re-exports the extractor classes most callers need; import
 editor or generator tooling directly from their subpackages when required.
+The re-exports are resolved on first access.
 """
 
-from core.extractor import (
-    AnimationExporter,
-    AnimationProcessor,
-    AtlasProcessor,
-    Extractor,
-    FileProcessorWorker,
-    FrameExporter,
-    FrameSelector,
-    PreviewGenerator,
-    SpriteProcessor,
-    UnknownSpritesheetHandler,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from core.extractor import (
+        AnimationExporter,
+        AnimationProcessor,
+        AtlasProcessor,
+        Extractor,
+        FileProcessorWorker,
+        FrameExporter,
+        FrameSelector,
+        PreviewGenerator,
+        SpriteProcessor,
+        UnknownSpritesheetHandler,
+    )
+
+
+def __getattr__(name):
+    """Resolve the extractor re-exports on first access."""
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module("core.extractor"), name)
+
 
 __all__ = [
     "AnimationExporter",
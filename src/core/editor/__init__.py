@@ -7,4 +7,6 @@ overrides (e.g., custom durations).
 Modules:
     editor_composite: Functions for cloning animation maps and constructing
         composite frame sequences from user-defined definitions.
+    source_cache: LRU cache of spritemap renderers and parsed atlases so
+        opening several animations from one sheet parses it only once.
 """
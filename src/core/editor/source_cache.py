@@ -0,0 +1,176 @@
+"""Keep parsed animation sources alive between editor loads.
+
+Opening an animation in the alignment editor needs either an
+``AdobeSpritemapRenderer`` or a parsed atlas with a ``SpriteProcessor``.
+Building those means reading and parsing the metadata and preparing the
+atlas pixels, which is the same work for every animation on a sheet.
+``EditorSourceCache`` keeps the most recently used sources so opening more
+animations from the same sheet only renders or crops the requested frames.
+
+Entries are keyed by the files they were built from and rebuilt when any of
+those files changes on disk. Sources are not thread-safe; use each one from
+a single thread at a time.
+"""
+
+from __future__ import annotations
+
+import os
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Optional, Tuple
+
+DEFAULT_MAX_SOURCES = 4
+
+FileStamp = Tuple[str, int, int]
+
+
+def _file_stamp(path: str) -> FileStamp:
+    """Return ``(normalized path, mtime_ns, size)`` for ``path``."""
+    stat = os.stat(path)
+    return os.path.normcase(os.path.abspath(path)), stat.st_mtime_ns, stat.st_size
+
+
+class EditorSourceCache:
+    """LRU cache of spritemap renderers and parsed atlases.
+
+    Attributes:
+        max_entries: Number of sources kept before the least recently used
+            one is closed.
+        hits: Lookups answered from the cache.
+        misses: Lookups that had to build a new source.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_SOURCES) -> None:
+        """Create an empty cache.
+
+        Args:
+            max_entries: Maximum number of cached sources (at least 1).
+        """
+        self.max_entries = max(1, int(max_entries))
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[tuple, Tuple[tuple, Any, Callable[[], None]]]" = (
+            OrderedDict()
+        )
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get_renderer(
+        self, animation_json: str, spritemap_json: str, atlas_path: str
+    ) -> Any:
+        """Return a spritemap renderer for an Adobe Animate export.
+
+        Args:
+            animation_json: Path to ``Animation.json``.
+            spritemap_json: Path to the spritemap JSON.
+            atlas_path: Path to the spritemap atlas image.
+
+        Returns:
+            Cached or newly built ``AdobeSpritemapRenderer``.
+        """
+
+        def build():
+            from core.extractor.spritemap import AdobeSpritemapRenderer
+
+            renderer = AdobeSpritemapRenderer(
+                animation_json,
+                spritemap_json,
+                atlas_path,
+                filter_single_frame=True,
+            )
+            return renderer, renderer.close
+
+        return self._get(
+            "spritemap", (animation_json, spritemap_json, atlas_path), build
+        )
+
+    def get_sprite_processor(self, atlas_path: str, metadata_path: str) -> Any:
+        """Return a ``SpriteProcessor`` over a parsed atlas.
+
+        The atlas comes from the shared decoded-image pool and stays leased
+        while the entry is cached.
+
+        Args:
+            atlas_path: Path to the atlas image.
+            metadata_path: Path to the atlas metadata.
+
+        Returns:
+            Cached or newly built ``SpriteProcessor`` holding every sprite.
+
+        Raises:
+            ValueError: If the atlas cannot be opened or has no sprites.
+        """
+
+        def build():
+            from core.extractor.atlas_processor import AtlasProcessor
+            from core.extractor.sprite_processor import SpriteProcessor
+
+            atlas_processor = AtlasProcessor(atlas_path, metadata_path)
+            if not atlas_processor.has_image_data or not atlas_processor.sprites:
+                atlas_processor.close()
+                raise ValueError(f"No sprites could be read from {metadata_path}")
+            sprite_processor = SpriteProcessor(
+                atlas_processor.atlas,
+                atlas_processor.sprites,
+                owns_atlas=False,
+                pages=atlas_processor.pages,
+            )
+
+            def close():
+                sprite_processor.dispose()
+                atlas_processor.close()
+
+            return sprite_processor, close
+
+        return self._get("atlas", (atlas_path, metadata_path), build)
+
+    def clear(self) -> None:
+        """Close and drop every cached source."""
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+        for _stamps, _source, close in entries:
+            self._close_quietly(close)
+
+    def _get(self, kind: str, paths: tuple, build: Callable[[], tuple]) -> Any:
+        """Look up a source, rebuilding it when its files changed."""
+        key = (kind,) + tuple(os.path.normcase(os.path.abspath(p)) for p in paths)
+        stamps = tuple(_file_stamp(path) for path in paths)
+        stale: Optional[Callable[[], None]] = None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] == stamps:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                stale = self._entries.pop(key)[2]
+            self.misses += 1
+        if stale is not None:
+            self._close_quietly(stale)
+
+        source, close = build()
+        evicted = []
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                evicted.append(previous[2])
+            self._entries[key] = (stamps, source, close)
+            while len(self._entries) > self.max_entries:
+                evicted.append(self._entries.popitem(last=False)[1][2])
+        for close_evicted in evicted:
+            self._close_quietly(close_evicted)
+        return source
+
+    @staticmethod
+    def _close_quietly(close: Callable[[], None]) -> None:
+        try:
+            close()
+        except Exception as exc:
+            print(f"[EditorSourceCache] Failed to release source: {exc}")
+
+
+__all__ = ["DEFAULT_MAX_SOURCES", "EditorSourceCache"]
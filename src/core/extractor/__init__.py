@@ -16,17 +16,54 @@ Exports:
     PreviewGenerator: Creates temporary animation files for UI preview.
     SpriteProcessor: Groups parsed sprites into animation buckets.
     UnknownSpritesheetHandler: Fallback for atlas images lacking metadata.
+
+The exports are resolved on first access, so importing one submodule (for
+example ``core.extractor.metadata_cache``) does not load the whole pipeline,
+Wand included.
 """
 
-from .extractor import Extractor, FileProcessorWorker, ExtractionCancelled
-from .animation_processor import AnimationProcessor
-from .atlas_processor import AtlasProcessor
-from .frame_selector import FrameSelector
-from .frame_exporter import FrameExporter
-from .animation_exporter import AnimationExporter
-from .preview_generator import PreviewGenerator
-from .sprite_processor import SpriteProcessor
-from .unknown_spritesheet_handler import UnknownSpritesheetHandler
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+_LAZY_EXPORTS = {
+    "Extractor": ".extractor",
+    "ExtractionCancelled": ".extractor",
+    "FileProcessorWorker": ".extractor",
+    "AnimationProcessor": ".animation_processor",
+    "AtlasProcessor": ".atlas_processor",
+    "FrameSelector": ".frame_selector",
+    "FrameExporter": ".frame_exporter",
+    "AnimationExporter": ".animation_exporter",
+    "PreviewGenerator": ".preview_generator",
+    "SpriteProcessor": ".sprite_processor",
+    "UnknownSpritesheetHandler": ".unknown_spritesheet_handler",
+}
+
+if TYPE_CHECKING:
+    from .extractor import Extractor, FileProcessorWorker, ExtractionCancelled
+    from .animation_processor import AnimationProcessor
+    from .atlas_processor import AtlasProcessor
+    from .frame_selector import FrameSelector
+    from .frame_exporter import FrameExporter
+    from .animation_exporter import AnimationExporter
+    from .preview_generator import PreviewGenerator
+    from .sprite_processor import SpriteProcessor
+    from .unknown_spritesheet_handler import UnknownSpritesheetHandler
+
+
+def __getattr__(name):
+    """Import an exported class from its submodule on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __all__ = [
     "Extractor",
@@ -2,9 +2,11 @@
 
 Provides ``AnimationExporter`` which writes GIF, WebP, and APNG files from
 a sequence of frames (PIL Images or NumPy arrays), handling scaling, cropping,
-duration calculation, and duplicate frame removal.
+duration calculation, and duplicate frame removal. WebP and APNG files are
+encoded on the shared encode pipeline when an ``EncodeBatch`` is supplied.
 """
 
+import io
 import os
 from typing import Optional, Sequence, Set
 
@@ -13,15 +15,15 @@ from PIL.PngImagePlugin import PngInfo
 from wand.color import Color
 from wand.image import Image as WandImg
 
+from core.extractor.encode_pipeline import EncodedFile, write_encoded_file
 from core.extractor.frame_pipeline import (
     build_frame_durations,
     compute_shared_bbox,
     prepare_scaled_sequence,
 )
 from core.extractor.image_utils import (
-    apply_alpha_threshold,
     FrameSource,
-    crop_to_bbox,
+    crop_frames,
     ensure_rgba_array,
     frame_dimensions,
     pad_frames_to_canvas,
@@ -37,19 +39,23 @@ class AnimationExporter:
         output_dir: Directory where exported animations are saved.
         current_version: Version string embedded in file metadata.
         scale_image: Callable used to resize frames before export.
+        encoder: Optional ``EncodeBatch`` used to encode WebP and APNG files
+            off the calling thread. ``None`` saves them inline.
     """
 
-    def __init__(self, output_dir, current_version, scale_image_func):
+    def __init__(self, output_dir, current_version, scale_image_func, encoder=None):
         """Initialise the exporter with output path and helpers.
 
         Args:
             output_dir: Filesystem path for saved animations.
             current_version: Version string for metadata comments.
             scale_image_func: Callable ``(image, scale) -> image`` for resizing.
+            encoder: Optional ``EncodeBatch`` for parallel encoding.
         """
         self.output_dir = output_dir
         self.current_version = current_version
         self.scale_image = scale_image_func
+        self.encoder = encoder
 
     def save_animations(self, image_tuples, spritesheet_name, animation_name, settings):
         """Export an animation from the given frame tuples.
@@ -64,7 +70,8 @@ class AnimationExporter:
             settings: Dict containing fps, delay, scale, format, etc.
 
         Returns:
-            Number of animations successfully exported (0 or 1).
+            Number of animations written (0 or 1). An animation queued on
+            the encoder is counted by the encode batch once written.
         """
         anims_generated = 0
 
@@ -100,16 +107,22 @@ class AnimationExporter:
                 settings.get("suffix"),
             )
 
+        written = False
         if animation_format == "GIF":
-            self.save_gif(
+            written = self.save_gif(
                 images, filename, fps, delay, period, scale, threshold, settings
             )
         elif animation_format == "WebP":
-            self.save_webp(images, filename, fps, delay, period, scale, settings)
+            written = self.save_webp(
+                images, filename, fps, delay, period, scale, settings
+            )
         elif animation_format == "APNG":
-            self.save_apng(images, filename, fps, delay, period, scale, settings)
+            written = self.save_apng(
+                images, filename, fps, delay, period, scale, settings
+            )
 
-        anims_generated += 1
+        if written:
+            anims_generated += 1
         return anims_generated
 
     def save_webp(
@@ -132,6 +145,10 @@ class AnimationExporter:
             period: Total loop period in ms, or ``None``.
             scale: Scale factor (negative flips horizontally).
             settings: Additional options such as ``crop_option``.
+
+        Returns:
+            ``True`` if the file was written now, ``False`` if it was queued
+            on the encoder or there was nothing to save.
         """
         final_images = prepare_scaled_sequence(
             images,
@@ -140,7 +157,7 @@ class AnimationExporter:
             settings.get("crop_option"),
         )
         if not final_images:
-            return
+            return False
 
         custom_durations = settings.get("custom_frame_durations")
         if custom_durations and len(custom_durations) == len(final_images):
@@ -154,12 +171,15 @@ class AnimationExporter:
                 settings.get("var_delay", False),
             )
         if not durations:
-            return
+            return False
 
         webp_filename = os.path.join(self.output_dir, f"{filename}.webp")
 
-        final_images[0].save(
+        return self._write_animation(
+            final_images,
             webp_filename,
+            f"Saved WEBP animation: {webp_filename}",
+            format="WebP",
             save_all=True,
             append_images=final_images[1:],
             disposal=2,
@@ -167,7 +187,6 @@ class AnimationExporter:
             loop=0,
             lossless=True,
         )
-        print(f"Saved WEBP animation: {webp_filename}")
 
     def remove_dups(self, animation):
         """Remove duplicate frames from a Wand animation in place.
@@ -223,6 +242,10 @@ class AnimationExporter:
             scale: Scale factor (negative flips horizontally).
             threshold: Alpha threshold for edge cleanup, or ``None``.
             settings: Additional options such as ``crop_option``.
+
+        Returns:
+            ``True`` if the file was written now, ``False`` if it was queued
+            on the encoder or there was nothing to save.
         """
         custom_durations = settings.get("custom_frame_durations")
         if custom_durations and len(custom_durations) == len(images):
@@ -238,34 +261,26 @@ class AnimationExporter:
                 round_to_ten=True,
             )
         if not durations:
-            return
+            return False
 
         width, height = frame_dimensions(images[0])
         frame_arrays = [ensure_rgba_array(frame) for frame in images]
         crop_option = settings.get("crop_option")
         crop_mode = (crop_option or "None").lower()
-        should_crop = crop_mode != "none"
         crop_bounds = None
-        if should_crop:
+        if crop_mode != "none":
             crop_bounds = compute_shared_bbox(frame_arrays)
-            if crop_bounds is None:
-                should_crop = False
-            else:
-                frame_arrays = [
-                    crop_to_bbox(array, crop_bounds) for array in frame_arrays
-                ]
-
-        apply_threshold = should_crop and threshold is not None
-        if apply_threshold:
-            try:
-                threshold_value = float(threshold)
-            except (TypeError, ValueError):
-                apply_threshold = False
-            else:
-                frame_arrays = [
-                    apply_alpha_threshold(array, threshold_value)
-                    for array in frame_arrays
-                ]
+
+        if crop_bounds is not None:
+            threshold_value = None
+            if threshold is not None:
+                try:
+                    threshold_value = float(threshold)
+                except (TypeError, ValueError):
+                    threshold_value = None
+            frame_arrays = crop_frames(
+                frame_arrays, crop_bounds, alpha_threshold=threshold_value
+            )
 
         merge_duplicates = settings.get("merge_duplicate_frames", True)
         dedupe_required = False
@@ -333,6 +348,7 @@ class AnimationExporter:
                 f"GIF generated by: TextureAtlas Toolbox v{self.current_version}"
             )
             animation.save(filename=gif_filename)
+        return True
 
     @staticmethod
     def _frame_signature(frame_array: numpy.ndarray) -> Optional[int]:
@@ -400,6 +416,10 @@ class AnimationExporter:
             period: Total loop period in ms, or ``None``.
             scale: Scale factor (negative flips horizontally).
             settings: Additional options such as ``crop_option``.
+
+        Returns:
+            ``True`` if the file was written now, ``False`` if it was queued
+            on the encoder or there was nothing to save.
         """
         final_images = prepare_scaled_sequence(
             images,
@@ -408,7 +428,7 @@ class AnimationExporter:
             settings.get("crop_option"),
         )
         if not final_images:
-            return
+            return False
 
         custom_durations = settings.get("custom_frame_durations")
         if custom_durations and len(custom_durations) == len(final_images):
@@ -422,7 +442,7 @@ class AnimationExporter:
                 settings.get("var_delay", False),
             )
         if not durations:
-            return
+            return False
 
         apng_filename = os.path.join(self.output_dir, f"{filename}.png")
 
@@ -432,8 +452,10 @@ class AnimationExporter:
             f"APNG generated by TextureAtlas Toolbox v{self.current_version}",
         )
 
-        final_images[0].save(
+        return self._write_animation(
+            final_images,
             apng_filename,
+            f"Saved APNG animation: {apng_filename}",
             save_all=True,
             append_images=final_images[1:],
             duration=durations,
@@ -442,4 +464,29 @@ class AnimationExporter:
             disposal=2,
             pnginfo=metadata,
         )
-        print(f"Saved APNG animation: {apng_filename}")
+
+    def _write_animation(self, final_images, path, message, **save_kwargs):
+        """Encode a multi-frame image and write it, via the encoder if set.
+
+        Args:
+            final_images: Prepared PIL frames; the first one is saved with
+                the rest passed through ``save_kwargs["append_images"]``.
+            path: Destination file path.
+            message: Log line printed once the file is written.
+            **save_kwargs: Arguments forwarded to ``PIL.Image.Image.save``.
+
+        Returns:
+            ``True`` if the file was written now, ``False`` if it was queued
+            on the encoder.
+        """
+
+        def job():
+            buffer = io.BytesIO()
+            final_images[0].save(buffer, **save_kwargs)
+            return EncodedFile(path, buffer.getvalue(), message)
+
+        if self.encoder is not None:
+            cost = sum(image.width * image.height * 4 for image in final_images)
+            self.encoder.submit(job, cost, kind="animation")
+            return False
+        return write_encoded_file(job())
@@ -6,19 +6,20 @@ alignment overrides, injects editor-defined composites, and delegates to
 """
 
 import os
-from typing import Set
+from typing import Set, Tuple
 
 from PIL import Image
 
 from core.extractor.animation_exporter import AnimationExporter
 from core.extractor.frame_exporter import FrameExporter
 from core.extractor.frame_pipeline import FramePipeline
+from core.extractor.frame_scaler import FrameScaler
 from core.extractor.image_utils import (
     ensure_pil_image,
     frame_dimensions,
-    scale_image,
     scale_image_nearest,
 )
+from core.extractor.sprite_processor import LazyAnimationMap
 from core.editor.editor_composite import (
     clone_animation_map,
     build_editor_composite_frames,
@@ -42,6 +43,10 @@ class AnimationProcessor:
         spritesheet_label: Display name for the spritesheet.
         frame_exporter: ``FrameExporter`` instance for static frames.
         animation_exporter: ``AnimationExporter`` instance for animations.
+        frame_scaler: ``FrameScaler`` that memoizes resizes shared by both
+            exporters.
+        encode_batch: ``EncodeBatch`` shared by both exporters when an
+            encode pipeline was supplied, otherwise ``None``.
     """
 
     def __init__(
@@ -52,30 +57,43 @@ class AnimationProcessor:
         settings_manager,
         current_version,
         spritesheet_label=None,
+        encode_pipeline=None,
     ):
         """Initialise the processor and inject editor composites.
 
         Args:
-            animations: Dict mapping animation names to frame-tuple sequences.
+            animations: Dict mapping animation names to frame-tuple sequences,
+                or a ``LazyAnimationMap`` whose frames are cropped only when
+                an animation is exported.
             atlas_path: Path to the source texture atlas.
             output_dir: Directory for exported files.
             settings_manager: Settings provider for export options.
             current_version: Version string embedded in output metadata.
             spritesheet_label: Optional display name; defaults to atlas filename.
+            encode_pipeline: Optional shared ``EncodePipeline``. When given,
+                frame and animation files are encoded and written on it.
         """
-        base_animations = clone_animation_map(animations)
-        self._source_frames = clone_animation_map(base_animations)
-        self.animations = clone_animation_map(base_animations)
+        if isinstance(animations, LazyAnimationMap):
+            # Lazy maps hand out fresh frame lists on every lookup, so they
+            # can be shared instead of cloned (cloning would crop everything).
+            self._source_frames = animations
+            self.animations = animations.copy()
+        else:
+            base_animations = clone_animation_map(animations)
+            self._source_frames = clone_animation_map(base_animations)
+            self.animations = clone_animation_map(base_animations)
         self.atlas_path = atlas_path
         self.output_dir = output_dir
         self.settings_manager = settings_manager
         self.current_version = current_version
         self.spritesheet_label = spritesheet_label or os.path.split(self.atlas_path)[1]
+        self.frame_scaler = FrameScaler()
+        self.encode_batch = encode_pipeline.batch() if encode_pipeline else None
         self.frame_exporter = FrameExporter(
-            self.output_dir, self.current_version, self.scale_image
+            self.output_dir, self.current_version, self.scale_image, self.encode_batch
         )
         self.animation_exporter = AnimationExporter(
-            self.output_dir, self.current_version, self.scale_image
+            self.output_dir, self.current_version, self.scale_image, self.encode_batch
         )
         self._frame_pipeline = FramePipeline()
         self._editor_composite_names: Set[str] = set()
@@ -86,7 +104,10 @@ class AnimationProcessor:
 
         Iterates each animation, retrieves settings, applies alignment
         overrides for editor composites, and delegates to the appropriate
-        exporter.
+        exporter. Frames are only looked up for animations whose settings
+        request an export, and are released before the next animation.
+        Pages of multi-page atlases are released after the last animation
+        that uses them.
 
         Args:
             is_unknown_spritesheet: When ``True``, applies extra cropping
@@ -94,23 +115,35 @@ class AnimationProcessor:
 
         Returns:
             A tuple ``(frames_generated, anims_generated)`` with counts of
-            exported files.
+            files written to disk. Files that failed to encode or write are
+            not counted.
         """
         frames_generated = 0
         anims_generated = 0
 
         spritesheet_name = self.spritesheet_label
+        animation_names = list(self.animations)
+        page_releases = self._page_release_schedule(animation_names)
 
-        for animation_name, image_tuples in self.animations.items():
+        for position, animation_name in enumerate(animation_names):
+            if position:
+                self._release_pages(page_releases.pop(position - 1, None))
 
             settings = self.settings_manager.get_settings(
                 spritesheet_name, f"{spritesheet_name}/{animation_name}"
             )
+            if not self._wants_export(settings):
+                continue
+
+            image_tuples, selection = self._frames_for_export(animation_name, settings)
+            if not image_tuples:
+                continue
             context = self._frame_pipeline.build_context(
                 spritesheet_name,
                 animation_name,
                 image_tuples,
                 settings,
+                selection,
             )
 
             alignment_overrides = settings.get("alignment_overrides")
@@ -126,7 +159,7 @@ class AnimationProcessor:
                 context = context.with_frames(aligned_tuples)
 
             if settings.get("fnf_idle_loop") and "idle" in animation_name.lower():
-                settings["delay"] = 0
+                settings = {**settings, "delay": 0}
 
             frame_export = settings.get("frame_export", False)
             if frame_export and settings.get("frame_format") != "None":
@@ -151,7 +184,78 @@ class AnimationProcessor:
                     context.frames, spritesheet_name, animation_name, settings
                 )
 
-        return frames_generated, anims_generated
+            image_tuples = None
+            context = None
+
+        for pages in page_releases.values():
+            self._release_pages(pages)
+        frames_written, anims_written = self.wait_for_writes()
+        return frames_generated + frames_written, anims_generated + anims_written
+
+    def _page_release_schedule(self, animation_names):
+        """Return when atlas pages can be released, keyed by position."""
+        if isinstance(self.animations, LazyAnimationMap):
+            return self.animations.page_release_schedule(animation_names)
+        return {}
+
+    def _release_pages(self, pages):
+        """Release decoded atlas pages no remaining animation needs."""
+        if pages and isinstance(self.animations, LazyAnimationMap):
+            self.animations.release_pages(pages)
+
+    def _frames_for_export(self, animation_name, settings):
+        """Look up the frames an animation's export will actually use.
+
+        Animations still held as sprite metadata are narrowed to the frames
+        named by ``indices`` (and by ``frame_selection`` when no animated
+        file is written) before anything is cropped.
+
+        Returns:
+            Tuple ``(image_tuples, selection)`` where ``selection`` is the
+            ``FrameSelection`` the frames were cropped from, or ``None``
+            when the full frame list was looked up.
+        """
+        if isinstance(self.animations, LazyAnimationMap):
+            frame_keys = self.animations.frame_keys(animation_name)
+            if frame_keys is not None:
+                selection = self._frame_pipeline.plan_selection(
+                    frame_keys,
+                    settings,
+                    frames_only=not self._wants_animation_export(settings),
+                )
+                image_tuples = self.animations.build_selected(
+                    animation_name, selection.positions
+                )
+                return image_tuples, selection
+        return self.animations.get(animation_name), None
+
+    @classmethod
+    def _wants_export(cls, settings) -> bool:
+        """Return ``True`` if settings request frame or animation output."""
+        if settings.get("frame_export", False) and settings.get("frame_format") != "None":
+            return True
+        return cls._wants_animation_export(settings)
+
+    @staticmethod
+    def _wants_animation_export(settings) -> bool:
+        """Return ``True`` if settings request an animated file."""
+        return bool(
+            settings.get("animation_export", False)
+            and settings.get("animation_format") != "None"
+        )
+
+    def wait_for_writes(self) -> Tuple[int, int]:
+        """Block until every file queued on the encode pipeline is written.
+
+        Returns:
+            ``(frames, animations)`` written by the encode pipeline since
+            the previous wait.
+        """
+        if self.encode_batch is None:
+            return 0, 0
+        self.encode_batch.wait()
+        written = self.encode_batch.take_written()
+        return written.get("frame", 0), written.get("animation", 0)
 
     def _inject_editor_composites(self):
         """Build and register editor-defined composite animations.
@@ -271,6 +375,9 @@ class AnimationProcessor:
     def scale_image(self, img, size):
         """Scale an image using the configured resampling method.
 
+        Results are memoized per frame content and scale, so the frame and
+        animation exporters reuse each other's resizes within a file.
+
         Args:
             img: Source PIL Image or NumPy array.
             size: Scale factor; negative values flip horizontally.
@@ -281,16 +388,20 @@ class AnimationProcessor:
         resampling_method = self.settings_manager.global_settings.get(
             "resampling_method", "Lanczos"
         )
-        return scale_image(img, size, resampling_method=resampling_method)
+        return self.frame_scaler.scale(img, size, resampling_method)
 
     def dispose(self) -> None:
         """Release cached data and child exporters.
 
-        Clears animation frame dicts, source frames, and composite name
-        tracking. Drops references to the frame pipeline and exporters so
-        their buffers can be reclaimed.
+        Waits for any files still queued on the encode pipeline, then clears
+        animation frame dicts, source frames, and composite name tracking.
+        Drops references to the frame pipeline and exporters so their
+        buffers can be reclaimed.
         """
 
+        if getattr(self, "encode_batch", None) is not None:
+            self.encode_batch.wait()
+            self.encode_batch = None
         if isinstance(getattr(self, "animations", None), dict):
             self.animations.clear()
         if isinstance(getattr(self, "_source_frames", None), dict):
@@ -301,5 +412,7 @@ class AnimationProcessor:
         if hasattr(self, "_editor_composite_names"):
             self._editor_composite_names.clear()
         self._frame_pipeline = None
+        if getattr(self, "frame_scaler", None) is not None:
+            self.frame_scaler.clear()
         self.frame_exporter = None
         self.animation_exporter = None
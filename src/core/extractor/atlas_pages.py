@@ -0,0 +1,137 @@
+"""Lazily decoded page images of multi-page texture atlases.
+
+Provides ``AtlasPages``, which maps the page indices stored on sprites to
+page image files and decodes each page only when a sprite on it is first
+cropped. Pages come from the shared decoded-image pool and are handed back
+to it as soon as the caller releases them, so a large multi-page export
+only holds the pages its current animations need.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+from PIL import Image
+
+from utils.image_pool import get_image_pool
+
+
+class AtlasPages:
+    """Page images of one atlas, decoded on first use.
+
+    Attributes:
+        paths: Image path of every page, in page-index order. Pages whose
+            file could not be found are ``None``.
+    """
+
+    def __init__(self, paths: Sequence[Optional[str]]) -> None:
+        """Describe the pages without decoding any of them.
+
+        Args:
+            paths: Image path of each page, ``None`` for missing pages.
+        """
+        self.paths: List[Optional[str]] = list(paths)
+        self._images: Dict[int, Image.Image] = {}
+        self._arrays: Dict[int, np.ndarray] = {}
+
+    @classmethod
+    def resolve(
+        cls,
+        metadata_path: str,
+        page_names: Sequence[str],
+        atlas_path: Optional[str] = None,
+    ) -> "AtlasPages":
+        """Locate the page images named by a metadata file.
+
+        Page names are resolved relative to the metadata file. The atlas
+        path the caller already paired with the metadata is used for the
+        page of the same filename, so renamed sheets keep working.
+
+        Args:
+            metadata_path: Path to the metadata file naming the pages.
+            page_names: Page image filenames in page order.
+            atlas_path: Image path already paired with the metadata.
+
+        Returns:
+            ``AtlasPages`` with ``None`` for every page that does not exist.
+        """
+        directory = os.path.dirname(metadata_path)
+        atlas_name = os.path.basename(atlas_path).lower() if atlas_path else None
+        paths: List[Optional[str]] = []
+        for page_name in page_names:
+            if atlas_name and os.path.basename(page_name).lower() == atlas_name:
+                candidate = atlas_path
+            else:
+                candidate = os.path.join(directory, page_name)
+            if not os.path.isfile(candidate):
+                print(f"[AtlasPages] Atlas page not found: {candidate}")
+                candidate = None
+            paths.append(candidate)
+        return cls(paths)
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def is_available(self, page: int) -> bool:
+        """Return True if ``page`` has an image file to decode."""
+        return 0 <= page < len(self.paths) and self.paths[page] is not None
+
+    def is_loaded(self, page: int) -> bool:
+        """Return True if ``page`` is currently decoded."""
+        return page in self._arrays
+
+    @property
+    def loaded_pages(self) -> List[int]:
+        """Indices of the pages currently decoded, in ascending order."""
+        return sorted(self._arrays)
+
+    def array(self, page: int) -> np.ndarray:
+        """Return the RGBA pixels of ``page``, decoding it if needed.
+
+        Args:
+            page: Page index stored on the sprite.
+
+        Returns:
+            Contiguous ``(height, width, 4)`` uint8 array.
+
+        Raises:
+            FileNotFoundError: If the page has no image file.
+        """
+        pixels = self._arrays.get(page)
+        if pixels is not None:
+            return pixels
+        if not self.is_available(page):
+            raise FileNotFoundError(f"Atlas page {page} has no image file")
+
+        Image.MAX_IMAGE_PIXELS = None
+        image = get_image_pool().acquire(self.paths[page])
+        try:
+            rgba = image if image.mode == "RGBA" else image.convert("RGBA")
+            pixels = np.ascontiguousarray(np.asarray(rgba))
+        except Exception:
+            get_image_pool().release(image)
+            raise
+        self._images[page] = image
+        self._arrays[page] = pixels
+        return pixels
+
+    def release(self, pages: Iterable[int]) -> None:
+        """Drop the decoded pixels of ``pages`` and return them to the pool.
+
+        Releasing a page that is not loaded does nothing; it is decoded again
+        if a sprite on it is cropped later.
+        """
+        for page in pages:
+            self._arrays.pop(page, None)
+            image = self._images.pop(page, None)
+            if image is not None:
+                get_image_pool().release(image)
+
+    def release_all(self) -> None:
+        """Release every decoded page."""
+        self.release(list(self._images))
+
+
+__all__ = ["AtlasPages"]
@@ -2,15 +2,22 @@
 
 Provides ``AtlasProcessor`` which opens atlas images and delegates to the
 unified parser registry for metadata parsing with full error handling.
+Metadata that spreads its sprites over several page images gets an
+``AtlasPages`` instead of a single decoded atlas, so pages are only decoded
+when their sprites are cropped.
 """
 
 from __future__ import annotations
 
 import re
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 
 from PIL import Image
 
+from core.extractor.atlas_pages import AtlasPages
+from core.extractor.metadata_cache import get_metadata_cache
+from utils.image_pool import get_image_pool
+
 
 class AtlasProcessor:
     """Open a texture atlas and parse sprite metadata.
@@ -23,8 +30,12 @@ class AtlasProcessor:
         atlas_path: Filesystem path to the atlas image.
         metadata_path: Filesystem path to the metadata file, or ``None``.
         parent_window: Optional parent widget for progress dialogs.
-        atlas: The opened PIL ``Image``, or ``None`` on failure.
-        sprites: List of parsed sprite dicts.
+        atlas: The decoded RGBA ``Image``, or ``None`` on failure and for
+            multi-page atlases. When it comes from the shared image pool it
+            is read-only.
+        pages: ``AtlasPages`` for multi-page atlases, otherwise ``None``.
+        sprites: Parsed sprites; a ``SpriteTable`` for registry-parsed
+            metadata, otherwise a list of sprite dicts.
         parse_result: Full ParseResult with warnings and errors.
     """
 
@@ -46,54 +57,59 @@ class AtlasProcessor:
         self.metadata_path = metadata_path
         self.parent_window = parent_window
         self.parse_result: Optional[Any] = None  # Will be ParseResult
+        self.pages: Optional[AtlasPages] = None
+        self._pooled_atlas: Optional[Image.Image] = None
         self.atlas, self.sprites = self.open_atlas_and_parse_metadata()
 
     def open_atlas_and_parse_metadata(
         self,
-    ) -> Tuple[Optional[Image.Image], List[Dict[str, Any]]]:
+    ) -> Tuple[Optional[Image.Image], Sequence[Mapping[str, Any]]]:
         """Open the atlas image and parse sprite metadata.
 
-        Uses ParserRegistry for format detection and unified parsing.
-        Falls back to ``UnknownParser`` when metadata is missing or points to
-        an image file.
+        Metadata goes through the shared metadata cache, which parses with
+        ParserRegistry only when the file is new or has changed. Falls back
+        to ``UnknownParser`` when metadata is missing or points to an image
+        file; its detected sprite boxes are cached per image fingerprint.
+        The atlas is taken from the shared decoded-image pool so it is only
+        decoded once across detection, previews and export. Multi-page
+        metadata decodes nothing here: ``pages`` is set up instead and
+        sprites on pages whose image is missing are dropped.
 
         Returns:
             A tuple ``(atlas, sprites)`` where ``atlas`` is a PIL ``Image``
-            (or ``None`` on error) and ``sprites`` is a list of sprite dicts.
+            (or ``None`` on error or for multi-page atlases) and ``sprites``
+            is a ``SpriteTable`` or a list of sprite dicts.
 
         Raises:
             ParserError: If the metadata file cannot be parsed.
         """
-        from parsers.parser_registry import ParserRegistry
         from parsers.parser_types import ParseResult, ParserError, ParserErrorCode
+        from parsers.sprite_table import SpriteTable
         from parsers.unknown_parser import UnknownParser
 
         atlas: Optional[Image.Image] = None
         sprites: List[Dict[str, Any]] = []
 
-        try:
-            Image.MAX_IMAGE_PIXELS = None
-            atlas = Image.open(self.atlas_path)
-        except Exception as e:
-            print(f"Error opening atlas: {e}")
-            return None, []
-
         if self._is_unknown_spritesheet():
+            atlas = self._acquire_atlas()
+            if atlas is None:
+                return None, []
             processed_atlas, sprites = UnknownParser.parse_unknown_image(
-                self.atlas_path, self.parent_window
+                self.atlas_path, self.parent_window, image=atlas
             )
             if processed_atlas is not None:
                 atlas = processed_atlas
             return atlas, sprites
 
         try:
-            if not ParserRegistry._all_parsers:
-                ParserRegistry.initialize()
-
-            self.parse_result = ParserRegistry.parse_file(self.metadata_path)
+            self.parse_result = get_metadata_cache().parse(self.metadata_path)
 
             if self.parse_result.is_valid:
-                sprites = list(self.parse_result.sprites)
+                # The cached result is shared: lists are copied, immutable
+                # tables are used as they are.
+                sprites = self.parse_result.sprites
+                if not isinstance(sprites, SpriteTable):
+                    sprites = list(sprites)
 
                 # Log any warnings
                 for warning in self.parse_result.warnings:
@@ -128,8 +144,52 @@ class AtlasProcessor:
                 f"Unexpected error: {e}",
             )
 
+        if self.parse_result is not None and self.parse_result.is_multi_page:
+            self.pages = AtlasPages.resolve(
+                self.metadata_path, self.parse_result.pages, self.atlas_path
+            )
+            return None, self._drop_missing_pages(sprites)
+
+        atlas = self._acquire_atlas()
+        if atlas is None:
+            return None, []
         return atlas, sprites
 
+    def _acquire_atlas(self) -> Optional[Image.Image]:
+        """Take the atlas image from the shared pool, or ``None`` on error."""
+        try:
+            Image.MAX_IMAGE_PIXELS = None
+            atlas = get_image_pool().acquire(self.atlas_path)
+        except Exception as e:
+            print(f"Error opening atlas: {e}")
+            return None
+        self._pooled_atlas = atlas
+        return atlas
+
+    def _drop_missing_pages(self, sprites):
+        """Remove sprites whose page image could not be found."""
+        from parsers.sprite_table import PAGE_FIELD, SpriteTable
+
+        if all(self.pages.is_available(page) for page in range(len(self.pages))):
+            return sprites
+        if isinstance(sprites, SpriteTable):
+            pages = sprites.column(PAGE_FIELD)
+            return sprites.take(
+                index
+                for index, page in enumerate(pages.tolist())
+                if self.pages.is_available(page)
+            )
+        return [
+            sprite
+            for sprite in sprites
+            if self.pages.is_available(sprite.get(PAGE_FIELD, 0))
+        ]
+
+    @property
+    def has_image_data(self) -> bool:
+        """True if sprites can be cropped: an atlas or page images exist."""
+        return self.atlas is not None or self.pages is not None
+
     def _is_unknown_spritesheet(self) -> bool:
         """Check if this is an unknown spritesheet (no metadata or image-only).
 
@@ -168,33 +228,27 @@ class AtlasProcessor:
             return ""
         return self.parse_result.get_summary()
 
-    def parse_for_preview(self, animation_name: str) -> List[Dict[str, Any]]:
-        """Parse metadata for a single animation's sprites.
+    def parse_for_preview(self, animation_name: str) -> Sequence[Mapping[str, Any]]:
+        """Return the sprites of a single animation.
 
-        Filters sprites to only those matching the animation name.
-        Uses the appropriate method based on metadata file type.
+        Filters the sprites already parsed for this atlas, which come from
+        the shared metadata cache, instead of reading the file again.
 
         Args:
             animation_name: Animation prefix to filter by.
 
         Returns:
-            List of sprite dicts matching the animation.
+            Sprites matching the animation.
         """
         if not self.metadata_path:
             return []
-
-        if self.metadata_path.endswith(".xml"):
-            return self.parse_xml_for_preview(animation_name)
-        elif self.metadata_path.endswith(".txt"):
-            return self.parse_txt_for_preview(animation_name)
-        else:
-            return self._filter_sprites_for_animation(animation_name, self.sprites)
+        return self._filter_sprites_for_animation(animation_name, self.sprites)
 
     def _filter_sprites_for_animation(
         self,
         animation_name: str,
-        sprites: List[Dict[str, Any]],
-    ) -> List[Dict[str, Any]]:
+        sprites: Sequence[Mapping[str, Any]],
+    ) -> Sequence[Mapping[str, Any]]:
         """Filter sprites to only those matching an animation name.
 
         Supports two matching modes:
@@ -203,11 +257,21 @@ class AtlasProcessor:
 
         Args:
             animation_name: Animation name or prefix to filter by.
-            sprites: List of all sprites.
+            sprites: All sprites, as a list or ``SpriteTable``.
 
         Returns:
-            Filtered list of matching sprites.
+            Filtered sprites; a ``SpriteTable`` when given one.
         """
+        from parsers.sprite_table import SpriteTable
+
+        if isinstance(sprites, SpriteTable):
+            # Tables carry no animation tags, so only names need matching.
+            prefixes = tuple(self._get_animation_patterns(animation_name))
+            return sprites.take(
+                index
+                for index, name in enumerate(sprites.names)
+                if name.startswith(prefixes)
+            )
 
         tag_matched_sprites = [
             sprite
@@ -247,101 +311,29 @@ class AtlasProcessor:
         ]
         return list(dict.fromkeys(patterns))
 
-    def parse_xml_for_preview(self, animation_name: str) -> List[Dict[str, Any]]:
-        """Parse XML metadata for a single animation's sprites.
-
-        Only extracts sprites whose names match ``animation_name``, reducing
-        memory and processing time for preview generation.
-
-        Args:
-            animation_name: Animation prefix to filter by.
-
-        Returns:
-            List of sprite dicts matching the animation.
-        """
-        if not self.metadata_path or not self.metadata_path.endswith(".xml"):
-            return []
-
-        try:
-            import xml.etree.ElementTree as ET
-
-            tree = ET.parse(self.metadata_path)
-            xml_root = tree.getroot()
-
-            anim_patterns = self._get_animation_patterns(animation_name)
-
-            animation_sprites = []
-            for sprite in xml_root.findall("SubTexture"):
-                sprite_name = sprite.get("name", "")
-                is_match = False
-                for pattern in anim_patterns:
-                    if sprite_name == pattern or sprite_name.startswith(pattern):
-                        is_match = True
-                        break
-
-                if is_match:
-                    sprite_data = {
-                        "name": sprite_name,
-                        "x": int(sprite.get("x", 0)),
-                        "y": int(sprite.get("y", 0)),
-                        "width": int(sprite.get("width", 0)),
-                        "height": int(sprite.get("height", 0)),
-                        "frameX": int(sprite.get("frameX", 0)),
-                        "frameY": int(sprite.get("frameY", 0)),
-                        "frameWidth": int(
-                            sprite.get("frameWidth", sprite.get("width", 0))
-                        ),
-                        "frameHeight": int(
-                            sprite.get("frameHeight", sprite.get("height", 0))
-                        ),
-                        "rotated": sprite.get("rotated", "false") == "true",
-                    }
-                    animation_sprites.append(sprite_data)
-
-            return animation_sprites
-
-        except Exception as e:
-            print(f"Error parsing XML for animation {animation_name}: {e}")
-            return []
-
-    def parse_txt_for_preview(self, animation_name: str) -> List[Dict[str, Any]]:
-        """Parse TXT metadata for a single animation's sprites.
-
-        Only extracts sprites whose names match ``animation_name``, reducing
-        memory and processing time for preview generation.
-
-        Args:
-            animation_name: Animation prefix to filter by.
-
-        Returns:
-            List of sprite dicts matching the animation.
-        """
-        if not self.metadata_path or not self.metadata_path.endswith(".txt"):
-            return []
-
-        try:
-            from parsers.txt_parser import TxtParser
-
-            all_sprites = TxtParser.parse_txt_packer(self.metadata_path)
-            return self._filter_sprites_for_animation(animation_name, all_sprites)
-        except Exception as e:
-            print(f"Error parsing TXT for animation {animation_name}: {e}")
-            return []
-
     def close(self) -> None:
         """Release resources held by this processor.
 
-        Closes the atlas PIL image and clears the sprite list and parse
-        result so memory can be reclaimed.
+        Returns the pooled atlas and any decoded pages to the shared image
+        pool, closes any processed copy, and clears the sprite list and
+        parse result so memory can be reclaimed.
         """
 
+        pooled = getattr(self, "_pooled_atlas", None)
         if getattr(self, "atlas", None) is not None:
             try:
-                self.atlas.close()
+                if self.atlas is not pooled:
+                    self.atlas.close()
             except Exception:
                 pass
             finally:
                 self.atlas = None
+        if pooled is not None:
+            get_image_pool().release(pooled)
+            self._pooled_atlas = None
+        if getattr(self, "pages", None) is not None:
+            self.pages.release_all()
+            self.pages = None
 
         self.sprites = []
         self.parse_result = None
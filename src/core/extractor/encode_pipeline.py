@@ -0,0 +1,285 @@
+"""Bounded, parallel encode-and-write pipeline for exported images.
+
+Provides ``EncodePipeline``, which encodes images on a thread pool and hands
+the encoded bytes to a separate writer thread, and ``EncodeBatch``, a handle
+that lets one spritesheet wait for just the files it submitted.
+
+Pillow releases the GIL while zlib/libwebp compress, so PNG and WebP
+encoding scales across cores even though export runs in Python threads.
+Submissions block once the raw pixel bytes held by queued jobs exceed
+``max_pending_bytes`` and, optionally, until a memory gate (such as
+``Extractor.wait_for_memory_budget``) reports that the process is back
+under its memory budget.
+
+Type Aliases:
+    EncodeJob: ``Callable[[], Optional[EncodedFile]]`` run on an encode thread.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from threading import Condition, Lock
+from typing import Callable, Dict, List, Optional, Tuple
+
+DEFAULT_PENDING_BYTES = 256 * 1024 * 1024
+MAX_AUTO_WORKERS = 8
+
+
+@dataclass
+class EncodedFile:
+    """Encoded file contents waiting to be written.
+
+    Attributes:
+        path: Destination path on disk.
+        data: Complete encoded file contents.
+        message: Optional log line printed once the file is written.
+    """
+
+    path: str
+    data: bytes
+    message: Optional[str] = None
+
+
+EncodeJob = Callable[[], Optional[EncodedFile]]
+
+
+def write_encoded_file(encoded: Optional[EncodedFile]) -> bool:
+    """Write an encoded file to disk synchronously.
+
+    Args:
+        encoded: Result of an encode job, or ``None`` when encoding failed.
+
+    Returns:
+        ``True`` if the file was written.
+    """
+    if encoded is None:
+        return False
+    with open(encoded.path, "wb") as handle:
+        handle.write(encoded.data)
+    if encoded.message:
+        print(encoded.message)
+    return True
+
+
+class EncodePipeline:
+    """Encode images on a thread pool and write them asynchronously.
+
+    Attributes:
+        max_workers: Number of encode threads.
+        max_pending_bytes: Upper bound on raw bytes held by queued jobs.
+        memory_gate: Optional callable that blocks until the process is
+            within its memory budget. Called before each submission.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_pending_bytes: int = DEFAULT_PENDING_BYTES,
+        memory_gate: Optional[Callable[[], bool]] = None,
+    ) -> None:
+        """Start the encode and writer thread pools.
+
+        Args:
+            max_workers: Encode thread count, or ``None`` for one per CPU
+                (capped at ``MAX_AUTO_WORKERS``).
+            max_pending_bytes: Raw byte budget for in-flight jobs.
+            memory_gate: Optional blocking memory check, e.g.
+                ``Extractor.wait_for_memory_budget``.
+        """
+        if max_workers is None:
+            max_workers = min(os.cpu_count() or 1, MAX_AUTO_WORKERS)
+        self.max_workers = max(1, int(max_workers))
+        self.max_pending_bytes = max(1, int(max_pending_bytes))
+        self.memory_gate = memory_gate
+        self._encoders = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="encode"
+        )
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="write")
+        self._pending_bytes = 0
+        self._condition = Condition()
+        self._closed = False
+
+    @property
+    def pending_bytes(self) -> int:
+        """Raw bytes currently reserved by queued or running jobs."""
+        with self._condition:
+            return self._pending_bytes
+
+    def submit(self, job: EncodeJob, cost_bytes: int) -> Future:
+        """Queue an encode job, blocking while the pipeline is over budget.
+
+        Args:
+            job: Callable returning the encoded file, or ``None`` to skip.
+            cost_bytes: Memory held by the job until it is written,
+                usually the raw RGBA size of the image(s) it encodes.
+
+        Returns:
+            Future resolving to ``True`` once the file is written, or
+            ``False`` when the job produced nothing.
+        """
+        if self.memory_gate is not None:
+            self.memory_gate()
+
+        cost = max(0, int(cost_bytes))
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("EncodePipeline has been shut down")
+            # A single job larger than the budget is still admitted once the
+            # pipeline drains, otherwise it could never run.
+            while self._pending_bytes and (
+                self._pending_bytes + cost > self.max_pending_bytes
+            ):
+                self._condition.wait()
+            self._pending_bytes += cost
+
+        done: Future = Future()
+        try:
+            self._encoders.submit(self._run_encode, job, cost, done)
+        except RuntimeError:
+            self._release(cost)
+            raise
+        return done
+
+    def batch(self) -> "EncodeBatch":
+        """Return a handle that tracks the jobs submitted through it."""
+        return EncodeBatch(self)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting jobs and optionally wait for queued writes.
+
+        Args:
+            wait: Block until every queued file is written.
+        """
+        with self._condition:
+            self._closed = True
+        self._encoders.shutdown(wait=wait)
+        self._writer.shutdown(wait=wait)
+
+    def _run_encode(self, job: EncodeJob, cost: int, done: Future) -> None:
+        """Encode on a worker thread and hand the bytes to the writer."""
+        try:
+            encoded = job()
+        except BaseException as exc:
+            self._release(cost)
+            done.set_exception(exc)
+            return
+
+        if encoded is None:
+            self._release(cost)
+            done.set_result(False)
+            return
+
+        try:
+            self._writer.submit(self._run_write, encoded, cost, done)
+        except RuntimeError as exc:
+            self._release(cost)
+            done.set_exception(exc)
+
+    def _run_write(self, encoded: EncodedFile, cost: int, done: Future) -> None:
+        """Write encoded bytes on the writer thread."""
+        try:
+            written = write_encoded_file(encoded)
+        except BaseException as exc:
+            print(f"[EncodePipeline] Could not write {encoded.path}: {exc}")
+            done.set_exception(exc)
+        else:
+            done.set_result(written)
+        finally:
+            self._release(cost)
+
+    def _release(self, cost: int) -> None:
+        """Return reserved bytes to the budget and wake blocked submitters."""
+        with self._condition:
+            self._pending_bytes = max(0, self._pending_bytes - cost)
+            self._condition.notify_all()
+
+
+class EncodeBatch:
+    """Track the files one caller submitted to a shared ``EncodePipeline``.
+
+    Several spritesheets share one pipeline during extraction. Each one
+    waits on its own batch so it finishes only after its files are on disk.
+
+    Attributes:
+        pipeline: Pipeline that runs the submitted jobs.
+    """
+
+    def __init__(self, pipeline: EncodePipeline) -> None:
+        """Bind the batch to a pipeline.
+
+        Args:
+            pipeline: Pipeline that runs the submitted jobs.
+        """
+        self.pipeline = pipeline
+        self._written: Dict[str, int] = {}
+        self._futures: List[Tuple[str, Future]] = []
+        self._lock = Lock()
+
+    def submit(self, job: EncodeJob, cost_bytes: int, kind: str = "file") -> None:
+        """Queue a job on the pipeline and remember its future.
+
+        Falls back to encoding and writing inline if the pipeline has
+        already been shut down.
+
+        Args:
+            job: Callable returning the encoded file.
+            cost_bytes: Memory held by the job until it is written.
+            kind: Label the write is counted under by ``take_written``.
+        """
+        try:
+            future = self.pipeline.submit(job, cost_bytes)
+        except RuntimeError:
+            future = Future()
+            try:
+                future.set_result(write_encoded_file(job()))
+            except Exception as exc:
+                future.set_exception(exc)
+        with self._lock:
+            self._futures.append((kind, future))
+
+    def wait(self) -> int:
+        """Block until every job submitted through this batch has finished.
+
+        Successful writes are counted per kind for ``take_written``; failed
+        jobs are logged and not counted.
+
+        Returns:
+            Number of files written by this batch since the last wait.
+        """
+        with self._lock:
+            futures, self._futures = self._futures, []
+
+        written = 0
+        for kind, future in futures:
+            try:
+                if future.result():
+                    written += 1
+                    with self._lock:
+                        self._written[kind] = self._written.get(kind, 0) + 1
+            except Exception as exc:
+                print(f"[EncodePipeline] Export job failed: {exc}")
+        return written
+
+    def take_written(self) -> Dict[str, int]:
+        """Return and reset the per-kind counts of files written so far.
+
+        Only jobs collected by ``wait`` are counted, so call it first.
+
+        Returns:
+            Mapping of submission ``kind`` to files written.
+        """
+        with self._lock:
+            written, self._written = self._written, {}
+        return written
+
+
+__all__ = [
+    "DEFAULT_PENDING_BYTES",
+    "EncodeBatch",
+    "EncodeJob",
+    "EncodedFile",
+    "EncodePipeline",
+    "write_encoded_file",
+]
@@ -9,7 +9,6 @@ Type Aliases:
     ProgressCallback: ``Callable[[int, int, str], None]`` for progress updates.
     StatisticsCallback: ``Callable[[int, int, int], None]`` for totals.
     ErrorPromptCallback: ``Callable[[str, BaseException], bool]`` for error prompts.
-    StatsUpdate: Dict payload carrying counter deltas between threads.
 """
 
 from __future__ import annotations
@@ -18,7 +17,7 @@ import gc
 import os
 import time
 from pathlib import Path
-from queue import SimpleQueue, Empty
+from queue import SimpleQueue
 from threading import Event, Lock
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
@@ -33,16 +32,37 @@ except ImportError:  # pragma: no cover - psutil is part of app requirements
 from core.extractor.atlas_processor import AtlasProcessor
 from core.extractor.sprite_processor import SpriteProcessor
 from core.extractor.animation_processor import AnimationProcessor
+from core.extractor.encode_pipeline import DEFAULT_PENDING_BYTES, EncodePipeline
+from core.extractor.memory_admission import (
+    MemoryAdmission,
+    MemoryReservation,
+    estimate_extraction_memory,
+    format_reservation_report,
+)
 from core.extractor.preview_generator import PreviewGenerator
+from core.extractor.progress_board import (
+    PROGRESS_SAMPLE_INTERVAL,
+    ProgressBoard,
+    ProgressTotals,
+    WorkerProgress,
+)
+from core.extractor.work_scheduler import (
+    FileCost,
+    ScheduleReport,
+    build_schedule_report,
+    estimate_file_cost,
+    get_cost_calibration,
+    schedule_longest_first,
+)
 from core.extractor.spritemap import AdobeSpritemapRenderer
 from core.extractor.unknown_spritesheet_handler import UnknownSpritesheetHandler
+from utils.image_pool import DEFAULT_POOL_BYTES, get_image_pool
 from utils.translation_manager import tr as translate
 from utils.utilities import Utilities
 
 ProgressCallback = Callable[[int, int, str], None]
 StatisticsCallback = Callable[[int, int, int], None]
 ErrorPromptCallback = Callable[[str, BaseException], bool]
-StatsUpdate = Dict[str, Any]
 
 SUPPORTED_METADATA_EXTENSIONS: Tuple[str, ...] = (
     ".json",
@@ -68,7 +88,8 @@ class Extractor:
     """Orchestrate parallel spritesheet parsing and animation export.
 
     Manages a pool of ``FileProcessorWorker`` threads, dispatches files from
-    a queue, aggregates statistics, and supports pause/cancel semantics.
+    a queue, samples their progress at a fixed rate, and supports
+    pause/cancel semantics.
 
     Attributes:
         settings_manager: Provides per-spritesheet and global settings.
@@ -115,16 +136,12 @@ class Extractor:
         self.unknown_handler = UnknownSpritesheetHandler()
         self._trace_stats = False
         # UI updates and worker management
-        self._stats_queue = SimpleQueue()
         self._progress_callback = None
-        self.work_in_progress = {}
-        self._worker_labels = {}
-        self._last_started_file = None
-        self._progress_dirty = False
-        self._last_progress_emit = 0.0
-        self._progress_emit_interval = 0.12  # seconds between UI payloads
-        self._qt_event_interval = 0.04
-        self._last_qt_event_pump = 0.0
+        self._progress_board = ProgressBoard()
+        self._worker_progress: Dict[QThread, WorkerProgress] = {}
+        self._reported_totals = ProgressTotals()
+        self._last_progress_payload = None
+        self._progress_sample_interval = PROGRESS_SAMPLE_INTERVAL
         self._pause_event = Event()
         self._pause_event.set()
         self._awaiting_error_decision = False
@@ -137,6 +154,18 @@ class Extractor:
         self._memory_overage_logged = False
         self._last_gc_collect = 0.0
         self._gc_collect_interval = 0.75
+        self._memory_admission: Optional[MemoryAdmission] = None
+        # Shared encode/write pipeline for frame and animation files
+        self._encode_pipeline: Optional[EncodePipeline] = None
+        self._encode_pipeline_users = 0
+        self._encode_pipeline_lock = Lock()
+        # Cost-aware queue ordering and per-file timings
+        self._file_costs: List[FileCost] = []
+        self._file_durations: Dict[str, float] = {}
+        self._file_durations_lock = Lock()
+        self._scheduled_worker_count = 0
+        self._schedule_seconds_per_unit = 0.0
+        self._last_schedule_report: Optional[ScheduleReport] = None
 
     def process_directory(
         self,
@@ -171,10 +200,10 @@ class Extractor:
 
         cpu_threads = self._resolve_cpu_threads()
         filenames = list(spritesheet_list or [])
+        max_threads = self._determine_worker_budget(cpu_threads, len(filenames))
         if filenames:
-            filenames = self._prioritize_spritesheets(input_dir, filenames)
+            filenames = self._schedule_spritesheets(input_dir, filenames, max_threads)
         self.total_files = len(filenames)
-        self.work_in_progress.clear()
         for filename in filenames:
             self.file_queue.put(filename)
         # Push sentinel entries so workers know when to stop.
@@ -182,19 +211,27 @@ class Extractor:
         # Using None avoids extra allocations and still keeps intent clear.
         self.start_time = time.time()
 
-        max_threads = self._determine_worker_budget(cpu_threads, len(filenames))
         if max_threads:
             for _ in range(max_threads):
                 self.file_queue.put(None)
         else:
             self._workers_done_event.set()
-        self._start_worker_pool(
-            max_threads,
-            input_dir,
-            output_dir,
-            parent_window,
-        )
-        self._monitor_workers()
+        # Hold the pipeline for the whole run so per-file extract calls
+        # share it instead of starting and stopping it for every file.
+        self.acquire_encode_pipeline()
+        try:
+            self._start_worker_pool(
+                max_threads,
+                input_dir,
+                output_dir,
+                parent_window,
+            )
+            self._monitor_workers()
+        finally:
+            self.release_encode_pipeline()
+            # Decoded atlases are only shared within a run; do not keep up
+            # to the pool budget resident once extraction is over.
+            get_image_pool().clear()
         self._finalize_directory_processing()
         self._raise_if_cancelled()
 
@@ -212,24 +249,24 @@ class Extractor:
         self.total_sprites_failed = 0
         self._memory_limit_mb = self._resolve_memory_limit()
         self._memory_overage_logged = False
+        self._memory_admission = self._create_memory_admission()
+        get_image_pool().set_max_bytes(self._resolve_image_pool_bytes())
+        self._file_costs = []
+        with self._file_durations_lock:
+            self._file_durations = {}
+        self._scheduled_worker_count = 0
+        self._last_schedule_report = None
         self.processed_count = 0
         self.active_workers = []
-        self._stats_queue = SimpleQueue()
         self.file_queue = SimpleQueue()
-        self.work_in_progress = {}
-        self._worker_labels = {}
-        self._last_started_file = None
+        self._progress_board = ProgressBoard()
+        self._worker_progress = {}
+        self._reported_totals = ProgressTotals()
+        self._last_progress_payload = None
         if hasattr(self, "_workers_done_event"):
             self._workers_done_event.clear()
         else:
             self._workers_done_event = Event()
-        if hasattr(self, "_stats_available_event"):
-            self._stats_available_event.clear()
-        else:
-            self._stats_available_event = Event()
-        self._progress_dirty = False
-        self._last_progress_emit = 0.0
-        self._last_qt_event_pump = 0.0
 
     def _choose_progress_callback(self, override_callback):
         """Return an explicit override or fall back to the instance callback.
@@ -368,6 +405,95 @@ class Extractor:
             self._maybe_collect_garbage()
             time.sleep(self._memory_check_interval)
 
+    def _read_rss_bytes(self) -> Optional[int]:
+        """Return process RSS in bytes, or ``None`` without ``psutil``."""
+
+        if psutil is None:
+            return None
+        if self._psutil_process is None:
+            self._psutil_process = psutil.Process(os.getpid())
+        return self._psutil_process.memory_info().rss
+
+    def _create_memory_admission(self) -> Optional[MemoryAdmission]:
+        """Build the per-run admission controller from the memory limit.
+
+        The budget is the configured limit minus what the process already
+        uses, but never less than a quarter of the limit. Returns ``None``
+        when no memory limit is configured.
+        """
+
+        if not self._memory_limit_mb:
+            return None
+        limit_bytes = self._memory_limit_mb * 1024 * 1024
+        baseline = 0
+        try:
+            baseline = self._read_rss_bytes() or 0
+        except Exception:
+            baseline = 0
+        budget = max(limit_bytes // 4, limit_bytes - baseline)
+        return MemoryAdmission(budget, rss_reader=self._read_rss_bytes)
+
+    def reserve_file_memory(
+        self,
+        label: str,
+        atlas_path: str,
+        metadata_path: Optional[str],
+        settings: Dict[str, Any],
+        is_spritemap: bool = False,
+    ) -> Optional[MemoryReservation]:
+        """Wait until a file's predicted memory fits the budget and reserve it.
+
+        The prediction is read from the atlas header and metadata sprite
+        count before any pixels are decoded, so large files queue here
+        while smaller ones continue on other workers.
+
+        Args:
+            label: File name used in log messages.
+            atlas_path: Path to the atlas image.
+            metadata_path: Metadata path, or ``None`` for unknown sheets.
+            settings: File settings; export scales enlarge the estimate.
+            is_spritemap: ``True`` for Adobe spritemap projects.
+
+        Returns:
+            Reservation to pass to ``release_file_memory``, or ``None`` when
+            admission control is disabled or the run was cancelled.
+        """
+
+        admission = self._memory_admission
+        if admission is None:
+            return None
+
+        scales = []
+        for key in ("scale", "frame_scale"):
+            try:
+                scales.append(abs(float(settings.get(key) or 1.0)))
+            except (TypeError, ValueError):
+                continue
+        estimate = estimate_extraction_memory(
+            atlas_path,
+            metadata_path,
+            scale=max(scales, default=1.0),
+            is_spritemap=is_spritemap,
+        )
+        return admission.acquire(label, estimate, self.cancel_event)
+
+    def release_file_memory(self, reservation: Optional[MemoryReservation]) -> None:
+        """Return a file's reservation to the admission budget.
+
+        Estimated versus observed peak memory is logged when
+        ``_trace_stats`` is enabled.
+
+        Args:
+            reservation: Value returned by ``reserve_file_memory``.
+        """
+
+        admission = self._memory_admission
+        if admission is None or reservation is None:
+            return
+        admission.release(reservation)
+        if self._trace_stats:
+            print(format_reservation_report(reservation))
+
     def _after_file_processed(self) -> None:
         """Post-processing hook invoked after each spritesheet completes.
 
@@ -379,6 +505,60 @@ class Extractor:
             return
         self._maybe_collect_garbage(force=True)
 
+    def _resolve_encode_budget_bytes(self) -> int:
+        """Return how many raw pixel bytes may wait in the encode pipeline.
+
+        With a memory limit configured, queued encode jobs may hold up to an
+        eighth of it (at least 64 MB). Otherwise ``DEFAULT_PENDING_BYTES``.
+        """
+
+        if not self._memory_limit_mb:
+            return DEFAULT_PENDING_BYTES
+        return max(64, self._memory_limit_mb // 8) * 1024 * 1024
+
+    def _resolve_image_pool_bytes(self) -> int:
+        """Return the byte budget for decoded atlases kept between uses.
+
+        With a memory limit configured, released decodes may hold up to an
+        eighth of it (at least 64 MB). Otherwise ``DEFAULT_POOL_BYTES``.
+        """
+
+        if not self._memory_limit_mb:
+            return DEFAULT_POOL_BYTES
+        return max(64, self._memory_limit_mb // 8) * 1024 * 1024
+
+    def acquire_encode_pipeline(self) -> EncodePipeline:
+        """Return the shared encode pipeline, starting it on first use.
+
+        Every call must be paired with ``release_encode_pipeline``; the
+        pipeline is stopped once its last user releases it. The pipeline
+        blocks new submissions through ``wait_for_memory_budget`` so
+        encoding honours the same memory threshold as the file workers.
+        """
+
+        with self._encode_pipeline_lock:
+            if self._encode_pipeline is None:
+                self._encode_pipeline = EncodePipeline(
+                    max_pending_bytes=self._resolve_encode_budget_bytes(),
+                    memory_gate=self.wait_for_memory_budget,
+                )
+            self._encode_pipeline_users += 1
+            return self._encode_pipeline
+
+    def release_encode_pipeline(self) -> None:
+        """Drop one user of the encode pipeline.
+
+        The last user flushes pending writes and stops the pipeline threads.
+        """
+
+        with self._encode_pipeline_lock:
+            self._encode_pipeline_users = max(0, self._encode_pipeline_users - 1)
+            if self._encode_pipeline_users:
+                return
+            pipeline, self._encode_pipeline = self._encode_pipeline, None
+        if pipeline is not None:
+            pipeline.shutdown(wait=True)
+
     @staticmethod
     def _determine_worker_budget(cpu_threads, file_count):
         """Return the smaller of available threads and pending files.
@@ -392,39 +572,111 @@ class Extractor:
         """
         return min(cpu_threads, file_count)
 
-    def _prioritize_spritesheets(
-        self, input_dir: str, filenames: Sequence[str]
+    def _schedule_spritesheets(
+        self, input_dir: str, filenames: Sequence[str], worker_count: int
     ) -> List[str]:
-        """Reorder filenames so heavy spritemap projects process last.
+        """Order filenames longest-predicted-first so workers drain evenly.
 
-        Adobe spritemap projects are CPU and memory intensive, so deferring
-        them reduces peak resource contention when mixed with lighter atlases.
+        Each file's cost is estimated from its atlas pixel count, sprite and
+        animation counts, and the export formats its settings request. Heavy
+        files then start early instead of leaving most workers idle behind
+        them at the end of the run. With memory admission enabled it keeps
+        heavy files from running together; without it, spritemap projects
+        are still queued after all other files.
 
         Args:
             input_dir: Root directory containing atlas files.
             filenames: Unordered sequence of relative paths.
+            worker_count: Workers that will pull from the queue.
 
         Returns:
-            List with standard atlases first, followed by spritemap projects.
+            Filenames in descending order of predicted cost, spritemap
+            projects last when memory admission is off.
         """
 
         if not filenames:
             return []
 
-        regular: List[str] = []
-        spritemaps: List[str] = []
+        costs: List[FileCost] = []
         for name in filenames:
             try:
-                target = (
-                    spritemaps
-                    if self._looks_like_spritemap(input_dir, name)
-                    else regular
-                )
+                costs.append(self._estimate_file_cost(input_dir, name))
             except Exception:
-                target = regular
-            target.append(name)
+                costs.append(FileCost(name))
+
+        self._file_costs = schedule_longest_first(
+            costs, spritemaps_last=self._memory_admission is None
+        )
+        self._scheduled_worker_count = worker_count
+        self._schedule_seconds_per_unit = get_cost_calibration().seconds_per_unit
+        return [item.filename for item in self._file_costs]
+
+    def _estimate_file_cost(self, input_dir: str, filename: str) -> FileCost:
+        """Predict the processing cost of one queued file.
 
-        return regular + spritemaps
+        Args:
+            input_dir: Root directory containing atlas files.
+            filename: Relative path to the atlas image.
+
+        Returns:
+            ``FileCost`` for the file.
+        """
+
+        atlas_path = Path(input_dir) / Path(filename)
+        is_spritemap = self._looks_like_spritemap(input_dir, filename)
+        if is_spritemap:
+            metadata_path = str(atlas_path.parent / f"{atlas_path.stem}.json")
+        else:
+            metadata_path = self.find_metadata_file(atlas_path.parent, atlas_path.stem)
+        settings = self.settings_manager.get_settings(filename)
+        return estimate_file_cost(
+            filename,
+            str(atlas_path),
+            metadata_path,
+            settings,
+            is_spritemap=is_spritemap,
+        )
+
+    @staticmethod
+    def find_metadata_file(atlas_dir: Path, base_filename: str) -> Optional[str]:
+        """Return the preferred metadata file next to an atlas, if any.
+
+        Candidates named ``<base_filename>.<ext>`` are ranked by the order of
+        ``SUPPORTED_METADATA_EXTENSIONS``.
+
+        Args:
+            atlas_dir: Folder containing the atlas image.
+            base_filename: Atlas file name without its extension.
+
+        Returns:
+            Path to the metadata file, or ``None`` when none exists.
+        """
+
+        metadata_candidates: Dict[str, str] = {}
+        try:
+            for candidate in Path(atlas_dir).glob(f"{base_filename}.*"):
+                suffix = candidate.suffix.lower()
+                if suffix in SUPPORTED_METADATA_SUFFIXES:
+                    metadata_candidates.setdefault(suffix, str(candidate))
+        except Exception:
+            metadata_candidates = {}
+
+        for ext in SUPPORTED_METADATA_EXTENSIONS:
+            chosen = metadata_candidates.get(ext)
+            if chosen:
+                return chosen
+        return None
+
+    def record_file_duration(self, filename: str, seconds: float) -> None:
+        """Store how long a worker spent processing a file.
+
+        Args:
+            filename: Queue entry that was processed.
+            seconds: Wall time spent extracting it.
+        """
+
+        with self._file_durations_lock:
+            self._file_durations[filename] = seconds
 
     @staticmethod
     def _looks_like_spritemap(input_dir: str, filename: str) -> bool:
@@ -455,7 +707,10 @@ class Extractor:
         output_dir,
         parent_window,
     ):
-        """Spawn worker threads and wire up their signals.
+        """Spawn worker threads, each with its own progress slot.
+
+        Only failures and thread exit are signalled; routine progress is
+        read from the slots by ``_monitor_workers``.
 
         Args:
             max_threads: Number of workers to create.
@@ -469,62 +724,47 @@ class Extractor:
         self._planned_worker_count = max_threads
 
         for i in range(max_threads):
+            label = f"Worker {i + 1}"
+            progress = self._progress_board.add_worker(label)
             worker = FileProcessorWorker(
                 input_dir,
                 output_dir,
                 parent_window,
                 self,
                 self.file_queue,
+                progress,
             )
-
-            label = f"Worker {i + 1}"
             worker.setObjectName(label)
-            self._worker_labels[worker] = label
+            self._worker_progress[worker] = progress
 
-            worker.file_completed.connect(self._on_file_completed)
             worker.file_failed.connect(self._on_file_failed)
-            worker.task_started.connect(
-                lambda filename, w=worker: self._on_worker_task_started(w, filename)
-            )
-            worker.task_finished.connect(
-                lambda filename, w=worker: self._on_worker_task_finished(w, filename)
-            )
             worker.finished.connect(lambda w=worker: self._worker_finished(w))
 
             self.active_workers.append(worker)
             worker.start()
 
     def _monitor_workers(self) -> None:
-        """Drain statistics queue and update progress until workers finish.
+        """Sample worker progress at a fixed rate until all workers exit.
 
-        Uses blocking waits with timeouts to reduce idle spin while keeping
-        the UI responsive. Exits once all workers signal completion and the
-        stats queue is empty.
+        Each tick delivers pending worker signals (failures and thread
+        exit), sums the workers' progress slots and reports changes to the
+        UI. Also samples RSS for admitted files so their observed peaks can
+        be compared with the estimates.
         """
         while True:
+            if self._memory_admission is not None:
+                self._memory_admission.sample()
             if self.cancel_event.is_set():
                 self._capture_cancel_reason()
                 self._wake_workers()
-            processed = self._drain_stats_queue()
-            if not processed:
-                timeout = self._compute_wait_timeout()
-                if self.cancel_event.is_set():
-                    timeout = min(timeout, 0.02)
-                woke_for_stats = self._stats_available_event.wait(timeout)
-                if not woke_for_stats:
-                    self._maybe_process_qt_events(force=True)
-                else:
-                    self._maybe_process_qt_events()
-            else:
-                self._maybe_process_qt_events()
-
-            self._update_progress_text()
+            self._process_qt_events()
+            self._sample_progress()
 
-            if self._workers_done_event.is_set() and self._stats_queue_empty():
+            if self._workers_done_event.is_set():
                 break
+            self._workers_done_event.wait(self._progress_sample_interval)
 
-        self._drain_stats_queue()
-        self._update_progress_text(force=True)
+        self._sample_progress(force=True)
 
     @staticmethod
     def _process_qt_events() -> None:
@@ -533,35 +773,12 @@ class Extractor:
         if app is not None:
             QCoreApplication.processEvents()
 
-    def _maybe_process_qt_events(self, *, force: bool = False) -> None:
-        """Throttle event processing so high-volume batches do not starve the UI.
-
-        Args:
-            force: When ``True``, bypass throttling and pump events immediately.
-        """
-        now = time.monotonic()
-        if force or (now - self._last_qt_event_pump) >= self._qt_event_interval:
-            self._process_qt_events()
-            self._last_qt_event_pump = now
-
-    def _compute_wait_timeout(self) -> float:
-        """Pick the next wait duration based on queued work and worker state.
-
-        Returns:
-            Timeout in seconds, shorter when work is in progress.
-        """
-        active_tasks = len(self.work_in_progress)
-        if active_tasks:
-            return 0.015
-        if self.active_workers:
-            return 0.05
-        return 0.08
-
     def _finalize_directory_processing(self) -> None:
         """Capture timing and aggregate stats once all workers have stopped.
 
-        Stores elapsed duration and totals in instance attributes for later
-        retrieval by UI components or diagnostics.
+        Stores elapsed duration, totals, and the predicted versus actual
+        makespan in instance attributes for later retrieval by UI components
+        or diagnostics.
         """
         end_time = time.time()
         duration = end_time - self.start_time
@@ -572,6 +789,25 @@ class Extractor:
             self.total_anims_generated,
             self.total_sprites_failed,
         )
+        with self._file_durations_lock:
+            durations = dict(self._file_durations)
+        self._last_schedule_report = build_schedule_report(
+            self._file_costs,
+            durations,
+            self._scheduled_worker_count,
+            duration,
+            self._schedule_seconds_per_unit,
+        )
+        get_cost_calibration().update(self._file_costs, durations)
+
+    def get_schedule_report(self) -> Optional[ScheduleReport]:
+        """Return predicted versus actual makespan of the last finished run.
+
+        Returns:
+            ``ScheduleReport``, or ``None`` before a run has finished or if
+            no file duration was measured.
+        """
+        return self._last_schedule_report
 
     def request_cancel(self, reason: Optional[str] = None) -> None:
         """Set the cancel flag, wake workers, and optionally note the reason.
@@ -675,145 +911,48 @@ class Extractor:
 
         return continue_processing
 
-    def _queue_stats_update(
-        self,
-        *,
-        frames_delta: int = 0,
-        anims_delta: int = 0,
-        failed_delta: int = 0,
-        processed_delta: int = 1,
-        debug_message: Optional[str] = None,
-    ) -> None:
-        """Push a stats delta into the queue consumed by the monitor thread.
+    def _sample_progress(self, *, force: bool = False) -> None:
+        """Apply the workers' latest totals and report any change to the UI.
 
         Args:
-            frames_delta (int): Change in exported frame count.
-            anims_delta (int): Change in exported animation count.
-            failed_delta (int): Change in failure count.
-            processed_delta (int): Increment applied to processed file count.
-            debug_message (str | None): Optional trace string for verbose logging.
+            force: When ``True``, report progress even if nothing changed.
         """
+        totals = self._progress_board.totals()
+        if totals != self._reported_totals:
+            self._apply_totals(totals)
+        self._update_progress_text(force=force)
 
-        update: StatsUpdate = {
-            "frames_delta": frames_delta,
-            "anims_delta": anims_delta,
-            "failed_delta": failed_delta,
-            "processed_delta": processed_delta,
-            "debug_message": debug_message,
-        }
-        self._stats_queue.put(update)
-        if hasattr(self, "_stats_available_event"):
-            self._stats_available_event.set()
-
-    def _drain_stats_queue(self) -> bool:
-        """Flush pending stats updates and apply them sequentially.
-
-        Returns:
-            bool: ``True`` when at least one update was processed.
-        """
-        processed = False
-        while True:
-            try:
-                update = self._stats_queue.get(block=False)
-            except Empty:
-                break
-            self._apply_stats_update(update)
-            processed = True
-
-        if processed:
-            self._update_progress_text()
-
-        if not self._stats_queue_empty() and hasattr(self, "_stats_available_event"):
-            # Leave event set so waiters wake immediately for remaining items.
-            pass
-        elif hasattr(self, "_stats_available_event"):
-            self._stats_available_event.clear()
-
-        return processed
-
-    def _stats_queue_empty(self) -> bool:
-        """Return ``True`` when no pending stats updates remain."""
-        return self._stats_queue.empty()
-
-    def _apply_stats_update(self, update: StatsUpdate) -> None:
-        """Update global counters and emit statistics callbacks for a delta.
+    def _apply_totals(self, totals: ProgressTotals) -> None:
+        """Store summed worker totals and emit the statistics callback.
 
         Args:
-            update (StatsUpdate): Queued dictionary describing counter deltas.
+            totals: Totals of all workers, as sampled from the progress board.
         """
+        self._reported_totals = totals
+        self.total_frames_generated = totals.frames
+        self.total_anims_generated = totals.anims
+        self.total_sprites_failed = totals.failed
+        self.processed_count = totals.files
 
-        frames_delta = int(update.get("frames_delta", 0))
-        anims_delta = int(update.get("anims_delta", 0))
-        failed_delta = int(update.get("failed_delta", 0))
-
-        processed_delta = int(update.get("processed_delta", 0))
-
-        self.total_frames_generated += frames_delta
-        self.total_anims_generated += anims_delta
-        self.total_sprites_failed += failed_delta
-        self.processed_count += processed_delta
-
-        stats_snapshot = (
-            self.total_frames_generated,
-            self.total_anims_generated,
-            self.total_sprites_failed,
-        )
+        stats_snapshot = (totals.frames, totals.anims, totals.failed)
 
         if self._trace_stats:
             print(
-                f"[_apply_stats_update] Totals: {stats_snapshot[0]} frames, {stats_snapshot[1]} anims, {stats_snapshot[2]} failed"
+                f"[_apply_totals] Totals: {stats_snapshot[0]} frames, {stats_snapshot[1]} anims, {stats_snapshot[2]} failed"
             )
 
         if self.statistics_callback:
             self.statistics_callback(*stats_snapshot)
 
-        self._progress_dirty = True
-
-    def _on_worker_task_started(self, worker: QThread, filename: str) -> None:
-        """Record which worker claimed a file so progress summaries stay accurate.
-
-        Args:
-            worker (QThread): Worker instance that began processing.
-            filename (str): Path claimed by the worker.
-        """
-        if worker:
-            self.work_in_progress[worker] = filename
-        if filename:
-            self._last_started_file = str(filename)
-        self._progress_dirty = True
-        self._update_progress_text(force=True)
-
-    def _on_worker_task_finished(self, worker: QThread, filename: str) -> None:
-        """Drop worker bookkeeping once a file completes.
-
-        Args:
-            worker: Worker instance that finished its task.
-            filename: Path that was being processed.
-        """
-        if worker in self.work_in_progress:
-            self.work_in_progress.pop(worker, None)
-        self._progress_dirty = True
-        self._update_progress_text(force=True)
-
     def _update_progress_text(self, *, force: bool = False) -> None:
-        """Emit throttled progress updates with human-friendly worker summaries.
+        """Emit progress with human-friendly worker summaries when it changed.
 
         Args:
-            force: When ``True``, bypass throttling and emit immediately.
+            force: When ``True``, emit even if the payload is unchanged.
         """
         if not self._progress_callback:
             return
 
-        if not force and not self._progress_dirty:
-            return
-
-        now = time.monotonic()
-        if (
-            not force
-            and (now - self._last_progress_emit) < self._progress_emit_interval
-        ):
-            return
-
         snapshot = self._build_worker_status_snapshot()
         summary_text = snapshot.get("summary") if snapshot else ""
         if summary_text:
@@ -826,11 +965,11 @@ class Extractor:
         total = getattr(self, "total_files", 0)
         if snapshot is not None:
             snapshot["fallback"] = current_files_text
-        self._progress_callback(
-            self.processed_count, total, snapshot or current_files_text
-        )
-        self._progress_dirty = False
-        self._last_progress_emit = now
+        payload = (self.processed_count, total, snapshot or current_files_text)
+        if not force and payload == self._last_progress_payload:
+            return
+        self._progress_callback(*payload)
+        self._last_progress_payload = payload
 
     def _build_worker_status_snapshot(self, limit: int = 4) -> Dict[str, Any]:
         """Capture a structured snapshot of worker state for the UI overlay.
@@ -845,8 +984,9 @@ class Extractor:
         processing_count = 0
 
         for idx, worker in enumerate(self.active_workers):
-            label = self._worker_labels.get(worker, f"Worker {idx + 1}")
-            current = self.work_in_progress.get(worker)
+            progress = self._worker_progress.get(worker)
+            label = progress.label if progress else f"Worker {idx + 1}"
+            current = progress.current if progress else None
             display_name = Path(current).name if current else "idle"
             if current:
                 processing_count += 1
@@ -865,7 +1005,7 @@ class Extractor:
         else:
             summary = "No workers active"
 
-        recent_full_path = self._last_started_file
+        recent_full_path = self._progress_board.last_started()
         recent_display = Path(recent_full_path).name if recent_full_path else None
 
         return {
@@ -895,45 +1035,17 @@ class Extractor:
             f"(of {worker_count} total worker{total_plural})"
         )
 
-    def _on_file_completed(
-        self, filename: str, result: Optional[Dict[str, int]]
-    ) -> None:
-        """Handle successful file completion by relaying stats deltas.
-
-        Args:
-            filename (str): Processed file path.
-            result (dict[str, int] | None): Result payload from the worker thread.
-        """
-        debug_message = None
-        frames_added = 0
-        anims_added = 0
-        failed_added = 0
-
-        if result:
-            frames_added = result.get("frames_generated", 0)
-            anims_added = result.get("anims_generated", 0)
-            failed_added = result.get("sprites_failed", 0)
-        else:
-            failed_added = 1
-
-        self._queue_stats_update(
-            frames_delta=frames_added,
-            anims_delta=anims_added,
-            failed_delta=failed_added,
-            processed_delta=1,
-            debug_message=debug_message,
-        )
-
     def _on_file_failed(self, filename: str, error: BaseException | str) -> None:
         """Handle file processing failure and decide whether to abort.
 
+        The failure is already counted in the worker's progress slot.
+
         Args:
             filename (str): File that failed to process.
             error (BaseException | str): Failure details for logging and prompts.
         """
         print(f"Error processing {filename}: {error}")
 
-        self._queue_stats_update(failed_delta=1, processed_delta=1)
         if self._handle_worker_error_prompt(filename, error):
             return
 
@@ -953,15 +1065,11 @@ class Extractor:
             worker.wait()
             worker.deleteLater()
             self.active_workers.remove(worker)
-            self._worker_labels.pop(worker, None)
 
-        self.work_in_progress.pop(worker, None)
+        self._worker_progress.pop(worker, None)
         if not self.active_workers:
             self._workers_done_event.set()
 
-        self._progress_dirty = True
-        self._update_progress_text(force=True)
-
     def extract_sprites(
         self,
         atlas_path: str,
@@ -997,14 +1105,20 @@ class Extractor:
             "sprites_failed": 0,
         }
 
+        encode_pipeline = self.acquire_encode_pipeline()
         try:
             is_unknown_spritesheet = metadata_path is None
 
             atlas_processor = AtlasProcessor(atlas_path, metadata_path, parent_window)
             sprite_processor = SpriteProcessor(
-                atlas_processor.atlas, atlas_processor.sprites
+                atlas_processor.atlas,
+                atlas_processor.sprites,
+                owns_atlas=False,
+                pages=atlas_processor.pages,
             )
-            animations = sprite_processor.process_sprites()
+            # Group sprite metadata only; frames are cropped per animation
+            # once its settings say it will actually be exported.
+            animations = sprite_processor.lazy_animations()
             animation_processor = AnimationProcessor(
                 animations,
                 atlas_path,
@@ -1012,6 +1126,7 @@ class Extractor:
                 self.settings_manager,
                 self.current_version,
                 spritesheet_label=spritesheet_label,
+                encode_pipeline=encode_pipeline,
             )
 
             frames_generated, anims_generated = animation_processor.process_animations(
@@ -1045,12 +1160,13 @@ class Extractor:
                     atlas_processor.close()
                 except Exception:
                     pass
-            if isinstance(animations, dict):
+            if animations is not None:
                 animations.clear()
             animations = None
             animation_processor = None
             sprite_processor = None
             atlas_processor = None
+            self.release_encode_pipeline()
 
         return result
 
@@ -1088,6 +1204,7 @@ class Extractor:
             "sprites_failed": 0,
         }
 
+        encode_pipeline = self.acquire_encode_pipeline()
         try:
             spritesheet_name = spritesheet_label or os.path.basename(atlas_path)
             renderer = AdobeSpritemapRenderer(
@@ -1111,6 +1228,7 @@ class Extractor:
                 self.settings_manager,
                 self.current_version,
                 spritesheet_label=spritesheet_name,
+                encode_pipeline=encode_pipeline,
             )
             frames_generated, anims_generated = animation_processor.process_animations()
             result["frames_generated"] = frames_generated
@@ -1136,6 +1254,7 @@ class Extractor:
             animations = None
             animation_processor = None
             renderer = None
+            self.release_encode_pipeline()
 
         return result
 
@@ -1201,20 +1320,15 @@ class Extractor:
 class FileProcessorWorker(QThread):
     """Worker thread that pulls filenames from a queue and processes them.
 
-    Emits Qt signals on completion or failure so the main thread can update
-    statistics and progress displays.
+    Writes the file it is on and its running totals to its own
+    ``WorkerProgress`` slot, which the extractor samples. Only failures are
+    signalled, so the extractor can prompt the user or cancel the run.
 
     Signals:
-        file_completed: ``(filename, result_dict)`` on success.
         file_failed: ``(filename, error_str)`` on failure.
-        task_started: ``(filename)`` when a file is claimed.
-        task_finished: ``(filename)`` when processing ends.
     """
 
-    file_completed = Signal(str, dict)  # filename, result
     file_failed = Signal(str, object)  # filename, error detail
-    task_started = Signal(str)
-    task_finished = Signal(str)
 
     tr = translate
 
@@ -1225,6 +1339,7 @@ class FileProcessorWorker(QThread):
         parent_window: Optional[Any],
         extractor_instance: Extractor,
         task_queue: SimpleQueue,
+        progress: Optional[WorkerProgress] = None,
     ) -> None:
         """Wire worker thread to shared queues and parent extractor instance.
 
@@ -1234,6 +1349,8 @@ class FileProcessorWorker(QThread):
             parent_window (Any | None): UI parent used for modal dialogs.
             extractor_instance (Extractor): Owning extractor orchestrator.
             task_queue (SimpleQueue): Queue of filenames plus sentinels.
+            progress (WorkerProgress | None): Slot to publish progress to;
+                a private one is used when omitted.
         """
         super().__init__()
         self.input_dir = input_dir
@@ -1241,13 +1358,14 @@ class FileProcessorWorker(QThread):
         self.parent_window = parent_window
         self.extractor = extractor_instance
         self.task_queue = task_queue
+        self.progress = progress or ProgressBoard().add_worker("Worker")
         self.current_filename = None
 
     def run(self) -> None:
         """Pull files from the queue until a sentinel or cancellation.
 
-        Emits ``task_started`` and ``task_finished`` around each file.
-        Exits cleanly when the extractor requests cancellation.
+        Publishes the claimed file to the progress slot for the duration
+        of each file. Exits cleanly when the extractor requests cancellation.
         """
         import threading
 
@@ -1264,13 +1382,13 @@ class FileProcessorWorker(QThread):
                 break
 
             self.current_filename = filename
-            self.task_started.emit(filename)
+            self.progress.start(filename)
             try:
                 if self.extractor.cancel_event.is_set():
                     break
                 self._process_single_file(filename, thread_id)
             finally:
-                self.task_finished.emit(filename)
+                self.progress.idle()
                 self.current_filename = None
 
             if self.extractor.cancel_event.is_set():
@@ -1304,20 +1422,7 @@ class FileProcessorWorker(QThread):
             )
             metadata_file = None
             if not has_animation_project:
-                metadata_candidates: Dict[str, str] = {}
-                try:
-                    for candidate in atlas_dir.glob(f"{base_filename}.*"):
-                        suffix = candidate.suffix.lower()
-                        if suffix in SUPPORTED_METADATA_SUFFIXES:
-                            metadata_candidates.setdefault(suffix, str(candidate))
-                except Exception:
-                    metadata_candidates = {}
-
-                for ext in SUPPORTED_METADATA_EXTENSIONS:
-                    chosen = metadata_candidates.get(ext)
-                    if chosen:
-                        metadata_file = chosen
-                        break
+                metadata_file = Extractor.find_metadata_file(atlas_dir, base_filename)
 
             has_metadata = metadata_file is not None
             image_is_supported = filename.lower().endswith(
@@ -1329,49 +1434,92 @@ class FileProcessorWorker(QThread):
                 and not has_metadata
                 and not (os.path.isfile(image_path) and image_is_supported)
             ):
-                self.file_failed.emit(filename, "No valid processing path found")
+                self._report_failure(filename, "No valid processing path found")
                 return
 
             settings = self.extractor.settings_manager.get_settings(filename)
 
-            if has_animation_project:
-                result = self.extractor.extract_spritemap_project(
-                    image_path,
-                    str(animation_json_path),
-                    str(spritemap_json_path),
-                    sprite_output_dir,
-                    settings,
-                    spritesheet_label=filename,
-                )
-                self.file_completed.emit(filename, result)
-
-            elif has_metadata:
-                result = self.extractor.extract_sprites(
-                    image_path,
-                    metadata_file,
-                    sprite_output_dir,
-                    settings,
-                    None,
-                    spritesheet_label=filename,
-                )
-                self.file_completed.emit(filename, result)
+            reservation = self.extractor.reserve_file_memory(
+                filename,
+                image_path,
+                str(spritemap_json_path) if has_animation_project else metadata_file,
+                settings,
+                is_spritemap=has_animation_project,
+            )
+            if self.extractor.cancel_event.is_set():
+                self.extractor.release_file_memory(reservation)
+                return
 
-            else:
-                result = self.extractor.extract_sprites(
-                    image_path,
-                    None,
-                    sprite_output_dir,
-                    settings,
-                    None,
-                    spritesheet_label=filename,
+            started = time.perf_counter()
+            try:
+                if has_animation_project:
+                    result = self.extractor.extract_spritemap_project(
+                        image_path,
+                        str(animation_json_path),
+                        str(spritemap_json_path),
+                        sprite_output_dir,
+                        settings,
+                        spritesheet_label=filename,
+                    )
+                    self._report_result(result)
+
+                elif has_metadata:
+                    result = self.extractor.extract_sprites(
+                        image_path,
+                        metadata_file,
+                        sprite_output_dir,
+                        settings,
+                        None,
+                        spritesheet_label=filename,
+                    )
+                    self._report_result(result)
+
+                else:
+                    result = self.extractor.extract_sprites(
+                        image_path,
+                        None,
+                        sprite_output_dir,
+                        settings,
+                        None,
+                        spritesheet_label=filename,
+                    )
+                    self._report_result(result)
+            finally:
+                self.extractor.record_file_duration(
+                    filename, time.perf_counter() - started
                 )
-                self.file_completed.emit(filename, result)
+                self.extractor.release_file_memory(reservation)
 
         except Exception as e:
             print(f"[FileProcessorWorker] Error processing {filename}: {str(e)}")
             import traceback
 
             traceback.print_exc()
-            self.file_failed.emit(filename, e)
+            self._report_failure(filename, e)
         finally:
             self.extractor._after_file_processed()
+
+    def _report_result(self, result: Optional[Dict[str, int]]) -> None:
+        """Count a finished file; a missing result counts as one failure.
+
+        Args:
+            result (dict[str, int] | None): Counts returned by the extraction.
+        """
+        if result:
+            self.progress.finish(
+                frames=result.get("frames_generated", 0),
+                anims=result.get("anims_generated", 0),
+                failed=result.get("sprites_failed", 0),
+            )
+        else:
+            self.progress.finish(failed=1)
+
+    def _report_failure(self, filename: str, error: BaseException | str) -> None:
+        """Count a failed file and signal the failure to the extractor.
+
+        Args:
+            filename (str): File that failed to process.
+            error (BaseException | str): Failure details.
+        """
+        self.progress.finish(failed=1)
+        self.file_failed.emit(filename, error)
@@ -2,13 +2,17 @@
 
 Provides ``FrameExporter`` which writes individual frames as image files
 in various formats (PNG, WebP, AVIF, etc.) with configurable cropping,
-scaling, and compression options.
+scaling, and compression options. When an ``EncodeBatch`` is supplied,
+frames are encoded and written on the shared encode pipeline instead of
+inline.
 """
 
+import io
 import os
 from PIL.PngImagePlugin import PngInfo
 
-from core.extractor.image_utils import ensure_pil_image
+from core.extractor.encode_pipeline import EncodedFile, write_encoded_file
+from core.extractor.image_utils import ensure_pil_image, frame_bboxes
 from utils.utilities import Utilities
 
 
@@ -22,19 +26,23 @@ class FrameExporter:
         output_dir: Directory where exported frames are saved.
         current_version: Version string embedded in image metadata.
         scale_image: Callable that scales a PIL image by a given factor.
+        encoder: Optional ``EncodeBatch`` used to encode and write frames
+            off the calling thread. ``None`` saves frames inline.
     """
 
-    def __init__(self, output_dir, current_version, scale_image_func):
+    def __init__(self, output_dir, current_version, scale_image_func, encoder=None):
         """Initialise the frame exporter.
 
         Args:
             output_dir: Base directory for exported frame folders.
             current_version: Version string for file metadata comments.
             scale_image_func: Callable ``(image, scale) -> image`` for resizing.
+            encoder: Optional ``EncodeBatch`` for parallel encoding.
         """
         self.output_dir = output_dir
         self.current_version = current_version
         self.scale_image = scale_image_func
+        self.encoder = encoder
 
     def save_frames(
         self,
@@ -62,7 +70,8 @@ class FrameExporter:
             is_unknown_spritesheet: When ``True``, applies extra cropping.
 
         Returns:
-            Number of frames successfully exported.
+            Number of frames written. Frames queued on the encoder are not
+            included; they are counted by the encode batch once written.
         """
         frames_generated = 0
         if len(image_tuples) == 0:
@@ -91,16 +100,27 @@ class FrameExporter:
         # Normalize crop_option to lowercase for comparison (supports legacy values)
         crop_option_lower = crop_option.lower() if crop_option else ""
 
+        # Bounding boxes of all kept frames in one batched pass; they decide
+        # which frames are empty and drive both crop modes.
+        kept_indices = [
+            index for index in range(len(image_tuples)) if index in kept_frame_indices
+        ]
+        frame_boxes = dict(
+            zip(
+                kept_indices,
+                frame_bboxes([image_tuples[index][1] for index in kept_indices]),
+            )
+        )
+
         animation_bbox = None
         if crop_option_lower in ("animation based", "animation"):
-            animation_bbox = self._compute_animation_bbox(
-                image_tuples, kept_frame_indices
-            )
+            animation_bbox = self._compute_animation_bbox(frame_boxes.values())
             if animation_bbox is None:
                 return frames_generated
 
         for index, frame in enumerate(image_tuples):
-            if index in kept_frame_indices:
+            bbox = frame_boxes.get(index)
+            if bbox is not None:
                 formatted_frame_name = Utilities.format_filename(
                     settings.get("prefix"),
                     spritesheet_name,
@@ -116,26 +136,26 @@ class FrameExporter:
                 frame_image = ensure_pil_image(frame[1])
                 final_frame_image = self._prepare_frame_image(
                     frame_image,
+                    bbox,
                     crop_option,
                     animation_bbox,
                     frame_scale,
                     is_unknown_spritesheet,
                 )
-                if final_frame_image is None:
-                    continue
 
-                self._save_frame_to_image(
+                if self._save_frame_to_image(
                     final_frame_image,
                     frame_filename,
                     frame_format,
                     settings.get("compression_settings"),
-                )
-                frames_generated += 1
+                ):
+                    frames_generated += 1
         return frames_generated
 
     def _prepare_frame_image(
         self,
         frame_image,
+        bbox,
         crop_option,
         animation_bbox,
         frame_scale,
@@ -145,6 +165,7 @@ class FrameExporter:
 
         Args:
             frame_image: PIL image to process.
+            bbox: Bounding box of the frame's visible pixels.
             crop_option: ``"frame"``, ``"animation"``, or ``None``.
                 Also accepts legacy values ``"Frame based"``, ``"Animation based"``.
             animation_bbox: Precomputed bounding box for animation-based crop.
@@ -152,17 +173,13 @@ class FrameExporter:
             is_unknown_spritesheet: When ``True``, runs an extra crop pass.
 
         Returns:
-            Processed PIL image, or ``None`` if the frame is fully transparent.
+            Processed PIL image.
         """
-        bbox = frame_image.getbbox()
-        if bbox is None:
-            return None
-
         # Normalize crop_option for comparison (supports legacy values)
         crop_option_lower = crop_option.lower() if crop_option else ""
 
         working = frame_image
-        if crop_option_lower in ("frame based", "frame") and bbox is not None:
+        if crop_option_lower in ("frame based", "frame"):
             working = working.crop(bbox)
         elif (
             crop_option_lower in ("animation based", "animation")
@@ -176,43 +193,114 @@ class FrameExporter:
         return self.scale_image(working, frame_scale)
 
     @staticmethod
-    def _compute_animation_bbox(image_tuples, kept_frame_indices):
-        """Compute the union bounding box across all kept frames.
+    def _compute_animation_bbox(frame_boxes):
+        """Compute the union of the kept frames' bounding boxes.
 
         Args:
-            image_tuples: Sequence of ``(name, image, metadata)`` tuples where
-                image is a PIL Image or NumPy array.
-            kept_frame_indices: Indices of frames to include in the calculation.
+            frame_boxes: Per-frame bounding boxes, ``None`` for empty frames.
 
         Returns:
             Tuple ``(left, top, right, bottom)``, or ``None`` if no valid bbox.
         """
-        min_x, min_y, max_x, max_y = float("inf"), float("inf"), 0, 0
-        for index, frame in enumerate(image_tuples):
-            if index in kept_frame_indices:
-                bbox = ensure_pil_image(frame[1]).getbbox()
-                if bbox:
-                    min_x = min(min_x, bbox[0])
-                    min_y = min(min_y, bbox[1])
-                    max_x = max(max_x, bbox[2])
-                    max_y = max(max_y, bbox[3])
-
-        if min_x > max_x or min_y > max_y:
+        boxes = [box for box in frame_boxes if box is not None]
+        if not boxes:
             return None
-        return (min_x, min_y, max_x, max_y)
+        return (
+            min(box[0] for box in boxes),
+            min(box[1] for box in boxes),
+            max(box[2] for box in boxes),
+            max(box[3] for box in boxes),
+        )
 
     def _save_frame_to_image(
         self, image, filename, frame_format, compression_settings=None
     ):
         """Write an image to disk in the specified format.
 
-        Falls back to PNG if saving in the requested format fails.
+        Falls back to PNG if saving in the requested format fails. When an
+        encoder is configured the work is queued and this returns at once.
 
         Args:
             image: PIL image to save.
             filename: Destination path including extension.
             frame_format: Format name (e.g., ``"PNG"``, ``"WebP"``).
             compression_settings: Optional dict of format-specific options.
+
+        Returns:
+            ``True`` if the file was written now, ``False`` if it was queued
+            on the encoder or could not be saved.
+        """
+
+        def job():
+            return self._encode_frame(
+                image, filename, frame_format, compression_settings
+            )
+
+        if self.encoder is not None:
+            self.encoder.submit(job, image.width * image.height * 4, kind="frame")
+            return False
+        try:
+            return write_encoded_file(job())
+        except OSError as e:
+            print(f"Error saving {filename} as {frame_format}: {e}")
+            return False
+
+    def _encode_frame(self, image, filename, frame_format, compression_settings=None):
+        """Encode an image in memory, falling back to PNG on failure.
+
+        Args:
+            image: PIL image to encode.
+            filename: Destination path including extension.
+            frame_format: Format name (e.g., ``"PNG"``, ``"WebP"``).
+            compression_settings: Optional dict of format-specific options.
+
+        Returns:
+            ``EncodedFile`` for the requested or fallback format, or ``None``
+            if the image could not be encoded at all.
+        """
+        save_kwargs = self._build_save_kwargs(image, frame_format, compression_settings)
+
+        try:
+            buffer = io.BytesIO()
+            image.save(buffer, **save_kwargs)
+            return EncodedFile(filename, buffer.getvalue())
+
+        except Exception as e:
+            print(f"Error saving {filename} as {frame_format}: {e}")
+            try:
+                png_filename = filename.rsplit(".", 1)[0] + ".png"
+                metadata = PngInfo()
+                metadata.add_text(
+                    "Comment",
+                    f"PNG generated by TextureAtlas Toolbox v{self.current_version}",
+                )
+                buffer = io.BytesIO()
+                image.save(
+                    buffer,
+                    format="PNG",
+                    pnginfo=metadata,
+                    compress_level=9,
+                    optimize=True,
+                )
+                return EncodedFile(
+                    png_filename,
+                    buffer.getvalue(),
+                    f"Fallback: Successfully saved {png_filename} as PNG",
+                )
+            except Exception as fallback_e:
+                print(f"Critical error: Could not save image even as PNG: {fallback_e}")
+                return None
+
+    def _build_save_kwargs(self, image, frame_format, compression_settings=None):
+        """Translate the frame format and compression settings to save kwargs.
+
+        Args:
+            image: PIL image being saved (TIFF stores a description on it).
+            frame_format: Format name (e.g., ``"PNG"``, ``"WebP"``).
+            compression_settings: Optional dict of format-specific options.
+
+        Returns:
+            Keyword arguments for ``PIL.Image.Image.save``.
         """
         save_kwargs = {}
 
@@ -280,29 +368,9 @@ class FrameExporter:
             )
             save_kwargs["exact"] = compression_settings.get("webp_exact", True)
 
-        try:
-            image.save(filename, **save_kwargs)
-            # print(f"Successfully saved {filename} as {frame_format}")
-
-        except Exception as e:
-            print(f"Error saving {filename} as {frame_format}: {e}")
-            try:
-                png_filename = filename.rsplit(".", 1)[0] + ".png"
-                metadata = PngInfo()
-                metadata.add_text(
-                    "Comment",
-                    f"PNG generated by TextureAtlas Toolbox v{self.current_version}",
-                )
-                image.save(
-                    png_filename,
-                    format="PNG",
-                    pnginfo=metadata,
-                    compress_level=9,
-                    optimize=True,
-                )
-                print(f"Fallback: Successfully saved {png_filename} as PNG")
-            except Exception as fallback_e:
-                print(f"Critical error: Could not save image even as PNG: {fallback_e}")
+        # Unknown formats are written with a .png extension, so encode PNG.
+        save_kwargs.setdefault("format", "PNG")
+        return save_kwargs
 
     def _apply_extra_crop_pass(self, image):
         """Remove excess transparent padding if it reduces area significantly.
@@ -1,32 +1,36 @@
 """Utilities for normalizing, selecting, and preparing frames for exporters.
 
 Provides ``AnimationContext`` (a frozen dataclass holding export-ready frame
-data), ``FramePipeline`` (helpers for sorting and filtering), and standalone
-functions for computing bounding boxes and frame durations.
+data), ``FrameSelection`` (the frames an animation needs, chosen from sprite
+metadata before cropping), ``FramePipeline`` (helpers for sorting and
+filtering), and standalone functions for computing bounding boxes and frame
+durations.
 
 Type Aliases:
     FrameTuple: ``Tuple[str, FrameSource, dict]`` representing a single frame
         with its name, image data (PIL Image or NumPy array), and metadata.
+    FrameKey: ``Tuple[str, Any]`` holding a frame's name and metadata
+        without its pixels.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Callable, Iterator, List, Optional, Sequence, Tuple
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Tuple
 
-import numpy as np
 from PIL import Image
 
 from core.extractor.frame_selector import FrameSelector
 from core.extractor.image_utils import (
     array_to_rgba_image,
     FrameSource,
-    crop_to_bbox,
+    crop_frames,
     ensure_rgba_array,
-    frame_bbox,
+    shared_bbox,
 )
 
 FrameTuple = Tuple[str, FrameSource, dict]
+FrameKey = Tuple[str, Any]
 
 
 @dataclass(frozen=True)
@@ -79,6 +83,21 @@ class AnimationContext:
         return list(self.iter_selected_frames())
 
 
+@dataclass(frozen=True)
+class FrameSelection:
+    """Frames an animation needs, chosen before any pixels are cropped.
+
+    Attributes:
+        positions: Indices into the animation's sprite list, in export order,
+            with ``indices`` filtering already applied.
+        kept_resolved: ``True`` when ``positions`` are exactly the frames to
+            export, so ``frame_selection`` must not be applied again.
+    """
+
+    positions: List[int]
+    kept_resolved: bool
+
+
 class FramePipeline:
     """Shared helpers for frame sorting, selection, and context building.
 
@@ -92,6 +111,7 @@ class FramePipeline:
         animation_name: str,
         image_tuples: Sequence[FrameTuple],
         settings: dict,
+        selection: Optional[FrameSelection] = None,
     ) -> AnimationContext:
         """Normalize frames and build an export-ready context.
 
@@ -100,14 +120,24 @@ class FramePipeline:
             animation_name: Name of the animation sequence.
             image_tuples: Raw frame tuples (name, image, metadata).
             settings: Export settings controlling selection and format.
+            selection: ``FrameSelection`` the frames were cropped from. The
+                frames are then already ordered and index-filtered.
 
         Returns:
             Populated ``AnimationContext`` with sorted frames and kept indices.
         """
-        frames = self._normalize_frames(image_tuples, settings)
-        single_frame = FrameSelector.is_single_frame(frames)
-        kept_frames = FrameSelector.get_kept_frames(settings, single_frame, frames)
-        kept_indices = FrameSelector.get_kept_frame_indices(kept_frames, frames)
+        if selection is None:
+            frames = self._normalize_frames(image_tuples, settings)
+        else:
+            frames = self._to_rgba_frames(image_tuples)
+
+        if selection is not None and selection.kept_resolved:
+            single_frame = False
+            kept_indices = list(range(len(frames)))
+        else:
+            single_frame = FrameSelector.is_single_frame(frames)
+            kept_frames = FrameSelector.get_kept_frames(settings, single_frame, frames)
+            kept_indices = FrameSelector.get_kept_frame_indices(kept_frames, frames)
         return AnimationContext(
             spritesheet_name=spritesheet_name,
             animation_name=animation_name,
@@ -117,6 +147,49 @@ class FramePipeline:
             single_frame=single_frame,
         )
 
+    def plan_selection(
+        self,
+        frame_keys: Sequence[FrameKey],
+        settings: dict,
+        frames_only: bool,
+    ) -> FrameSelection:
+        """Choose the frames an animation needs from names and metadata.
+
+        Mirrors the sorting and ``indices`` filtering of ``build_context``.
+        When only individual frames are exported, ``frame_selection`` is
+        resolved here too, unless it depends on pixel data: duplicate
+        removal, or frames whose metadata is identical and that may or may
+        not be visually the same.
+
+        Args:
+            frame_keys: ``(name, metadata)`` pairs in sprite order.
+            settings: Export settings controlling selection.
+            frames_only: ``True`` when no animated file will be written, so
+                frames outside ``frame_selection`` are never needed.
+
+        Returns:
+            ``FrameSelection`` naming the sprites to crop.
+        """
+        positions = sorted(
+            range(len(frame_keys)), key=lambda position: frame_keys[position][0]
+        )
+        indices = self._sanitize_indices(settings.get("indices"), len(positions))
+        if indices:
+            positions = [positions[i] for i in indices]
+
+        if not frames_only or FrameSelector.needs_pixel_data(settings):
+            return FrameSelection(positions, kept_resolved=False)
+
+        # Differing metadata already rules out a single-frame animation;
+        # identical metadata needs the pixels to decide.
+        first_metadata = frame_keys[positions[0]][1] if positions else None
+        if all(frame_keys[position][1] == first_metadata for position in positions):
+            return FrameSelection(positions, kept_resolved=False)
+
+        kept_frames = FrameSelector.get_kept_frames(settings, False, positions)
+        kept_indices = FrameSelector.get_kept_frame_indices(kept_frames, positions)
+        return FrameSelection([positions[i] for i in kept_indices], kept_resolved=True)
+
     def _normalize_frames(
         self, image_tuples: Sequence[FrameTuple], settings: dict
     ) -> List[FrameTuple]:
@@ -148,11 +221,15 @@ class FramePipeline:
         if indices:
             frames = [frames[i] for i in indices]
 
-        normalized: List[FrameTuple] = []
-        for name, image, metadata in frames:
-            normalized.append((name, ensure_rgba_array(image), metadata))
+        return self._to_rgba_frames(frames)
 
-        return normalized
+    @staticmethod
+    def _to_rgba_frames(image_tuples: Sequence[FrameTuple]) -> List[FrameTuple]:
+        """Convert each frame's image to an RGBA array, keeping the order."""
+        return [
+            (name, ensure_rgba_array(image), metadata)
+            for name, image, metadata in image_tuples or []
+        ]
 
     @staticmethod
     def _should_preserve_sequence(frames: Sequence[FrameTuple]) -> bool:
@@ -199,25 +276,7 @@ def compute_shared_bbox(
     Returns:
         Tuple ``(left, top, right, bottom)``, or ``None`` if all frames are empty.
     """
-    min_x, min_y, max_x, max_y = (
-        float("inf"),
-        float("inf"),
-        float("-inf"),
-        float("-inf"),
-    )
-
-    for frame in images:
-        bbox = frame_bbox(frame)
-        if bbox is None:
-            continue
-        min_x = min(min_x, bbox[0])
-        min_y = min(min_y, bbox[1])
-        max_x = max(max_x, bbox[2])
-        max_y = max(max_y, bbox[3])
-
-    if min_x == float("inf") or max_x == float("-inf"):
-        return None
-    return int(min_x), int(min_y), int(max_x), int(max_y)
+    return shared_bbox(images)
 
 
 def prepare_scaled_sequence(
@@ -240,23 +299,16 @@ def prepare_scaled_sequence(
     scale_value = scale if isinstance(scale, (int, float)) else 1.0
     crop_mode = (crop_option or "None").lower()
 
-    crop_box = None
-    frame_arrays: Optional[List[np.ndarray]] = None
+    frame_arrays = [ensure_rgba_array(frame) for frame in images]
     if crop_mode != "none":
-        frame_arrays = [ensure_rgba_array(frame) for frame in images]
         crop_box = compute_shared_bbox(frame_arrays)
         if crop_box is None:
             return []
+        frame_arrays = crop_frames(frame_arrays, crop_box)
 
     processed: List[Image.Image] = []
-    for index, frame in enumerate(images):
-        frame_array = (
-            frame_arrays[index]
-            if frame_arrays is not None
-            else ensure_rgba_array(frame)
-        )
-        working_array = crop_to_bbox(frame_array, crop_box) if crop_box else frame_array
-        working_image = array_to_rgba_image(working_array)
+    for frame_array in frame_arrays:
+        working_image = array_to_rgba_image(frame_array)
         processed.append(scale_image(working_image, scale_value))
     return processed
 
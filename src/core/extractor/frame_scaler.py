@@ -0,0 +1,142 @@
+"""Memoized frame scaling shared by the exporters of one spritesheet.
+
+Provides ``FrameScaler``, which wraps ``image_utils.scale_image`` with a
+byte-bounded LRU cache keyed by a BLAKE2b digest of the source pixels, the
+scale factor, and the resampling method. The digest is stable across
+processes and, unlike Python's ``hash``, collisions are not a practical
+concern.
+
+Held poses repeat the same pixels across many frames, and frame export and
+animation export often scale the same crops again. Filtered resizes
+(Lanczos, Bicubic, ...) cost far more than fingerprinting a frame, so those
+results are reused. Nearest-neighbour resizes in Pillow are cheaper than
+hashing the source, so they are passed straight through.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from threading import Lock
+from typing import Optional, Tuple
+
+import numpy as np
+from PIL import Image
+
+from core.extractor.image_utils import FrameSource, ensure_pil_image, scale_image
+
+DEFAULT_CACHE_BYTES = 96 * 1024 * 1024
+UNCACHED_METHODS = frozenset({"Nearest"})
+
+# Bytes of the BLAKE2b digest that fingerprints a source frame.
+DIGEST_SIZE = 16
+
+CacheKey = Tuple[Tuple, bytes, float, str]
+
+
+class FrameScaler:
+    """Scale frames with memoization of repeated inputs.
+
+    Attributes:
+        resampling_method: Default method used when ``scale`` is not given one.
+        max_bytes: Upper bound on the RGBA bytes held by cached results.
+        hits: Number of scales answered from the cache.
+        misses: Number of scales that had to resize.
+    """
+
+    def __init__(
+        self,
+        resampling_method: str = "Nearest",
+        max_bytes: int = DEFAULT_CACHE_BYTES,
+    ) -> None:
+        """Create an empty cache.
+
+        Args:
+            resampling_method: Default resampling method name.
+            max_bytes: Byte budget for cached scaled frames.
+        """
+        self.resampling_method = resampling_method
+        self.max_bytes = max(0, int(max_bytes))
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[CacheKey, Image.Image]" = OrderedDict()
+        self._cached_bytes = 0
+        self._lock = Lock()
+
+    def scale(
+        self,
+        image: FrameSource,
+        size: float,
+        resampling_method: Optional[str] = None,
+    ) -> Image.Image:
+        """Return ``image`` scaled by ``size``, reusing earlier results.
+
+        Args:
+            image: Source PIL Image or NumPy array.
+            size: Scale multiplier; negative values flip horizontally.
+            resampling_method: Method name overriding the default.
+
+        Returns:
+            Scaled PIL image. Cached results are shared between callers and
+            must not be modified in place.
+        """
+        method = resampling_method or self.resampling_method
+
+        if size == 1 or method in UNCACHED_METHODS or not self.max_bytes:
+            return scale_image(ensure_pil_image(image), size, resampling_method=method)
+
+        key = self._make_key(image, size, method)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached
+
+        scaled = scale_image(ensure_pil_image(image), size, resampling_method=method)
+        self._store(key, scaled)
+        return scaled
+
+    def clear(self) -> None:
+        """Drop every cached frame."""
+        with self._lock:
+            self._entries.clear()
+            self._cached_bytes = 0
+
+    @staticmethod
+    def _make_key(image: FrameSource, size: float, method: str) -> CacheKey:
+        """Fingerprint a source frame together with the scale parameters.
+
+        Contiguous NumPy frames are hashed through the buffer protocol
+        without copying; PIL images are hashed from their raw bytes.
+        """
+        if isinstance(image, np.ndarray):
+            data = np.ascontiguousarray(image)
+            layout = (data.dtype.str, data.shape)
+        else:
+            data = image.tobytes()
+            layout = (image.mode, image.size)
+        digest = hashlib.blake2b(data, digest_size=DIGEST_SIZE).digest()
+        return (layout, digest, float(size), method)
+
+    @staticmethod
+    def _image_bytes(image: Image.Image) -> int:
+        """Approximate memory held by an RGBA image."""
+        return image.width * image.height * 4
+
+    def _store(self, key: CacheKey, scaled: Image.Image) -> None:
+        """Insert a result and evict least recently used entries over budget."""
+        nbytes = self._image_bytes(scaled)
+        with self._lock:
+            self.misses += 1
+            # A single frame that would take most of the budget is not kept.
+            if nbytes > self.max_bytes // 2 or key in self._entries:
+                return
+            self._entries[key] = scaled
+            self._cached_bytes += nbytes
+            while self._cached_bytes > self.max_bytes and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._cached_bytes -= self._image_bytes(evicted)
+
+
+__all__ = ["DEFAULT_CACHE_BYTES", "FrameScaler"]
@@ -108,6 +108,22 @@ class FrameSelector:
         else:
             return kept_frames.split(",")
 
+    @staticmethod
+    def needs_pixel_data(settings):
+        """Return ``True`` when the frame selection compares frame contents.
+
+        Every other selection only depends on the number of frames, so it
+        can be resolved before any pixels are cropped.
+
+        Args:
+            settings: Dict with optional ``frame_selection`` key.
+        """
+        kept_frames = settings.get("frame_selection")
+        return isinstance(kept_frames, str) and kept_frames.lower() in (
+            "no_duplicates",
+            "no duplicates",
+        )
+
     @staticmethod
     def get_kept_frame_indices(kept_frames, image_tuples):
         """Convert string specifiers into a sorted list of unique indices.
@@ -1,7 +1,9 @@
 """Image helper utilities shared across extractor components.
 
 Provides conversion functions between PIL Images and NumPy arrays, bounding
-box calculations, scaling, padding, and alpha channel manipulation.
+box calculations, scaling, padding, and alpha channel manipulation. The
+``*_frames``/``frame_bboxes``/``shared_bbox`` helpers work on whole frame
+sequences at once so per-frame Python overhead stays out of hot loops.
 
 Type Aliases:
     FrameSource: ``Union[Image.Image, np.ndarray]`` — frame data may be
@@ -22,6 +24,9 @@ from utils.resampling import get_pil_resampling_filter
 FrameSource = Union[Image.Image, np.ndarray]
 BBox = Tuple[int, int, int, int]
 
+# Upper bound on temporary memory used when frames are stacked for a batch.
+BATCH_CHUNK_BYTES = 64 * 1024 * 1024
+
 
 def scale_image(
     image: Image.Image,
@@ -324,14 +329,14 @@ def apply_alpha_threshold(array: np.ndarray, threshold: float) -> np.ndarray:
     Pixels with alpha above the normalized threshold become 255; others become 0.
 
     Args:
-        array: RGBA NumPy array.
+        array: RGBA NumPy array, or an ``(N, H, W, 4)`` stack of them.
         threshold: Normalized cutoff in ``[0.0, 1.0]``.
 
     Returns:
         Array with binary alpha; may be a copy if the input was read-only.
     """
 
-    if array.ndim < 3 or array.shape[2] < 4:
+    if array.ndim < 3 or array.shape[-1] < 4:
         return array
 
     try:
@@ -354,3 +359,183 @@ def apply_alpha_threshold(array: np.ndarray, threshold: float) -> np.ndarray:
 
     np.multiply(mask, 255, out=alpha_view, casting="unsafe")
     return working
+
+
+def _alpha_plane(array: np.ndarray) -> Optional[np.ndarray]:
+    """Return a 2-D plane whose values exceed a threshold where visible.
+
+    Uses the alpha channel when present and the per-pixel channel maximum
+    otherwise, matching ``alpha_mask``.
+    """
+
+    if array.size == 0:
+        return None
+    if array.ndim == 2:
+        return array
+    if array.ndim != 3 or array.shape[2] == 0:
+        return None
+    if array.shape[2] >= 4:
+        return array[..., 3]
+    return array.max(axis=2)
+
+
+def _frame_arrays(frames: Union[Sequence[FrameSource], np.ndarray]) -> List[np.ndarray]:
+    """Convert a frame sequence (or an ``(N, H, W, C)`` stack) to arrays."""
+
+    if isinstance(frames, np.ndarray) and frames.ndim == 4:
+        return list(frames)
+    return [ensure_rgba_array(frame) for frame in frames]
+
+
+def _chunk_length(plane_shape: Tuple[int, ...], itemsize: int) -> int:
+    """Return how many planes of the given shape fit in ``BATCH_CHUNK_BYTES``."""
+
+    plane_bytes = max(1, int(np.prod(plane_shape)) * itemsize)
+    return max(1, BATCH_CHUNK_BYTES // plane_bytes)
+
+
+def shared_bbox(
+    frames: Union[Sequence[FrameSource], np.ndarray], *, threshold: int = 0
+) -> Optional[BBox]:
+    """Compute the union bounding box of visible pixels across all frames.
+
+    Frames are anchored at their top-left corner. Rather than computing a
+    bounding box per frame, the maximum alpha over all frames is reduced
+    into one plane (a single call for an ``(N, H, W, 4)`` stack) and its
+    bounding box is taken once.
+
+    Args:
+        frames: PIL Images, NumPy arrays, or an ``(N, H, W, C)`` stack.
+        threshold: Minimum alpha to be considered visible.
+
+    Returns:
+        Tuple ``(left, top, right, bottom)``, or ``None`` if every frame is
+        empty.
+    """
+
+    if isinstance(frames, np.ndarray) and frames.ndim == 4:
+        if frames.size == 0:
+            return None
+        if frames.shape[3] >= 4:
+            envelope = frames[..., 3].max(axis=0)
+        else:
+            envelope = frames.max(axis=(0, 3))
+        return bbox_from_mask(envelope > threshold)
+
+    planes = [
+        plane
+        for plane in (_alpha_plane(array) for array in _frame_arrays(frames))
+        if plane is not None
+    ]
+    if not planes:
+        return None
+
+    height = max(plane.shape[0] for plane in planes)
+    width = max(plane.shape[1] for plane in planes)
+    envelope = np.zeros((height, width), dtype=planes[0].dtype)
+    for plane in planes:
+        region = envelope[: plane.shape[0], : plane.shape[1]]
+        np.maximum(region, plane, out=region)
+    return bbox_from_mask(envelope > threshold)
+
+
+def frame_bboxes(
+    frames: Union[Sequence[FrameSource], np.ndarray], *, threshold: int = 0
+) -> List[Optional[BBox]]:
+    """Compute the bounding box of every frame in batched NumPy calls.
+
+    Frames that share dimensions are stacked (in chunks bounded by
+    ``BATCH_CHUNK_BYTES``) and their row/column alpha projections are
+    reduced along axes for the whole chunk at once.
+
+    Args:
+        frames: PIL Images, NumPy arrays, or an ``(N, H, W, C)`` stack.
+        threshold: Minimum alpha to be considered visible.
+
+    Returns:
+        One ``(left, top, right, bottom)`` tuple per frame, or ``None`` for
+        frames without visible pixels.
+    """
+
+    planes = [_alpha_plane(array) for array in _frame_arrays(frames)]
+    results: List[Optional[BBox]] = [None] * len(planes)
+
+    groups: dict = {}
+    for index, plane in enumerate(planes):
+        if plane is not None:
+            groups.setdefault(plane.shape, []).append(index)
+
+    for shape, indices in groups.items():
+        step = _chunk_length(shape, planes[indices[0]].itemsize)
+        for start in range(0, len(indices), step):
+            chunk = indices[start : start + step]
+            stacked = np.stack([planes[index] for index in chunk])
+            rows = stacked.max(axis=2) > threshold
+            cols = stacked.max(axis=1) > threshold
+            present = rows.any(axis=1)
+            tops = rows.argmax(axis=1)
+            bottoms = shape[0] - rows[:, ::-1].argmax(axis=1)
+            lefts = cols.argmax(axis=1)
+            rights = shape[1] - cols[:, ::-1].argmax(axis=1)
+            for offset, index in enumerate(chunk):
+                if present[offset]:
+                    results[index] = (
+                        int(lefts[offset]),
+                        int(tops[offset]),
+                        int(rights[offset]),
+                        int(bottoms[offset]),
+                    )
+    return results
+
+
+def crop_frames(
+    frames: Union[Sequence[FrameSource], np.ndarray],
+    bbox: BBox,
+    *,
+    alpha_threshold: Optional[float] = None,
+) -> List[np.ndarray]:
+    """Crop every frame to one bounding box, optionally binarizing alpha.
+
+    When all frames share dimensions the crop is taken as a single slice of
+    an ``(N, H, W, 4)`` stack and the alpha threshold is applied to the
+    whole stack in one call. Each returned frame is then a contiguous view
+    into that stack.
+
+    Args:
+        frames: PIL Images, NumPy arrays, or an ``(N, H, W, C)`` stack.
+        bbox: Tuple ``(left, top, right, bottom)``.
+        alpha_threshold: Optional normalized cutoff passed to
+            ``apply_alpha_threshold``.
+
+    Returns:
+        List of cropped RGBA arrays, one per frame.
+    """
+
+    arrays = _frame_arrays(frames)
+    if not arrays:
+        return []
+
+    same_shape = all(array.shape == arrays[0].shape for array in arrays)
+    if not same_shape or arrays[0].ndim != 3:
+        cropped = [crop_to_bbox(array, bbox) for array in arrays]
+        if alpha_threshold is not None:
+            cropped = [apply_alpha_threshold(array, alpha_threshold) for array in cropped]
+        return cropped
+
+    height, width = arrays[0].shape[0], arrays[0].shape[1]
+    left, top, right, bottom = bbox
+    left = max(0, min(width, int(left)))
+    top = max(0, min(height, int(top)))
+    right = max(left, min(width, int(right)))
+    bottom = max(top, min(height, int(bottom)))
+
+    stacked = np.empty(
+        (len(arrays), bottom - top, right - left, arrays[0].shape[2]),
+        dtype=np.uint8,
+    )
+    for index, array in enumerate(arrays):
+        stacked[index] = array[top:bottom, left:right]
+
+    if alpha_threshold is not None:
+        stacked = apply_alpha_threshold(stacked, alpha_threshold)
+    return list(stacked)
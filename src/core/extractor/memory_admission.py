@@ -0,0 +1,364 @@
+"""Predictive memory admission control for extraction workers.
+
+Provides ``estimate_extraction_memory``, which predicts the peak memory a
+spritesheet will need from its image header and metadata without decoding
+anything, and ``MemoryAdmission``, which hands out reservations against a
+byte budget so that memory-heavy files wait while small ones keep flowing.
+
+The estimate is a linear model over:
+
+* atlas decode: the decoded source image plus its RGBA copy,
+* frame tuples: the frames of the animation being exported (bounded by the
+  atlas area) plus per-sprite Python overhead,
+* encoder buffers: scaled frames queued on the encode pipeline.
+
+Each factor is a module constant so observed peaks, logged when a
+reservation is released, can be used to tune them. Observed peaks come from
+process-wide RSS, so they are an approximation: while several files run at
+once, each one's peak also includes memory allocated by the others.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from collections import deque
+from dataclasses import dataclass
+from threading import Condition, Event
+from typing import Callable, Deque, List, Optional
+
+from PIL import Image
+
+# Model factors, tuned against "estimated vs observed" log lines.
+FRAME_BYTES_FACTOR = 1.0
+ENCODER_BYTES_FACTOR = 0.5
+SPRITEMAP_BYTES_FACTOR = 4.0
+SPRITE_OVERHEAD_BYTES = 4096
+METADATA_SCAN_LIMIT = 8 * 1024 * 1024
+
+# A waiter older than this blocks newer admissions until it gets in.
+STARVATION_TIMEOUT = 5.0
+
+# Released reservations kept for tuning the estimate model.
+HISTORY_LIMIT = 256
+
+
+@dataclass
+class MemoryEstimate:
+    """Predicted peak memory for extracting one spritesheet.
+
+    Attributes:
+        atlas_bytes: Decoded atlas plus its RGBA working copy.
+        frame_bytes: Frame tuples and per-sprite overhead.
+        encoder_bytes: Scaled frames waiting to be encoded.
+        sprite_count: Sprite count read from metadata (``0`` if unknown).
+    """
+
+    atlas_bytes: int = 0
+    frame_bytes: int = 0
+    encoder_bytes: int = 0
+    sprite_count: int = 0
+
+    @property
+    def total_bytes(self) -> int:
+        """Sum of all estimated components."""
+        return self.atlas_bytes + self.frame_bytes + self.encoder_bytes
+
+
+@dataclass(eq=False)
+class MemoryReservation:
+    """Budget held by one admitted file.
+
+    Attributes:
+        label: File name used in log messages.
+        estimate: Estimate the reservation was sized from.
+        reserved_bytes: Bytes taken from the budget.
+        start_rss: Process RSS when the file was admitted, if known.
+        peak_rss: Highest RSS sampled while the file was running. RSS is
+            process-wide, so this includes memory used by other files
+            running at the same time.
+    """
+
+    label: str
+    estimate: MemoryEstimate
+    reserved_bytes: int
+    start_rss: Optional[int] = None
+    peak_rss: Optional[int] = None
+
+    @property
+    def observed_bytes(self) -> Optional[int]:
+        """RSS growth seen while the reservation was held, if sampled.
+
+        This approximates the file's own peak; concurrent files and
+        allocator behaviour both skew it.
+        """
+        if self.start_rss is None or self.peak_rss is None:
+            return None
+        return max(0, self.peak_rss - self.start_rss)
+
+
+def read_metadata_head(metadata_path: Optional[str]) -> Optional[str]:
+    """Read up to ``METADATA_SCAN_LIMIT`` characters of a metadata file.
+
+    Args:
+        metadata_path: Path to the metadata file, or ``None``.
+
+    Returns:
+        The text read, or ``None`` if there is no readable file.
+    """
+    if not metadata_path:
+        return None
+    try:
+        with open(metadata_path, "r", encoding="utf-8", errors="ignore") as handle:
+            return handle.read(METADATA_SCAN_LIMIT)
+    except OSError:
+        return None
+
+
+def count_sprites_in_text(text: str, suffix: str) -> int:
+    """Count sprite entries in metadata text by format-specific markers.
+
+    Args:
+        text: Metadata text, typically from ``read_metadata_head``.
+        suffix: Lower-case metadata file extension, including the dot.
+
+    Returns:
+        Approximate number of sprites.
+    """
+    if suffix == ".xml":
+        return text.count("<SubTexture") or text.count("<sprite")
+    if suffix == ".plist":
+        return text.count("<key>frame</key>") or text.count("<key>textureRect</key>")
+    if suffix in (".json", ".tpsheet", ".paper2dsprites"):
+        return text.count('"frame"') or text.count('"filename"')
+    return sum(1 for line in text.splitlines() if line.strip())
+
+
+def count_metadata_sprites(metadata_path: Optional[str]) -> int:
+    """Cheaply count sprite entries in a metadata file without parsing it.
+
+    Args:
+        metadata_path: Path to the metadata file, or ``None``.
+
+    Returns:
+        Approximate number of sprites, or ``0`` if unknown.
+    """
+    text = read_metadata_head(metadata_path)
+    if text is None:
+        return 0
+    suffix = os.path.splitext(metadata_path)[1].lower()
+    return count_sprites_in_text(text, suffix)
+
+
+def estimate_extraction_memory(
+    atlas_path: str,
+    metadata_path: Optional[str] = None,
+    *,
+    scale: float = 1.0,
+    is_spritemap: bool = False,
+) -> MemoryEstimate:
+    """Predict the peak memory needed to extract a spritesheet.
+
+    Only the image header is read; pixel data is not decoded.
+
+    Args:
+        atlas_path: Path to the atlas image.
+        metadata_path: Optional metadata path used for the sprite count.
+        scale: Largest export scale factor in the file's settings.
+        is_spritemap: ``True`` for Adobe spritemap projects, which render
+            symbols onto full-size canvases.
+
+    Returns:
+        ``MemoryEstimate``; all zeros if the header cannot be read.
+    """
+    try:
+        with Image.open(atlas_path) as header:
+            width, height = header.size
+            bands = len(header.getbands())
+    except Exception:
+        return MemoryEstimate()
+
+    pixels = width * height
+    rgba_bytes = pixels * 4
+    atlas_bytes = rgba_bytes if bands == 4 else pixels * bands + rgba_bytes
+
+    sprite_count = count_metadata_sprites(metadata_path)
+    frame_factor = SPRITEMAP_BYTES_FACTOR if is_spritemap else FRAME_BYTES_FACTOR
+    frame_bytes = int(rgba_bytes * frame_factor) + sprite_count * SPRITE_OVERHEAD_BYTES
+
+    try:
+        scale_value = abs(float(scale or 1.0))
+    except (TypeError, ValueError):
+        scale_value = 1.0
+    encoder_bytes = int(
+        rgba_bytes * frame_factor * max(1.0, scale_value) ** 2 * ENCODER_BYTES_FACTOR
+    )
+
+    return MemoryEstimate(atlas_bytes, frame_bytes, encoder_bytes, sprite_count)
+
+
+class MemoryAdmission:
+    """Admit files against a byte budget using reservations.
+
+    A file is admitted once its estimate fits in the free budget. A file
+    larger than the whole budget is admitted alone. To avoid starving large
+    files, a waiter that has been blocked longer than ``STARVATION_TIMEOUT``
+    stops newer files from being admitted until it gets in.
+
+    Attributes:
+        budget_bytes: Total bytes available for reservations.
+        rss_reader: Optional callable returning current process RSS bytes,
+            used to record observed peaks.
+        history: The last ``HISTORY_LIMIT`` released reservations, for
+            tuning the estimate model.
+    """
+
+    def __init__(
+        self,
+        budget_bytes: int,
+        rss_reader: Optional[Callable[[], Optional[int]]] = None,
+    ) -> None:
+        """Create an admission controller.
+
+        Args:
+            budget_bytes: Bytes that may be reserved at once.
+            rss_reader: Optional RSS probe for observed-peak logging.
+        """
+        self.budget_bytes = max(1, int(budget_bytes))
+        self.rss_reader = rss_reader
+        self.history: Deque[MemoryReservation] = deque(maxlen=HISTORY_LIMIT)
+        self._reserved_bytes = 0
+        self._active: List[MemoryReservation] = []
+        self._starving_since: Optional[float] = None
+        self._condition = Condition()
+
+    @property
+    def reserved_bytes(self) -> int:
+        """Bytes currently held by admitted files."""
+        with self._condition:
+            return self._reserved_bytes
+
+    def acquire(
+        self,
+        label: str,
+        estimate: MemoryEstimate,
+        cancel_event: Optional[Event] = None,
+        poll_interval: float = 0.1,
+    ) -> Optional[MemoryReservation]:
+        """Block until the estimate fits in the budget and reserve it.
+
+        Args:
+            label: File name used in log messages.
+            estimate: Predicted memory for the file.
+            cancel_event: Optional event that aborts the wait when set.
+            poll_interval: Seconds between cancellation checks.
+
+        Returns:
+            The reservation, or ``None`` if cancelled while waiting.
+        """
+        size = min(max(0, estimate.total_bytes), self.budget_bytes)
+        waiting_since = time.monotonic()
+
+        with self._condition:
+            while True:
+                if cancel_event is not None and cancel_event.is_set():
+                    self._clear_starvation(waiting_since)
+                    return None
+                if self._may_admit(size, waiting_since):
+                    break
+                now = time.monotonic()
+                if (
+                    now - waiting_since >= STARVATION_TIMEOUT
+                    and self._starving_since is None
+                ):
+                    self._starving_since = waiting_since
+                self._condition.wait(poll_interval)
+
+            self._clear_starvation(waiting_since)
+            self._reserved_bytes += size
+            rss = self._read_rss()
+            reservation = MemoryReservation(label, estimate, size, rss, rss)
+            self._active.append(reservation)
+            return reservation
+
+    def release(self, reservation: Optional[MemoryReservation]) -> None:
+        """Return a reservation's bytes to the budget and record its peak.
+
+        Args:
+            reservation: Reservation from ``acquire``; ``None`` is ignored.
+        """
+        if reservation is None:
+            return
+        self.sample()
+        with self._condition:
+            if reservation in self._active:
+                self._active.remove(reservation)
+                self._reserved_bytes = max(
+                    0, self._reserved_bytes - reservation.reserved_bytes
+                )
+                self.history.append(reservation)
+            self._condition.notify_all()
+
+    def sample(self) -> None:
+        """Record current RSS as a candidate peak for all active files."""
+        rss = self._read_rss()
+        if rss is None:
+            return
+        with self._condition:
+            for reservation in self._active:
+                if reservation.peak_rss is None or rss > reservation.peak_rss:
+                    reservation.peak_rss = rss
+
+    def _may_admit(self, size: int, waiting_since: float) -> bool:
+        """Return ``True`` if a waiter that arrived at ``waiting_since`` fits."""
+        if self._starving_since is not None and waiting_since > self._starving_since:
+            return False
+        if self._reserved_bytes == 0:
+            return True
+        return self._reserved_bytes + size <= self.budget_bytes
+
+    def _clear_starvation(self, waiting_since: float) -> None:
+        """Lift the starvation barrier if this waiter raised it."""
+        if self._starving_since == waiting_since:
+            self._starving_since = None
+            self._condition.notify_all()
+
+    def _read_rss(self) -> Optional[int]:
+        """Return process RSS in bytes, or ``None`` without a reader."""
+        if self.rss_reader is None:
+            return None
+        try:
+            return self.rss_reader()
+        except Exception:
+            return None
+
+
+def format_reservation_report(reservation: MemoryReservation) -> str:
+    """Describe estimated versus observed memory for a released file.
+
+    The observed figure is process RSS growth, an approximation of the
+    file's own peak.
+    """
+    mb = 1024 * 1024
+    estimate = reservation.estimate
+    observed = reservation.observed_bytes
+    observed_text = "n/a" if observed is None else f"{observed / mb:.1f} MB"
+    return (
+        f"[MemoryAdmission] {reservation.label}: estimated "
+        f"{estimate.total_bytes / mb:.1f} MB (atlas {estimate.atlas_bytes / mb:.1f}, "
+        f"frames {estimate.frame_bytes / mb:.1f}, encoder {estimate.encoder_bytes / mb:.1f}), "
+        f"observed peak {observed_text}"
+    )
+
+
+__all__ = [
+    "HISTORY_LIMIT",
+    "MemoryAdmission",
+    "MemoryEstimate",
+    "MemoryReservation",
+    "count_metadata_sprites",
+    "count_sprites_in_text",
+    "estimate_extraction_memory",
+    "format_reservation_report",
+    "read_metadata_head",
+]
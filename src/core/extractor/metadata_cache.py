@@ -0,0 +1,443 @@
+"""Process-wide cache of parsed spritesheet metadata.
+
+Provides ``MetadataCache``, which parses a metadata file once and hands the
+same ``ParseResult`` to every caller until the file changes on disk. The
+extract tab's animation list, previews, the editor and extraction all read
+the same metadata, so clicking back and forth through a large input folder
+no longer re-parses a sheet on every selection.
+
+Entries are keyed by absolute path and validated against the file's
+modification time and size. Besides the ``ParseResult`` each entry keeps
+derived animation-name sets for the animation list. Names of parsed formats
+are grouped from the cached ``ParseResult``, so selecting a sheet and then
+extracting it parses the file once.
+
+With a ``cache_dir`` the cache also stores parsed sprite tables and name
+sets on disk as compact ``.npz`` files, so they survive restarts.
+The application points the shared cache at a directory next to its config
+file on startup and prunes it with ``prune_disk``, which drops stale files
+and keeps the directory within ``DEFAULT_MAX_DISK_BYTES``.
+
+Cached results are shared between threads and callers and must be treated
+as read-only.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Callable, Dict, FrozenSet, Iterable, Optional, Set, Tuple
+
+import numpy as np
+
+from parsers.parser_types import ParseResult, ParserErrorCode, ParserWarning
+from parsers.sprite_table import SPRITE_DTYPE, SpriteTable
+
+DEFAULT_MAX_METADATA_ENTRIES = 512
+DEFAULT_MAX_DISK_BYTES = 256 * 1024 * 1024
+DEFAULT_MAX_DISK_AGE = 30 * 24 * 60 * 60
+DISK_FORMAT_VERSION = 2
+
+FileStamp = Tuple[int, int]
+
+
+@dataclass(eq=False)
+class _MetadataEntry:
+    """Everything cached for one metadata file at one file stamp."""
+
+    stamp: FileStamp
+    result: Optional[ParseResult] = None
+    names: Dict[str, FrozenSet[str]] = field(default_factory=dict)
+
+
+def _file_stamp(path: str) -> Optional[FileStamp]:
+    """Return ``(mtime_ns, size)`` for ``path``, or ``None`` if unreadable."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class MetadataCache:
+    """LRU cache of parse results and animation names per metadata file.
+
+    Attributes:
+        max_entries: Number of files kept in memory.
+        cache_dir: Directory for the on-disk copy, or ``None`` to keep the
+            cache in memory only.
+        hits: Lookups answered from memory or disk.
+        misses: Lookups that had to parse the file.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_METADATA_ENTRIES,
+        cache_dir: Optional[str] = None,
+    ) -> None:
+        """Create an empty cache.
+
+        Args:
+            max_entries: Number of files kept in memory.
+            cache_dir: Optional directory for persisted entries; created on
+                first write.
+        """
+        self.max_entries = max(1, int(max_entries))
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, _MetadataEntry]" = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def parse(self, path: str) -> ParseResult:
+        """Return the ``ParseResult`` for ``path``, parsing it if needed.
+
+        Args:
+            path: Metadata file path.
+
+        Returns:
+            Shared, read-only ``ParseResult``.
+
+        Raises:
+            ParserError: If the registry cannot parse the file. Failures are
+                not cached.
+        """
+        from parsers.parser_registry import ParserRegistry
+
+        key, stamp = self._key(path)
+        entry = self._lookup(key, stamp)
+        if entry is not None and entry.result is not None:
+            self._count(hit=True)
+            return entry.result
+
+        self._count(hit=False)
+        if not ParserRegistry._all_parsers:
+            ParserRegistry.initialize()
+        result = ParserRegistry.parse_file(path)
+
+        if stamp is not None:
+            entry = self._store(key, stamp)
+            entry.result = result
+            self._save(key, entry)
+        return result
+
+    def animation_names(
+        self,
+        path: str,
+        loader: Callable[[], Iterable[str]],
+        variant: str = "",
+    ) -> Set[str]:
+        """Return the animation names of ``path``, loading them if needed.
+
+        Args:
+            path: Metadata file the names are derived from.
+            loader: Computes the names on a miss.
+            variant: Distinguishes names derived with different options
+                (for example spritemap single-frame filtering).
+
+        Returns:
+            A new set the caller may modify.
+        """
+        key, stamp = self._key(path)
+        entry = self._lookup(key, stamp)
+        if entry is not None and variant in entry.names:
+            self._count(hit=True)
+            return set(entry.names[variant])
+
+        self._count(hit=False)
+        names = frozenset(loader())
+
+        if stamp is not None:
+            entry = self._store(key, stamp)
+            entry.names[variant] = names
+            self._save(key, entry)
+        return set(names)
+
+    def parsed_animation_names(self, path: str) -> Set[str]:
+        """Return the animation names extraction will produce for ``path``.
+
+        Names are grouped from the cached ``ParseResult`` the same way
+        ``SpriteProcessor`` groups sprites, so the animation list matches
+        the exported animations and shares the parse with extraction.
+
+        Args:
+            path: Metadata file path.
+
+        Returns:
+            A new set the caller may modify.
+
+        Raises:
+            ParserError: If the registry cannot parse the file.
+        """
+        from core.extractor.sprite_processor import SpriteProcessor
+
+        return self.animation_names(
+            path,
+            lambda: SpriteProcessor.animation_names(self.parse(path).sprites),
+            variant="parsed",
+        )
+
+    def invalidate(self, path: str) -> None:
+        """Forget everything cached for ``path``, in memory and on disk."""
+        key, _stamp = self._key(path)
+        with self._lock:
+            self._entries.pop(key, None)
+        disk_path = self._disk_path(key)
+        if disk_path is not None:
+            try:
+                os.remove(disk_path)
+            except OSError:
+                pass
+
+    def clear(self) -> None:
+        """Drop every in-memory entry. Files on disk are kept."""
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def _key(path: str) -> Tuple[str, Optional[FileStamp]]:
+        key = os.path.normcase(os.path.abspath(path))
+        return key, _file_stamp(key)
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def _lookup(
+        self, key: str, stamp: Optional[FileStamp]
+    ) -> Optional[_MetadataEntry]:
+        """Return the entry for ``key`` at ``stamp`` from memory or disk."""
+        if stamp is None:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.stamp == stamp:
+                self._entries.move_to_end(key)
+                return entry
+
+        loaded = self._load(key, stamp)
+        if loaded is None:
+            return None
+        with self._lock:
+            current = self._entries.get(key)
+            if current is not None and current.stamp == stamp:
+                return current
+            self._insert(key, loaded)
+            return loaded
+
+    def _store(self, key: str, stamp: FileStamp) -> _MetadataEntry:
+        """Return the entry for ``key`` at ``stamp``, creating it if needed."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.stamp != stamp:
+                entry = _MetadataEntry(stamp)
+                self._insert(key, entry)
+            return entry
+
+    def _insert(self, key: str, entry: _MetadataEntry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    # -- On-disk copy --------------------------------------------------------
+
+    def prune_disk(
+        self,
+        max_bytes: int = DEFAULT_MAX_DISK_BYTES,
+        max_age: float = DEFAULT_MAX_DISK_AGE,
+    ) -> int:
+        """Delete stale and least recently used files from ``cache_dir``.
+
+        Files not used for ``max_age`` seconds and leftover temporary files
+        are removed first, then the oldest files until the rest fit in
+        ``max_bytes``. Loading a file marks it as used.
+
+        Args:
+            max_bytes: Size budget for the directory.
+            max_age: Seconds after which an unused file is removed.
+
+        Returns:
+            Number of files removed.
+        """
+        if not self.cache_dir or not os.path.isdir(self.cache_dir):
+            return 0
+        cutoff = time.time() - max_age
+        kept = []
+        removed = 0
+        with os.scandir(self.cache_dir) as scan:
+            for item in scan:
+                if not item.is_file():
+                    continue
+                try:
+                    stat = item.stat()
+                except OSError:
+                    continue
+                if item.name.endswith(".npz") and stat.st_mtime >= cutoff:
+                    kept.append((stat.st_mtime, stat.st_size, item.path))
+                elif item.name.endswith((".npz", ".tmp")):
+                    removed += self._remove(item.path)
+
+        total = sum(size for _, size, _ in kept)
+        for _, size, path in sorted(kept):
+            if total <= max_bytes:
+                break
+            removed += self._remove(path)
+            total -= size
+        return removed
+
+    @staticmethod
+    def _remove(path: str) -> int:
+        try:
+            os.remove(path)
+        except OSError:
+            return 0
+        return 1
+
+    def _disk_path(self, key: str) -> Optional[str]:
+        if not self.cache_dir:
+            return None
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.npz")
+
+    def _save(self, key: str, entry: _MetadataEntry) -> None:
+        """Persist ``entry``; only sprite tables and name sets are stored."""
+        disk_path = self._disk_path(key)
+        if disk_path is None:
+            return
+        with self._lock:
+            result = entry.result
+            names = dict(entry.names)
+        meta = {
+            "version": DISK_FORMAT_VERSION,
+            "path": key,
+            "stamp": list(entry.stamp),
+            "names": {variant: sorted(found) for variant, found in names.items()},
+            "result": None,
+        }
+        arrays = {}
+        if result is not None and isinstance(result.sprites, SpriteTable):
+            meta["result"] = {
+                "file_path": result.file_path,
+                "parser_name": result.parser_name,
+                "pages": list(result.pages),
+                "warnings": [
+                    [warning.code.name, warning.message, warning.sprite_name]
+                    for warning in result.warnings
+                ],
+                "errors": [
+                    [error.code.name, error.message, error.sprite_name]
+                    for error in result.errors
+                ],
+            }
+            arrays["records"] = result.sprites.records
+            arrays["names"] = np.array(result.sprites.names, dtype=str)
+
+        temp_path = None
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # A unique temp file per write, so concurrent saves of one key
+            # never share a file; the last rename wins.
+            fd, temp_path = tempfile.mkstemp(
+                prefix=f".{os.path.basename(disk_path)}.",
+                suffix=".tmp",
+                dir=self.cache_dir,
+            )
+            with os.fdopen(fd, "wb") as cache_file:
+                np.savez(cache_file, meta=np.array(json.dumps(meta)), **arrays)
+            os.replace(temp_path, disk_path)
+        except Exception as exc:
+            print(f"[MetadataCache] Could not write cache for {key}: {exc}")
+            if temp_path is not None:
+                self._remove(temp_path)
+
+    def _load(self, key: str, stamp: FileStamp) -> Optional[_MetadataEntry]:
+        """Read the persisted entry for ``key`` if it matches ``stamp``."""
+        disk_path = self._disk_path(key)
+        if disk_path is None or not os.path.isfile(disk_path):
+            return None
+        try:
+            with np.load(disk_path, allow_pickle=False) as data:
+                meta = json.loads(str(data["meta"]))
+                if (
+                    meta.get("version") != DISK_FORMAT_VERSION
+                    or meta.get("path") != key
+                    or tuple(meta.get("stamp", ())) != stamp
+                ):
+                    return None
+                entry = _MetadataEntry(stamp)
+                entry.names = {
+                    name: frozenset(names)
+                    for name, names in meta.get("names", {}).items()
+                }
+                stored = meta.get("result")
+                if stored is not None:
+                    records = data["records"]
+                    if records.dtype != SPRITE_DTYPE:
+                        return None
+                    entry.result = self._restore_result(
+                        stored, data["names"].tolist(), records
+                    )
+        except Exception as exc:
+            # Truncated or corrupt files raise BadZipFile, EOFError and more;
+            # drop the file so the next parse replaces it.
+            print(f"[MetadataCache] Removing unreadable cache {disk_path}: {exc}")
+            self._remove(disk_path)
+            return None
+        try:
+            os.utime(disk_path)
+        except OSError:
+            pass
+        return entry
+
+    @staticmethod
+    def _restore_result(stored, names, records) -> ParseResult:
+        result = ParseResult(
+            sprites=SpriteTable([sys.intern(name) for name in names], records),
+            file_path=stored.get("file_path"),
+            parser_name=stored.get("parser_name"),
+            pages=list(stored.get("pages", [])),
+        )
+        for code, message, sprite_name in stored.get("warnings", []):
+            result.warnings.append(
+                ParserWarning(ParserErrorCode[code], message, sprite_name)
+            )
+        for code, message, sprite_name in stored.get("errors", []):
+            result.add_error(ParserErrorCode[code], message, sprite_name)
+        return result
+
+
+_shared_cache: Optional[MetadataCache] = None
+_shared_cache_lock = Lock()
+
+
+def get_metadata_cache() -> MetadataCache:
+    """Return the process-wide metadata cache, creating it on first use."""
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = MetadataCache()
+        return _shared_cache
+
+
+__all__ = [
+    "DEFAULT_MAX_DISK_AGE",
+    "DEFAULT_MAX_DISK_BYTES",
+    "DEFAULT_MAX_METADATA_ENTRIES",
+    "MetadataCache",
+    "get_metadata_cache",
+]
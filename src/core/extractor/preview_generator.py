@@ -215,20 +215,21 @@ class PreviewGenerator:
             return None
 
         atlas_processor = AtlasProcessor(atlas_path, metadata_path)
-        if metadata_path.endswith(".xml"):
-            animation_sprites = atlas_processor.parse_xml_for_preview(animation_name)
-        elif metadata_path.endswith(".txt"):
-            animation_sprites = atlas_processor.parse_txt_for_preview(animation_name)
-        else:
-            print(f"Unsupported metadata format for preview: {metadata_path}")
-            return None
-
-        if not animation_sprites:
-            print(f"No sprites found for animation: {animation_name}")
-            return None
+        try:
+            animation_sprites = atlas_processor.parse_for_preview(animation_name)
+            if not animation_sprites:
+                print(f"No sprites found for animation: {animation_name}")
+                return None
 
-        sprite_processor = SpriteProcessor(atlas_processor.atlas, animation_sprites)
-        processed = sprite_processor.process_specific_animation(animation_name)
+            sprite_processor = SpriteProcessor(
+                atlas_processor.atlas,
+                animation_sprites,
+                owns_atlas=False,
+                pages=atlas_processor.pages,
+            )
+            processed = sprite_processor.process_specific_animation(animation_name)
+        finally:
+            atlas_processor.close()
         frames = processed.get(animation_name)
         if not frames:
             print(f"Animation {animation_name} not found in processed sprites")
@@ -324,10 +325,16 @@ class PreviewGenerator:
             Cloned animation map dict.
         """
         atlas_processor = AtlasProcessor(atlas_path, metadata_path)
-        sprite_processor = SpriteProcessor(
-            atlas_processor.atlas, atlas_processor.sprites
-        )
-        animations = sprite_processor.process_sprites()
+        try:
+            sprite_processor = SpriteProcessor(
+                atlas_processor.atlas,
+                atlas_processor.sprites,
+                owns_atlas=False,
+                pages=atlas_processor.pages,
+            )
+            animations = sprite_processor.process_sprites()
+        finally:
+            atlas_processor.close()
         return clone_animation_map(animations)
 
     @staticmethod
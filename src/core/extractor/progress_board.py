@@ -0,0 +1,126 @@
+"""Per-worker progress slots sampled by the extraction monitor.
+
+Provides ``ProgressBoard``, which hands every extraction worker its own
+``WorkerProgress`` slot. Workers publish the file they are on and their
+running totals by replacing a single attribute of their slot, and the
+monitor sums all slots at a fixed rate. Each slot has exactly one writer
+and every update is one reference assignment, so routine progress needs
+neither locks nor a Qt signal per file.
+"""
+
+from __future__ import annotations
+
+import itertools
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+# Seconds between progress samples taken by the monitor.
+PROGRESS_SAMPLE_INTERVAL = 0.1
+
+
+@dataclass(frozen=True)
+class ProgressTotals:
+    """Cumulative counters of finished files.
+
+    Attributes:
+        files: Files finished, successfully or not.
+        frames: Frame images exported.
+        anims: Animation files exported.
+        failed: Sprites or files that failed.
+    """
+
+    files: int = 0
+    frames: int = 0
+    anims: int = 0
+    failed: int = 0
+
+    def __add__(self, other: "ProgressTotals") -> "ProgressTotals":
+        return ProgressTotals(
+            self.files + other.files,
+            self.frames + other.frames,
+            self.anims + other.anims,
+            self.failed + other.failed,
+        )
+
+
+class WorkerProgress:
+    """Progress slot written by a single worker thread.
+
+    Attributes:
+        label: Display name of the worker, e.g. ``"Worker 1"``.
+        current: File the worker is processing, or ``None`` when idle.
+        totals: Counters of the files this worker has finished.
+        last_started: ``(sequence, filename)`` of the worker's most recent
+            file, ordered across workers by ``sequence``; ``None`` before
+            its first file.
+    """
+
+    __slots__ = ("label", "current", "totals", "last_started", "_sequence")
+
+    def __init__(self, label: str, sequence: "itertools.count") -> None:
+        self.label = label
+        self.current: Optional[str] = None
+        self.totals = ProgressTotals()
+        self.last_started: Optional[Tuple[int, str]] = None
+        self._sequence = sequence
+
+    def start(self, filename: str) -> None:
+        """Mark ``filename`` as the file being processed."""
+        self.last_started = (next(self._sequence), filename)
+        self.current = filename
+
+    def finish(self, frames: int = 0, anims: int = 0, failed: int = 0) -> None:
+        """Add a finished file and its export counts to the totals."""
+        totals = self.totals
+        self.totals = ProgressTotals(
+            totals.files + 1,
+            totals.frames + frames,
+            totals.anims + anims,
+            totals.failed + failed,
+        )
+
+    def idle(self) -> None:
+        """Mark the worker as waiting for its next file."""
+        self.current = None
+
+
+class ProgressBoard:
+    """Progress slots of every worker in one extraction run."""
+
+    def __init__(self) -> None:
+        self._slots: List[WorkerProgress] = []
+        self._sequence = itertools.count()
+
+    def add_worker(self, label: str) -> WorkerProgress:
+        """Create the slot a new worker will write its progress to.
+
+        Call this before the worker starts; slots are kept after the worker
+        exits so its totals still count.
+        """
+        slot = WorkerProgress(label, self._sequence)
+        self._slots.append(slot)
+        return slot
+
+    def totals(self) -> ProgressTotals:
+        """Sum the totals of all workers."""
+        combined = ProgressTotals()
+        for slot in self._slots:
+            combined = combined + slot.totals
+        return combined
+
+    def last_started(self) -> Optional[str]:
+        """Return the file most recently claimed by any worker."""
+        latest = None
+        for slot in self._slots:
+            started = slot.last_started
+            if started is not None and (latest is None or started[0] > latest[0]):
+                latest = started
+        return latest[1] if latest else None
+
+
+__all__ = [
+    "PROGRESS_SAMPLE_INTERVAL",
+    "ProgressBoard",
+    "ProgressTotals",
+    "WorkerProgress",
+]
@@ -1,37 +1,196 @@
 """Sprite extraction and animation grouping from atlas images.
 
 Provides ``SpriteProcessor`` which crops individual sprites from an atlas
-and organizes them into animation groups based on naming conventions.
+and organizes them into animation groups based on naming conventions, and
+``LazyAnimationMap`` which groups sprite metadata up front but only crops
+an animation's pixels when it is looked up.
+
+Sprites may be a list of sprite dicts or a columnar ``SpriteTable``; tables
+are grouped and cropped from their columns without per-sprite dict lookups.
+An animation's frame names and metadata can be read without cropping, so
+callers can pick the frames they need before any pixels are touched.
+
+Multi-page atlases pass an ``AtlasPages`` instead of a single atlas image.
+Each sprite is cropped from the page it lies on, pages are decoded on first
+use, and ``LazyAnimationMap.page_release_schedule`` tells callers when a
+page is no longer needed.
 """
 
 import re
+from collections.abc import MutableMapping
 
 import numpy as np
 
+from parsers.sprite_table import PAGE_FIELD, SpriteTable
 from utils.utilities import Utilities
 
+_REQUIRED_SPRITE_KEYS = ("name", "x", "y", "width", "height")
+
+
+class LazyAnimationMap(MutableMapping):
+    """Animation map that builds frame tuples on access.
+
+    Holds sprite metadata grouped by animation name. Looking up an animation
+    crops its frames from the atlas and returns a fresh list without keeping
+    a reference, so frames are freed as soon as the caller drops them.
+    Assigned entries (e.g. injected composites) are stored as given.
+
+    Attributes:
+        processor: ``SpriteProcessor`` used to crop frames.
+    """
+
+    def __init__(self, processor, groups, frames=None):
+        """Initialise the map.
+
+        Args:
+            processor: ``SpriteProcessor`` that owns the atlas pixels.
+            groups: Dict mapping animation names to sprite metadata lists.
+            frames: Optional dict of already materialised frame lists.
+        """
+        self.processor = processor
+        self._groups = dict(groups)
+        self._frames = dict(frames or {})
+
+    def __getitem__(self, animation_name):
+        if animation_name in self._frames:
+            return self._frames[animation_name]
+        sprites = self._groups[animation_name]
+        return self.processor.build_frames(sprites)
+
+    def __setitem__(self, animation_name, frames):
+        self._frames[animation_name] = frames
+
+    def __delitem__(self, animation_name):
+        found = False
+        if animation_name in self._frames:
+            del self._frames[animation_name]
+            found = True
+        if animation_name in self._groups:
+            del self._groups[animation_name]
+            found = True
+        if not found:
+            raise KeyError(animation_name)
+
+    def __iter__(self):
+        yield from self._groups
+        for animation_name in self._frames:
+            if animation_name not in self._groups:
+                yield animation_name
+
+    def __len__(self):
+        return len(self._groups) + sum(
+            1 for name in self._frames if name not in self._groups
+        )
+
+    def __contains__(self, animation_name):
+        return animation_name in self._groups or animation_name in self._frames
+
+    def frame_keys(self, animation_name):
+        """Return an animation's ``(name, metadata)`` pairs without cropping.
+
+        Returns:
+            List of pairs in sprite order, or ``None`` when the animation was
+            assigned as ready-made frames.
+        """
+        if animation_name in self._frames:
+            return None
+        return self.processor.frame_keys(self._groups[animation_name])
+
+    def build_selected(self, animation_name, positions):
+        """Crop only the sprites at ``positions`` of an animation.
+
+        Args:
+            animation_name: Grouped animation to crop from.
+            positions: Indices into the animation's sprites, in output order.
+
+        Returns:
+            List of ``(name, image, metadata)`` tuples in ``positions`` order.
+        """
+        sprites = SpriteProcessor.take_sprites(self._groups[animation_name], positions)
+        return self.processor.build_frames(sprites)
+
+    def page_release_schedule(self, animation_names):
+        """Plan when decoded atlas pages can be released.
+
+        Args:
+            animation_names: Animations in the order they will be visited.
+
+        Returns:
+            Dict mapping a position in ``animation_names`` to the pages no
+            later animation uses. Empty for single-page atlases.
+        """
+        if self.processor.pages is None:
+            return {}
+        last_use = {}
+        for position, animation_name in enumerate(animation_names):
+            sprites = self._groups.get(animation_name)
+            if sprites is None:
+                continue
+            for page in self.processor.sprite_pages(sprites):
+                last_use[page] = position
+        schedule = {}
+        for page, position in last_use.items():
+            schedule.setdefault(position, []).append(page)
+        return schedule
+
+    def release_pages(self, pages):
+        """Release decoded atlas pages; they are decoded again if needed."""
+        if self.processor.pages is not None and pages:
+            self.processor.pages.release(pages)
+
+    def sprite_count(self, animation_name):
+        """Return the number of frames an animation has without cropping them."""
+        if animation_name in self._frames:
+            return len(self._frames[animation_name])
+        return len(self._groups.get(animation_name, ()))
+
+    def copy(self):
+        """Return a new map sharing sprite metadata and materialised lists."""
+        return LazyAnimationMap(self.processor, self._groups, self._frames)
+
+    def clear(self):
+        """Drop all groups and materialised frames."""
+        self._groups.clear()
+        self._frames.clear()
+
 
 class SpriteProcessor:
     """Extract sprites from an atlas and group them into animations.
 
     Caches an RGBA NumPy view of the atlas so each sprite extraction is a
-    cheap array slice rather than repeated PIL conversions.
+    cheap array slice rather than repeated PIL conversions. Multi-page
+    atlases crop from the decoded page each sprite lies on instead.
 
     Attributes:
-        atlas: Source PIL image.
+        atlas: Source PIL image, or ``None`` for multi-page atlases.
+        pages: ``AtlasPages`` of a multi-page atlas, otherwise ``None``.
         sprites: List of sprite metadata dicts from a parser.
     """
 
-    def __init__(self, atlas, sprites):
+    def __init__(self, atlas, sprites, owns_atlas=True, pages=None):
         """Initialise the processor with an atlas image and sprite metadata.
 
         Args:
-            atlas: PIL image of the full atlas.
-            sprites: List of sprite dicts with keys like ``name``, ``x``, ``y``, etc.
+            atlas: PIL image of the full atlas; may be ``None`` when
+                ``pages`` is given.
+            sprites: ``SpriteTable`` or list of sprite dicts with keys like
+                ``name``, ``x``, ``y``, etc.
+            owns_atlas: When ``False`` the atlas belongs to the caller (for
+                example a pooled image) and is not closed by ``dispose``.
+            pages: Optional ``AtlasPages`` for atlases whose sprites carry
+                a ``page`` index. Pages belong to the caller.
         """
         self.atlas = atlas
-        self._atlas_rgba = atlas if atlas.mode == "RGBA" else atlas.convert("RGBA")
-        self._atlas_array = np.ascontiguousarray(np.asarray(self._atlas_rgba))
+        self.pages = pages
+        self._owns_atlas = owns_atlas
+        if pages is not None:
+            self._atlas_rgba = None
+            self._atlas_array = None
+        else:
+            self._atlas_rgba = (
+                atlas if atlas.mode == "RGBA" else atlas.convert("RGBA")
+            )
+            self._atlas_array = np.ascontiguousarray(np.asarray(self._atlas_rgba))
         self.sprites = sprites
 
     def process_sprites(self):
@@ -44,21 +203,170 @@ class SpriteProcessor:
             Dict mapping animation names to lists of ``(name, image, metadata)``
             tuples where image is a NumPy array.
         """
-        animations = {}
-        for sprite in self.sprites:
-            frame_tuple = self._build_frame_tuple(sprite)
-            if frame_tuple is None:
+        return {
+            folder_name: self.build_frames(sprites)
+            for folder_name, sprites in self.group_sprites().items()
+        }
+
+    def lazy_animations(self):
+        """Group sprites into animations without cropping any pixels.
+
+        Returns:
+            ``LazyAnimationMap`` that crops an animation's frames only when
+            it is looked up.
+        """
+        return LazyAnimationMap(self, self.group_sprites())
+
+    def group_sprites(self, sprites=None):
+        """Group sprite metadata by animation name.
+
+        For formats with animation tags (like Aseprite), groups by tag.
+        Otherwise, groups by name prefix (strips trailing digits). Sprites
+        missing position or size keys are skipped.
+
+        Args:
+            sprites: Sprites to group; defaults to ``self.sprites``.
+
+        Returns:
+            Dict mapping animation names to lists of sprite dicts, or to
+            ``SpriteTable`` slices when the sprites are a table.
+        """
+        if sprites is None:
+            sprites = self.sprites
+        if isinstance(sprites, SpriteTable):
+            return self._group_table(sprites)
+
+        groups = {}
+        for sprite in sprites:
+            if any(key not in sprite for key in _REQUIRED_SPRITE_KEYS):
                 continue
+            groups.setdefault(self._animation_key(sprite), []).append(sprite)
+        return groups
+
+    @classmethod
+    def animation_names(cls, sprites):
+        """Return the animation names ``group_sprites`` would produce.
+
+        Only names are computed; no sprites are grouped or cropped.
+
+        Args:
+            sprites: Parsed sprites, as a list of dicts or a ``SpriteTable``.
 
-            animation_tag = sprite.get("animation_tag")
-            if animation_tag:
-                folder_name = animation_tag
-            else:
-                name = frame_tuple[0]
-                folder_name = Utilities.strip_trailing_digits(name)
+        Returns:
+            Set of animation names.
+        """
+        if isinstance(sprites, SpriteTable):
+            return {Utilities.strip_trailing_digits(name) for name in sprites.names}
+        return {
+            cls._animation_key(sprite)
+            for sprite in sprites
+            if all(key in sprite for key in _REQUIRED_SPRITE_KEYS)
+        }
+
+    @staticmethod
+    def _animation_key(sprite):
+        """Return the animation a sprite dict belongs to."""
+        animation_tag = sprite.get("animation_tag")
+        if animation_tag:
+            return animation_tag
+        return Utilities.strip_trailing_digits(sprite["name"])
 
-            animations.setdefault(folder_name, []).append(frame_tuple)
-        return animations
+    @staticmethod
+    def _group_table(table):
+        """Group the rows of a ``SpriteTable`` by name prefix."""
+        indices = {}
+        for index, name in enumerate(table.names):
+            folder_name = Utilities.strip_trailing_digits(name)
+            indices.setdefault(folder_name, []).append(index)
+        return {
+            folder_name: table.take(rows) for folder_name, rows in indices.items()
+        }
+
+    @staticmethod
+    def frame_keys(sprites):
+        """Return ``(name, metadata)`` for each sprite without cropping.
+
+        The metadata matches the tuple ``build_frames`` attaches to each
+        frame. Sprites are expected to be grouped already, so none are
+        missing position or size keys.
+
+        Args:
+            sprites: Sprite metadata, typically one animation group.
+
+        Returns:
+            List of ``(name, (x, y, width, height, frameX, frameY))`` pairs.
+        """
+        if isinstance(sprites, SpriteTable):
+            return [(row[0], tuple(row[1:7])) for row in sprites.rows()]
+        return [
+            (
+                sprite["name"],
+                (
+                    sprite["x"],
+                    sprite["y"],
+                    sprite["width"],
+                    sprite["height"],
+                    sprite.get("frameX", 0),
+                    sprite.get("frameY", 0),
+                ),
+            )
+            for sprite in sprites
+        ]
+
+    @staticmethod
+    def sprite_pages(sprites):
+        """Return the set of page indices the given sprites lie on."""
+        if isinstance(sprites, SpriteTable):
+            return set(np.unique(sprites.column(PAGE_FIELD)).tolist())
+        return {sprite.get(PAGE_FIELD, 0) for sprite in sprites}
+
+    @staticmethod
+    def take_sprites(sprites, positions):
+        """Return the sprites at ``positions`` in that order.
+
+        Returns:
+            A ``SpriteTable`` when ``sprites`` is one, otherwise a list.
+        """
+        if isinstance(sprites, SpriteTable):
+            return sprites.take(positions)
+        return [sprites[position] for position in positions]
+
+    def build_frames(self, sprites):
+        """Crop frame tuples for a list of sprite dicts.
+
+        Args:
+            sprites: Sprite metadata, typically one animation group.
+
+        Returns:
+            List of ``(name, image, metadata)`` tuples.
+        """
+        return list(self.iter_frames(sprites))
+
+    def iter_frames(self, sprites):
+        """Crop frame tuples one at a time for a list of sprite dicts.
+
+        Lets callers hand each frame on as soon as it is cropped instead of
+        waiting for the whole animation.
+
+        Args:
+            sprites: Sprite metadata, typically one animation group.
+
+        Yields:
+            ``(name, image, metadata)`` tuples, skipping invalid sprites.
+        """
+        if isinstance(sprites, SpriteTable):
+            if self.pages is None:
+                for row in sprites.rows():
+                    yield self._crop_frame(*row)
+                return
+            pages = sprites.column(PAGE_FIELD).tolist()
+            for row, page in zip(sprites.rows(), pages):
+                yield self._crop_frame(*row, page=page)
+            return
+        for sprite in sprites:
+            frame_tuple = self._build_frame_tuple(sprite)
+            if frame_tuple is not None:
+                yield frame_tuple
 
     def process_specific_animation(self, animation_name):
         """Process only sprites belonging to a specific animation.
@@ -73,6 +381,42 @@ class SpriteProcessor:
         Returns:
             Dict mapping matched animation names to frame tuple lists.
         """
+        matching_sprites = self.match_animation_sprites(animation_name)
+        if not matching_sprites:
+            return {}
+
+        return {
+            folder_name: self.build_frames(sprites)
+            for folder_name, sprites in self.group_sprites(matching_sprites).items()
+        }
+
+    def match_animation_sprites(self, animation_name):
+        """Select the sprites that belong to an animation without cropping.
+
+        Args:
+            animation_name: Animation identifier to match against sprite names or tags.
+
+        Returns:
+            Matching sprites in metadata order; a ``SpriteTable`` when the
+            processor holds one.
+        """
+        patterns = [
+            animation_name,
+            re.sub(r"\d+$", "", animation_name),
+            re.sub(r"_?\d+$", "", animation_name),
+            re.sub(r"[-_]?\d+$", "", animation_name),
+        ]
+        patterns = list(dict.fromkeys(patterns))
+
+        if isinstance(self.sprites, SpriteTable):
+            # Tables carry no animation tags, so only names need matching.
+            prefixes = tuple(patterns)
+            return self.sprites.take(
+                index
+                for index, name in enumerate(self.sprites.names)
+                if name.startswith(prefixes)
+            )
+
         tag_matched_sprites = [
             sprite
             for sprite in self.sprites
@@ -82,14 +426,6 @@ class SpriteProcessor:
         if tag_matched_sprites:
             matching_sprites = tag_matched_sprites
         else:
-            patterns = [
-                animation_name,
-                re.sub(r"\d+$", "", animation_name),
-                re.sub(r"_?\d+$", "", animation_name),
-                re.sub(r"[-_]?\d+$", "", animation_name),
-            ]
-            patterns = list(dict.fromkeys(patterns))
-
             matching_sprites = []
             for sprite in self.sprites:
                 sprite_name = sprite.get("name", "")
@@ -99,25 +435,7 @@ class SpriteProcessor:
                 ):
                     matching_sprites.append(sprite)
 
-        if not matching_sprites:
-            return {}
-
-        animations = {}
-        for sprite in matching_sprites:
-            frame_tuple = self._build_frame_tuple(sprite)
-            if frame_tuple is None:
-                continue
-
-            animation_tag = sprite.get("animation_tag")
-            if animation_tag:
-                folder_name = animation_tag
-            else:
-                name = frame_tuple[0]
-                folder_name = Utilities.strip_trailing_digits(name)
-
-            animations.setdefault(folder_name, []).append(frame_tuple)
-
-        return animations
+        return matching_sprites
 
     def _build_frame_tuple(self, sprite):
         """Build a frame tuple from a sprite metadata dict.
@@ -140,13 +458,44 @@ class SpriteProcessor:
         except KeyError:
             return None
 
-        frame_x = sprite.get("frameX", 0)
-        frame_y = sprite.get("frameY", 0)
-        frame_width = sprite.get("frameWidth", width)
-        frame_height = sprite.get("frameHeight", height)
-        rotated = sprite.get("rotated", False)
+        return self._crop_frame(
+            name,
+            x,
+            y,
+            width,
+            height,
+            sprite.get("frameX", 0),
+            sprite.get("frameY", 0),
+            sprite.get("frameWidth", width),
+            sprite.get("frameHeight", height),
+            sprite.get("rotated", False),
+            page=sprite.get(PAGE_FIELD, 0),
+        )
+
+    def _crop_frame(
+        self,
+        name,
+        x,
+        y,
+        width,
+        height,
+        frame_x,
+        frame_y,
+        frame_width,
+        frame_height,
+        rotated,
+        page=0,
+    ):
+        """Crop one sprite and place it on its logical canvas.
 
-        sprite_array = self._atlas_array[y : y + height, x : x + width]
+        Returns:
+            Tuple ``(name, array, metadata)``.
+        """
+        if self.pages is None:
+            atlas_array = self._atlas_array
+        else:
+            atlas_array = self.pages.array(page)
+        sprite_array = atlas_array[y : y + height, x : x + width]
         requires_canvas = rotated or frame_x or frame_y
 
         if rotated:
@@ -225,10 +574,12 @@ class SpriteProcessor:
         """Release atlas and sprite references.
 
         Clears the cached NumPy array view and closes the underlying PIL
-        image so large buffers can be garbage-collected.
+        image, unless it is owned by the caller, so large buffers can be
+        garbage-collected. Atlas pages are left to their owner.
         """
 
         self.sprites = None
+        self.pages = None
         self._atlas_array = None
         if getattr(self, "_atlas_rgba", None) is not None:
             try:
@@ -243,7 +594,9 @@ class SpriteProcessor:
 
         if getattr(self, "atlas", None) is not None:
             try:
-                if hasattr(self.atlas, "close"):
+                if getattr(self, "_owns_atlas", True) and hasattr(
+                    self.atlas, "close"
+                ):
                     self.atlas.close()
             except Exception:
                 pass
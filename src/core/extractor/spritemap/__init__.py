@@ -13,6 +13,23 @@ Modules:
 
 Exports:
     AdobeSpritemapRenderer: Main entry point for rendering spritemap animations.
+        Imported on first access, so the lightweight metadata helpers can be
+        used without loading the renderer.
 """
 
-from .renderer import AdobeSpritemapRenderer
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .renderer import AdobeSpritemapRenderer
+
+
+def __getattr__(name):
+    """Import ``AdobeSpritemapRenderer`` on first access."""
+    if name == "AdobeSpritemapRenderer":
+        from .renderer import AdobeSpritemapRenderer
+
+        return AdobeSpritemapRenderer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ["AdobeSpritemapRenderer"]
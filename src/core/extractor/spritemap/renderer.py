@@ -9,10 +9,12 @@ from __future__ import annotations
 
 import json
 import math
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from PIL import Image
 
+from core.extractor.image_utils import shared_bbox
+from utils.image_pool import get_image_pool
 from utils.utilities import Utilities
 from .sprite_atlas import SpriteAtlas
 from .symbols import Symbols
@@ -72,19 +74,21 @@ class AdobeSpritemapRenderer:
         with open(spritemap_json_path, "rb") as spritemap_file:
             spritemap_json = json.loads(spritemap_file.read().decode("utf-8-sig"))
 
-        atlas_image = Image.open(atlas_image_path)
-        if canvas_size is None:
-            canvas_size = _infer_canvas_size(
-                self.animation_json,
-                spritemap_json,
-                atlas_image.size,
+        # SpriteAtlas keeps its own premultiplied copy, so the pooled
+        # decode is only needed while it is built.
+        with get_image_pool().lease(atlas_image_path) as atlas_image:
+            if canvas_size is None:
+                canvas_size = _infer_canvas_size(
+                    self.animation_json,
+                    spritemap_json,
+                    atlas_image.size,
+                )
+            self.sprite_atlas = SpriteAtlas(
+                spritemap_json, atlas_image, canvas_size, resample
             )
 
         self.frame_rate = self.animation_json.get("MD", {}).get("FRT", 24)
         self.filter_single_frame = filter_single_frame
-        self.sprite_atlas = SpriteAtlas(
-            spritemap_json, atlas_image, canvas_size, resample
-        )
         self.symbols = Symbols(self.animation_json, self.sprite_atlas, canvas_size)
 
     def list_symbol_names(self) -> List[str]:
@@ -149,6 +153,7 @@ class AdobeSpritemapRenderer:
         start_frame: int = 0,
         end_frame: Optional[int] = None,
         frame_name_prefix: Optional[str] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
     ):
         """Render a contiguous range of frames for a symbol or timeline label.
 
@@ -160,6 +165,8 @@ class AdobeSpritemapRenderer:
             start_frame: First frame index to render (inclusive).
             end_frame: Last frame index (exclusive); defaults to total length.
             frame_name_prefix: Prefix for generated frame names.
+            progress_callback: Optional callable receiving ``(rendered, total)``
+                after each frame is rendered.
 
         Returns:
             List of ``(name, image, bounds)`` tuples, or empty if no valid
@@ -183,6 +190,10 @@ class AdobeSpritemapRenderer:
 
         for frame_index in range(start_frame, end_frame):
             frame_image = self.symbols.render_symbol(symbol_name, frame_index)
+            if progress_callback is not None:
+                progress_callback(
+                    frame_index - start_frame + 1, end_frame - start_frame
+                )
             if frame_image is None:
                 continue
             frames_with_index.append((frame_index - start_frame, frame_image))
@@ -207,22 +218,14 @@ class AdobeSpritemapRenderer:
                 frame = new_frame
             normalized_frames.append((frame_index, frame))
 
-        min_x, min_y, max_x, max_y = float("inf"), float("inf"), 0, 0
-        for _, frame in normalized_frames:
-            bbox = frame.getbbox()
-            if bbox:
-                min_x = min(min_x, bbox[0])
-                min_y = min(min_y, bbox[1])
-                max_x = max(max_x, bbox[2])
-                max_y = max(max_y, bbox[3])
-
-        if min_x > max_x:
+        bounds = shared_bbox([frame for _, frame in normalized_frames])
+        if bounds is None:
             return []
 
         prefix = frame_name_prefix or (symbol_name if symbol_name else "timeline")
 
         for frame_index, frame in normalized_frames:
-            cropped_frame = frame.crop((min_x, min_y, max_x, max_y))
+            cropped_frame = frame.crop(bounds)
             frame_name = f"{prefix}_{frame_index:04d}"
             rendered_frames.append(
                 (
@@ -266,12 +269,14 @@ class AdobeSpritemapRenderer:
             )
             sprite_settings.setdefault("duration", default_duration_ms)
 
-    def render_animation(self, target):
+    def render_animation(self, target, progress_callback=None):
         """Render frames for a symbol or timeline label.
 
         Args:
             target: Either a symbol name string, or a dict with ``type`` and
                 ``value`` keys (type may be ``"symbol"`` or ``"timeline_label"``).
+            progress_callback: Optional callable receiving ``(rendered, total)``
+                after each frame is rendered.
 
         Returns:
             List of ``(name, image, bounds)`` tuples for the requested target.
@@ -288,9 +293,12 @@ class AdobeSpritemapRenderer:
                 start_frame=label_range["start"],
                 end_frame=label_range["end"],
                 frame_name_prefix=target_value,
+                progress_callback=progress_callback,
             )
 
-        return self._render_symbol_frames(target_value)
+        return self._render_symbol_frames(
+            target_value, progress_callback=progress_callback
+        )
 
     def _normalize_target(self, target):
         """Normalize a render target to a ``(type, value)`` pair.
@@ -0,0 +1,396 @@
+"""Discover spritesheets and their metadata files in an input folder.
+
+Provides ``SpritesheetScanner``, which walks an input directory with one
+``os.scandir`` call per folder and resolves each image's metadata
+companions (XML, TXT, JSON, Adobe Animate spritemaps, ...) from that
+in-memory listing instead of probing the filesystem once per extension.
+
+Directory listings are cached by modification time, and parsed
+``Animation.json`` symbol maps by file stamp, so rescanning a folder only
+re-reads the directories and documents that changed. This matters on
+network drives, where every ``stat`` is a round trip.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from core.extractor.spritemap.metadata import (
+    compute_symbol_lengths,
+    extract_label_ranges,
+)
+from core.extractor.spritemap.normalizer import normalize_animation_document
+from utils.utilities import Utilities
+
+SPRITESHEET_IMAGE_EXTENSIONS = (
+    ".png",
+    ".jpg",
+    ".jpeg",
+    ".avif",
+    ".bmp",
+    ".tga",
+    ".tiff",
+    ".webp",
+)
+
+# data_dict keys for metadata files named ``<image stem>.<key>``. JSON is
+# resolved separately because it may belong to an Adobe Animate spritemap.
+COMPANION_METADATA_KEYS = (
+    "xml",
+    "txt",
+    "plist",
+    "atlas",
+    "css",
+    "tpsheet",
+    "tpset",
+    "paper2dsprites",
+)
+
+ANIMATION_JSON_NAME = "Animation.json"
+
+# Directory mtimes can be coarse (two seconds on FAT, unreliable on some
+# network shares); listings taken this soon after a change are not cached.
+_MTIME_SETTLE_NS = 2_000_000_000
+
+
+@dataclass
+class SpritesheetEntry:
+    """A spritesheet image and the metadata files found next to it.
+
+    Attributes:
+        display_name: Label shown in the spritesheet list; a POSIX path
+            relative to the scanned folder.
+        image_path: Absolute path to the image.
+        data_files: Metadata paths keyed like ``parent_app.data_dict``
+            (``"xml"``, ``"json"``, ``"spritemap"``, ...).
+    """
+
+    display_name: str
+    image_path: str
+    data_files: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class _DirectoryListing:
+    """Cached ``os.scandir`` result for one directory."""
+
+    mtime_ns: int
+    files: Dict[str, str]
+    subdirectories: List[str]
+
+
+def build_spritemap_symbol_map(
+    animation_json_path: str, filter_single_frame: bool = True
+) -> Dict[str, Dict[str, Any]]:
+    """Return a mapping of display labels to spritemap metadata entries.
+
+    Args:
+        animation_json_path: Path to ``Animation.json`` describing the Adobe
+            Animate timeline.
+        filter_single_frame: Skip symbols and labels with one frame or less.
+
+    Returns:
+        Dict whose keys are human-friendly labels and whose values describe
+        the original symbol or label and its frame count.
+    """
+    symbol_map: Dict[str, Dict[str, Any]] = {}
+
+    def register_entry(display_name, entry_type, entry_value, frame_count):
+        """Store entries with unique labels so symbols and labels never collide."""
+        suffix = " (Timeline)" if entry_type == "timeline_label" else " (Symbol)"
+        candidate = display_name
+        if candidate in symbol_map:
+            candidate = f"{display_name}{suffix}"
+            counter = 2
+            while candidate in symbol_map:
+                candidate = f"{display_name}{suffix} #{counter}"
+                counter += 1
+        symbol_map[candidate] = {
+            "type": entry_type,
+            "value": entry_value,
+            "frame_count": frame_count,
+        }
+
+    try:
+        with open(animation_json_path, "r", encoding="utf-8") as animation_file:
+            animation_json = normalize_animation_document(json.load(animation_file))
+
+        symbol_lengths = compute_symbol_lengths(animation_json)
+
+        for symbol in animation_json.get("SD", {}).get("S", []):
+            raw_name = symbol.get("SN")
+            if not raw_name:
+                continue
+            frame_count = symbol_lengths.get(raw_name, 0)
+            if filter_single_frame and frame_count <= 1:
+                continue
+            display_name = Utilities.strip_trailing_digits(raw_name) or raw_name
+            register_entry(display_name, "symbol", raw_name, frame_count)
+
+        for label in extract_label_ranges(animation_json, None):
+            label_name = label["name"]
+            frame_count = label["end"] - label["start"]
+            if filter_single_frame and frame_count <= 1:
+                continue
+            register_entry(label_name, "timeline_label", label_name, frame_count)
+    except Exception as exc:
+        print(
+            f"Error parsing spritemap animation metadata {animation_json_path}: {exc}"
+        )
+    return symbol_map
+
+
+class SpritesheetScanner:
+    """Find spritesheets in a folder tree with cached directory listings.
+
+    Instances may be shared between threads; the caches are guarded by a
+    lock.
+
+    Attributes:
+        image_extensions: Image suffixes treated as spritesheets.
+        listings_read: Directories listed from disk.
+        listings_reused: Directories answered from the cache.
+    """
+
+    def __init__(self, image_extensions=SPRITESHEET_IMAGE_EXTENSIONS) -> None:
+        """Create a scanner with empty caches.
+
+        Args:
+            image_extensions: Image suffixes treated as spritesheets.
+        """
+        self.image_extensions = tuple(
+            os.path.normcase(ext) for ext in image_extensions
+        )
+        self.listings_read = 0
+        self.listings_reused = 0
+        self._listings: Dict[str, _DirectoryListing] = {}
+        self._symbol_maps: Dict[Tuple[str, bool], Tuple[Tuple[int, int], dict]] = {}
+        self._lock = Lock()
+
+    def scan(
+        self,
+        root: str,
+        filter_single_frame: bool = True,
+        should_stop: Optional[Callable[[], bool]] = None,
+    ) -> Iterator[SpritesheetEntry]:
+        """Yield spritesheets found under ``root``.
+
+        Images directly inside ``root`` are yielded first, as soon as the
+        folder has been listed. Images in subfolders are included only when
+        they form an Adobe Animate spritemap (``Animation.json`` plus a
+        JSON named after the image) and follow in path order.
+
+        Args:
+            root: Folder to scan.
+            filter_single_frame: Skip single-frame spritemap symbols.
+            should_stop: Optional callable; scanning ends once it returns
+                ``True``.
+
+        Yields:
+            ``SpritesheetEntry`` objects in display order.
+        """
+        stop = should_stop or (lambda: False)
+        root = os.path.abspath(root)
+        listing = self._listing(root)
+        if listing is None:
+            return
+
+        for name in self._sorted_images(listing):
+            if stop():
+                return
+            yield self._describe(root, listing, name, name, filter_single_frame)
+
+        nested: List[Tuple[Tuple[str, ...], str, _DirectoryListing, str]] = []
+        pending = [(root, listing, ())]
+        while pending:
+            if stop():
+                return
+            directory, directory_listing, parts = pending.pop()
+            for subdirectory in directory_listing.subdirectories:
+                path = os.path.join(directory, subdirectory)
+                child = self._listing(path)
+                if child is None:
+                    continue
+                child_parts = parts + (subdirectory,)
+                pending.append((path, child, child_parts))
+                if os.path.normcase(ANIMATION_JSON_NAME) not in child.files:
+                    continue
+                for name in self._sorted_images(child):
+                    stem = os.path.splitext(name)[0]
+                    if os.path.normcase(f"{stem}.json") in child.files:
+                        key = tuple(os.path.normcase(p) for p in child_parts + (name,))
+                        nested.append((key, path, child, name))
+
+        for key, directory, directory_listing, name in sorted(
+            nested, key=lambda item: item[0]
+        ):
+            if stop():
+                return
+            display_name = "/".join(
+                os.path.relpath(os.path.join(directory, name), root).split(os.sep)
+            )
+            yield self._describe(
+                directory, directory_listing, name, display_name, filter_single_frame
+            )
+
+    def describe(
+        self,
+        image_path: str,
+        search_directory: Optional[str] = None,
+        display_name: Optional[str] = None,
+        filter_single_frame: bool = True,
+    ) -> SpritesheetEntry:
+        """Resolve the metadata files for a single image.
+
+        Args:
+            image_path: Path to the spritesheet image.
+            search_directory: Folder holding the metadata; defaults to the
+                image's folder.
+            display_name: Label for the entry; defaults to the file name.
+            filter_single_frame: Skip single-frame spritemap symbols.
+
+        Returns:
+            ``SpritesheetEntry`` for the image.
+        """
+        name = os.path.basename(image_path)
+        directory = os.path.abspath(search_directory or os.path.dirname(image_path))
+        listing = self._listing(directory) or _DirectoryListing(0, {}, [])
+        entry = self._describe(
+            directory, listing, name, display_name or name, filter_single_frame
+        )
+        entry.image_path = os.path.abspath(image_path)
+        return entry
+
+    def symbol_map(
+        self, animation_json_path: str, filter_single_frame: bool = True
+    ) -> Dict[str, Dict[str, Any]]:
+        """Return the symbol map for ``Animation.json``, parsing it if changed."""
+        path_key = os.path.normcase(os.path.abspath(animation_json_path))
+        key = (path_key, filter_single_frame)
+        try:
+            stat = os.stat(animation_json_path)
+            stamp = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            stamp = None
+        with self._lock:
+            cached = self._symbol_maps.get(key)
+        if stamp is not None and cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        symbol_map = build_spritemap_symbol_map(
+            animation_json_path, filter_single_frame
+        )
+        if stamp is not None:
+            with self._lock:
+                self._symbol_maps[key] = (stamp, symbol_map)
+        return symbol_map
+
+    def clear(self) -> None:
+        """Forget every cached listing and symbol map."""
+        with self._lock:
+            self._listings.clear()
+            self._symbol_maps.clear()
+
+    def _listing(self, directory: str) -> Optional[_DirectoryListing]:
+        """Return the cached listing for ``directory`` or read it from disk."""
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except OSError:
+            return None
+        key = os.path.normcase(directory)
+        with self._lock:
+            cached = self._listings.get(key)
+            if cached is not None and cached.mtime_ns == mtime_ns:
+                self.listings_reused += 1
+                return cached
+
+        files: Dict[str, str] = {}
+        subdirectories: List[str] = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirectories.append(entry.name)
+                        elif entry.is_file():
+                            files[os.path.normcase(entry.name)] = entry.name
+                    except OSError:
+                        continue
+        except OSError:
+            return None
+
+        subdirectories.sort(key=os.path.normcase)
+        listing = _DirectoryListing(mtime_ns, files, subdirectories)
+        with self._lock:
+            self.listings_read += 1
+            if time.time_ns() - mtime_ns > _MTIME_SETTLE_NS:
+                self._listings[key] = listing
+            else:
+                self._listings.pop(key, None)
+        return listing
+
+    def _sorted_images(self, listing: _DirectoryListing) -> List[str]:
+        """Return image file names in ``listing`` in display order."""
+        return sorted(
+            (
+                name
+                for folded, name in listing.files.items()
+                if folded.endswith(self.image_extensions)
+            ),
+            key=os.path.normcase,
+        )
+
+    def _describe(
+        self,
+        directory: str,
+        listing: _DirectoryListing,
+        name: str,
+        display_name: str,
+        filter_single_frame: bool,
+    ) -> SpritesheetEntry:
+        """Build the entry for image ``name`` from its folder listing."""
+        stem = os.path.splitext(name)[0]
+        data_files: Dict[str, Any] = {}
+
+        def companion(file_name: str) -> Optional[str]:
+            actual = listing.files.get(os.path.normcase(file_name))
+            return os.path.join(directory, actual) if actual else None
+
+        for key in COMPANION_METADATA_KEYS:
+            path = companion(f"{stem}.{key}")
+            if path:
+                data_files[key] = path
+
+        animation_json = companion(ANIMATION_JSON_NAME)
+        spritemap_json = companion(f"{stem}.json")
+        if animation_json and spritemap_json:
+            data_files["spritemap"] = {
+                "type": "spritemap",
+                "animation_json": animation_json,
+                "spritemap_json": spritemap_json,
+                "symbol_map": self.symbol_map(animation_json, filter_single_frame),
+            }
+        elif spritemap_json:
+            # Standalone JSON (Aseprite, TexturePacker JSON, etc.)
+            data_files["json"] = spritemap_json
+
+        return SpritesheetEntry(
+            display_name=display_name,
+            image_path=os.path.join(directory, name),
+            data_files=data_files,
+        )
+
+
+__all__ = [
+    "ANIMATION_JSON_NAME",
+    "COMPANION_METADATA_KEYS",
+    "SPRITESHEET_IMAGE_EXTENSIONS",
+    "SpritesheetEntry",
+    "SpritesheetScanner",
+    "build_spritemap_symbol_map",
+]
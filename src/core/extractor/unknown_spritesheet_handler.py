@@ -10,10 +10,9 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Callable, List, Sequence
 
-from PIL import Image
-
 from gui.extractor.background_handler_window import BackgroundHandlerWindow
 from parsers.unknown_parser import UnknownParser
+from utils.image_pool import get_image_pool
 
 
 class UnknownSpritesheetHandler:
@@ -85,6 +84,7 @@ class UnknownSpritesheetHandler:
                 f"[UnknownSpritesheetHandler] Found {len(unknown_sheets)} unknown spritesheet(s), checking for background colors..."
             )
             BackgroundHandlerWindow.reset_batch_state()
+            UnknownParser.clear_background_choices()
 
             detection_results = self._detect_background_colors(
                 base_directory, unknown_sheets
@@ -120,9 +120,13 @@ class UnknownSpritesheetHandler:
                     return True
 
                 if background_choices:
-                    if not hasattr(BackgroundHandlerWindow, "_file_choices"):
-                        BackgroundHandlerWindow._file_choices = {}
-                    BackgroundHandlerWindow._file_choices.update(background_choices)
+                    # Workers read these instead of prompting per file.
+                    UnknownParser.set_background_choices(
+                        {
+                            str(base_directory / Path(filename)): choice
+                            for filename, choice in background_choices.items()
+                        }
+                    )
                     self._log(
                         f"[UnknownSpritesheetHandler] Background handling preferences set for {len(background_choices)} files"
                     )
@@ -201,16 +205,14 @@ class UnknownSpritesheetHandler:
         for filename in unknown_sheets:
             image_path = str(base_directory / Path(filename))
             try:
-                image = Image.open(image_path)
-                if image.mode != "RGBA":
-                    image = image.convert("RGBA")
-
-                has_transparency = UnknownParser._has_transparency(image)
-                detected_colors = []
-                if not has_transparency:
-                    detected_colors = UnknownParser._detect_background_colors(
-                        image, max_colors=3
-                    )
+                # Decoded once and kept in the shared pool for extraction.
+                with get_image_pool().lease(image_path) as image:
+                    has_transparency = UnknownParser._has_transparency(image)
+                    detected_colors = []
+                    if not has_transparency:
+                        detected_colors = UnknownParser._detect_background_colors(
+                            image, max_colors=3
+                        )
 
                 detection_results.append(
                     {
@@ -0,0 +1,398 @@
+"""Cost-aware ordering of the extraction queue.
+
+Provides ``estimate_file_cost``, which predicts how long a spritesheet will
+keep a worker busy from its image header, metadata and export settings, and
+``schedule_longest_first``, which orders files longest-processing-time first
+(LPT) so that large atlases start early and the worker pool drains evenly
+instead of idling behind a few heavy files at the tail.
+
+Costs are in abstract units. ``CostCalibration`` converts them to seconds
+using the measured durations of earlier runs (or ``DEFAULT_SECONDS_PER_UNIT``
+before the first one), so ``build_schedule_report`` can compare a run's
+predicted makespan with the actual one without fitting to that same run.
+"""
+
+from __future__ import annotations
+
+import heapq
+import os
+import re
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+from PIL import Image
+
+from core.extractor.memory_admission import count_sprites_in_text, read_metadata_head
+from utils.utilities import Utilities
+
+# Cost model weights, in units per megapixel / per item.
+DECODE_COST_PER_MP = 1.0
+SPRITE_COST = 0.002
+ANIMATION_COST = 0.05
+SPRITEMAP_COST_FACTOR = 4.0
+UNKNOWN_SHEET_COST_FACTOR = 2.0
+
+# Seconds per cost unit assumed until a run has been measured.
+DEFAULT_SECONDS_PER_UNIT = 0.25
+# Weight of the newest run when updating the calibration.
+CALIBRATION_SMOOTHING = 0.5
+
+# Relative encode cost per output format, for one pass over the atlas area.
+FRAME_FORMAT_WEIGHTS: Dict[str, float] = {
+    "AVIF": 4.0,
+    "WebP": 2.0,
+    "PNG": 1.0,
+    "TIFF": 0.6,
+    "TGA": 0.4,
+    "BMP": 0.3,
+    "DDS": 0.5,
+}
+ANIMATION_FORMAT_WEIGHTS: Dict[str, float] = {
+    "GIF": 3.0,
+    "WebP": 2.5,
+    "APNG": 1.5,
+}
+
+_NAME_PATTERNS = {
+    ".xml": re.compile(r"<SubTexture[^>]*?\bname=\"([^\"]*)\""),
+    ".json": re.compile(r"\"filename\"\s*:\s*\"([^\"]*)\"|\"([^\"]+)\"\s*:\s*\{\s*\"frame\""),
+    ".plist": re.compile(r"<key>([^<]+)</key>\s*<dict>"),
+}
+
+
+@dataclass
+class FileCost:
+    """Predicted work for one queued file.
+
+    Attributes:
+        filename: Queue entry, relative to the input directory.
+        pixels: Atlas pixel count read from the image header.
+        sprite_count: Sprites counted in the metadata (``0`` if unknown).
+        animation_count: Distinct animation names (``0`` if unknown).
+        output_weight: Summed format weights of the requested exports.
+        is_spritemap: ``True`` for Adobe spritemap projects.
+        cost: Predicted cost in model units.
+    """
+
+    filename: str
+    pixels: int = 0
+    sprite_count: int = 0
+    animation_count: int = 0
+    output_weight: float = 0.0
+    is_spritemap: bool = False
+    cost: float = 0.0
+
+
+@dataclass
+class ScheduleReport:
+    """Predicted versus actual makespan for a finished run.
+
+    Attributes:
+        worker_count: Workers the queue was scheduled for.
+        file_count: Files with both a prediction and a measured duration.
+        predicted_makespan: Makespan the model predicts for the chosen order,
+            in seconds, using the calibration from before the run.
+        actual_makespan: Measured wall time of the run in seconds.
+        ideal_makespan: Busy time divided evenly across workers; no order can
+            finish sooner.
+        seconds_per_unit: Calibration factor the prediction was made with.
+        measured_seconds_per_unit: Factor this run's durations imply; it
+            feeds the calibration of later runs.
+    """
+
+    worker_count: int
+    file_count: int
+    predicted_makespan: float
+    actual_makespan: float
+    ideal_makespan: float
+    seconds_per_unit: float
+    measured_seconds_per_unit: float
+
+
+def count_metadata_animations(text: Optional[str], suffix: str) -> int:
+    """Count distinct animation names in metadata text.
+
+    Names are grouped the same way ``SpriteProcessor`` groups them, by
+    stripping trailing frame numbers.
+
+    Args:
+        text: Metadata text, or ``None``.
+        suffix: Lower-case metadata file extension, including the dot.
+
+    Returns:
+        Number of distinct animations, or ``0`` if the format is not scanned.
+    """
+    pattern = _NAME_PATTERNS.get(suffix)
+    if not text or pattern is None:
+        return 0
+    names = set()
+    for match in pattern.finditer(text):
+        name = next((group for group in match.groups() if group), None)
+        if name:
+            names.add(Utilities.strip_trailing_digits(name))
+    return len(names)
+
+
+def output_weight_for_settings(settings: Mapping[str, Any]) -> float:
+    """Return the summed encode weight of the exports requested in settings.
+
+    The weight is scaled by the square of the largest export scale, since
+    encoding cost grows with the output area.
+
+    Args:
+        settings: Resolved settings for the file.
+
+    Returns:
+        Output weight; ``0.0`` when nothing will be exported.
+    """
+    weight = 0.0
+    if settings.get("frame_export", False):
+        weight += FRAME_FORMAT_WEIGHTS.get(settings.get("frame_format"), 0.0)
+    if settings.get("animation_export", False):
+        weight += ANIMATION_FORMAT_WEIGHTS.get(settings.get("animation_format"), 0.0)
+
+    scales = []
+    for key in ("scale", "frame_scale"):
+        try:
+            scales.append(abs(float(settings.get(key) or 1.0)))
+        except (TypeError, ValueError):
+            continue
+    return weight * max(scales, default=1.0) ** 2
+
+
+def estimate_file_cost(
+    filename: str,
+    atlas_path: str,
+    metadata_path: Optional[str],
+    settings: Mapping[str, Any],
+    *,
+    is_spritemap: bool = False,
+) -> FileCost:
+    """Predict how long a file will keep a worker busy.
+
+    Only the image header and the first ``METADATA_SCAN_LIMIT`` characters
+    of the metadata are read.
+
+    Args:
+        filename: Queue entry the cost is recorded under.
+        atlas_path: Path to the atlas image.
+        metadata_path: Metadata path, or ``None`` for unknown sheets.
+        settings: Resolved settings for the file.
+        is_spritemap: ``True`` for Adobe spritemap projects.
+
+    Returns:
+        ``FileCost``; unreadable images get a zero pixel count.
+    """
+    try:
+        with Image.open(atlas_path) as header:
+            width, height = header.size
+    except Exception:
+        width = height = 0
+
+    sprite_count = 0
+    animation_count = 0
+    text = read_metadata_head(metadata_path)
+    if text is not None:
+        suffix = os.path.splitext(metadata_path)[1].lower()
+        sprite_count = count_sprites_in_text(text, suffix)
+        animation_count = count_metadata_animations(text, suffix)
+
+    pixels = width * height
+    output_weight = output_weight_for_settings(settings)
+    megapixels = pixels / 1_000_000
+    cost = (
+        megapixels * (DECODE_COST_PER_MP + output_weight)
+        + sprite_count * SPRITE_COST
+        + animation_count * ANIMATION_COST * max(output_weight, 1.0)
+    )
+    if is_spritemap:
+        cost *= SPRITEMAP_COST_FACTOR
+    elif metadata_path is None:
+        cost *= UNKNOWN_SHEET_COST_FACTOR
+
+    return FileCost(
+        filename,
+        pixels,
+        sprite_count,
+        animation_count,
+        output_weight,
+        is_spritemap,
+        cost,
+    )
+
+
+def schedule_longest_first(
+    costs: Sequence[FileCost], *, spritemaps_last: bool = False
+) -> List[FileCost]:
+    """Order files by descending predicted cost (LPT).
+
+    Ties keep their original queue order.
+
+    Args:
+        costs: Per-file predictions in queue order.
+        spritemaps_last: Queue Adobe spritemap projects after every other
+            file. Without memory admission this keeps several of these
+            memory-heavy projects from running at once.
+
+    Returns:
+        New list, most expensive file first.
+    """
+    if spritemaps_last:
+        return sorted(costs, key=lambda item: (item.is_spritemap, -item.cost))
+    return sorted(costs, key=lambda item: -item.cost)
+
+
+def predict_makespan(durations: Sequence[float], worker_count: int) -> float:
+    """Simulate a worker pool pulling jobs in order and return its makespan.
+
+    Args:
+        durations: Job durations in the order they are dequeued.
+        worker_count: Number of workers pulling from the queue.
+
+    Returns:
+        Time at which the last job finishes.
+    """
+    workers = [0.0] * max(1, int(worker_count))
+    for duration in durations:
+        heapq.heappush(workers, heapq.heappop(workers) + max(0.0, duration))
+    return max(workers)
+
+
+def measure_seconds_per_unit(
+    costs: Sequence[FileCost], durations: Mapping[str, float]
+) -> Optional[float]:
+    """Return the seconds per cost unit implied by measured durations.
+
+    Args:
+        costs: Per-file predictions.
+        durations: Measured processing seconds keyed by filename.
+
+    Returns:
+        Busy seconds divided by predicted cost, or ``None`` if no file with
+        a positive cost was measured.
+    """
+    measured = [item for item in costs if item.filename in durations]
+    total_cost = sum(item.cost for item in measured)
+    if not measured or total_cost <= 0:
+        return None
+    return sum(durations[item.filename] for item in measured) / total_cost
+
+
+class CostCalibration:
+    """Seconds-per-unit factor learned from earlier runs.
+
+    Attributes:
+        seconds_per_unit: Current factor used to turn costs into seconds.
+        runs: Number of runs the factor has been updated from.
+    """
+
+    def __init__(self, seconds_per_unit: float = DEFAULT_SECONDS_PER_UNIT) -> None:
+        self.seconds_per_unit = seconds_per_unit
+        self.runs = 0
+        self._lock = Lock()
+
+    def update(
+        self, costs: Sequence[FileCost], durations: Mapping[str, float]
+    ) -> None:
+        """Blend the factor measured by a finished run into the calibration.
+
+        The first measured run replaces the default; later runs are mixed
+        in with weight ``CALIBRATION_SMOOTHING``.
+
+        Args:
+            costs: Predictions of the finished run.
+            durations: Measured processing seconds keyed by filename.
+        """
+        measured = measure_seconds_per_unit(costs, durations)
+        if measured is None:
+            return
+        with self._lock:
+            if self.runs == 0:
+                self.seconds_per_unit = measured
+            else:
+                self.seconds_per_unit += CALIBRATION_SMOOTHING * (
+                    measured - self.seconds_per_unit
+                )
+            self.runs += 1
+
+
+_shared_calibration: Optional[CostCalibration] = None
+_shared_calibration_lock = Lock()
+
+
+def get_cost_calibration() -> CostCalibration:
+    """Return the process-wide cost calibration, creating it on first use."""
+    global _shared_calibration
+    with _shared_calibration_lock:
+        if _shared_calibration is None:
+            _shared_calibration = CostCalibration()
+        return _shared_calibration
+
+
+def build_schedule_report(
+    costs: Sequence[FileCost],
+    durations: Mapping[str, float],
+    worker_count: int,
+    actual_makespan: float,
+    seconds_per_unit: float,
+) -> Optional[ScheduleReport]:
+    """Compare the predicted makespan of a run with the measured one.
+
+    Args:
+        costs: Predictions in the order the files were queued.
+        durations: Measured processing seconds keyed by filename.
+        worker_count: Workers the run used.
+        actual_makespan: Measured wall time of the run in seconds.
+        seconds_per_unit: Calibration taken before the run started, so the
+            prediction is not fitted to the durations it is compared with.
+
+    Returns:
+        ``ScheduleReport``, or ``None`` if no file was both predicted and
+        measured.
+    """
+    measured = [item for item in costs if item.filename in durations]
+    measured_seconds_per_unit = measure_seconds_per_unit(measured, durations)
+    if measured_seconds_per_unit is None:
+        return None
+
+    busy_seconds = sum(durations[item.filename] for item in measured)
+    predicted = predict_makespan(
+        [item.cost * seconds_per_unit for item in measured], worker_count
+    )
+    return ScheduleReport(
+        worker_count=max(1, int(worker_count)),
+        file_count=len(measured),
+        predicted_makespan=predicted,
+        actual_makespan=actual_makespan,
+        ideal_makespan=busy_seconds / max(1, int(worker_count)),
+        seconds_per_unit=seconds_per_unit,
+        measured_seconds_per_unit=measured_seconds_per_unit,
+    )
+
+
+def format_schedule_report(report: ScheduleReport) -> str:
+    """Describe predicted versus actual makespan for a finished run."""
+    return (
+        f"[Scheduler] {report.file_count} file(s) on {report.worker_count} worker(s): "
+        f"predicted makespan {report.predicted_makespan:.2f}s, "
+        f"actual {report.actual_makespan:.2f}s "
+        f"(ideal {report.ideal_makespan:.2f}s)"
+    )
+
+
+__all__ = [
+    "CostCalibration",
+    "DEFAULT_SECONDS_PER_UNIT",
+    "FileCost",
+    "ScheduleReport",
+    "build_schedule_report",
+    "count_metadata_animations",
+    "estimate_file_cost",
+    "format_schedule_report",
+    "get_cost_calibration",
+    "measure_seconds_per_unit",
+    "output_weight_for_settings",
+    "predict_makespan",
+    "schedule_longest_first",
+]
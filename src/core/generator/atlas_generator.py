@@ -36,9 +36,10 @@ from packers import (
     PackedFrame,
     PackerOptions,
     PackerResult,
-    get_packer,
     list_algorithms,
+    pack_best,
 )
+from exporters.atlas_compositor import AtlasCompositor, AtlasPlacement
 from exporters.exporter_registry import ExporterRegistry
 from exporters.exporter_types import GeneratorMetadata
 from utils.version import APP_VERSION
@@ -616,156 +617,12 @@ class AtlasGenerator:
         If heuristic is "auto" or None, tries all available heuristics
         and returns the result with the best packing efficiency.
         """
-        packer_options = options.to_packer_options()
-
-        algorithm = options.algorithm
-
-        # True auto mode: try all algorithms and pick the best
-        if algorithm == "auto":
-            return self._pack_with_best_algorithm(
-                frames, packer_options, options.heuristic
-            )
-
-        # Check if we should auto-select the best heuristic
-        if options.heuristic == "auto" or options.heuristic is None:
-            return self._pack_with_best_heuristic(frames, algorithm, packer_options)
-
-        # Use specified heuristic
-        packer = get_packer(algorithm, packer_options)
-        packer.set_heuristic(options.heuristic)
-        return packer.pack(frames)
-
-    def _pack_with_best_algorithm(
-        self,
-        frames: List[FrameInput],
-        options: PackerOptions,
-        heuristic_hint: Optional[str] = None,
-    ) -> PackerResult:
-        """Try all algorithms and return the best result.
-
-        For each algorithm, if heuristic_hint is "auto" or None, tries all
-        heuristics. Otherwise uses the specified heuristic if supported.
-
-        "Best" is determined by:
-        1. Successful packing (all frames fit)
-        2. Smallest atlas area
-        3. Highest packing efficiency
-
-        Args:
-            frames: Frames to pack.
-            options: Packer options.
-            heuristic_hint: Optional heuristic to prefer, or "auto"/None for best.
-
-        Returns:
-            The PackerResult with the best efficiency across all algorithms.
-        """
-        algorithms = list_algorithms()
-
-        best_result: Optional[PackerResult] = None
-        best_score: float = float("inf")  # Lower is better (area)
-
-        auto_heuristic = heuristic_hint == "auto" or heuristic_hint is None
-
-        for algo_info in algorithms:
-            algo_name = algo_info.get("name", "")
-            if not algo_name or algo_name == "auto":
-                continue  # Skip meta-algorithm placeholder
-
-            try:
-                if auto_heuristic:
-                    # Try all heuristics for this algorithm
-                    result = self._pack_with_best_heuristic(frames, algo_name, options)
-                else:
-                    # Use specified heuristic
-                    packer = get_packer(algo_name, options)
-                    packer.set_heuristic(heuristic_hint)
-                    result = packer.pack(frames)
-
-                if not result.success:
-                    continue
-
-                # Score by area (smaller is better), tie-break by efficiency
-                score = result.atlas_width * result.atlas_height
-                # Subtract efficiency to prefer higher efficiency at same area
-                score -= result.efficiency * 0.01
-
-                if best_result is None or score < best_score:
-                    best_result = result
-                    best_score = score
-
-            except Exception as e:
-                print(f"Warning: Algorithm '{algo_name}' failed: {e}")
-                continue
-
-        if best_result is None:
-            # All algorithms failed, fall back to maxrects default
-            packer = get_packer("maxrects", options)
-            return packer.pack(frames)
-
-        return best_result
-
-    def _pack_with_best_heuristic(
-        self,
-        frames: List[FrameInput],
-        algorithm: str,
-        options: PackerOptions,
-    ) -> PackerResult:
-        """Try all heuristics for an algorithm and return the best result.
-
-        "Best" is determined by:
-        1. Successful packing (all frames fit)
-        2. Smallest atlas area
-        3. Highest packing efficiency
-
-        Args:
-            frames: Frames to pack.
-            algorithm: Algorithm name.
-            options: Packer options.
-
-        Returns:
-            The PackerResult with the best efficiency.
-        """
-        from packers import get_heuristics_for_algorithm
-
-        heuristics = get_heuristics_for_algorithm(algorithm)
-
-        if not heuristics:
-            # No heuristics available (e.g., SimplePacker), just pack directly
-            packer = get_packer(algorithm, options)
-            return packer.pack(frames)
-
-        best_result: Optional[PackerResult] = None
-        best_score: float = float("inf")  # Lower is better (area)
-
-        for heuristic_key, _ in heuristics:
-            try:
-                # Create fresh packer for each attempt
-                packer = get_packer(algorithm, options)
-                packer.set_heuristic(heuristic_key)
-                result = packer.pack(frames)
-
-                if not result.success:
-                    continue
-
-                # Score by area (smaller is better), tie-break by efficiency
-                score = result.atlas_width * result.atlas_height
-                # Subtract efficiency to prefer higher efficiency at same area
-                score -= result.efficiency * 0.01
-
-                if best_result is None or score < best_score:
-                    best_result = result
-                    best_score = score
-
-            except Exception as e:
-                print(f"Warning: Heuristic '{heuristic_key}' failed: {e}")
-                continue
-
-        if best_result is None:
-            # All heuristics failed, try with default
-            packer = get_packer(algorithm, options)
-            return packer.pack(frames)
-
-        return best_result
+        return pack_best(
+            options.algorithm,
+            frames,
+            options.to_packer_options(),
+            options.heuristic,
+        )
 
     def _composite_atlas(
         self,
@@ -775,22 +632,22 @@ class AtlasGenerator:
         height: int,
         padding: int,
     ) -> Image.Image:
-        """Composite packed frames onto atlas image."""
-        atlas = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+        """Composite packed frames onto atlas image.
 
+        Packed rectangles never overlap, so frames are copied straight into
+        a preallocated RGBA buffer instead of alpha-pasted one by one.
+        Rotated frames are turned 90° clockwise to match the packer output.
+        """
+        placements: List[AtlasPlacement] = []
         for packed in packed_frames:
             img = images.get(packed.id)
             if img is None:
                 continue
+            placements.append(
+                AtlasPlacement(img, packed.x, packed.y, -1 if packed.rotated else 0)
+            )
 
-            # Handle rotation if needed
-            if packed.rotated:
-                img = img.transpose(Image.Transpose.ROTATE_270)
-
-            # Paste onto atlas
-            atlas.paste(img, (packed.x, packed.y), img)
-
-        return atlas
+        return AtlasCompositor(width, height).composite(placements)
 
     def _build_save_kwargs(self, options: GeneratorOptions) -> Dict[str, Any]:
         """Build PIL save kwargs from compression settings.
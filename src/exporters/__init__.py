@@ -55,6 +55,8 @@ Classes:
     ExporterRegistry: Central registry and format detection.
     ExportOptions: Configuration for export behavior.
     ExportResult: Container for export outcomes.
+    AtlasCompositor: Array-based compositing of packed sprites.
+    AtlasPlacement: A sprite image with its atlas position and rotation.
 
 Type Aliases:
     SpriteData: Canonical sprite structure (re-exported from parsers).
@@ -75,6 +77,7 @@ from exporters.exporter_types import (
     SpriteData,
 )
 
+from exporters.atlas_compositor import AtlasCompositor, AtlasPlacement
 from exporters.base_exporter import BaseExporter
 
 from exporters.exporter_registry import (
@@ -147,6 +150,9 @@ from exporters.unity_exporter import (
 __all__ = [
     # Base class
     "BaseExporter",
+    # Compositing
+    "AtlasCompositor",
+    "AtlasPlacement",
     # Registry
     "ExporterRegistry",
     "export_file",
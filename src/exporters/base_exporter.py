@@ -19,6 +19,7 @@ from typing import Any, Dict, List, Optional, Tuple, Union
 
 from PIL import Image
 
+from exporters.atlas_compositor import AtlasCompositor, AtlasPlacement
 from exporters.exporter_types import (
     ExporterError,
     ExporterErrorCode,
@@ -31,6 +32,13 @@ from exporters.exporter_types import (
     PackingError,
     SpriteData,
 )
+from packers import (
+    FrameInput,
+    PackerOptions,
+    PackerRegistry,
+    pack_best,
+)
+from packers.packer_types import PackerErrorCode
 
 
 class BaseExporter(ABC):
@@ -43,7 +51,7 @@ class BaseExporter(ABC):
 
     The base class provides:
         - export_file(): Main entry point for creating atlas + metadata.
-        - pack_sprites(): Sprite packing with configurable algorithms.
+        - pack_sprites(): Sprite packing through the packers registry.
         - composite_atlas(): Render sprites onto atlas image.
     """
 
@@ -183,8 +191,9 @@ class BaseExporter(ABC):
     ) -> Tuple[List[PackedSprite], int, int]:
         """Pack sprites into an atlas layout.
 
-        Uses a simple shelf-packing algorithm by default.
-        Subclasses or future versions can plug in more sophisticated packers.
+        Delegates to the packers subsystem using the algorithm and heuristic
+        named in the export options, so exporter atlases are laid out the
+        same way as generator atlases.
 
         Args:
             sprites: Sprite definitions to pack.
@@ -196,65 +205,78 @@ class BaseExporter(ABC):
         Raises:
             PackingError: If sprites cannot fit in the maximum dimensions.
         """
-        padding = self.options.padding
-        max_width = self.options.max_width
-        max_height = self.options.max_height
-
-        # Sort sprites by height (descending) for better shelf packing
-        sorted_sprites = sorted(
-            sprites,
-            key=lambda s: sprite_images[s["name"]].height,
-            reverse=True,
+        algorithm = self.options.packer or "maxrects"
+        if algorithm != "auto" and not PackerRegistry.is_registered(algorithm):
+            raise PackingError(
+                ExporterErrorCode.PACKING_FAILED,
+                f"Unknown packer algorithm: {algorithm}",
+                details={"available": ", ".join(PackerRegistry.get_algorithm_names())},
+            )
+
+        frames = [
+            FrameInput(
+                id=str(index),
+                width=sprite_images[sprite["name"]].width,
+                height=sprite_images[sprite["name"]].height,
+                user_data=sprite,
+            )
+            for index, sprite in enumerate(sprites)
+        ]
+
+        result = pack_best(
+            algorithm,
+            frames,
+            self._build_packer_options(),
+            self.options.heuristic,
         )
 
-        packed: List[PackedSprite] = []
-        current_x = padding
-        current_y = padding
-        row_height = 0
-        atlas_width = 0
-        atlas_height = 0
-
-        for sprite in sorted_sprites:
-            img = sprite_images[sprite["name"]]
-            w, h = img.width, img.height
-
-            # Check if sprite fits in current row
-            if current_x + w + padding > max_width:
-                # Move to next row
-                current_x = padding
-                current_y += row_height + padding
-                row_height = 0
-
-            # Check if sprite fits vertically
-            if current_y + h + padding > max_height:
-                raise PackingError(
-                    ExporterErrorCode.ATLAS_TOO_LARGE,
-                    f"Cannot fit all sprites in {max_width}x{max_height} atlas",
-                    details={"sprite_count": len(sprites)},
-                )
-
-            # Place sprite
-            packed.append(
-                PackedSprite(
-                    sprite=sprite,
-                    atlas_x=current_x,
-                    atlas_y=current_y,
-                    rotated=False,
-                )
+        if not result.success:
+            codes = {error.code for error in result.errors}
+            too_large = bool(
+                codes
+                & {PackerErrorCode.CANNOT_FIT_ALL, PackerErrorCode.FRAME_TOO_LARGE}
+            )
+            message = (
+                result.errors[0].message
+                if result.errors
+                else f"Cannot fit all sprites in "
+                f"{self.options.max_width}x{self.options.max_height} atlas"
+            )
+            raise PackingError(
+                (
+                    ExporterErrorCode.ATLAS_TOO_LARGE
+                    if too_large
+                    else ExporterErrorCode.PACKING_FAILED
+                ),
+                message,
+                details={"sprite_count": len(sprites)},
             )
 
-            # Update tracking
-            current_x += w + padding
-            row_height = max(row_height, h)
-            atlas_width = max(atlas_width, current_x)
-            atlas_height = max(atlas_height, current_y + h + padding)
+        packed = [
+            PackedSprite(
+                sprite=frame.frame.user_data,
+                atlas_x=frame.x,
+                atlas_y=frame.y,
+                rotated=frame.rotated,
+            )
+            for frame in result.packed_frames
+        ]
+        return packed, result.atlas_width, result.atlas_height
 
-        # Optionally round up to power of two
-        if self.options.power_of_two:
-            atlas_width = self._next_power_of_two(atlas_width)
-            atlas_height = self._next_power_of_two(atlas_height)
+    def _build_packer_options(self) -> PackerOptions:
+        """Translate export options into packer options.
 
-        return packed, atlas_width, atlas_height
+        Returns:
+            PackerOptions matching this exporter's size and layout settings.
+        """
+        return PackerOptions(
+            max_width=self.options.max_width,
+            max_height=self.options.max_height,
+            padding=self.options.padding,
+            border_padding=self.options.padding,
+            power_of_two=self.options.power_of_two,
+            allow_rotation=self.options.allow_rotation,
+        )
 
     def composite_atlas(
         self,
@@ -265,6 +287,10 @@ class BaseExporter(ABC):
     ) -> Image.Image:
         """Composite packed sprites onto an atlas image.
 
+        Sprites are copied into a shared RGBA buffer by ``AtlasCompositor``;
+        packed rectangles never overlap, so no alpha blending is needed.
+        Rotated sprites are turned 90° clockwise, matching the packers.
+
         Args:
             packed_sprites: Sprites with assigned atlas positions.
             sprite_images: Mapping of sprite names to PIL Images.
@@ -274,24 +300,16 @@ class BaseExporter(ABC):
         Returns:
             Composited atlas as a PIL Image.
         """
-        # Create transparent atlas
-        atlas = Image.new("RGBA", (atlas_width, atlas_height), (0, 0, 0, 0))
-
-        for packed in packed_sprites:
-            img = sprite_images[packed.name]
-
-            # Handle rotation if needed
-            if packed.rotated:
-                img = img.transpose(Image.Transpose.ROTATE_90)
-
-            # Ensure image is RGBA
-            if img.mode != "RGBA":
-                img = img.convert("RGBA")
-
-            # Paste onto atlas
-            atlas.paste(img, (packed.atlas_x, packed.atlas_y), img)
-
-        return atlas
+        placements = [
+            AtlasPlacement(
+                sprite_images[packed.name],
+                packed.atlas_x,
+                packed.atlas_y,
+                -1 if packed.rotated else 0,
+            )
+            for packed in packed_sprites
+        ]
+        return AtlasCompositor(atlas_width, atlas_height).composite(placements)
 
     def _save_atlas_image(self, image: Image.Image, path: str) -> None:
         """Save the atlas image to disk.
@@ -153,6 +153,10 @@ class ExportOptions:
         max_width: Maximum atlas width in pixels.
         max_height: Maximum atlas height in pixels.
         allow_rotation: Allow 90-degree rotation for better packing.
+        packer: Packing algorithm name from the packers registry
+            (e.g., 'maxrects', 'skyline'), or 'auto' to try them all.
+        heuristic: Algorithm-specific heuristic key, or None/'auto' to
+            pick the tightest result across all heuristics.
         trim_sprites: Trim transparent edges from sprites.
         pretty_print: Format metadata with indentation.
         include_metadata: Include atlas metadata (size, image name).
@@ -165,6 +169,8 @@ class ExportOptions:
     max_width: int = 4096
     max_height: int = 4096
     allow_rotation: bool = False
+    packer: str = "maxrects"
+    heuristic: Optional[str] = None
     trim_sprites: bool = False
     pretty_print: bool = True
     include_metadata: bool = True
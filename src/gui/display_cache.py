@@ -0,0 +1,207 @@
+"""Cached backgrounds and composited frames for on-screen previews.
+
+``checkerboard_brush`` returns a shared texture brush for transparency
+backgrounds, so widgets fill any area with one ``fillRect`` call instead of
+painting squares one by one.
+
+``DisplayFrameCache`` keeps frames that are already scaled and composited
+over their background, keyed by the source pixmap, the scale and the
+background. Once every frame of an animation has been shown, playback only
+swaps cached pixmaps and allocates nothing per frame.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from PySide6.QtCore import QSize, Qt
+from PySide6.QtGui import QBrush, QColor, QPainter, QPixmap
+
+DEFAULT_DISPLAY_CACHE_BYTES = 256 * 1024 * 1024
+
+BACKGROUND_NONE = "None"
+BACKGROUND_SOLID = "Solid Color"
+BACKGROUND_CHECKERED = "Transparency Pattern"
+
+Rgb = Tuple[int, int, int]
+
+_brushes: Dict[Tuple[int, Rgb, Rgb], QBrush] = {}
+
+
+def checkerboard_brush(
+    square_size: int = 16,
+    first: Rgb = (240, 240, 240),
+    second: Rgb = (255, 255, 255),
+) -> QBrush:
+    """Return a tiling brush that paints a checkerboard.
+
+    Brushes are built once per combination of arguments and reused. Must be
+    called from the GUI thread.
+
+    Args:
+        square_size: Edge length of one square in pixels.
+        first: RGB color of the top-left square.
+        second: RGB color of the alternating squares.
+
+    Returns:
+        ``QBrush`` with a two-by-two square texture.
+    """
+    key = (max(1, int(square_size)), tuple(first), tuple(second))
+    brush = _brushes.get(key)
+    if brush is None:
+        size = key[0]
+        tile = QPixmap(size * 2, size * 2)
+        tile.fill(QColor(*second))
+        painter = QPainter(tile)
+        painter.fillRect(0, 0, size, size, QColor(*first))
+        painter.fillRect(size, size, size, size, QColor(*first))
+        painter.end()
+        brush = _brushes[key] = QBrush(tile)
+    return brush
+
+
+class DisplayFrameCache:
+    """LRU cache of frames scaled and composited for display.
+
+    Entries for other scales or backgrounds are evicted first, then the
+    least recently used frames of the current scale and background.
+
+    Attributes:
+        max_bytes: Budget for cached pixels.
+        hits: Lookups answered from the cache.
+        misses: Lookups that had to compose a frame.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_DISPLAY_CACHE_BYTES) -> None:
+        """Create an empty cache.
+
+        Args:
+            max_bytes: Byte budget for cached pixmaps.
+        """
+        self.max_bytes = max(0, int(max_bytes))
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[tuple, QPixmap]" = OrderedDict()
+        self._cached_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def cached_bytes(self) -> int:
+        """Pixel bytes currently held by the cache."""
+        return self._cached_bytes
+
+    def get(
+        self,
+        pixmap: QPixmap,
+        scale: float,
+        background_mode: str = BACKGROUND_NONE,
+        background_color: Optional[QColor] = None,
+    ) -> QPixmap:
+        """Return ``pixmap`` scaled and composited over its background.
+
+        Args:
+            pixmap: Source frame.
+            scale: Zoom multiplier (1.0 = 100%).
+            background_mode: ``BACKGROUND_NONE``, ``BACKGROUND_SOLID`` or
+                ``BACKGROUND_CHECKERED``.
+            background_color: Fill color for ``BACKGROUND_SOLID``.
+
+        Returns:
+            Cached or newly composed pixmap. Callers must not paint on it.
+        """
+        config = self._config_key(scale, background_mode, background_color)
+        key = (pixmap.cacheKey(),) + config
+        cached = self._entries.get(key)
+        if cached is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        composed = self.compose(pixmap, scale, background_mode, background_color)
+        nbytes = self._pixmap_bytes(composed)
+        self._evict(nbytes, config)
+        if nbytes <= self.max_bytes:
+            self._entries[key] = composed
+            self._cached_bytes += nbytes
+        return composed
+
+    @staticmethod
+    def compose(
+        pixmap: QPixmap,
+        scale: float,
+        background_mode: str = BACKGROUND_NONE,
+        background_color: Optional[QColor] = None,
+    ) -> QPixmap:
+        """Scale ``pixmap`` and draw it over the requested background."""
+        if abs(scale - 1.0) < 0.001:
+            scaled = pixmap
+        else:
+            scaled = pixmap.scaled(
+                QSize(
+                    int(pixmap.width() * scale),
+                    int(pixmap.height() * scale),
+                ),
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation,
+            )
+
+        if background_mode not in (BACKGROUND_SOLID, BACKGROUND_CHECKERED):
+            return scaled
+
+        final_pixmap = QPixmap(scaled.size())
+        if background_mode == BACKGROUND_SOLID:
+            final_pixmap.fill(background_color or QColor(127, 127, 127))
+            painter = QPainter(final_pixmap)
+        else:
+            painter = QPainter(final_pixmap)
+            painter.fillRect(final_pixmap.rect(), checkerboard_brush())
+        painter.drawPixmap(0, 0, scaled)
+        painter.end()
+        return final_pixmap
+
+    def clear(self) -> None:
+        """Drop every cached frame."""
+        self._entries.clear()
+        self._cached_bytes = 0
+
+    @staticmethod
+    def _config_key(
+        scale: float, background_mode: str, background_color: Optional[QColor]
+    ) -> tuple:
+        color = None
+        if background_mode == BACKGROUND_SOLID and background_color is not None:
+            color = background_color.rgba()
+        return (round(float(scale), 3), background_mode, color)
+
+    @staticmethod
+    def _pixmap_bytes(pixmap: QPixmap) -> int:
+        return pixmap.width() * pixmap.height() * 4
+
+    def _evict(self, incoming: int, config: tuple) -> None:
+        """Make room for ``incoming`` bytes, dropping other configs first.
+
+        Frames of ``config`` itself are then dropped least recently used
+        first. Nothing is dropped for a frame larger than the whole budget.
+        """
+        if incoming > self.max_bytes:
+            return
+        for same_config in (False, True):
+            for key in list(self._entries):
+                if self._cached_bytes + incoming <= self.max_bytes:
+                    return
+                if (key[1:] == config) == same_config:
+                    self._cached_bytes -= self._pixmap_bytes(self._entries.pop(key))
+
+
+__all__ = [
+    "BACKGROUND_CHECKERED",
+    "BACKGROUND_NONE",
+    "BACKGROUND_SOLID",
+    "DEFAULT_DISPLAY_CACHE_BYTES",
+    "DisplayFrameCache",
+    "checkerboard_brush",
+]
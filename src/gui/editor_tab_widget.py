@@ -10,7 +10,17 @@ from collections import defaultdict
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Tuple
 
-from PySide6.QtCore import QEvent, QObject, QPoint, QPointF, QRect, QSize, Qt, Signal
+from PySide6.QtCore import (
+    QEvent,
+    QObject,
+    QPoint,
+    QPointF,
+    QRect,
+    QSize,
+    Qt,
+    QThread,
+    Signal,
+)
 from PySide6.QtGui import QColor, QImage, QPainter, QPixmap
 from PySide6.QtWidgets import (
     QAbstractItemView,
@@ -36,7 +46,9 @@ from PySide6.QtWidgets import (
     QMenu,
 )
 
+from core.editor.source_cache import EditorSourceCache
 from gui.base_tab_widget import BaseTabWidget
+from gui.display_cache import checkerboard_brush
 from utils.FNF.alignment import resolve_fnf_offset
 
 import numpy as np
@@ -382,13 +394,10 @@ class AlignmentCanvas(QWidget):
 
     def _paint_checkerboard(self, painter: QPainter, rect):
         """Fill the canvas with alternating squares to show transparency."""
-        square = 16
-        dark = QColor(60, 60, 60)
-        light = QColor(80, 80, 80)
-        for x in range(rect.left(), rect.right() + square, square):
-            for y in range(rect.top(), rect.bottom() + square, square):
-                color = dark if ((x // square + y // square) % 2 == 0) else light
-                painter.fillRect(x, y, square, square, color)
+        painter.save()
+        painter.setBrushOrigin(rect.topLeft())
+        painter.fillRect(rect, checkerboard_brush(16, (60, 60, 60), (80, 80, 80)))
+        painter.restore()
 
     def _paint_crosshair(self, painter: QPainter, rect):
         """Draw either axes through the center or lines along the top-left."""
@@ -559,6 +568,132 @@ class CanvasDetachWindow(QDialog):
         super().closeEvent(event)
 
 
+@dataclass
+class _PendingEditorLoad:
+    """Extractor animation queued for background loading into the editor."""
+
+    animation_id: str
+    spritesheet_name: str
+    animation_name: str
+    spritesheet_path: str
+    metadata_path: Optional[str]
+    spritemap_info: Optional[dict]
+    spritemap_target: Optional[dict]
+    frame_duration: int
+    overrides: Dict[str, Any]
+    error: Optional[str] = None
+
+
+class EditorAnimationLoader(QThread):
+    """Background thread that produces editor frames for one animation.
+
+    Sources come from an ``EditorSourceCache`` so loading several animations
+    from the same sheet parses it only once. Frames are emitted as
+    ``QImage`` objects as soon as they are cropped; the GUI thread turns
+    them into pixmaps. Supports early termination via ``stop()``.
+
+    Signals:
+        frame_ready(str, QImage, object): Emitted with the frame name, image
+            and frame metadata dict for each frame in order.
+        progress_updated(int, int): Emitted with processed and total frames.
+        loading_complete(int): Emitted with the number of frames produced.
+        error_occurred(str): Emitted with an error message on failure.
+    """
+
+    frame_ready = Signal(str, QImage, object)
+    progress_updated = Signal(int, int)
+    loading_complete = Signal(int)
+    error_occurred = Signal(str)
+
+    def __init__(
+        self,
+        source_cache: EditorSourceCache,
+        animation_name: str,
+        spritesheet_path: str,
+        metadata_path: Optional[str],
+        spritemap_info: Optional[dict] = None,
+        spritemap_target: Optional[dict] = None,
+    ):
+        """Initialize the loader.
+
+        Args:
+            source_cache: Cache providing renderers and parsed atlases.
+            animation_name: Animation to load from the sheet.
+            spritesheet_path: Path to the atlas image.
+            metadata_path: Path to the atlas metadata, if any.
+            spritemap_info: Adobe spritemap paths, for spritemap exports.
+            spritemap_target: Symbol or timeline label to render.
+        """
+        super().__init__()
+        self.source_cache = source_cache
+        self.animation_name = animation_name
+        self.spritesheet_path = spritesheet_path
+        self.metadata_path = metadata_path
+        self.spritemap_info = spritemap_info
+        self.spritemap_target = spritemap_target
+        self._stop_requested = False
+
+    def stop(self):
+        """Request to stop loading."""
+        self._stop_requested = True
+
+    def run(self):
+        """Produce frames in the background and stream them to the editor."""
+        try:
+            if not PIL_AVAILABLE:
+                self.error_occurred.emit("PIL/Pillow not available")
+                return
+
+            if self.spritemap_info:
+                animation_json = self.spritemap_info.get("animation_json")
+                spritemap_json = self.spritemap_info.get("spritemap_json")
+                if not (animation_json and spritemap_json):
+                    raise ValueError("Spritemap metadata is incomplete.")
+                renderer = self.source_cache.get_renderer(
+                    animation_json, spritemap_json, self.spritesheet_path
+                )
+                # Spritemap frames share one crop box, so the whole range is
+                # rendered before the first frame can be shown.
+                raw_frames = renderer.render_animation(
+                    self.spritemap_target or self.animation_name,
+                    progress_callback=self.progress_updated.emit,
+                )
+                total = len(raw_frames)
+                frames = iter(raw_frames)
+            else:
+                if not self.metadata_path:
+                    raise ValueError("The selected spritesheet does not have metadata.")
+                processor = self.source_cache.get_sprite_processor(
+                    self.spritesheet_path, self.metadata_path
+                )
+                groups = processor.group_sprites(
+                    processor.match_animation_sprites(self.animation_name)
+                )
+                sprites = groups.get(self.animation_name, [])
+                total = len(sprites)
+                frames = processor.iter_frames(sprites)
+
+            produced = 0
+            for frame_name, image, raw_metadata in frames:
+                if self._stop_requested:
+                    return
+                qimage = EditorTabWidget._pil_to_qimage(
+                    EditorTabWidget._ensure_pil_image(image)
+                )
+                self.frame_ready.emit(
+                    frame_name,
+                    qimage,
+                    EditorTabWidget._extract_frame_metadata(raw_metadata),
+                )
+                produced += 1
+                self.progress_updated.emit(produced, total)
+
+            if not self._stop_requested:
+                self.loading_complete.emit(produced)
+        except Exception as exc:
+            self.error_occurred.emit(str(exc))
+
+
 class EditorTabWidget(BaseTabWidget):
     """High-level controller for the alignment editor tab UI and logic."""
 
@@ -592,6 +727,10 @@ class EditorTabWidget(BaseTabWidget):
         self._animation_items: Dict[str, QTreeWidgetItem] = {}
         self._tree_reorder_filter: Optional[QObject] = None
         self._multi_drag_baselines: Optional[Dict[str, Tuple[int, int]]] = None
+        self._source_cache = EditorSourceCache()
+        self._pending_loads: List[_PendingEditorLoad] = []
+        self._active_load: Optional[_PendingEditorLoad] = None
+        self._load_worker: Optional[EditorAnimationLoader] = None
         self._default_status_text = self.tr(
             "Drag the frame, use arrow keys for fine adjustments, or type offsets manually."
         )
@@ -1384,148 +1523,202 @@ class EditorTabWidget(BaseTabWidget):
         spritemap_info: Optional[dict] = None,
         spritemap_target: Optional[dict] = None,
     ):
-        """Public entry point used by the extract tab to open an animation."""
-        animation = self._build_animation_from_spritesheet(
-            spritesheet_name,
-            animation_name,
-            spritesheet_path,
-            metadata_path,
-            spritemap_info,
-            spritemap_target,
+        """Public entry point used by the extract tab to open an animation.
+
+        The animation is added to the tree right away and its frames are
+        streamed in by an ``EditorAnimationLoader``. Requests are loaded one
+        at a time in the order they were made.
+        """
+        frame_duration, overrides = self._load_extractor_animation_settings(
+            spritesheet_name, animation_name
         )
-        if animation:
-            self._register_animation(animation)
-            self.status_label.setText(
-                self.tr("Loaded {animation} from {sheet}.").format(
-                    animation=animation_name, sheet=spritesheet_name
-                )
+        animation = AlignmentAnimation(
+            display_name=f"{spritesheet_name}/{animation_name}",
+            frames=[],
+            canvas_width=0,
+            canvas_height=0,
+            source="extract",
+            spritesheet_name=spritesheet_name,
+            animation_name=animation_name,
+            metadata={
+                "spritesheet_path": spritesheet_path,
+                "metadata_path": metadata_path or "",
+            },
+        )
+        animation_id = self._register_animation(animation)
+        self._pending_loads.append(
+            _PendingEditorLoad(
+                animation_id=animation_id,
+                spritesheet_name=spritesheet_name,
+                animation_name=animation_name,
+                spritesheet_path=spritesheet_path,
+                metadata_path=metadata_path,
+                spritemap_info=spritemap_info,
+                spritemap_target=spritemap_target,
+                frame_duration=frame_duration,
+                overrides=overrides,
             )
-            self._focus_latest_animation()
-        else:
-            QMessageBox.warning(
-                self,
-                self.tr("Editor"),
-                self.tr(
-                    "Could not load animation '{animation}' from '{sheet}'."
-                ).format(animation=animation_name, sheet=spritesheet_name),
+        )
+        self.status_label.setText(
+            self.tr("Loading {animation} from {sheet}...").format(
+                animation=animation_name, sheet=spritesheet_name
             )
+        )
+        self._start_next_load()
+
+    def _load_extractor_animation_settings(
+        self, spritesheet_name: str, animation_name: str
+    ) -> Tuple[int, Dict[str, Any]]:
+        """Return the frame duration and saved alignment overrides to apply."""
+        frame_duration = 42  # Default 42ms (~24fps)
+        overrides: Dict[str, Any] = {}
+        if hasattr(self.parent_app, "settings_manager"):
+            settings = self.parent_app.settings_manager.get_settings(
+                spritesheet_name, f"{spritesheet_name}/{animation_name}"
+            )
+            # Support both legacy 'fps' and new 'duration' keys
+            if "duration" in settings:
+                frame_duration = settings.get("duration", 42)
+            elif "fps" in settings:
+                fps = settings.get("fps", 24)
+                frame_duration = int(round(1000 / max(1, fps)))
+            overrides = settings.get("alignment_overrides", {}) or {}
+        return frame_duration, overrides
+
+    def _is_animation_loading(self, animation_id: Optional[str]) -> bool:
+        """Return ``True`` while frames for ``animation_id`` are still arriving."""
+        if self._active_load and self._active_load.animation_id == animation_id:
+            return True
+        return any(load.animation_id == animation_id for load in self._pending_loads)
+
+    def _start_next_load(self):
+        """Start a loader for the next queued animation if none is running."""
+        if self._load_worker is not None:
+            return
+        while self._pending_loads:
+            load = self._pending_loads.pop(0)
+            if load.animation_id not in self._animations:
+                continue
+            worker = EditorAnimationLoader(
+                self._source_cache,
+                load.animation_name,
+                load.spritesheet_path,
+                load.metadata_path,
+                load.spritemap_info,
+                load.spritemap_target,
+            )
+            worker.frame_ready.connect(self._on_loader_frame_ready)
+            worker.progress_updated.connect(self._on_loader_progress)
+            worker.error_occurred.connect(self._on_loader_error)
+            worker.finished.connect(self._on_loader_finished)
+            self._active_load = load
+            self._load_worker = worker
+            worker.start()
+            return
+
+    def _on_loader_frame_ready(self, name: str, image: QImage, metadata: object):
+        """Append a streamed frame to its animation and tree item."""
+        load = self._active_load
+        animation = self._animations.get(load.animation_id) if load else None
+        if animation is None:
+            if self._load_worker is not None:
+                self._load_worker.stop()
+            return
 
-    def _build_animation_from_spritesheet(
-        self,
-        spritesheet_name: str,
-        animation_name: str,
-        spritesheet_path: str,
-        metadata_path: Optional[str],
-        spritemap_info: Optional[dict],
-        spritemap_target: Optional[dict],
-    ) -> Optional[AlignmentAnimation]:
-        """Assemble an animation from atlas metadata or spritemap exports."""
-        try:
-            frames: List[AlignmentFrame] = []
-            frame_duration = 42  # Default 42ms (~24fps)
-            if hasattr(self.parent_app, "settings_manager"):
-                settings = self.parent_app.settings_manager.get_settings(
-                    spritesheet_name, f"{spritesheet_name}/{animation_name}"
-                )
-                # Support both legacy 'fps' and new 'duration' keys
-                if "duration" in settings:
-                    frame_duration = settings.get("duration", 42)
-                elif "fps" in settings:
-                    fps = settings.get("fps", 24)
-                    frame_duration = int(round(1000 / max(1, fps)))
-
-            if spritemap_info:
-                from core.extractor.spritemap import AdobeSpritemapRenderer
-
-                target = spritemap_target or animation_name
-                animation_json = spritemap_info.get("animation_json")
-                spritemap_json = spritemap_info.get("spritemap_json")
-                if not (animation_json and spritemap_json):
-                    raise ValueError("Spritemap metadata is incomplete.")
-                renderer = AdobeSpritemapRenderer(
-                    animation_json,
-                    spritemap_json,
-                    spritesheet_path,
-                    filter_single_frame=True,
-                )
-                raw_frames = renderer.render_animation(target)
-            else:
-                if not metadata_path:
-                    raise ValueError("The selected spritesheet does not have metadata.")
-                from core.extractor.atlas_processor import AtlasProcessor
-                from core.extractor.sprite_processor import SpriteProcessor
-
-                atlas_processor = AtlasProcessor(spritesheet_path, metadata_path)
-                if metadata_path.endswith(".xml"):
-                    animation_sprites = atlas_processor.parse_xml_for_preview(
-                        animation_name
-                    )
-                elif metadata_path.endswith(".txt"):
-                    animation_sprites = atlas_processor.parse_txt_for_preview(
-                        animation_name
-                    )
-                else:
-                    animation_sprites = []
-
-                if not animation_sprites:
-                    return None
-
-                sprite_processor = SpriteProcessor(
-                    atlas_processor.atlas, animation_sprites
-                )
-                processed = sprite_processor.process_specific_animation(animation_name)
-                raw_frames = processed.get(animation_name, [])
+        frame = AlignmentFrame(
+            name=name,
+            original_key=name,
+            pixmap=QPixmap.fromImage(image),
+            duration_ms=load.frame_duration,
+            metadata=dict(metadata or {}),
+        )
+        animation.frames.append(frame)
+        if load.overrides and len(animation.frames) == 1:
+            self._apply_alignment_overrides(animation, load.overrides)
+        else:
+            if load.overrides:
+                self._apply_frame_override(animation, load.overrides, frame)
+            animation.ensure_canvas_bounds(respect_existing=True)
 
-            if not raw_frames:
-                return None
+        item = self._animation_items.get(load.animation_id)
+        if item is None:
+            return
+        self._append_frame_item(
+            item, load.animation_id, len(animation.frames) - 1, frame
+        )
+        if load.animation_id != self._current_animation_id:
+            return
+        if len(animation.frames) == 1 and self.animation_tree.currentItem() is item:
+            self.animation_tree.setCurrentItem(item.child(0))
+        elif (
+            self.canvas_width_spin.value(),
+            self.canvas_height_spin.value(),
+        ) != (animation.canvas_width, animation.canvas_height):
+            self.canvas_width_spin.setValue(animation.canvas_width)
+            self.canvas_height_spin.setValue(animation.canvas_height)
+
+    def _on_loader_progress(self, current: int, total: int):
+        """Show loading progress for the active animation."""
+        load = self._active_load
+        if load is None or load.animation_id not in self._animations:
+            return
+        self.status_label.setText(
+            self.tr("Loading {animation} from {sheet}... {current}/{total}").format(
+                animation=load.animation_name,
+                sheet=load.spritesheet_name,
+                current=current,
+                total=total,
+            )
+        )
 
-            for idx, frame_entry in enumerate(raw_frames):
-                frame_name, pil_image, _meta = frame_entry
-                pil_image = self._ensure_pil_image(pil_image)
-                frame_metadata = self._extract_frame_metadata(_meta)
-                pixmap = self._pil_to_pixmap(pil_image)
-                frames.append(
-                    AlignmentFrame(
-                        name=frame_name,
-                        original_key=frame_name,
-                        pixmap=pixmap,
-                        duration_ms=frame_duration,
-                        metadata=frame_metadata,
+    def _on_loader_error(self, message: str):
+        """Remember the failure so it can be reported once the loader exits."""
+        if self._active_load is not None:
+            self._active_load.error = message
+
+    def _on_loader_finished(self):
+        """Finalize the active load and continue with the next request."""
+        load = self._active_load
+        worker = self._load_worker
+        self._active_load = None
+        self._load_worker = None
+        if worker is not None:
+            worker.deleteLater()
+
+        animation = self._animations.get(load.animation_id) if load else None
+        if load is not None and load.error:
+            print(
+                f"[EditorTabWidget] Failed to build animation "
+                f"{load.animation_name}: {load.error}"
+            )
+        if animation is not None:
+            if animation.frames:
+                self._refresh_ghost_options()
+                self.status_label.setText(
+                    self.tr("Loaded {animation} from {sheet}.").format(
+                        animation=load.animation_name, sheet=load.spritesheet_name
                     )
                 )
-
-            max_w = max(frame.pixmap.width() for frame in frames)
-            max_h = max(frame.pixmap.height() for frame in frames)
-            animation = AlignmentAnimation(
-                display_name=f"{spritesheet_name}/{animation_name}",
-                frames=frames,
-                canvas_width=max_w,
-                canvas_height=max_h,
-                source="extract",
-                spritesheet_name=spritesheet_name,
-                animation_name=animation_name,
-                metadata={
-                    "spritesheet_path": spritesheet_path,
-                    "metadata_path": metadata_path or "",
-                },
-            )
-            animation.ensure_canvas_bounds()
-
-            overrides = {}
-            if hasattr(self.parent_app, "settings_manager"):
-                settings = self.parent_app.settings_manager.get_settings(
-                    spritesheet_name, f"{spritesheet_name}/{animation_name}"
+            else:
+                self._discard_animation(load.animation_id)
+                QMessageBox.warning(
+                    self,
+                    self.tr("Editor"),
+                    self.tr(
+                        "Could not load animation '{animation}' from '{sheet}'."
+                    ).format(
+                        animation=load.animation_name, sheet=load.spritesheet_name
+                    ),
                 )
-                overrides = settings.get("alignment_overrides", {})
-            if overrides:
-                self._apply_alignment_overrides(animation, overrides)
+        self._start_next_load()
 
-            return animation
-        except Exception as exc:
-            print(
-                f"[EditorTabWidget] Failed to build animation {animation_name}: {exc}"
-            )
-            return None
+    def _stop_loading(self):
+        """Cancel queued loads and wait for the running loader to exit."""
+        self._pending_loads.clear()
+        worker = self._load_worker
+        if worker is not None:
+            worker.stop()
+            worker.wait()
 
     # ------------------------------------------------------------------
     # Animation registration / selection
@@ -1557,11 +1750,21 @@ class EditorTabWidget(BaseTabWidget):
         while animation_item.childCount():
             animation_item.removeChild(animation_item.child(0))
         for idx, frame in enumerate(animation.frames):
-            label = f"{frame.name}  ({frame.pixmap.width()}x{frame.pixmap.height()})"
-            child = QTreeWidgetItem([label])
-            child.setData(0, ANIMATION_ID_ROLE, animation_id)
-            child.setData(0, FRAME_INDEX_ROLE, idx)
-            animation_item.addChild(child)
+            self._append_frame_item(animation_item, animation_id, idx, frame)
+
+    @staticmethod
+    def _append_frame_item(
+        animation_item: QTreeWidgetItem,
+        animation_id: str,
+        frame_index: int,
+        frame: AlignmentFrame,
+    ):
+        """Add one child entry for ``frame`` under the animation item."""
+        label = f"{frame.name}  ({frame.pixmap.width()}x{frame.pixmap.height()})"
+        child = QTreeWidgetItem([label])
+        child.setData(0, ANIMATION_ID_ROLE, animation_id)
+        child.setData(0, FRAME_INDEX_ROLE, frame_index)
+        animation_item.addChild(child)
 
     def _focus_latest_animation(self):
         """Scroll to and select the most recently added animation item."""
@@ -1591,17 +1794,20 @@ class EditorTabWidget(BaseTabWidget):
         for animation_item in selected_items:
             if animation_item is None:
                 continue
-            animation_id = animation_item.data(0, ANIMATION_ID_ROLE)
-            if animation_id in self._animations:
-                del self._animations[animation_id]
-            self._animation_items.pop(animation_id, None)
+            self._discard_animation(animation_item.data(0, ANIMATION_ID_ROLE))
+
+    def _discard_animation(self, animation_id: Optional[str]):
+        """Drop an animation and its tree item, resetting state if necessary."""
+        self._animations.pop(animation_id, None)
+        animation_item = self._animation_items.pop(animation_id, None)
+        if animation_item is not None:
             index = self.animation_tree.indexOfTopLevelItem(animation_item)
             if index >= 0:
                 self.animation_tree.takeTopLevelItem(index)
-            if animation_id == self._current_animation_id:
-                self._current_animation_id = None
-                self._current_frame_index = -1
-                self.canvas.set_pixmap(None)
+        if animation_id == self._current_animation_id:
+            self._current_animation_id = None
+            self._current_frame_index = -1
+            self.canvas.set_pixmap(None)
         self.save_overrides_button.setEnabled(False)
         self.export_composite_button.setEnabled(False)
         self._update_combine_button_state()
@@ -1622,6 +1828,17 @@ class EditorTabWidget(BaseTabWidget):
             )
             return
 
+        if any(
+            self._is_animation_loading(item.data(0, ANIMATION_ID_ROLE))
+            for item in selected_items
+        ):
+            QMessageBox.information(
+                self,
+                self.tr("Still loading"),
+                self.tr("Wait for the selected animations to finish loading."),
+            )
+            return
+
         combined_frames: List[AlignmentFrame] = []
         composite_sources: List[str] = []
         source_animation_ids: List[str] = []
@@ -2291,6 +2508,13 @@ class EditorTabWidget(BaseTabWidget):
         animation = self._animations.get(self._current_animation_id)
         if animation is None or animation.source != "extract":
             return
+        if self._is_animation_loading(self._current_animation_id):
+            QMessageBox.information(
+                self,
+                self.tr("Still loading"),
+                self.tr("Wait for the animation to finish loading before saving."),
+            )
+            return
 
         overrides_data = self._build_alignment_overrides(animation)
         full_name = f"{animation.spritesheet_name}/{animation.animation_name}"
@@ -2639,27 +2863,33 @@ class EditorTabWidget(BaseTabWidget):
             animation.fnf_raw_offsets = {key: value for key, value in raw_block.items()}
         else:
             animation.fnf_raw_offsets = None
-        frame_map = overrides.get("frames", {})
         for frame in animation.frames:
-            data = frame_map.get(frame.original_key)
-            if data is None:
-                offset_x, offset_y = animation.default_offset
-            else:
-                offset_x = int(data.get("x", animation.default_offset[0]))
-                offset_y = int(data.get("y", animation.default_offset[1]))
+            self._apply_frame_override(animation, overrides, frame)
+        animation.ensure_canvas_bounds(respect_existing=True)
 
-            fnf_override = resolve_fnf_offset(
-                overrides, frame.original_key, frame.metadata
-            )
-            if fnf_override is not None:
-                offset_x, offset_y = fnf_override
+    @staticmethod
+    def _apply_frame_override(
+        animation: AlignmentAnimation, overrides: dict, frame: AlignmentFrame
+    ):
+        """Set one frame's offsets from saved overrides or the default offset."""
+        data = overrides.get("frames", {}).get(frame.original_key)
+        if data is None:
+            offset_x, offset_y = animation.default_offset
+        else:
+            offset_x = int(data.get("x", animation.default_offset[0]))
+            offset_y = int(data.get("y", animation.default_offset[1]))
 
-            frame.offset_x = offset_x
-            frame.offset_y = offset_y
-        animation.ensure_canvas_bounds(respect_existing=True)
+        fnf_override = resolve_fnf_offset(overrides, frame.original_key, frame.metadata)
+        if fnf_override is not None:
+            offset_x, offset_y = fnf_override
+
+        frame.offset_x = offset_x
+        frame.offset_y = offset_y
 
     def closeEvent(self, event):  # noqa: D401 - Qt API
-        """Ensure detached windows close when the editor tab is closed."""
+        """Stop background loads and close detached windows with the tab."""
+        self._stop_loading()
+        self._source_cache.clear()
         if self._detached_window:
             self._detached_window.close()
         super().closeEvent(event)
@@ -2690,8 +2920,8 @@ class EditorTabWidget(BaseTabWidget):
         )
 
     @staticmethod
-    def _pil_to_pixmap(image) -> QPixmap:
-        """Convert a Pillow image into a ``QPixmap`` for canvas rendering."""
+    def _pil_to_qimage(image) -> QImage:
+        """Convert a Pillow image into a ``QImage``; safe off the GUI thread."""
         image = image.convert("RGBA")
         data = image.tobytes("raw", "RGBA")
         bytes_per_line = image.width * 4
@@ -2702,7 +2932,12 @@ class EditorTabWidget(BaseTabWidget):
             bytes_per_line,
             QImage.Format.Format_RGBA8888,
         )
-        return QPixmap.fromImage(qimage.copy())
+        return qimage.copy()
+
+    @classmethod
+    def _pil_to_pixmap(cls, image) -> QPixmap:
+        """Convert a Pillow image into a ``QPixmap`` for canvas rendering."""
+        return QPixmap.fromImage(cls._pil_to_qimage(image))
 
     @staticmethod
     def _pixmap_to_pil(pixmap: QPixmap) -> Any:
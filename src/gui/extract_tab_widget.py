@@ -2,12 +2,13 @@
 # -*- coding: utf-8 -*-
 """Widgets and helpers that power the Extract tab in the GUI."""
 
-import json
 import os
 import tempfile
 import shutil
+import time
 from collections import defaultdict
 from pathlib import Path
+from threading import Event
 from typing import Optional
 
 from PySide6.QtWidgets import (
@@ -26,7 +27,7 @@ from PySide6.QtWidgets import (
     QMenu,
     QMessageBox,
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QThread, Signal
 from PySide6.QtGui import QAction
 
 from gui.base_tab_widget import BaseTabWidget
@@ -40,7 +41,6 @@ from utils.combo_options import (
 )
 
 from gui.extractor.enhanced_list_widget import EnhancedListWidget
-from utils.utilities import Utilities
 from utils.duration_utils import (
     convert_duration,
     duration_to_milliseconds,
@@ -49,11 +49,7 @@ from utils.duration_utils import (
     milliseconds_to_duration,
     resolve_native_duration_type,
 )
-from core.extractor.spritemap.metadata import (
-    compute_symbol_lengths,
-    extract_label_ranges,
-)
-from core.extractor.spritemap.normalizer import normalize_animation_document
+from core.extractor.spritesheet_scanner import SpritesheetScanner
 
 
 class SpritesheetFileDialog(QFileDialog):
@@ -191,6 +187,136 @@ class SpritesheetFileDialog(QFileDialog):
         self._address_line.setText(str(path))
 
 
+class SpritesheetScanWorker(QThread):
+    """Background thread that scans an input folder for spritesheets.
+
+    Entries are emitted in small batches as they are found so the list fills
+    while the rest of the tree is still being walked. Supports early
+    termination via ``stop()``.
+
+    Signals:
+        entries_found(int, list): Emitted with the scan id and a batch of
+            ``SpritesheetEntry`` objects.
+        scan_complete(int, int): Emitted with the scan id and entry count.
+        error_occurred(int, str): Emitted with the scan id and a message.
+    """
+
+    entries_found = Signal(int, list)
+    scan_complete = Signal(int, int)
+    error_occurred = Signal(int, str)
+
+    BATCH_SIZE = 64
+    BATCH_INTERVAL = 0.1
+
+    def __init__(
+        self,
+        scanner: SpritesheetScanner,
+        directory: str,
+        scan_id: int,
+        filter_single_frame: bool = True,
+    ):
+        """Initialize the worker.
+
+        Args:
+            scanner: Shared scanner holding the listing caches.
+            directory: Folder to scan.
+            scan_id: Identifier echoed in every signal.
+            filter_single_frame: Skip single-frame spritemap symbols.
+        """
+        super().__init__()
+        self.scanner = scanner
+        self.directory = directory
+        self.scan_id = scan_id
+        self.filter_single_frame = filter_single_frame
+        self._stop_requested = False
+
+    def stop(self):
+        """Request to stop scanning."""
+        self._stop_requested = True
+
+    def run(self):
+        """Walk the folder and stream entries back to the GUI thread."""
+        try:
+            batch = []
+            count = 0
+            last_emit = time.monotonic()
+            for entry in self.scanner.scan(
+                self.directory,
+                self.filter_single_frame,
+                should_stop=lambda: self._stop_requested,
+            ):
+                batch.append(entry)
+                count += 1
+                now = time.monotonic()
+                if (
+                    len(batch) >= self.BATCH_SIZE
+                    or now - last_emit >= self.BATCH_INTERVAL
+                ):
+                    self.entries_found.emit(self.scan_id, batch)
+                    batch = []
+                    last_emit = now
+            if self._stop_requested:
+                return
+            if batch:
+                self.entries_found.emit(self.scan_id, batch)
+            self.scan_complete.emit(self.scan_id, count)
+        except Exception as exc:
+            self.error_occurred.emit(self.scan_id, str(exc))
+
+
+class UnknownSheetDetectionWorker(QThread):
+    """Background thread that detects sprites on a sheet without metadata.
+
+    Runs ``UnknownParser`` detection off the GUI thread. ``cancel()`` sets
+    the worker's cancel event, which stops detection at the next pixel row.
+    Detected boxes land in the parser's detection cache, so previews and
+    extraction of the same image reuse them.
+
+    Signals:
+        names_detected(int, list): Emitted with the request id and the
+            detected animation names.
+        error_occurred(int, str): Emitted with the request id and a message.
+    """
+
+    names_detected = Signal(int, list)
+    error_occurred = Signal(int, str)
+
+    def __init__(self, image_path: str, request_id: int):
+        """Initialize the worker.
+
+        Args:
+            image_path: Spritesheet image to analyze.
+            request_id: Identifier echoed in every signal.
+        """
+        super().__init__()
+        self.image_path = image_path
+        self.request_id = request_id
+        self.cancel_event = Event()
+
+    def cancel(self):
+        """Request to stop detection."""
+        self.cancel_event.set()
+
+    def run(self):
+        """Detect sprites and send the names back to the GUI thread."""
+        from parsers.unknown_parser import DetectionCancelled, UnknownParser
+
+        try:
+            parser = UnknownParser(
+                directory=str(Path(self.image_path).parent),
+                image_filename=Path(self.image_path).name,
+                cancel_event=self.cancel_event,
+            )
+            names = parser.get_data()
+        except DetectionCancelled:
+            return
+        except Exception as exc:
+            self.error_occurred.emit(self.request_id, str(exc))
+            return
+        if not self.cancel_event.is_set():
+            self.names_detected.emit(self.request_id, sorted(names))
+
+
 class ExtractTabWidget(BaseTabWidget):
     """Widget for the Extract tab functionality."""
 
@@ -223,6 +349,13 @@ class ExtractTabWidget(BaseTabWidget):
             )
             self.use_native_file_dialog = interface.get("use_native_file_dialog", False)
         self.editor_composites = defaultdict(dict)
+        self._spritesheet_scanner = SpritesheetScanner(self.SUPPORTED_IMAGE_EXTENSIONS)
+        self._scan_id = 0
+        self._scan_worker: Optional[SpritesheetScanWorker] = None
+        self._retired_scan_workers = []
+        self._detection_id = 0
+        self._detection_worker: Optional[UnknownSheetDetectionWorker] = None
+        self._retired_detection_workers = []
 
     def _setup_with_existing_ui(self):
         """Set up the widget using existing UI elements from the parent."""
@@ -839,8 +972,7 @@ class ExtractTabWidget(BaseTabWidget):
             self.input_dir_label.setText(directory)
             self.populate_spritesheet_list(directory)
 
-            self.parent_app.settings_manager.animation_settings.clear()
-            self.parent_app.settings_manager.spritesheet_settings.clear()
+            self.parent_app.settings_manager.open_scope(directory)
 
     def select_output_directory(self):
         """Opens a directory selection dialog for output directory."""
@@ -895,6 +1027,8 @@ class ExtractTabWidget(BaseTabWidget):
                 except Exception:
                     pass
 
+            # Copied files have no folder of their own to persist overrides to.
+            self.parent_app.settings_manager.close_scope(clear=False)
             self.parent_app.manual_selection_temp_dir = tempfile.mkdtemp(
                 prefix="texture_atlas_manual_"
             )
@@ -913,8 +1047,9 @@ class ExtractTabWidget(BaseTabWidget):
     def populate_spritesheet_list(self, directory):
         """Populate the spritesheet listbox from a directory.
 
-        Clears existing entries, scans for spritesheet image files, and
-        registers any accompanying metadata files.
+        Clears existing entries and starts a ``SpritesheetScanWorker`` that
+        streams spritesheet images and their metadata files into the list.
+        Rescanning a folder reuses cached listings for unchanged directories.
 
         Args:
             directory: Folder path to scan for spritesheets.
@@ -923,48 +1058,83 @@ class ExtractTabWidget(BaseTabWidget):
         if not self.parent_app:
             return
 
+        self.stop_spritesheet_scan()
         self.listbox_png.clear()
         self.listbox_data.clear()
         self.parent_app.data_dict.clear()
 
-        directory_path = Path(directory)
-        if not directory_path.exists():
+        if not Path(directory).exists():
             return
 
-        image_files = []
-        for ext in self.SUPPORTED_IMAGE_EXTENSIONS:
-            image_files.extend(sorted(directory_path.glob(f"*{ext}")))
+        self._scan_id += 1
+        worker = SpritesheetScanWorker(
+            self._spritesheet_scanner,
+            str(directory),
+            self._scan_id,
+            self.filter_single_frame_spritemaps,
+        )
+        worker.entries_found.connect(self._on_scan_entries_found)
+        worker.scan_complete.connect(self._on_scan_complete)
+        worker.error_occurred.connect(self._on_scan_error)
+        worker.finished.connect(self._on_scan_worker_finished)
+        self._scan_worker = worker
+        worker.start()
 
-        for image_file in sorted(image_files):
-            display_name = self._format_display_name(directory_path, image_file)
-            self.listbox_png.add_item(display_name, str(image_file))
-            self.find_data_files_for_spritesheet(
-                image_file,
-                search_directory=image_file.parent,
-                display_name=display_name,
-            )
+    def is_scanning(self) -> bool:
+        """Return ``True`` while the input folder is still being scanned."""
+        return self._scan_worker is not None
 
-        # Nested spritemap folders (Animation.json + matching spritemap json)
-        nested_image_files = []
-        for ext in self.SUPPORTED_IMAGE_EXTENSIONS:
-            nested_image_files.extend(sorted(directory_path.rglob(f"*{ext}")))
+    def stop_spritesheet_scan(self, wait: bool = False):
+        """Cancel the running folder scan, if any.
 
-        for image_file in sorted(nested_image_files):
-            if image_file.parent == directory_path:
-                continue
-            animation_json = image_file.parent / "Animation.json"
-            spritemap_json = image_file.parent / f"{image_file.stem}.json"
-            if not (animation_json.exists() and spritemap_json.exists()):
-                continue
-            display_name = self._format_display_name(directory_path, image_file)
-            if self.listbox_png.find_item_by_text(display_name):
+        Args:
+            wait: Block until the worker thread has exited.
+        """
+        worker = self._scan_worker
+        self._scan_worker = None
+        if worker is None:
+            return
+        worker.stop()
+        self._retired_scan_workers.append(worker)
+        if wait:
+            worker.wait()
+
+    def _on_scan_entries_found(self, scan_id: int, entries: list):
+        """Add a batch of scanned spritesheets to the list and data dict.
+
+        ``data_dict`` holds an entry for every listed spritesheet, so it
+        doubles as a constant-time membership check for duplicates.
+        """
+        if scan_id != self._scan_id or self._scan_worker is None:
+            return
+        data_dict = self.parent_app.data_dict
+        for entry in entries:
+            if entry.display_name in data_dict:
                 continue
-            self.listbox_png.add_item(display_name, str(image_file))
-            self.find_data_files_for_spritesheet(
-                image_file,
-                search_directory=image_file.parent,
-                display_name=display_name,
-            )
+            self.listbox_png.add_item(entry.display_name, entry.image_path)
+            data_dict[entry.display_name] = entry.data_files
+
+    def _on_scan_complete(self, scan_id: int, count: int):
+        """Mark the current scan as finished."""
+        if scan_id == self._scan_id:
+            self._scan_worker = None
+
+    def _on_scan_error(self, scan_id: int, message: str):
+        """Report a failed scan and mark it as finished."""
+        if scan_id != self._scan_id:
+            return
+        self._scan_worker = None
+        print(f"Error scanning input directory: {message}")
+
+    def _on_scan_worker_finished(self):
+        """Release a scan worker once its thread has exited."""
+        worker = self.sender()
+        if worker is self._scan_worker:
+            self._scan_worker = None
+        if worker in self._retired_scan_workers:
+            self._retired_scan_workers.remove(worker)
+        if isinstance(worker, SpritesheetScanWorker):
+            worker.deleteLater()
 
     def populate_spritesheet_list_from_files(self, files, temp_folder=None):
         """Populate the spritesheet listbox from manually selected files.
@@ -977,6 +1147,7 @@ class ExtractTabWidget(BaseTabWidget):
         if not self.parent_app:
             return
 
+        self.stop_spritesheet_scan()
         self.listbox_png.clear()
         self.listbox_data.clear()
         self.parent_app.data_dict.clear()
@@ -1108,66 +1279,21 @@ class ExtractTabWidget(BaseTabWidget):
             return
 
         spritesheet_path = Path(spritesheet_path)
-        base_name = spritesheet_path.stem
-        directory = (
-            Path(search_directory) if search_directory else spritesheet_path.parent
-        )
-
         record_key = display_name or spritesheet_path.name
-        if record_key not in self.parent_app.data_dict:
-            self.parent_app.data_dict[record_key] = {}
-
-        xml_file = directory / f"{base_name}.xml"
-        if xml_file.exists():
-            self.parent_app.data_dict[record_key]["xml"] = str(xml_file)
-
-        txt_file = directory / f"{base_name}.txt"
-        if txt_file.exists():
-            self.parent_app.data_dict[record_key]["txt"] = str(txt_file)
-
-        plist_file = directory / f"{base_name}.plist"
-        if plist_file.exists():
-            self.parent_app.data_dict[record_key]["plist"] = str(plist_file)
-
-        atlas_file = directory / f"{base_name}.atlas"
-        if atlas_file.exists():
-            self.parent_app.data_dict[record_key]["atlas"] = str(atlas_file)
-
-        css_file = directory / f"{base_name}.css"
-        if css_file.exists():
-            self.parent_app.data_dict[record_key]["css"] = str(css_file)
-
-        tpsheet_file = directory / f"{base_name}.tpsheet"
-        if tpsheet_file.exists():
-            self.parent_app.data_dict[record_key]["tpsheet"] = str(tpsheet_file)
-
-        tpset_file = directory / f"{base_name}.tpset"
-        if tpset_file.exists():
-            self.parent_app.data_dict[record_key]["tpset"] = str(tpset_file)
-
-        paper2d_file = directory / f"{base_name}.paper2dsprites"
-        if paper2d_file.exists():
-            self.parent_app.data_dict[record_key]["paper2dsprites"] = str(paper2d_file)
-
-        # Check for spritemap with Animation.json (Adobe Animate)
-        animation_json = directory / "Animation.json"
-        spritemap_json = directory / f"{base_name}.json"
-        if animation_json.exists() and spritemap_json.exists():
-            symbol_map = self._build_spritemap_symbol_map(animation_json)
-            self.parent_app.data_dict[record_key]["spritemap"] = {
-                "type": "spritemap",
-                "animation_json": str(animation_json),
-                "spritemap_json": str(spritemap_json),
-                "symbol_map": symbol_map,
-            }
-        elif spritemap_json.exists():
-            # Look for standalone JSON files (Aseprite, TexturePacker JSON, etc.)
-            # Only use if not already handled as spritemap above
-            self.parent_app.data_dict[record_key]["json"] = str(spritemap_json)
+        entry = self._spritesheet_scanner.describe(
+            str(spritesheet_path),
+            search_directory=str(search_directory) if search_directory else None,
+            display_name=record_key,
+            filter_single_frame=self.filter_single_frame_spritemaps,
+        )
+        self.parent_app.data_dict.setdefault(record_key, {}).update(entry.data_files)
 
     def _build_spritemap_symbol_map(self, animation_json_path):
         """Return a mapping of display labels to spritemap metadata entries.
 
+        Parsed maps are cached by the spritesheet scanner until
+        ``Animation.json`` changes on disk.
+
         Args:
             animation_json_path: Path to ``Animation.json`` describing the Adobe
                 Animate timeline.
@@ -1176,51 +1302,9 @@ class ExtractTabWidget(BaseTabWidget):
             dict: Keys are human-friendly labels, values describe the original
                 symbol, label, and estimated frame count.
         """
-        symbol_map = {}
-
-        def register_entry(display_name, entry_type, entry_value, frame_count):
-            """Store entries with unique labels so symbols and labels never collide."""
-            suffix = " (Timeline)" if entry_type == "timeline_label" else " (Symbol)"
-            candidate = display_name
-            if candidate in symbol_map:
-                candidate = f"{display_name}{suffix}"
-                counter = 2
-                while candidate in symbol_map:
-                    candidate = f"{display_name}{suffix} #{counter}"
-                    counter += 1
-            symbol_map[candidate] = {
-                "type": entry_type,
-                "value": entry_value,
-                "frame_count": frame_count,
-            }
-
-        try:
-            with open(animation_json_path, "r", encoding="utf-8") as animation_file:
-                animation_json = normalize_animation_document(json.load(animation_file))
-
-            symbol_lengths = compute_symbol_lengths(animation_json)
-
-            for symbol in animation_json.get("SD", {}).get("S", []):
-                raw_name = symbol.get("SN")
-                if not raw_name:
-                    continue
-                frame_count = symbol_lengths.get(raw_name, 0)
-                if self.filter_single_frame_spritemaps and frame_count <= 1:
-                    continue
-                display_name = Utilities.strip_trailing_digits(raw_name) or raw_name
-                register_entry(display_name, "symbol", raw_name, frame_count)
-
-            for label in extract_label_ranges(animation_json, None):
-                label_name = label["name"]
-                frame_count = label["end"] - label["start"]
-                if self.filter_single_frame_spritemaps and frame_count <= 1:
-                    continue
-                register_entry(label_name, "timeline_label", label_name, frame_count)
-        except Exception as exc:
-            print(
-                f"Error parsing spritemap animation metadata {animation_json_path}: {exc}"
-            )
-        return symbol_map
+        return self._spritesheet_scanner.symbol_map(
+            str(animation_json_path), self.filter_single_frame_spritemaps
+        )
 
     def register_editor_composite(
         self,
@@ -1329,6 +1413,7 @@ class ExtractTabWidget(BaseTabWidget):
         if not self.parent_app:
             return
 
+        self.cancel_unknown_detection()
         self.listbox_data.clear()
 
         if spritesheet_name not in self.parent_app.data_dict:
@@ -1337,30 +1422,26 @@ class ExtractTabWidget(BaseTabWidget):
             self._append_editor_composites_to_list(spritesheet_name)
             return
 
+        from core.extractor.metadata_cache import get_metadata_cache
+
         data_files = self.parent_app.data_dict[spritesheet_name]
 
         if isinstance(data_files, dict):
             if "xml" in data_files:
                 try:
-                    from parsers.xml_parser import XmlParser
-
-                    xml_parser = XmlParser(
-                        directory=str(Path(data_files["xml"]).parent),
-                        xml_filename=Path(data_files["xml"]).name,
+                    names = get_metadata_cache().parsed_animation_names(
+                        str(data_files["xml"])
                     )
-                    self._populate_animation_names(xml_parser.get_data())
+                    self._populate_animation_names(names)
                 except Exception as e:
                     print(f"Error parsing XML: {e}")
 
             elif "txt" in data_files:
                 try:
-                    from parsers.txt_parser import TxtParser
-
-                    txt_parser = TxtParser(
-                        directory=str(Path(data_files["txt"]).parent),
-                        txt_filename=Path(data_files["txt"]).name,
+                    names = get_metadata_cache().parsed_animation_names(
+                        str(data_files["txt"])
                     )
-                    self._populate_animation_names(txt_parser.get_data())
+                    self._populate_animation_names(names)
                 except Exception as e:
                     print(f"Error parsing TXT: {e}")
 
@@ -1372,17 +1453,24 @@ class ExtractTabWidget(BaseTabWidget):
                         target_data = symbol_map.get(display_name)
                         self.listbox_data.add_item(display_name, target_data)
                 else:
+                    # Spritemap names come from the Animation.json symbols,
+                    # which the parsed result does not carry.
                     try:
                         from parsers.spritemap_parser import SpritemapParser
 
                         animation_path = spritemap_info.get("animation_json")
                         if animation_path:
-                            parser = SpritemapParser(
-                                directory=str(Path(animation_path).parent),
-                                animation_filename=Path(animation_path).name,
-                                filter_single_frame=self.filter_single_frame_spritemaps,
+                            filter_single = self.filter_single_frame_spritemaps
+                            names = get_metadata_cache().animation_names(
+                                animation_path,
+                                lambda: SpritemapParser(
+                                    directory=str(Path(animation_path).parent),
+                                    animation_filename=Path(animation_path).name,
+                                    filter_single_frame=filter_single,
+                                ).get_data(),
+                                variant=f"spritemap:{bool(filter_single)}",
                             )
-                            self._populate_animation_names(parser.get_data())
+                            self._populate_animation_names(names)
                     except Exception as e:
                         print(f"Error parsing spritemap animations: {e}")
 
@@ -1418,43 +1506,17 @@ class ExtractTabWidget(BaseTabWidget):
         """Parse a metadata file using the ParserRegistry.
 
         Uses automatic format detection to find the appropriate parser
-        and populate the animation list.
+        and populate the animation list. Names are grouped from the shared
+        metadata cache's parse result, which extraction reuses.
 
         Args:
             metadata_path: Path to the metadata file.
         """
-        try:
-            from parsers.parser_registry import ParserRegistry
-            import inspect
-
-            if not ParserRegistry._all_parsers:
-                ParserRegistry.initialize()
-
-            parser_cls = ParserRegistry.detect_parser(metadata_path)
-            if parser_cls:
-                filename = Path(metadata_path).name
-                directory = str(Path(metadata_path).parent)
+        from core.extractor.metadata_cache import get_metadata_cache
 
-                sig = inspect.signature(parser_cls.__init__)
-                params = list(sig.parameters.keys())
-
-                filename_param = None
-                for param in params:
-                    if param.endswith("_filename") or param == "filename":
-                        filename_param = param
-                        break
-
-                if filename_param:
-                    parser = parser_cls(
-                        directory=directory, **{filename_param: filename}
-                    )
-                else:
-                    parser = parser_cls(directory=directory, filename=filename)
-
-                self._populate_animation_names(parser.get_data())
-            else:
-                print(f"No parser found for: {metadata_path}")
-                self._populate_unknown_parser_fallback()
+        try:
+            names = get_metadata_cache().parsed_animation_names(metadata_path)
+            self._populate_animation_names(names)
         except Exception as e:
             print(f"Error parsing {metadata_path}: {e}")
             self._populate_unknown_parser_fallback()
@@ -1464,26 +1526,69 @@ class ExtractTabWidget(BaseTabWidget):
         self._populate_using_unknown_parser()
 
     def _populate_using_unknown_parser(self):
-        """Load animation names via the generic unknown-format parser."""
+        """Load animation names via the generic unknown-format parser.
 
-        try:
-            from parsers.unknown_parser import UnknownParser
+        Detection runs in an ``UnknownSheetDetectionWorker`` and the names
+        are added to the list when it finishes, so large sheets no longer
+        freeze the window. Detection for a previous selection is cancelled.
+        """
 
-            current_item = self.listbox_png.currentItem()
-            if not current_item:
-                return
+        self.cancel_unknown_detection()
 
-            spritesheet_path = current_item.data(Qt.ItemDataRole.UserRole)
-            if not spritesheet_path:
-                return
+        current_item = self.listbox_png.currentItem()
+        if not current_item:
+            return
 
-            unknown_parser = UnknownParser(
-                directory=str(Path(spritesheet_path).parent),
-                image_filename=Path(spritesheet_path).name,
-            )
-            self._populate_animation_names(unknown_parser.get_data())
-        except Exception as exc:
-            print(f"Error using unknown parser: {exc}")
+        spritesheet_path = current_item.data(Qt.ItemDataRole.UserRole)
+        if not spritesheet_path:
+            return
+
+        self._detection_id += 1
+        worker = UnknownSheetDetectionWorker(spritesheet_path, self._detection_id)
+        worker.names_detected.connect(self._on_unknown_names_detected)
+        worker.error_occurred.connect(self._on_unknown_detection_error)
+        worker.finished.connect(self._on_detection_worker_finished)
+        self._detection_worker = worker
+        worker.start()
+
+    def cancel_unknown_detection(self, wait: bool = False):
+        """Cancel the running unknown-sheet detection, if any.
+
+        Args:
+            wait: Block until the worker thread has exited.
+        """
+        worker = self._detection_worker
+        self._detection_worker = None
+        if worker is None:
+            return
+        worker.cancel()
+        self._retired_detection_workers.append(worker)
+        if wait:
+            worker.wait()
+
+    def _on_unknown_names_detected(self, request_id: int, names: list):
+        """Show names detected for the current selection."""
+        if request_id != self._detection_id or self._detection_worker is None:
+            return
+        self._detection_worker = None
+        self._populate_animation_names(names)
+
+    def _on_unknown_detection_error(self, request_id: int, message: str):
+        """Report failed detection for the current selection."""
+        if request_id != self._detection_id:
+            return
+        self._detection_worker = None
+        print(f"Error using unknown parser: {message}")
+
+    def _on_detection_worker_finished(self):
+        """Release a detection worker once its thread has exited."""
+        worker = self.sender()
+        if worker is self._detection_worker:
+            self._detection_worker = None
+        if worker in self._retired_detection_workers:
+            self._retired_detection_workers.remove(worker)
+        if isinstance(worker, UnknownSheetDetectionWorker):
+            worker.deleteLater()
 
     def _populate_animation_names(self, names):
         """Add animation names to the animation listbox.
@@ -1530,12 +1635,7 @@ class ExtractTabWidget(BaseTabWidget):
         self.input_dir_label.setText(self.tr("No input directory selected"))
         self.output_dir_label.setText(self.tr("No output directory selected"))
 
-        self.parent_app.settings_manager.animation_settings.clear()
-        self.parent_app.settings_manager.spritesheet_settings.clear()
-        self.parent_app.data_dict.clear()
-
-        self.parent_app.settings_manager.animation_settings.clear()
-        self.parent_app.settings_manager.spritesheet_settings.clear()
+        self.parent_app.settings_manager.close_scope()
         self.parent_app.data_dict.clear()
 
     def delete_selected_spritesheet(self):
@@ -2020,14 +2120,15 @@ class ExtractTabWidget(BaseTabWidget):
                 composites = self.editor_composites.get(spritesheet_name, {})
                 composites.pop(item.text(), None)
                 if hasattr(self.parent_app, "settings_manager"):
-                    sheet_settings = (
-                        self.parent_app.settings_manager.spritesheet_settings.get(
-                            spritesheet_name, {}
-                        )
+                    sheet_overrides = (
+                        self.parent_app.settings_manager.spritesheet_settings
                     )
+                    sheet_settings = sheet_overrides.get(spritesheet_name, {})
                     editor_defs = sheet_settings.get("editor_composites")
-                    if isinstance(editor_defs, dict):
-                        editor_defs.pop(item.text(), None)
+                    if isinstance(editor_defs, dict) and item.text() in editor_defs:
+                        del editor_defs[item.text()]
+                        # Assign back so the override store sees the change.
+                        sheet_overrides[spritesheet_name] = sheet_settings
 
     def override_animation_settings(self):
         """Opens window to override settings for selected animation."""
@@ -2412,6 +2513,11 @@ class ExtractTabWidget(BaseTabWidget):
                 "Please enable at least one export option (Animation or Frame)."
             )
 
+        if self.is_scanning():
+            return False, self.tr(
+                "The input directory is still being scanned. Please wait."
+            )
+
         if self.listbox_png.count() == 0:
             return False, self.tr(
                 "No spritesheets found. Please select a directory with images."
@@ -32,7 +32,7 @@ from PySide6.QtWidgets import (
     QMessageBox,
     QScrollArea,
 )
-from PySide6.QtCore import Qt, QTimer, QThread, Signal, QSize
+from PySide6.QtCore import Qt, QTimer, QThread, Signal
 from PySide6.QtGui import QPixmap, QImage, QPainter, QColor
 
 try:
@@ -42,6 +42,12 @@ try:
 except ImportError:
     PIL_AVAILABLE = False
 
+from gui.display_cache import (
+    BACKGROUND_CHECKERED,
+    BACKGROUND_NONE,
+    BACKGROUND_SOLID,
+    DisplayFrameCache,
+)
 from utils.duration_utils import (
     convert_duration,
     duration_to_milliseconds,
@@ -285,7 +291,9 @@ class AnimationDisplay(QScrollArea):
     """Scrollable widget for displaying animation frames with zoom support.
 
     Supports solid-color and checkered transparency backgrounds as well as
-    Ctrl+wheel zoom. Caches scaled pixmaps to minimize redraw cost.
+    Ctrl+wheel zoom. Frames are scaled and composited once per scale and
+    background through a ``DisplayFrameCache``, so looping playback reuses
+    the cached pixmaps instead of redrawing them.
 
     Signals:
         scale_changed(float): Emitted when the zoom level changes.
@@ -309,14 +317,12 @@ class AnimationDisplay(QScrollArea):
         self.setStyleSheet("border: 1px solid gray; background-color: transparent;")
 
         self._background_color = QColor(127, 127, 127, 255)
-        self._background_mode = "None"
-        self._checkered_pattern = None
+        self._background_mode = BACKGROUND_NONE
         self._current_pixmap = None
         self._scale_factor = 1.0
         self._original_size = None
 
-        self._cached_scaled_pixmap = None
-        self._cached_scale = None
+        self._frame_cache = DisplayFrameCache()
 
         self.image_label.installEventFilter(self)
 
@@ -365,7 +371,7 @@ class AnimationDisplay(QScrollArea):
             color: QColor to fill behind the frame.
         """
         self._background_color = color
-        self._background_mode = "Solid Color"
+        self._background_mode = BACKGROUND_SOLID
         self.setStyleSheet("border: 1px solid gray; background-color: transparent;")
         self.update_display()
 
@@ -376,9 +382,6 @@ class AnimationDisplay(QScrollArea):
             mode: One of 'None', 'Solid Color', or 'Transparency Pattern'.
         """
         self._background_mode = mode
-        if mode == "Transparency Pattern":
-            self._create_checkered_pattern()
-
         self.setStyleSheet("border: 1px solid gray; background-color: transparent;")
         self.update_display()
 
@@ -391,28 +394,9 @@ class AnimationDisplay(QScrollArea):
             show_transparency: If True, enable the checkered pattern.
         """
         if show_transparency:
-            self.set_background_mode("Transparency Pattern")
+            self.set_background_mode(BACKGROUND_CHECKERED)
         else:
-            self.set_background_mode("Solid Color")
-
-    def _create_checkered_pattern(self):
-        """Build a repeating checkered tile for transparency backgrounds."""
-        checker_size = 16
-        pattern_size = checker_size * 2
-
-        self._checkered_pattern = QPixmap(pattern_size, pattern_size)
-        painter = QPainter(self._checkered_pattern)
-
-        light_gray = QColor(240, 240, 240)
-        white = QColor(255, 255, 255)
-
-        for x in range(0, pattern_size, checker_size):
-            for y in range(0, pattern_size, checker_size):
-                is_light = ((x // checker_size) + (y // checker_size)) % 2 == 0
-                color = light_gray if is_light else white
-                painter.fillRect(x, y, checker_size, checker_size, color)
-
-        painter.end()
+            self.set_background_mode(BACKGROUND_SOLID)
 
     def get_scale_factor(self):
         """Return the current zoom multiplier.
@@ -430,10 +414,6 @@ class AnimationDisplay(QScrollArea):
         """
         if abs(self._scale_factor - scale) > 0.001:
             self._scale_factor = scale
-
-            self._cached_scaled_pixmap = None
-            self._cached_scale = None
-
             self.update_display()
 
     def set_frame(self, pixmap: QPixmap):
@@ -443,8 +423,6 @@ class AnimationDisplay(QScrollArea):
             pixmap: QPixmap to render in the scroll area.
         """
         self._current_pixmap = pixmap
-        self._cached_scaled_pixmap = None
-        self._cached_scale = None
 
         if pixmap and not pixmap.isNull():
             self._original_size = pixmap.size()
@@ -457,64 +435,18 @@ class AnimationDisplay(QScrollArea):
             self.image_label.clear()
             return
 
-        pixmap_size = self._current_pixmap.size()
-        scaled_width = int(pixmap_size.width() * self._scale_factor)
-        scaled_height = int(pixmap_size.height() * self._scale_factor)
-        scaled_size = QSize(scaled_width, scaled_height)
-
-        if (
-            self._cached_scaled_pixmap
-            and self._cached_scale
-            and abs(self._cached_scale - self._scale_factor) < 0.001
-            and self._cached_scaled_pixmap.size() == scaled_size
-        ):
-            display_pixmap = self._cached_scaled_pixmap
-        else:
-            if self._scale_factor == 1.0:
-                display_pixmap = self._current_pixmap
-            else:
-                display_pixmap = self._current_pixmap.scaled(
-                    scaled_size,
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation,
-                )
-
-                self._cached_scaled_pixmap = display_pixmap
-                self._cached_scale = self._scale_factor
-
-        if self._background_mode == "Transparency Pattern" and self._checkered_pattern:
-            final_pixmap = QPixmap(display_pixmap.size())
-            final_pixmap.fill(Qt.GlobalColor.transparent)
-
-            painter = QPainter(final_pixmap)
-
-            pattern_size = self._checkered_pattern.size()
-            for x in range(0, final_pixmap.width(), pattern_size.width()):
-                for y in range(0, final_pixmap.height(), pattern_size.height()):
-                    painter.drawPixmap(x, y, self._checkered_pattern)
-
-            painter.drawPixmap(0, 0, display_pixmap)
-            painter.end()
-
-            self.image_label.setPixmap(final_pixmap)
-        elif self._background_mode == "Solid Color":
-            final_pixmap = QPixmap(display_pixmap.size())
-            final_pixmap.fill(self._background_color)
-
-            painter = QPainter(final_pixmap)
-            painter.drawPixmap(0, 0, display_pixmap)
-            painter.end()
-
-            self.image_label.setPixmap(final_pixmap)
-        else:
-            self.image_label.setPixmap(display_pixmap)
-
+        display_pixmap = self._frame_cache.get(
+            self._current_pixmap,
+            self._scale_factor,
+            self._background_mode,
+            self._background_color,
+        )
+        self.image_label.setPixmap(display_pixmap)
         self.image_label.resize(display_pixmap.size())
 
     def clear_cache(self):
-        """Discard cached scaled pixmaps to free memory."""
-        self._cached_scaled_pixmap = None
-        self._cached_scale = None
+        """Discard cached display pixmaps to free memory."""
+        self._frame_cache.clear()
 
 
 class AnimationPreviewWindow(QDialog):
@@ -963,6 +895,7 @@ class AnimationPreviewWindow(QDialog):
             self.processor.stop()
             self.processor.wait(1000)
 
+        self.display.clear_cache()
         self.frames.clear()
         self.frame_durations.clear()
 
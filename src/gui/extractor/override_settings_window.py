@@ -503,6 +503,21 @@ class OverrideSettingsWindow(QDialog):
         fps_numeric = max(1.0, fps_numeric)
         return max(1, round(1000 / fps_numeric))
 
+    def _store_local_settings(self):
+        """Assign ``local_settings`` back to the settings manager.
+
+        ``local_settings`` is the stored override dict, so changing it in
+        place is only persisted once the override is assigned again.
+        """
+
+        if self.settings_type == "animation":
+            overrides = self.settings_manager.animation_settings
+            key = self.animation_name
+        else:
+            overrides = self.settings_manager.spritesheet_settings
+            key = self.spritesheet_name
+        overrides[key] = self.local_settings
+
     def load_current_values(self):
         """Populate UI controls with current settings values."""
 
@@ -525,6 +540,7 @@ class OverrideSettingsWindow(QDialog):
             fps_value = self.local_settings.pop("fps", None)
             duration_ms = self._legacy_fps_to_ms(fps_value)
             self.local_settings["duration"] = duration_ms
+            self._store_local_settings()
 
         if duration_ms is None:
             duration_ms = self.settings.get("duration")
@@ -87,6 +87,7 @@ from packers.packer_registry import (
     register_packer,
     get_packer,
     pack,
+    pack_best,
     list_algorithms,
     get_heuristics_for_algorithm,
 )
@@ -126,6 +127,7 @@ __all__ = [
     "register_packer",
     "get_packer",
     "pack",
+    "pack_best",
     "list_algorithms",
     "get_heuristics_for_algorithm",
 ]
@@ -20,6 +20,9 @@ Usage:
     # Use convenience function
     result = PackerRegistry.pack("guillotine", frames, options)
 
+    # Search all heuristics (or all algorithms with "auto") for the tightest fit
+    result = PackerRegistry.pack_best("maxrects", frames, options, "auto")
+
     # Register a custom packer
     @register_packer
     class MyCustomPacker(BasePacker):
@@ -34,6 +37,7 @@ from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Type
 from packers.packer_types import (
     FrameInput,
     PackerError,
+    PackerErrorCode,
     PackerOptions,
     PackerResult,
 )
@@ -115,8 +119,9 @@ class PackerRegistry:
         if algorithm_name not in cls._registry:
             available = ", ".join(sorted(cls._registry.keys()))
             raise PackerError(
+                PackerErrorCode.INVALID_OPTIONS,
                 f"Unknown packer algorithm: '{algorithm_name}'. "
-                f"Available: {available}"
+                f"Available: {available}",
             )
 
         packer_class = cls._registry[algorithm_name]
@@ -188,6 +193,128 @@ class PackerRegistry:
 
         return packer.pack(frames)
 
+    @classmethod
+    def pack_best(
+        cls,
+        algorithm_name: str,
+        frames: List[FrameInput],
+        options: Optional[PackerOptions] = None,
+        heuristic: Optional[str] = None,
+    ) -> PackerResult:
+        """Pack frames, searching for the tightest layout where requested.
+
+        An algorithm name of "auto" tries every registered algorithm. A
+        heuristic of "auto" or None tries every heuristic the algorithm
+        supports. "Best" means a successful pack with the smallest atlas
+        area, tie-broken by packing efficiency.
+
+        Args:
+            algorithm_name: Packing algorithm name, or "auto".
+            frames: List of frames to pack.
+            options: Optional packer configuration.
+            heuristic: Heuristic key, or "auto"/None to search.
+
+        Returns:
+            The best PackerResult found.
+        """
+        if algorithm_name == "auto":
+            return cls._pack_with_best_algorithm(frames, options, heuristic)
+
+        if heuristic == "auto" or heuristic is None:
+            return cls._pack_with_best_heuristic(algorithm_name, frames, options)
+
+        return cls.pack(algorithm_name, frames, options, heuristic)
+
+    @staticmethod
+    def _score(result: PackerResult) -> float:
+        """Score a result by area (lower is better), tie-broken by efficiency."""
+        return result.atlas_width * result.atlas_height - result.efficiency * 0.01
+
+    @classmethod
+    def _pack_with_best_algorithm(
+        cls,
+        frames: List[FrameInput],
+        options: Optional[PackerOptions],
+        heuristic_hint: Optional[str],
+    ) -> PackerResult:
+        """Try all algorithms and return the best result.
+
+        Args:
+            frames: Frames to pack.
+            options: Packer options.
+            heuristic_hint: Heuristic to use, or "auto"/None to search.
+
+        Returns:
+            The best PackerResult across all algorithms.
+        """
+        best_result: Optional[PackerResult] = None
+        auto_heuristic = heuristic_hint == "auto" or heuristic_hint is None
+
+        for algo_name in cls.get_algorithm_names():
+            if algo_name == "auto":
+                continue
+
+            try:
+                if auto_heuristic:
+                    result = cls._pack_with_best_heuristic(algo_name, frames, options)
+                else:
+                    result = cls.pack(algo_name, frames, options, heuristic_hint)
+            except Exception as e:
+                print(f"Warning: Algorithm '{algo_name}' failed: {e}")
+                continue
+
+            if result.success and (
+                best_result is None or cls._score(result) < cls._score(best_result)
+            ):
+                best_result = result
+
+        if best_result is None:
+            # All algorithms failed, fall back to maxrects default
+            return cls.pack("maxrects", frames, options)
+
+        return best_result
+
+    @classmethod
+    def _pack_with_best_heuristic(
+        cls,
+        algorithm_name: str,
+        frames: List[FrameInput],
+        options: Optional[PackerOptions],
+    ) -> PackerResult:
+        """Try all heuristics for an algorithm and return the best result.
+
+        Args:
+            algorithm_name: Algorithm name.
+            frames: Frames to pack.
+            options: Packer options.
+
+        Returns:
+            The best PackerResult for this algorithm.
+        """
+        heuristics = get_heuristics_for_algorithm(algorithm_name)
+        if not heuristics:
+            # No heuristics available (e.g., SimplePacker), just pack directly
+            return cls.pack(algorithm_name, frames, options)
+
+        best_result: Optional[PackerResult] = None
+        for heuristic_key, _ in heuristics:
+            try:
+                result = cls.pack(algorithm_name, frames, options, heuristic_key)
+            except Exception as e:
+                print(f"Warning: Heuristic '{heuristic_key}' failed: {e}")
+                continue
+
+            if result.success and (
+                best_result is None or cls._score(result) < cls._score(best_result)
+            ):
+                best_result = result
+
+        if best_result is None:
+            # All heuristics failed, try with default
+            return cls.pack(algorithm_name, frames, options)
+
+        return best_result
+
     @classmethod
     def is_registered(cls, algorithm_name: str) -> bool:
         """Check if an algorithm is registered.
@@ -282,6 +409,26 @@ def pack(
     return PackerRegistry.pack(algorithm_name, frames, options, heuristic)
 
 
+def pack_best(
+    algorithm_name: str,
+    frames: List[FrameInput],
+    options: Optional[PackerOptions] = None,
+    heuristic: Optional[str] = None,
+) -> PackerResult:
+    """Convenience function to pack frames, searching "auto" choices.
+
+    Args:
+        algorithm_name: Name of the packing algorithm, or "auto".
+        frames: List of frames to pack.
+        options: Optional packer configuration.
+        heuristic: Heuristic key, or "auto"/None to try all heuristics.
+
+    Returns:
+        The best PackerResult found.
+    """
+    return PackerRegistry.pack_best(algorithm_name, frames, options, heuristic)
+
+
 def list_algorithms() -> List[Dict[str, str]]:
     """List all available packing algorithms.
 
@@ -325,6 +472,7 @@ __all__ = [
     "register_packer",
     "get_packer",
     "pack",
+    "pack_best",
     "list_algorithms",
     "get_heuristics_for_algorithm",
 ]
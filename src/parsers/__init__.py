@@ -17,6 +17,7 @@ Error handling:
 Sprite data:
     - SpriteData: TypedDict defining the canonical sprite structure.
     - normalize_sprite(): Ensures sprites have consistent fields and types.
+    - SpriteTable: Columnar sprite storage returned by validate_sprites().
 """
 
 # Core types - no dependencies on other parser modules
@@ -34,6 +35,7 @@ from parsers.parser_types import (
     validate_sprites,
 )
 
+from parsers.sprite_table import SpriteRecord, SpriteTable
 from parsers.base_parser import BaseParser
 
 
@@ -75,6 +77,8 @@ __all__ = [
     "ParseResult",
     "normalize_sprite",
     "validate_sprites",
+    "SpriteRecord",
+    "SpriteTable",
     # Base class
     "BaseParser",
     # Functions
@@ -65,10 +65,12 @@ class GodotAtlasParser(BaseParser):
             textures: List of texture dicts, each containing a ``sprites`` list.
 
         Returns:
-            List of normalized sprite dicts from all textures.
+            List of normalized sprite dicts from all textures. Each sprite's
+            ``page_image`` names the texture image it lies on.
         """
         sprites: List[Dict[str, Any]] = []
         for texture in textures:
+            page_image = texture.get("image")
             for sprite in texture.get("sprites", []):
                 region = sprite.get("region", {})
                 x = int(region.get("x", 0))
@@ -87,6 +89,7 @@ class GodotAtlasParser(BaseParser):
                     "frameWidth": width,
                     "frameHeight": height,
                     "rotated": False,
+                    "page_image": page_image,
                 }
                 sprites.append(sprite_data)
         return sprites
@@ -8,13 +8,26 @@ This module defines:
     - ParserError hierarchy: Typed exceptions for parsing failures.
     - ParseResult: Dataclass holding parsed sprites, warnings, and errors.
     - ParserErrorCode: Enum of error categories for programmatic handling.
+
+``validate_sprites`` returns its sprites as a columnar ``SpriteTable``;
+parsers that build their own lists of ``SpriteData`` dicts still work.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Any, Dict, List, Optional, TypedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypedDict, Union
+
+import numpy as np
+
+from parsers.sprite_table import (
+    INT_FIELDS,
+    PAGE_FIELD,
+    PIVOT_FIELDS,
+    SpriteTable,
+    build_sprite_table,
+)
 
 
 class ParserErrorCode(Enum):
@@ -71,6 +84,8 @@ class SpriteData(TypedDict, total=False):
         rotated: True if sprite is rotated 90 degrees in atlas (default: False).
         pivotX: Horizontal pivot point 0.0-1.0 (optional).
         pivotY: Vertical pivot point 0.0-1.0 (optional).
+        page: Index into ``ParseResult.pages`` of the image holding the
+            sprite, for multi-page atlases (default: 0).
     """
 
     # Required keys
@@ -181,19 +196,29 @@ class ParseResult:
     """Container for parser output with full diagnostics.
 
     Attributes:
-        sprites: List of successfully parsed sprite dicts.
+        sprites: Successfully parsed sprites, either a ``SpriteTable`` or a
+            list of sprite dicts. Both support ``len``, indexing and
+            iteration over dict-like sprites.
         warnings: Non-fatal issues encountered during parsing.
         errors: Fatal errors for specific sprites (partial failures).
         file_path: Path to the parsed file.
         parser_name: Name of the parser class used.
+        pages: Page image filenames, relative to the metadata file, in page
+            order. Empty when the format does not name its images.
         is_valid: True if parsing produced usable sprites.
     """
 
-    sprites: List[SpriteData] = field(default_factory=list)
+    sprites: Union[List[SpriteData], SpriteTable] = field(default_factory=list)
     warnings: List[ParserWarning] = field(default_factory=list)
     errors: List[SpriteError] = field(default_factory=list)
     file_path: Optional[str] = None
     parser_name: Optional[str] = None
+    pages: List[str] = field(default_factory=list)
+
+    @property
+    def is_multi_page(self) -> bool:
+        """Return True if the sprites are spread over several page images."""
+        return len(self.pages) > 1
 
     @property
     def is_valid(self) -> bool:
@@ -319,46 +344,171 @@ def normalize_sprite(sprite: Dict[str, Any]) -> SpriteData:
         result["pivotX"] = float(sprite["pivotX"])
     if "pivotY" in sprite:
         result["pivotY"] = float(sprite["pivotY"])
+    if sprite.get("page"):
+        result["page"] = int(sprite["page"])
 
     return result
 
 
+_Failure = Tuple[ParserErrorCode, str, Optional[Dict[str, Any]]]
+
+
+def _convert_column(
+    values: List[Any],
+    dtype: type,
+    convert: Callable[[Any], Any],
+) -> Tuple[np.ndarray, Dict[int, Exception]]:
+    """Convert one field of every sprite, finding failures per sprite.
+
+    The whole column is converted in one call; only when that fails is it
+    converted value by value to find the offending sprites.
+
+    Returns:
+        ``(column, failures)`` where failed entries are zero in ``column``
+        and ``failures`` maps their indices to the conversion error.
+    """
+    try:
+        return np.array(values, dtype=dtype), {}
+    except (TypeError, ValueError, OverflowError):
+        pass
+    column = np.zeros(len(values), dtype=dtype)
+    failures: Dict[int, Exception] = {}
+    for index, value in enumerate(values):
+        try:
+            column[index] = convert(value)
+        except (TypeError, ValueError, OverflowError) as error:
+            failures[index] = error
+    return column, failures
+
+
 def validate_sprites(
     sprites: List[Dict[str, Any]],
     file_path: Optional[str] = None,
 ) -> ParseResult:
     """Validate and normalize a list of raw sprite dicts.
 
-    Attempts to normalize each sprite, collecting successes and failures.
-    Returns a ParseResult that can be used even if some sprites failed.
+    Applies the same rules as ``normalize_sprite`` to every sprite at
+    once: each field is converted as a whole column and invalid sprites are
+    found with array masks. Failed sprites are reported as errors in input
+    order and the rest are kept, so the result is usable even if some
+    sprites failed.
+
+    Parsers of multi-page formats tag each raw sprite with ``page_image``,
+    the filename of the page it lies on. The distinct names become
+    ``ParseResult.pages`` in first-seen order and each sprite's ``page`` is
+    its index there.
 
     Args:
         sprites: List of raw sprite dicts from a parser.
         file_path: Path to the source file for error context.
 
     Returns:
-        ParseResult with normalized sprites, warnings, and errors.
+        ParseResult whose ``sprites`` is a ``SpriteTable``.
     """
     result = ParseResult(file_path=file_path)
-
-    for i, raw_sprite in enumerate(sprites):
-        sprite_name = raw_sprite.get("name", f"sprite_{i}")
-        try:
-            normalized = normalize_sprite(raw_sprite)
-            result.sprites.append(normalized)
-        except ContentError as e:
-            result.add_error(
-                e.code,
-                e.message,
-                sprite_name=sprite_name,
-                details=e.details,
+    count = len(sprites)
+    names = [sprite.get("name") for sprite in sprites]
+    failures: Dict[int, _Failure] = {}
+
+    for index, name in enumerate(names):
+        if not name:
+            failures[index] = (
+                ParserErrorCode.MISSING_REQUIRED_KEY,
+                "Sprite missing required 'name' field",
+                {"sprite": str(sprites[index])[:100]},
             )
-        except Exception as e:
-            result.add_error(
-                ParserErrorCode.SPRITE_PARSE_FAILED,
-                f"Unexpected error normalizing sprite: {e}",
-                sprite_name=sprite_name,
+
+    int_limits = np.iinfo(np.int32)
+    columns: Dict[str, np.ndarray] = {}
+    for key in INT_FIELDS:
+        column, errors = _convert_column(
+            [sprite.get(key, 0) for sprite in sprites], np.int64, int
+        )
+        out_of_range = (column < int_limits.min) | (column > int_limits.max)
+        for index in np.flatnonzero(out_of_range):
+            errors.setdefault(int(index), ValueError(f"{key} is out of range"))
+        for index, error in errors.items():
+            if key in ("x", "y", "width", "height"):
+                failure = (
+                    ParserErrorCode.INVALID_VALUE_TYPE,
+                    f"Invalid coordinate value for sprite '{names[index]}': {error}",
+                    {"sprite_name": names[index]},
+                )
+            else:
+                failure = (
+                    ParserErrorCode.SPRITE_PARSE_FAILED,
+                    f"Unexpected error normalizing sprite: {error}",
+                    None,
+                )
+            failures.setdefault(index, failure)
+        columns[key] = column
+
+    width, height = columns["width"], columns["height"]
+    for index in np.flatnonzero((width <= 0) | (height <= 0)):
+        index = int(index)
+        failures.setdefault(
+            index,
+            (
+                ParserErrorCode.ZERO_DIMENSION,
+                f"Sprite '{names[index]}' has zero or negative dimensions: "
+                f"{width[index]}x{height[index]}",
+                {
+                    "sprite_name": names[index],
+                    "width": int(width[index]),
+                    "height": int(height[index]),
+                },
+            ),
+        )
+
+    columns["frameWidth"] = np.where(
+        columns["frameWidth"] == 0, width, columns["frameWidth"]
+    )
+    columns["frameHeight"] = np.where(
+        columns["frameHeight"] == 0, height, columns["frameHeight"]
+    )
+    columns["rotated"] = np.array(
+        [bool(sprite.get("rotated", False)) for sprite in sprites], dtype=bool
+    )
+
+    for key in PIVOT_FIELDS:
+        column, errors = _convert_column(
+            [sprite.get(key, np.nan) for sprite in sprites], np.float64, float
+        )
+        for index, error in errors.items():
+            failures.setdefault(
+                index,
+                (
+                    ParserErrorCode.SPRITE_PARSE_FAILED,
+                    f"Unexpected error normalizing sprite: {error}",
+                    None,
+                ),
             )
+        columns[key] = column
+
+    keep = np.ones(count, dtype=bool)
+    for index in sorted(failures):
+        keep[index] = False
+        code, message, details = failures[index]
+        result.add_error(
+            code,
+            message,
+            sprite_name=sprites[index].get("name", f"sprite_{index}"),
+            details=details,
+        )
+
+    page_images = [sprite.get("page_image") for sprite in sprites]
+    if any(page_images):
+        page_index: Dict[str, int] = {}
+        for page_image in page_images:
+            if page_image:
+                page_index.setdefault(page_image, len(page_index))
+        result.pages = list(page_index)
+        columns[PAGE_FIELD] = np.array(
+            [page_index.get(page_image, 0) for page_image in page_images],
+            dtype=np.int32,
+        )
+
+    result.sprites = build_sprite_table(names, columns, keep)
 
     # Add warning if no sprites were parsed
     if not result.sprites and sprites:
@@ -68,10 +68,12 @@ class Phaser3Parser(BaseParser):
             textures: List of texture dicts containing frames arrays.
 
         Returns:
-            List of normalized sprite dicts with position/trim data.
+            List of normalized sprite dicts with position/trim data. Each
+            sprite's ``page_image`` names the texture image it lies on.
         """
         sprites: List[Dict[str, Any]] = []
         for texture in textures:
+            page_image = texture.get("image")
             for frame_entry in texture.get("frames", []):
                 frame = frame_entry.get("frame", {})
                 frame_x = int(frame.get("x", 0))
@@ -94,6 +96,7 @@ class Phaser3Parser(BaseParser):
                     "frameWidth": int(source_size.get("w", frame_w)),
                     "frameHeight": int(source_size.get("h", frame_h)),
                     "rotated": rotated,
+                    "page_image": page_image,
                 }
                 sprites.append(sprite_data)
         return sprites
@@ -6,7 +6,7 @@
 from __future__ import annotations
 
 import os
-from typing import Callable, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Set
 
 from parsers.base_parser import BaseParser
 from utils.utilities import Utilities
@@ -16,6 +16,8 @@ class SpineAtlasParser(BaseParser):
     """Parse Spine ``.atlas`` text files."""
 
     FILE_EXTENSIONS = (".atlas",)
+    # Properties that follow a page's image name rather than a region name.
+    PAGE_PROPERTIES = ("size", "format", "filter", "repeat", "pma")
 
     def __init__(
         self,
@@ -42,7 +44,7 @@ class SpineAtlasParser(BaseParser):
         return {Utilities.strip_trailing_digits(sprite["name"]) for sprite in sprites}
 
     @staticmethod
-    def parse_atlas_file(file_path: str) -> List[Dict[str, int]]:
+    def parse_atlas_file(file_path: str) -> List[Dict[str, Any]]:
         """Parse a Spine .atlas text file and return sprite metadata.
 
         Args:
@@ -50,11 +52,13 @@ class SpineAtlasParser(BaseParser):
 
         Returns:
             List of sprite dicts with position, dimension, and rotation data.
+            Each sprite's ``page_image`` names the page it lies on.
         """
-        sprites: List[Dict[str, int]] = []
+        sprites: List[Dict[str, Any]] = []
         with open(file_path, "r", encoding="utf-8") as atlas_file:
             lines = [line.strip() for line in atlas_file if line.strip()]
 
+        page_image: Optional[str] = None
         idx = 0
         while idx < len(lines):
             line = lines[idx]
@@ -62,6 +66,11 @@ class SpineAtlasParser(BaseParser):
                 idx += 1
                 continue
 
+            if SpineAtlasParser._is_page_header(lines, idx):
+                page_image = line
+                idx += 1
+                continue
+
             name = line
             if idx + 4 >= len(lines):
                 break
@@ -91,12 +100,21 @@ class SpineAtlasParser(BaseParser):
                 "frameWidth": orig_w or width,
                 "frameHeight": orig_h or height,
                 "rotated": rotate,
+                "page_image": page_image,
             }
             sprites.append(sprite_data)
             idx += 5
 
         return sprites
 
+    @staticmethod
+    def _is_page_header(lines: List[str], idx: int) -> bool:
+        """Return True if the name at ``idx`` starts a page, not a region."""
+        if idx + 1 >= len(lines):
+            return False
+        key = lines[idx + 1].split(":", 1)[0].strip().lower()
+        return key in SpineAtlasParser.PAGE_PROPERTIES
+
     @staticmethod
     def _parse_pair(line: str) -> List[int]:
         """Parse a colon-separated line with two comma-delimited integers.
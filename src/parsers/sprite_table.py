@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Columnar storage for normalized sprite metadata.
+
+``SpriteTable`` keeps the numeric fields of every sprite in one NumPy
+structured array and the names in a list of interned strings, instead of one
+dict per sprite. Large atlases with tens of thousands of sprites take a
+fraction of the memory, and checks over all sprites can run as array
+operations.
+
+Indexing or iterating a table yields ``SpriteRecord`` views. They behave
+like read-only ``SpriteData`` dicts, so code written against the dict format
+keeps working while it is moved to the columnar API.
+
+Sprites of multi-page atlases also carry the index of the page image they
+lie on; single-page atlases leave it at ``0``.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Mapping, Sequence
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+SPRITE_DTYPE = np.dtype(
+    [
+        ("x", np.int32),
+        ("y", np.int32),
+        ("width", np.int32),
+        ("height", np.int32),
+        ("frameX", np.int32),
+        ("frameY", np.int32),
+        ("frameWidth", np.int32),
+        ("frameHeight", np.int32),
+        ("rotated", np.bool_),
+        ("pivotX", np.float64),
+        ("pivotY", np.float64),
+        ("page", np.int32),
+    ]
+)
+
+INT_FIELDS = (
+    "x",
+    "y",
+    "width",
+    "height",
+    "frameX",
+    "frameY",
+    "frameWidth",
+    "frameHeight",
+)
+PIVOT_FIELDS = ("pivotX", "pivotY")
+PAGE_FIELD = "page"
+SPRITE_KEYS = ("name",) + INT_FIELDS + ("rotated",)
+
+# Geometry as (name, x, y, width, height, frameX, frameY, frameWidth,
+# frameHeight, rotated).
+SpriteRow = Tuple[str, int, int, int, int, int, int, int, int, bool]
+
+
+class SpriteRecord(Mapping):
+    """Read-only dict view of one row of a ``SpriteTable``.
+
+    Keys and value types match ``SpriteData``. Pivot keys are only present
+    when the source sprite had them, and ``page`` only for sprites on a page
+    other than the first.
+    """
+
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table: "SpriteTable", index: int) -> None:
+        self._table = table
+        self._index = index
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "name":
+            return self._table.names[self._index]
+        if key in INT_FIELDS:
+            return int(self._table.records[key][self._index])
+        if key == "rotated":
+            return bool(self._table.records["rotated"][self._index])
+        if key in PIVOT_FIELDS:
+            value = float(self._table.records[key][self._index])
+            if value == value:
+                return value
+        if key == PAGE_FIELD:
+            value = int(self._table.records[PAGE_FIELD][self._index])
+            if value:
+                return value
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from SPRITE_KEYS
+        row = self._table.records[self._index]
+        for key in PIVOT_FIELDS:
+            if not np.isnan(row[key]):
+                yield key
+        if row[PAGE_FIELD]:
+            yield PAGE_FIELD
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"SpriteRecord({dict(self)!r})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a standalone ``SpriteData`` dict for this sprite."""
+        return dict(self)
+
+
+class SpriteTable(Sequence):
+    """Immutable, columnar list of normalized sprites.
+
+    Attributes:
+        names: Sprite names, interned, in metadata order.
+        records: Structured array of ``SPRITE_DTYPE`` rows parallel to
+            ``names``. Missing pivots are stored as NaN.
+    """
+
+    def __init__(self, names: List[str], records: np.ndarray) -> None:
+        """Wrap parallel name and record columns.
+
+        Args:
+            names: Sprite names.
+            records: Structured array with ``SPRITE_DTYPE`` and one row per
+                name.
+
+        Raises:
+            ValueError: If the columns have different lengths or the records
+                use another dtype.
+        """
+        if records.dtype != SPRITE_DTYPE:
+            raise ValueError("SpriteTable records must use SPRITE_DTYPE")
+        if len(names) != len(records):
+            raise ValueError(
+                f"SpriteTable has {len(names)} names but {len(records)} records"
+            )
+        self.names = names
+        self.records = records
+
+    @classmethod
+    def empty(cls) -> "SpriteTable":
+        """Return a table without sprites."""
+        return cls([], np.zeros(0, dtype=SPRITE_DTYPE))
+
+    @classmethod
+    def from_sprites(cls, sprites: Iterable[Mapping]) -> "SpriteTable":
+        """Build a table from already normalized sprite dicts.
+
+        Args:
+            sprites: ``SpriteData`` dicts, e.g. from ``normalize_sprite``.
+
+        Returns:
+            A new ``SpriteTable``; keys outside ``SpriteData`` are dropped.
+        """
+        sprites = list(sprites)
+        records = np.zeros(len(sprites), dtype=SPRITE_DTYPE)
+        for key in INT_FIELDS + ("rotated",):
+            records[key] = [sprite[key] for sprite in sprites]
+        for key in PIVOT_FIELDS:
+            records[key] = [sprite.get(key, np.nan) for sprite in sprites]
+        records[PAGE_FIELD] = [sprite.get(PAGE_FIELD, 0) for sprite in sprites]
+        names = [sys.intern(str(sprite["name"])) for sprite in sprites]
+        return cls(names, records)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return SpriteTable(self.names[index], self.records[index])
+        if index < 0:
+            index += len(self.names)
+        if not 0 <= index < len(self.names):
+            raise IndexError("SpriteTable index out of range")
+        return SpriteRecord(self, index)
+
+    def __iter__(self) -> Iterator[SpriteRecord]:
+        for index in range(len(self.names)):
+            yield SpriteRecord(self, index)
+
+    def __repr__(self) -> str:
+        return f"SpriteTable({len(self)} sprites)"
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the numeric columns."""
+        return self.records.nbytes
+
+    def column(self, key: str):
+        """Return one field for every sprite.
+
+        Args:
+            key: A ``SpriteData`` key.
+
+        Returns:
+            The name list for ``"name"``, otherwise a read-only array view.
+        """
+        if key == "name":
+            return self.names
+        column = self.records[key]
+        column.flags.writeable = False
+        return column
+
+    def take(self, indices: Iterable[int]) -> "SpriteTable":
+        """Return a new table holding the rows at ``indices`` in that order."""
+        indices = np.fromiter(indices, dtype=np.intp)
+        return SpriteTable([self.names[i] for i in indices], self.records[indices])
+
+    def rows(self) -> Iterator[SpriteRow]:
+        """Yield the geometry of every sprite as plain Python tuples.
+
+        Much cheaper than going through ``SpriteRecord`` views when every
+        field of every sprite is needed.
+        """
+        for name, values in zip(self.names, self.records.tolist()):
+            yield (name,) + values[:9]
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Return the sprites as standalone ``SpriteData`` dicts."""
+        return [record.to_dict() for record in self]
+
+
+def build_sprite_table(
+    names: List[str],
+    columns: Dict[str, np.ndarray],
+    keep: Optional[np.ndarray] = None,
+) -> SpriteTable:
+    """Assemble a table from per-field columns.
+
+    Args:
+        names: Sprite names for every row.
+        columns: Arrays keyed by ``SPRITE_DTYPE`` field; missing pivot
+            columns default to NaN and a missing page column to ``0``.
+        keep: Optional boolean mask selecting the rows to keep.
+
+    Returns:
+        A new ``SpriteTable``.
+    """
+    if keep is None:
+        keep = np.ones(len(names), dtype=bool)
+    kept = np.flatnonzero(keep)
+    records = np.zeros(len(kept), dtype=SPRITE_DTYPE)
+    for key in SPRITE_DTYPE.names:
+        column = columns.get(key)
+        if column is None:
+            records[key] = np.nan if key in PIVOT_FIELDS else 0
+        else:
+            records[key] = np.asarray(column)[kept]
+    return SpriteTable([sys.intern(str(names[i])) for i in kept], records)
+
+
+__all__ = [
+    "INT_FIELDS",
+    "PAGE_FIELD",
+    "PIVOT_FIELDS",
+    "SPRITE_DTYPE",
+    "SPRITE_KEYS",
+    "SpriteRecord",
+    "SpriteRow",
+    "SpriteTable",
+    "build_sprite_table",
+]
@@ -2,6 +2,8 @@
 # -*- coding: utf-8 -*-
 
 import os
+from collections import OrderedDict
+from threading import Event, Lock
 from typing import Set, Optional, Callable, List, Dict, Any, Tuple
 from PIL import Image
 import numpy as np
@@ -15,12 +17,20 @@ from parsers.parser_types import (
     FormatError,
     validate_sprites,
 )
+from utils.image_pool import get_image_pool
 
 # Qt imports
-from PySide6.QtCore import QCoreApplication
+from PySide6.QtCore import QCoreApplication, QThread
 from PySide6.QtWidgets import QMessageBox, QApplication
 
 
+DetectionKey = Tuple[str, int, int, bool]
+
+
+class DetectionCancelled(Exception):
+    """Raised when sprite detection is stopped through its cancel event."""
+
+
 class UnknownParser(BaseParser):
     """Fallback parser for images without metadata files.
 
@@ -33,6 +43,29 @@ class UnknownParser(BaseParser):
 
     FILE_EXTENSIONS = ()  # Used as fallback for any image, not extension-based
 
+    # Background keying choices, matching BackgroundHandlerWindow results
+    KEY_BACKGROUND = "key_background"
+    EXCLUDE_BACKGROUND = "exclude_background"
+
+    # Used for files without a recorded choice when no prompt can be shown
+    # (worker threads, headless runs), so batches never block on a dialog.
+    default_background_choice = EXCLUDE_BACKGROUND
+    _background_choices: Dict[str, str] = {}
+
+    # Smallest cell size accepted by grid detection
+    MIN_GRID_CELL = 8
+    # Components smaller than this share of the largest one in their cell
+    # are detached fragments (limbs, particles) rather than separate sprites.
+    GRID_FRAGMENT_RATIO = 0.25
+
+    # Detected sprite boxes per image fingerprint, shared by the animation
+    # list, previews and extraction so an image is only analyzed once.
+    MAX_CACHED_DETECTIONS = 64
+    _detection_cache: "OrderedDict[DetectionKey, Tuple[Dict[str, Any], ...]]" = (
+        OrderedDict()
+    )
+    _detection_lock = Lock()
+
     @classmethod
     def parse_file(cls, file_path: str, parent_window=None) -> ParseResult:
         """Parse an image file using computer vision sprite detection.
@@ -71,6 +104,7 @@ class UnknownParser(BaseParser):
         directory: str,
         image_filename: str,
         name_callback: Optional[Callable[[str], None]] = None,
+        cancel_event: Optional[Event] = None,
     ):
         """Initialize the unknown image parser.
 
@@ -78,18 +112,25 @@ class UnknownParser(BaseParser):
             directory: Directory containing the image file.
             image_filename: Name of the image file.
             name_callback: Optional callback invoked for each extracted name.
+            cancel_event: Optional ``Event`` that stops detection when set.
         """
         super().__init__(directory, image_filename, name_callback)
+        self.cancel_event = cancel_event
 
     def extract_names(self) -> Set[str]:
         """Generate sequential sprite names based on detected regions.
 
         Returns:
             Set of names like ``sprite_001``, ``sprite_002``, etc.
+
+        Raises:
+            DetectionCancelled: If ``cancel_event`` was set during detection.
         """
         try:
             file_path = os.path.join(self.directory, self.filename)
-            _, sprites = self.parse_unknown_image(file_path)
+            _, sprites = self.parse_unknown_image(
+                file_path, cancel_event=self.cancel_event
+            )
 
             names = set()
             for i, sprite in enumerate(sprites):
@@ -98,53 +139,239 @@ class UnknownParser(BaseParser):
                 names.add(name)
 
             return names
+        except DetectionCancelled:
+            raise
         except Exception as e:
             print(f"Error extracting names from image {self.filename}: {e}")
             return set()
 
+    @classmethod
+    def set_background_choices(cls, choices: Dict[str, str]) -> None:
+        """Record per-file background keying choices for later extraction.
+
+        Args:
+            choices: Mapping of image paths to ``KEY_BACKGROUND`` or
+                ``EXCLUDE_BACKGROUND``. Other values are ignored.
+        """
+        for path, choice in choices.items():
+            if choice in (cls.KEY_BACKGROUND, cls.EXCLUDE_BACKGROUND):
+                cls._background_choices[cls._choice_key(path)] = choice
+
+    @classmethod
+    def clear_background_choices(cls) -> None:
+        """Forget all recorded background keying choices."""
+        cls._background_choices.clear()
+
+    @classmethod
+    def background_choice_for(cls, file_path: Optional[str]) -> Optional[str]:
+        """Return the recorded keying choice for ``file_path``, if any."""
+        if not file_path:
+            return None
+        return cls._background_choices.get(cls._choice_key(file_path))
+
+    @staticmethod
+    def _choice_key(path: str) -> str:
+        """Normalise a path for choice lookups."""
+        return os.path.normcase(os.path.abspath(path))
+
+    @classmethod
+    def clear_detection_cache(cls) -> None:
+        """Forget all cached sprite detections."""
+        with cls._detection_lock:
+            cls._detection_cache.clear()
+
+    @staticmethod
+    def _detection_key(file_path: str, keyed: bool) -> Optional[DetectionKey]:
+        """Fingerprint ``file_path`` for the detection cache.
+
+        Args:
+            file_path: Path to the image file.
+            keyed: Whether the background color was removed before detection.
+
+        Returns:
+            ``(path, mtime_ns, size, keyed)``, or ``None`` if the file cannot
+            be stat'ed.
+        """
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        return (
+            UnknownParser._choice_key(file_path),
+            stat.st_mtime_ns,
+            stat.st_size,
+            keyed,
+        )
+
+    @staticmethod
+    def _cached_detection(
+        key: Optional[DetectionKey],
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Return copies of the sprites cached under ``key``, if any."""
+        if key is None:
+            return None
+        with UnknownParser._detection_lock:
+            sprites = UnknownParser._detection_cache.get(key)
+            if sprites is None:
+                return None
+            UnknownParser._detection_cache.move_to_end(key)
+        return [dict(sprite) for sprite in sprites]
+
+    @staticmethod
+    def _store_detection(
+        key: Optional[DetectionKey], sprites: List[Dict[str, Any]]
+    ) -> None:
+        """Cache ``sprites`` under ``key``, evicting the oldest entries."""
+        if key is None:
+            return
+        cache = UnknownParser._detection_cache
+        with UnknownParser._detection_lock:
+            for stale in [k for k in cache if k[0] == key[0] and k[1:3] != key[1:3]]:
+                del cache[stale]
+            cache[key] = tuple(dict(sprite) for sprite in sprites)
+            cache.move_to_end(key)
+            while len(cache) > UnknownParser.MAX_CACHED_DETECTIONS:
+                cache.popitem(last=False)
+
+    @staticmethod
+    def _check_cancelled(cancel_event: Optional[Event]) -> None:
+        """Raise ``DetectionCancelled`` if ``cancel_event`` is set."""
+        if cancel_event is not None and cancel_event.is_set():
+            raise DetectionCancelled("Sprite detection cancelled")
+
     @staticmethod
     def parse_unknown_image(
-        file_path: str, parent_window=None
+        file_path: str,
+        parent_window=None,
+        image=None,
+        cancel_event: Optional[Event] = None,
     ) -> Tuple[Image.Image, List[Dict[str, Any]]]:
         """Detect sprite regions in an image using alpha transparency.
 
+        Detected boxes are cached per image fingerprint and keying choice,
+        so later calls for an unchanged file skip the detection pass.
+
         Args:
             file_path: Path to the image file.
             parent_window: Optional parent widget for background-removal dialogs.
+            image: Already decoded image for ``file_path``. When omitted the
+                image is taken from the shared decoded-image pool.
+            cancel_event: Optional ``Event`` that stops detection when set.
 
         Returns:
             A tuple (processed_image, sprites) where sprites is a list of dicts.
+            When no background is keyed out, ``processed_image`` may be the
+            shared pooled image and must not be modified or closed.
+
+        Raises:
+            DetectionCancelled: If ``cancel_event`` was set during detection.
         """
         try:
-            from PIL import Image
-
-            Image.MAX_IMAGE_PIXELS = None
-            image = Image.open(file_path)
+            if image is None:
+                Image.MAX_IMAGE_PIXELS = None
+                with get_image_pool().lease(file_path) as pooled:
+                    return UnknownParser.parse_unknown_image(
+                        file_path,
+                        parent_window,
+                        image=pooled,
+                        cancel_event=cancel_event,
+                    )
 
             if image.mode != "RGBA":
                 image = image.convert("RGBA")
 
-            background_color = UnknownParser._detect_background_color(image)
+            # Sheets that already have transparency are never keyed.
+            background_color = None
+            if not UnknownParser._has_transparency(image):
+                background_color = UnknownParser._detect_background_color(image)
 
-            if background_color and UnknownParser._should_apply_color_keying(
-                background_color, parent_window
-            ):
+            keyed = bool(
+                background_color
+                and UnknownParser._should_apply_color_keying(
+                    background_color, parent_window, file_path
+                )
+            )
+            if keyed:
                 processed_image = UnknownParser._apply_color_keying(
                     image, background_color
                 )
             else:
                 processed_image = image
 
-            sprites = UnknownParser._find_sprites_in_image(processed_image)
+            key = UnknownParser._detection_key(file_path, keyed)
+            sprites = UnknownParser._cached_detection(key)
+            if sprites is None:
+                sprites = UnknownParser._find_sprites_in_image(
+                    processed_image, cancel_event
+                )
+                UnknownParser._store_detection(key, sprites)
 
             return processed_image, sprites
 
+        except DetectionCancelled:
+            raise
         except Exception as e:
             print(f"Error parsing unknown image {file_path}: {e}")
-            from PIL import Image
-
             return Image.new("RGBA", (1, 1), (0, 0, 0, 0)), []
 
+    @staticmethod
+    def _edge_strips(
+        image: Image.Image,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Return the top, bottom, left and right edges as ``(N, 3)`` RGB arrays.
+
+        Only the one-pixel border is cropped and converted, never the whole
+        image.
+        """
+        width, height = image.size
+
+        def strip(box):
+            return np.asarray(image.crop(box).convert("RGB")).reshape(-1, 3)
+
+        return (
+            strip((0, 0, width, 1)),
+            strip((0, height - 1, width, height)),
+            strip((0, 0, 1, height)),
+            strip((width - 1, 0, width, height)),
+        )
+
+    @staticmethod
+    def _interleave(first: np.ndarray, second: Optional[np.ndarray]) -> np.ndarray:
+        """Interleave two equal-length pixel rows as ``a0, b0, a1, b1, ...``."""
+        if second is None:
+            return first
+        return np.stack((first, second), axis=1).reshape(-1, 3)
+
+    @staticmethod
+    def _rank_colors(pixels: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Count distinct RGB colours, most frequent first.
+
+        Colours are packed into ``uint32`` so counting is one ``np.unique``
+        call. Ties keep first-seen order, like ``Counter.most_common``.
+
+        Args:
+            pixels: ``(N, 3)`` uint8 RGB samples.
+
+        Returns:
+            Tuple ``(packed_colors, counts)`` sorted by descending count.
+        """
+        packed = (
+            pixels[:, 0].astype(np.uint32) << 16
+            | pixels[:, 1].astype(np.uint32) << 8
+            | pixels[:, 2].astype(np.uint32)
+        )
+        colors, first_index, counts = np.unique(
+            packed, return_index=True, return_counts=True
+        )
+        order = np.lexsort((first_index, -counts))
+        return colors[order], counts[order]
+
+    @staticmethod
+    def _unpack_color(packed: int) -> Tuple[int, int, int]:
+        """Convert a packed ``0xRRGGBB`` value back to an RGB tuple."""
+        packed = int(packed)
+        return ((packed >> 16) & 0xFF, (packed >> 8) & 0xFF, packed & 0xFF)
+
     @staticmethod
     def _detect_background_color(image: Image.Image) -> Optional[Tuple[int, int, int]]:
         """Detect the most common edge color as a potential background.
@@ -156,26 +383,17 @@ class UnknownParser(BaseParser):
             RGB tuple of the background color, or None if not detected.
         """
         try:
-            rgb_image = image.convert("RGB")
-
-            width, height = image.size
-            edge_pixels = []
-
-            for x in range(width):
-                edge_pixels.append(rgb_image.getpixel((x, 0)))  # Top edge
-                edge_pixels.append(rgb_image.getpixel((x, height - 1)))  # Bottom edge
-
-            for y in range(height):
-                edge_pixels.append(rgb_image.getpixel((0, y)))  # Left edge
-                edge_pixels.append(rgb_image.getpixel((width - 1, y)))  # Right edge
-
-            from collections import Counter
-
-            color_counts = Counter(edge_pixels)
-            most_common = color_counts.most_common(1)
+            top, bottom, left, right = UnknownParser._edge_strips(image)
+            edge_pixels = np.concatenate(
+                (
+                    UnknownParser._interleave(top, bottom),
+                    UnknownParser._interleave(left, right),
+                )
+            )
 
-            if most_common and most_common[0][1] > len(edge_pixels) * 0.1:
-                return most_common[0][0]
+            colors, counts = UnknownParser._rank_colors(edge_pixels)
+            if len(counts) and counts[0] > len(edge_pixels) * 0.1:
+                return UnknownParser._unpack_color(colors[0])
 
             return None
         except Exception:
@@ -183,17 +401,31 @@ class UnknownParser(BaseParser):
 
     @staticmethod
     def _should_apply_color_keying(
-        background_color: Tuple[int, int, int], parent_window=None
+        background_color: Tuple[int, int, int],
+        parent_window=None,
+        file_path: Optional[str] = None,
     ) -> bool:
-        """Prompt user to confirm background color removal.
+        """Decide whether to remove the detected background color.
+
+        A choice recorded with ``set_background_choices`` wins. Otherwise the
+        user is asked, but only on the GUI thread; worker threads and runs
+        without a ``QApplication`` fall back to ``default_background_choice``
+        so extraction never waits on a modal dialog.
 
         Args:
             background_color: The detected background RGB tuple.
             parent_window: Optional parent widget for the dialog.
+            file_path: Image path used to look up a recorded choice.
 
         Returns:
-            True if the user confirms removal.
+            True if the background should be keyed out.
         """
+        choice = UnknownParser.background_choice_for(file_path)
+        if choice is None and not UnknownParser._can_prompt():
+            choice = UnknownParser.default_background_choice
+        if choice is not None:
+            return choice == UnknownParser.KEY_BACKGROUND
+
         try:
             if parent_window is None:
                 app = QApplication.instance()
@@ -225,12 +457,22 @@ class UnknownParser(BaseParser):
         except Exception:
             return False
 
+    @staticmethod
+    def _can_prompt() -> bool:
+        """Return ``True`` when a modal dialog can be shown from this thread."""
+        app = QApplication.instance()
+        return app is not None and QThread.currentThread() is app.thread()
+
     @staticmethod
     def _apply_color_keying(
         image: Image.Image, background_color: Tuple[int, int, int], tolerance: int = 10
     ) -> Image.Image:
         """Make pixels matching the background color transparent.
 
+        The match mask is built from per-channel range checks on the
+        ``uint8`` data with a reused scratch buffer, then written into the
+        alpha channel in place.
+
         Args:
             image: The source RGBA image.
             background_color: RGB tuple of the color to remove.
@@ -240,38 +482,55 @@ class UnknownParser(BaseParser):
             A new image with matching pixels set to alpha 0.
         """
         try:
-            img_array = np.array(image)
+            img_array = np.array(image.convert("RGBA") if image.mode != "RGBA" else image)
 
-            r, g, b = background_color
-            mask = (
-                (np.abs(img_array[:, :, 0] - r) <= tolerance)
-                & (np.abs(img_array[:, :, 1] - g) <= tolerance)
-                & (np.abs(img_array[:, :, 2] - b) <= tolerance)
-            )
+            mask = np.ones(img_array.shape[:2], dtype=bool)
+            scratch = np.empty_like(mask)
+            for channel, value in enumerate(background_color):
+                plane = img_array[:, :, channel]
+                np.greater_equal(plane, max(0, int(value) - tolerance), out=scratch)
+                mask &= scratch
+                np.less_equal(plane, min(255, int(value) + tolerance), out=scratch)
+                mask &= scratch
 
-            img_array[mask, 3] = 0
+            np.putmask(img_array[:, :, 3], mask, 0)
 
-            return Image.fromarray(img_array, "RGBA")
+            return Image.fromarray(img_array)
         except Exception as e:
             print(f"Error applying color keying: {e}")
             return image
 
     @staticmethod
-    def _find_sprites_in_image(image: Image.Image) -> List[Dict[str, Any]]:
-        """Find connected non-transparent regions in the image.
+    def _find_sprites_in_image(
+        image: Image.Image, cancel_event: Optional[Event] = None
+    ) -> List[Dict[str, Any]]:
+        """Find sprite regions in the image.
+
+        Uniform grid sheets are detected from alpha projection profiles and
+        split into equally sized cells in row-major order. Other sheets fall
+        back to connected non-transparent regions.
 
         Args:
             image: The RGBA image to analyze.
+            cancel_event: Optional ``Event`` that stops detection when set.
 
         Returns:
             List of sprite dicts with name, x, y, width, height.
+
+        Raises:
+            DetectionCancelled: If ``cancel_event`` was set during detection.
         """
         try:
-            img_array = np.array(image)
+            img_array = np.asarray(image)
 
             alpha_mask = img_array[:, :, 3] > 0
 
-            regions = UnknownParser._find_connected_regions(alpha_mask)
+            grid_sprites = UnknownParser._find_grid_sprites(alpha_mask, cancel_event)
+            if grid_sprites:
+                return grid_sprites
+
+            UnknownParser._check_cancelled(cancel_event)
+            regions = UnknownParser._find_connected_regions(alpha_mask, cancel_event)
 
             sprites = []
             for i, region in enumerate(regions):
@@ -287,19 +546,200 @@ class UnknownParser(BaseParser):
                     sprites.append(sprite_data)
 
             return sprites
+        except DetectionCancelled:
+            raise
         except Exception as e:
             print(f"Error finding sprites in image: {e}")
             return []
 
     @staticmethod
-    def _find_connected_regions(alpha_mask: np.ndarray) -> List[List[Tuple[int, int]]]:
+    def _grid_pitch(occupied: np.ndarray) -> Optional[int]:
+        """Find the smallest regular cell pitch along one axis.
+
+        A pitch is accepted when it divides the axis into at least two
+        cells, no run of occupied pixels crosses a cell boundary, and every
+        cell band holds some content.
+
+        Args:
+            occupied: 1D boolean projection of the alpha mask onto the axis.
+
+        Returns:
+            Cell size in pixels, or ``None`` if no pitch fits.
+        """
+        length = len(occupied)
+        for pitch in range(UnknownParser.MIN_GRID_CELL, length // 2 + 1):
+            if length % pitch:
+                continue
+            boundaries = np.arange(pitch, length, pitch)
+            if np.any(occupied[boundaries - 1] & occupied[boundaries]):
+                continue
+            bands = np.add.reduceat(occupied, np.arange(0, length, pitch))
+            if np.all(bands):
+                return pitch
+        return None
+
+    @staticmethod
+    def _find_grid_sprites(
+        alpha_mask: np.ndarray, cancel_event: Optional[Event] = None
+    ) -> List[Dict[str, Any]]:
+        """Split a uniform grid sheet into cell-sized frames.
+
+        Args:
+            alpha_mask: Boolean 2D array where True indicates non-transparent pixels.
+            cancel_event: Optional ``Event`` checked once per pixel row.
+
+        A sheet is a grid when at least one axis splits into two or more
+        cells at a regular pitch; the other axis may be a single band. The
+        grid is rejected when any cell holds more than one sprite-sized
+        connected component, since such cells merge separate sprites.
+
+        Returns:
+            Sprite dicts for non-empty cells in row-major order, or an empty
+            list when the sheet is not such a grid.
+
+        Raises:
+            DetectionCancelled: If ``cancel_event`` was set during detection.
+        """
+        height, width = alpha_mask.shape
+        cell_width = UnknownParser._grid_pitch(alpha_mask.any(axis=0))
+        cell_height = UnknownParser._grid_pitch(alpha_mask.any(axis=1))
+        if cell_width is None and cell_height is None:
+            return []
+        cell_width = cell_width or width
+        cell_height = cell_height or height
+
+        columns = width // cell_width
+        rows = height // cell_height
+        if UnknownParser._cells_merge_sprites(
+            alpha_mask, cell_width, cell_height, cancel_event
+        ):
+            return []
+
+        filled = alpha_mask.reshape(rows, cell_height, columns, cell_width).any(
+            axis=(1, 3)
+        )
+        sprites = []
+        for row, column in zip(*np.nonzero(filled)):
+            sprites.append(
+                {
+                    "name": f"sprite_{len(sprites) + 1:03d}",
+                    "x": int(column) * cell_width,
+                    "y": int(row) * cell_height,
+                    "width": cell_width,
+                    "height": cell_height,
+                }
+            )
+        return sprites
+
+    @staticmethod
+    def _cells_merge_sprites(
+        alpha_mask: np.ndarray,
+        cell_width: int,
+        cell_height: int,
+        cancel_event: Optional[Event] = None,
+    ) -> bool:
+        """Return ``True`` if any grid cell holds more than one sprite.
+
+        Components below ``GRID_FRAGMENT_RATIO`` of the largest component in
+        the same cell are ignored.
+
+        Args:
+            alpha_mask: Boolean 2D array where True indicates non-transparent pixels.
+            cell_width: Cell width in pixels.
+            cell_height: Cell height in pixels.
+            cancel_event: Optional ``Event`` checked once per pixel row.
+
+        Raises:
+            DetectionCancelled: If ``cancel_event`` was set while labelling.
+        """
+        largest: Dict[Tuple[int, int], List[int]] = {}
+        components = UnknownParser._component_sizes(alpha_mask, cancel_event)
+        for size, y, x in components:
+            largest.setdefault((y // cell_height, x // cell_width), []).append(size)
+        for sizes in largest.values():
+            threshold = max(sizes) * UnknownParser.GRID_FRAGMENT_RATIO
+            if sum(1 for size in sizes if size >= threshold) > 1:
+                return True
+        return False
+
+    @staticmethod
+    def _component_sizes(
+        alpha_mask: np.ndarray, cancel_event: Optional[Event] = None
+    ) -> List[Tuple[int, int, int]]:
+        """Label 8-connected components from horizontal pixel runs.
+
+        Runs are found per row with NumPy and merged with the touching runs
+        of the previous row, so the Python work scales with the number of
+        runs rather than pixels.
+
+        Args:
+            alpha_mask: Boolean 2D array where True indicates non-transparent pixels.
+            cancel_event: Optional ``Event`` checked once per pixel row.
+
+        Returns:
+            ``(pixel_count, y, x)`` per component, where ``(x, y)`` is one of
+            its pixels.
+
+        Raises:
+            DetectionCancelled: If ``cancel_event`` was set while labelling.
+        """
+        parent: List[int] = []
+        sizes: List[int] = []
+        anchors: List[Tuple[int, int]] = []
+
+        def find(run: int) -> int:
+            while parent[run] != run:
+                parent[run] = parent[parent[run]]
+                run = parent[run]
+            return run
+
+        previous: List[Tuple[int, int, int]] = []
+        for y, row in enumerate(alpha_mask):
+            UnknownParser._check_cancelled(cancel_event)
+            if not row.any():
+                previous = []
+                continue
+            edges = np.flatnonzero(np.diff(row, prepend=False, append=False))
+            current = []
+            first = 0
+            for start, end in zip(edges[::2].tolist(), edges[1::2].tolist()):
+                run = len(parent)
+                parent.append(run)
+                sizes.append(end - start)
+                anchors.append((y, start))
+                while first < len(previous) and previous[first][1] < start:
+                    first += 1
+                index = first
+                while index < len(previous) and previous[index][0] <= end:
+                    root, other = find(run), find(previous[index][2])
+                    if root != other:
+                        parent[other] = root
+                        sizes[root] += sizes[other]
+                    index += 1
+                current.append((start, end, run))
+            previous = current
+
+        return [
+            (sizes[run], *anchors[run])
+            for run in range(len(parent))
+            if find(run) == run
+        ]
+
+    @staticmethod
+    def _find_connected_regions(
+        alpha_mask: np.ndarray, cancel_event: Optional[Event] = None
+    ) -> List[List[Tuple[int, int]]]:
         """Flood-fill the alpha mask to find connected regions.
 
         Args:
             alpha_mask: Boolean 2D array where True indicates non-transparent pixels.
+            cancel_event: Optional ``Event`` checked once per pixel row.
 
         Returns:
             List of regions, each a list of (x, y) coordinate tuples.
+
+        Raises:
+            DetectionCancelled: If ``cancel_event`` was set during the fill.
         """
         try:
             height, width = alpha_mask.shape
@@ -333,6 +773,7 @@ class UnknownParser(BaseParser):
                 return region
 
             for y in range(height):
+                UnknownParser._check_cancelled(cancel_event)
                 for x in range(width):
                     if alpha_mask[y, x] and not visited[y, x]:
                         region = flood_fill(x, y)
@@ -340,6 +781,8 @@ class UnknownParser(BaseParser):
                             regions.append(region)
 
             return regions
+        except DetectionCancelled:
+            raise
         except Exception as e:
             print(f"Error finding connected regions: {e}")
             return []
@@ -378,9 +821,8 @@ class UnknownParser(BaseParser):
             if image.mode != "RGBA":
                 return False
 
-            img_array = np.array(image)
-
-            return np.any(img_array[:, :, 3] < 255)
+            min_alpha, _ = image.getextrema()[3]
+            return bool(min_alpha < 255)
         except Exception as e:
             print(f"Error checking transparency: {e}")
             return False
@@ -399,38 +841,31 @@ class UnknownParser(BaseParser):
             List of RGB tuples sorted by frequency.
         """
         try:
-            rgb_image = image.convert("RGB")
-
             width, height = image.size
-            edge_pixels = []
-
-            for x in range(0, width, max(1, width // 50)):  # Sample every ~2% of width
-                edge_pixels.append(rgb_image.getpixel((x, 0)))
-                if height > 1:
-                    edge_pixels.append(rgb_image.getpixel((x, height - 1)))
-
-            for y in range(0, height, max(1, height // 50)):
-                edge_pixels.append(rgb_image.getpixel((0, y)))
-                if width > 1:
-                    edge_pixels.append(rgb_image.getpixel((width - 1, y)))
-
-            corners = [(0, 0), (width - 1, 0), (0, height - 1), (width - 1, height - 1)]
-            for corner in corners:
-                for _ in range(5):
-                    edge_pixels.append(rgb_image.getpixel(corner))
-
-            from collections import Counter
-
-            color_counts = Counter(edge_pixels)
+            top, bottom, left, right = UnknownParser._edge_strips(image)
+            x_step = max(1, width // 50)  # Sample every ~2% of width
+            y_step = max(1, height // 50)
+            corners = np.concatenate((top[[0, -1]], bottom[[0, -1]]))
+
+            edge_pixels = np.concatenate(
+                (
+                    UnknownParser._interleave(
+                        top[::x_step], bottom[::x_step] if height > 1 else None
+                    ),
+                    UnknownParser._interleave(
+                        left[::y_step], right[::y_step] if width > 1 else None
+                    ),
+                    np.repeat(corners, 5, axis=0),
+                )
+            )
 
+            colors, counts = UnknownParser._rank_colors(edge_pixels)
             min_occurrences = max(1, len(edge_pixels) * 0.05)
-            background_colors = []
-
-            for color, count in color_counts.most_common(max_colors * 2):
-                if count >= min_occurrences and len(background_colors) < max_colors:
-                    background_colors.append(color)
-
-            return background_colors
+            return [
+                UnknownParser._unpack_color(color)
+                for color, count in zip(colors[:max_colors], counts[:max_colors])
+                if count >= min_occurrences
+            ]
 
         except Exception as e:
             print(f"Error detecting background colors: {e}")
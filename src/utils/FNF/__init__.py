@@ -7,4 +7,5 @@ Modules:
     anim_utils: Animation timing and frame utilities for FNF sprites.
     character_data: Parsers for FNF character JSON data files.
     engine_detector: Detection of FNF engine variants from file structure.
+    mod_importer: Bulk import of character settings from whole mod folders.
 """
@@ -4,10 +4,12 @@ import os
 
 from PySide6.QtWidgets import QFileDialog
 
-from utils.FNF.engine_detector import detect_engine
-from utils.FNF.alignment import build_alignment_overrides
-from utils.FNF.anim_utils import parse_indices_attribute, parse_xml_offsets
-from utils.utilities import Utilities
+from utils.FNF.mod_importer import (
+    ModImportResult,
+    apply_mod_import,
+    parse_character_file,
+    parse_character_files,
+)
 
 
 class CharacterData:
@@ -31,6 +33,8 @@ class CharacterData:
     ):
         """Load all character files from the configured directory.
 
+        Files are parsed in parallel and their settings stored in one batch.
+
         Args:
             settings_manager: Manager to receive animation settings.
             data_dict: Dictionary mapping PNG filenames to data file paths.
@@ -40,15 +44,28 @@ class CharacterData:
         if not self.fnf_char_json_directory:
             return
 
-        for filename in os.listdir(self.fnf_char_json_directory):
-            file_path = os.path.join(self.fnf_char_json_directory, filename)
-            self._process_character_file(
+        file_paths = [
+            os.path.join(self.fnf_char_json_directory, filename)
+            for filename in os.listdir(self.fnf_char_json_directory)
+        ]
+        result = ModImportResult(root=self.fnf_char_json_directory)
+        for file_path, character in zip(file_paths, parse_character_files(file_paths)):
+            filename = os.path.basename(file_path)
+            if character is None:
+                print(
+                    f"Skipping {filename}: Not a FNF character data file or unsupported engine type."
+                )
+                continue
+            print(f"Found {character.engine} data for {filename}.")
+            self._register_spritesheet_entry(
+                character.png_filename,
                 file_path,
-                settings_manager,
-                data_dict=data_dict,
-                listbox_png_callback=listbox_png_callback,
-                listbox_data_callback=listbox_data_callback,
+                data_dict,
+                listbox_png_callback,
+                listbox_data_callback,
             )
+            result.characters.append(character)
+        apply_mod_import(result, settings_manager)
 
     def fnf_select_char_data_directory(
         self,
@@ -91,22 +108,12 @@ class CharacterData:
         if not processed:
             raise ValueError("Unsupported or invalid FNF character data file.")
 
-    def _process_character_file(
-        self,
-        file_path,
-        settings_manager,
-        data_dict=None,
-        listbox_png_callback=None,
-        listbox_data_callback=None,
-    ):
-        """Parse a character file and register its animation settings.
+    def _process_character_file(self, file_path, settings_manager):
+        """Parse a character file and store its animation settings.
 
         Args:
             file_path: Path to the character data file.
             settings_manager: Manager to receive animation settings.
-            data_dict: Optional dictionary for PNG-to-data mapping.
-            listbox_png_callback: Optional callback to register PNG entries.
-            listbox_data_callback: Optional callback to register data entries.
 
         Returns:
             True if the file was processed successfully, False otherwise.
@@ -114,99 +121,20 @@ class CharacterData:
         if not file_path or not os.path.exists(file_path):
             return False
 
-        engine_type, parsed_data = detect_engine(file_path)
         filename = os.path.basename(file_path)
-        print(f"Found {engine_type} data for {filename}.")
-
-        if engine_type == "Psych Engine" and parsed_data:
-            png_filename = self._register_spritesheet_entry(
-                parsed_data.get("image", ""),
-                file_path,
-                data_dict,
-                listbox_png_callback,
-                listbox_data_callback,
-            )
-            scale = parsed_data.get("scale", 1)
-            for anim in parsed_data.get("animations", []):
-                anim_name = Utilities.strip_trailing_digits(anim.get("name", ""))
-                fps = anim.get("fps", 0)
-                indices = anim.get("indices") or None
-                loop = bool(anim.get("loop", False))
-                offsets = anim.get("offsets")
-                self._update_animation_settings(
-                    settings_manager,
-                    png_filename,
-                    anim_name,
-                    fps,
-                    indices=indices,
-                    loop=loop,
-                    scale=scale,
-                    offsets=offsets,
-                    flip_x=parsed_data.get("flip_x", False),
-                )
-            return True
-
-        if engine_type == "Codename Engine" and parsed_data is not None:
-            png_filename = self._register_spritesheet_entry(
-                filename,
-                file_path,
-                data_dict,
-                listbox_png_callback,
-                listbox_data_callback,
+        character = parse_character_file(file_path)
+        if character is None:
+            print(
+                f"Skipping {filename}: Not a FNF character data file or unsupported engine type."
             )
-            try:
-                scale = float(parsed_data.attrib.get("scale", 1))
-            except (TypeError, ValueError):
-                scale = 1
-            for anim in parsed_data.findall("anim"):
-                anim_name = Utilities.strip_trailing_digits(anim.get("name", ""))
-                fps = int(anim.get("fps", 0))
-                indices = parse_indices_attribute(anim.get("indices"))
-                loop = anim.get("loop", "false").lower() == "true"
-                offsets = parse_xml_offsets(anim)
-                self._update_animation_settings(
-                    settings_manager,
-                    png_filename,
-                    anim_name,
-                    fps,
-                    indices=indices,
-                    loop=loop,
-                    scale=scale,
-                    offsets=offsets,
-                )
-            return True
-
-        if engine_type == "Kade Engine" and parsed_data:
-            png_filename = self._register_spritesheet_entry(
-                filename,
-                file_path,
-                data_dict,
-                listbox_png_callback,
-                listbox_data_callback,
-            )
-            fps = parsed_data.get("frameRate", 0)
-            scale_value = parsed_data.get("scale", 1)
-            for anim in parsed_data.get("animations", []):
-                anim_name = Utilities.strip_trailing_digits(anim.get("name", ""))
-                indices = anim.get("frameIndices") or None
-                loop = bool(anim.get("looped", False))
-                offsets = anim.get("offsets")
-                self._update_animation_settings(
-                    settings_manager,
-                    png_filename,
-                    anim_name,
-                    fps,
-                    indices=indices,
-                    loop=loop,
-                    scale=scale_value,
-                    offsets=offsets,
-                )
-            return True
+            return False
 
-        print(
-            f"Skipping {filename}: Not a FNF character data file or unsupported engine type."
-        )
-        return False
+        print(f"Found {character.engine} data for {filename}.")
+        if settings_manager:
+            result = ModImportResult(root=os.path.dirname(file_path))
+            result.characters.append(character)
+            apply_mod_import(result, settings_manager)
+        return True
 
     def _register_spritesheet_entry(
         self,
@@ -239,49 +167,3 @@ class CharacterData:
         if listbox_data_callback:
             listbox_data_callback(file_path)
         return png_filename
-
-    def _update_animation_settings(
-        self,
-        settings_manager,
-        png_filename,
-        anim_name,
-        fps,
-        indices=None,
-        loop=False,
-        scale=1,
-        offsets=None,
-        flip_x=False,
-    ):
-        """Store animation settings in the settings manager.
-
-        Args:
-            settings_manager: Manager to receive animation settings.
-            png_filename: Spritesheet filename prefix.
-            anim_name: Animation name within the spritesheet.
-            fps: Frame rate for the animation (converted to duration in ms).
-            indices: Optional list of frame indices.
-            loop: Whether the animation loops continuously.
-            scale: Sprite scale factor.
-            offsets: Optional (x, y) offset values.
-            flip_x: Whether the sprite is horizontally flipped.
-        """
-        if not settings_manager or not png_filename or not anim_name:
-            return
-
-        full_anim_name = f"{png_filename}/{anim_name}"
-        # Convert fps to duration in milliseconds
-        duration_ms = max(1, round(1000 / fps)) if fps > 0 else 42
-        settings = {"duration": duration_ms}
-
-        if scale not in (None, 1):
-            settings["scale"] = scale
-        if indices:
-            settings["indices"] = indices
-        if loop:
-            settings["delay"] = 0
-
-        alignment = build_alignment_overrides(offsets, scale=scale, flip_x=flip_x)
-        if alignment:
-            settings["alignment_overrides"] = alignment
-
-        settings_manager.set_animation_settings(full_anim_name, **settings)
@@ -78,13 +78,13 @@ def _is_psych_engine(data: Any) -> bool:
     Returns:
         True if the structure matches Psych Engine format.
     """
-    animations = data.get("animations") if isinstance(data, Mapping) else None
+    animations = data.get("animations") if isinstance(data, (dict, Mapping)) else None
     if not isinstance(animations, list):
         return False
 
     required_keys = {"name", "fps", "anim", "loop", "indices"}
     for anim in animations:
-        if not isinstance(anim, Mapping):
+        if not isinstance(anim, (dict, Mapping)):
             return False
         if not required_keys.issubset(anim.keys()):
             return False
@@ -104,7 +104,7 @@ def _is_kade_engine(data: Any) -> bool:
     Returns:
         True if the structure matches Kade Engine format.
     """
-    if not isinstance(data, Mapping):
+    if not isinstance(data, (dict, Mapping)):
         return False
     required_keys = {"name", "asset", "startingAnim", "animations"}
     if not required_keys.issubset(data.keys()):
@@ -115,7 +115,7 @@ def _is_kade_engine(data: Any) -> bool:
         return False
 
     for anim in animations:
-        if not isinstance(anim, Mapping):
+        if not isinstance(anim, (dict, Mapping)):
             return False
         if not {"name", "prefix", "offsets"}.issubset(anim.keys()):
             return False
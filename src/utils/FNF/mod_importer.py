@@ -0,0 +1,410 @@
+#!/usr/bin/env python3
+"""Bulk import of FNF character settings from a whole mod folder.
+
+``index_mod_folder`` walks a mod once, collecting its character data files
+and the spritesheets under ``images/``. ``collect_mod_characters`` parses
+every character file on a thread pool and resolves each character's atlas
+through that index, and ``apply_mod_import`` hands all animation settings to
+``SettingsManager`` in one batch. ``import_mod_folder`` runs all three.
+
+``parse_character_file`` is also used for single-file imports; it has no
+side effects, so it can run on any thread.
+"""
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from utils.FNF.alignment import build_alignment_overrides
+from utils.FNF.anim_utils import parse_indices_attribute, parse_xml_offsets
+from utils.FNF.engine_detector import detect_engine
+from utils.utilities import Utilities
+
+CHARACTER_EXTENSIONS = (".json", ".xml")
+IMAGE_EXTENSIONS = (".png",)
+MAX_AUTO_WORKERS = 8
+
+AnimationSettings = Dict[str, Any]
+
+
+@dataclass
+class ModIndex:
+    """Character files and spritesheets found in one mod folder.
+
+    Attributes:
+        root: Mod folder that was indexed.
+        character_files: Candidate character data files, sorted by path.
+        images: Spritesheet paths keyed by lower-case path relative to an
+            ``images`` folder, without extension (``characters/bf``).
+        image_stems: Spritesheet paths keyed by lower-case file stem. Stems
+            shared by several images are left out.
+    """
+
+    root: str
+    character_files: List[str] = field(default_factory=list)
+    images: Dict[str, str] = field(default_factory=dict)
+    image_stems: Dict[str, str] = field(default_factory=dict)
+
+    def resolve_image(self, hint: Optional[str]) -> Optional[str]:
+        """Return the spritesheet for an image reference, if indexed.
+
+        Args:
+            hint: Image reference from character data, such as
+                ``characters/BOYFRIEND`` or ``BOYFRIEND.png``.
+
+        Returns:
+            Path of the matching spritesheet, or ``None``.
+        """
+        key = _image_key(hint or "")
+        if not key:
+            return None
+        if key.startswith("images/"):
+            key = key[len("images/") :]
+        return self.images.get(key) or self.image_stems.get(key.rsplit("/", 1)[-1])
+
+
+@dataclass
+class CharacterImport:
+    """Animation settings parsed from one character file.
+
+    Attributes:
+        file_path: Character data file.
+        engine: Detected engine name.
+        png_filename: Spritesheet filename the settings are stored under.
+        atlas_path: Spritesheet resolved through a ``ModIndex``, if any.
+        animations: ``(animation_name, settings)`` pairs in file order.
+    """
+
+    file_path: str
+    engine: str
+    png_filename: str
+    atlas_path: Optional[str] = None
+    animations: List[Tuple[str, AnimationSettings]] = field(default_factory=list)
+
+    def settings_by_animation(self) -> Dict[str, AnimationSettings]:
+        """Return the settings keyed as ``SettingsManager`` stores them."""
+        return {
+            f"{self.png_filename}/{name}": settings
+            for name, settings in self.animations
+        }
+
+
+@dataclass
+class ModImportResult:
+    """Outcome of parsing the character files of a mod.
+
+    Attributes:
+        root: Mod folder that was imported.
+        characters: Parsed characters in path order.
+        skipped: Files that were not recognized as FNF character data.
+        animation_count: Animation settings applied by ``apply_mod_import``.
+    """
+
+    root: str
+    characters: List[CharacterImport] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+    animation_count: int = 0
+
+    @property
+    def missing_atlases(self) -> List[CharacterImport]:
+        """Characters whose spritesheet was not found in the mod."""
+        return [character for character in self.characters if not character.atlas_path]
+
+
+def _image_key(path: str) -> str:
+    """Normalise an image reference for index lookups."""
+    return os.path.splitext(path.replace("\\", "/").strip("/"))[0].lower()
+
+
+def index_mod_folder(root: str) -> ModIndex:
+    """Walk a mod folder once and index its character files and images.
+
+    Character files are ``.json``/``.xml`` files inside a ``characters``
+    folder, or directly in ``root`` when a characters folder itself was
+    chosen. Images are ``.png`` files below an ``images`` folder.
+
+    Args:
+        root: Mod folder to index.
+
+    Returns:
+        The populated ``ModIndex``.
+    """
+    index = ModIndex(root=root)
+    stems: Dict[str, List[str]] = {}
+
+    for directory, subdirectories, filenames in os.walk(root):
+        subdirectories.sort()
+        relative = os.path.relpath(directory, root)
+        parts = [] if relative == "." else relative.replace("\\", "/").split("/")
+        lowered = [part.lower() for part in parts]
+
+        if "images" in lowered:
+            image_root = parts[: len(lowered) - lowered[::-1].index("images")]
+            image_dir = "/".join(parts[len(image_root) :])
+            for filename in filenames:
+                stem, extension = os.path.splitext(filename)
+                if extension.lower() not in IMAGE_EXTENSIONS:
+                    continue
+                path = os.path.join(directory, filename)
+                key = _image_key(f"{image_dir}/{stem}" if image_dir else stem)
+                index.images.setdefault(key, path)
+                stems.setdefault(stem.lower(), []).append(path)
+            continue
+
+        if parts and "characters" not in lowered:
+            continue
+        for filename in filenames:
+            if filename.lower().endswith(CHARACTER_EXTENSIONS):
+                index.character_files.append(os.path.join(directory, filename))
+
+    index.character_files.sort()
+    index.image_stems = {
+        stem: paths[0] for stem, paths in stems.items() if len(paths) == 1
+    }
+    return index
+
+
+@lru_cache(maxsize=4096)
+def _animation_key(raw_name: str) -> str:
+    """Strip frame numbers from an animation name.
+
+    Mods reuse the same few names (``idle``, ``singLEFT``...) in every
+    character file, so results are memoized.
+    """
+    return Utilities.strip_trailing_digits(raw_name)
+
+
+def build_animation_settings(
+    fps,
+    indices=None,
+    loop=False,
+    scale=1,
+    offsets=None,
+    flip_x=False,
+) -> AnimationSettings:
+    """Translate FNF animation fields into ``SettingsManager`` settings.
+
+    Args:
+        fps: Frame rate for the animation (converted to duration in ms).
+        indices: Optional list of frame indices.
+        loop: Whether the animation loops continuously.
+        scale: Sprite scale factor.
+        offsets: Optional (x, y) offset values.
+        flip_x: Whether the sprite is horizontally flipped.
+
+    Returns:
+        Settings for one animation.
+    """
+    duration_ms = max(1, round(1000 / fps)) if fps > 0 else 42
+    settings: AnimationSettings = {"duration": duration_ms}
+
+    if scale not in (None, 1):
+        settings["scale"] = scale
+    if indices:
+        settings["indices"] = indices
+    if loop:
+        settings["delay"] = 0
+
+    alignment = build_alignment_overrides(offsets, scale=scale, flip_x=flip_x)
+    if alignment:
+        settings["alignment_overrides"] = alignment
+    return settings
+
+
+def _add_animation(character: CharacterImport, raw_name: str, **fields) -> None:
+    anim_name = _animation_key(raw_name)
+    if anim_name:
+        character.animations.append((anim_name, build_animation_settings(**fields)))
+
+
+def _png_filename(image_hint: str) -> str:
+    png_base = os.path.splitext(os.path.basename(image_hint))[0]
+    return f"{png_base}.png"
+
+
+def parse_character_file(
+    file_path: str, index: Optional[ModIndex] = None
+) -> Optional[CharacterImport]:
+    """Parse a Psych, Codename or Kade Engine character file.
+
+    Args:
+        file_path: Path to the character data file.
+        index: Optional mod index used to find the character's spritesheet.
+
+    Returns:
+        The parsed character, or ``None`` if the file is missing or is not
+        a supported FNF character file.
+    """
+    if not file_path or not os.path.exists(file_path):
+        return None
+
+    engine_type, parsed_data = detect_engine(file_path)
+    file_stem = os.path.splitext(os.path.basename(file_path))[0]
+
+    if engine_type == "Psych Engine" and parsed_data:
+        image_hints = [parsed_data.get("image", ""), file_stem]
+    elif engine_type == "Codename Engine" and parsed_data is not None:
+        image_hints = [file_stem, parsed_data.attrib.get("sprite", "")]
+    elif engine_type == "Kade Engine" and parsed_data:
+        image_hints = [file_stem, parsed_data.get("asset", "")]
+    else:
+        return None
+
+    atlas_path = None
+    if index is not None:
+        for hint in image_hints:
+            atlas_path = index.resolve_image(hint)
+            if atlas_path:
+                break
+    png_filename = _png_filename(
+        atlas_path or next((hint for hint in image_hints if hint), file_stem)
+    )
+    character = CharacterImport(file_path, engine_type, png_filename, atlas_path)
+
+    if engine_type == "Psych Engine":
+        scale = parsed_data.get("scale", 1)
+        for anim in parsed_data.get("animations", []):
+            _add_animation(
+                character,
+                anim.get("name", ""),
+                fps=anim.get("fps", 0),
+                indices=anim.get("indices") or None,
+                loop=bool(anim.get("loop", False)),
+                scale=scale,
+                offsets=anim.get("offsets"),
+                flip_x=parsed_data.get("flip_x", False),
+            )
+    elif engine_type == "Codename Engine":
+        try:
+            scale = float(parsed_data.attrib.get("scale", 1))
+        except (TypeError, ValueError):
+            scale = 1
+        for anim in parsed_data.findall("anim"):
+            _add_animation(
+                character,
+                anim.get("name", ""),
+                fps=int(anim.get("fps", 0)),
+                indices=parse_indices_attribute(anim.get("indices")),
+                loop=anim.get("loop", "false").lower() == "true",
+                scale=scale,
+                offsets=parse_xml_offsets(anim),
+            )
+    else:
+        fps = parsed_data.get("frameRate", 0)
+        scale = parsed_data.get("scale", 1)
+        for anim in parsed_data.get("animations", []):
+            _add_animation(
+                character,
+                anim.get("name", ""),
+                fps=fps,
+                indices=anim.get("frameIndices") or None,
+                loop=bool(anim.get("looped", False)),
+                scale=scale,
+                offsets=anim.get("offsets"),
+            )
+    return character
+
+
+def parse_character_files(
+    file_paths: Sequence[str],
+    index: Optional[ModIndex] = None,
+    max_workers: Optional[int] = None,
+) -> List[Optional[CharacterImport]]:
+    """Parse many character files in parallel.
+
+    Args:
+        file_paths: Character data files.
+        index: Optional mod index used to find spritesheets.
+        max_workers: Parser thread count, or ``None`` for one per CPU (up to
+            ``MAX_AUTO_WORKERS``).
+
+    Returns:
+        One result per path, in the same order; ``None`` for skipped files.
+    """
+    if max_workers is None:
+        max_workers = min(os.cpu_count() or 1, MAX_AUTO_WORKERS)
+    workers = max(1, min(int(max_workers), len(file_paths)))
+    if workers == 1:
+        return [parse_character_file(path, index) for path in file_paths]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(lambda path: parse_character_file(path, index), file_paths))
+
+
+def collect_mod_characters(
+    root: str, max_workers: Optional[int] = None
+) -> ModImportResult:
+    """Index a mod folder and parse all of its character files.
+
+    Args:
+        root: Mod folder, or a ``characters`` folder inside one.
+        max_workers: Parser thread count; see ``parse_character_files``.
+
+    Returns:
+        Parsed characters and skipped files. Nothing is applied yet.
+    """
+    index = index_mod_folder(root)
+    result = ModImportResult(root=root)
+    parsed = parse_character_files(index.character_files, index, max_workers)
+    for file_path, character in zip(index.character_files, parsed):
+        if character is None:
+            result.skipped.append(file_path)
+        else:
+            result.characters.append(character)
+    return result
+
+
+def apply_mod_import(result: ModImportResult, settings_manager) -> int:
+    """Store the settings of every parsed character in one batch.
+
+    Characters are applied in path order, so when two characters define the
+    same spritesheet animation the later file wins, as with one-by-one
+    imports.
+
+    Args:
+        result: Output of ``collect_mod_characters``.
+        settings_manager: Manager to receive the animation settings.
+
+    Returns:
+        Number of animation settings applied.
+    """
+    batch: Dict[str, AnimationSettings] = {}
+    for character in result.characters:
+        batch.update(character.settings_by_animation())
+    settings_manager.set_animation_settings_batch(batch)
+    result.animation_count = len(batch)
+    return result.animation_count
+
+
+def import_mod_folder(
+    root: str, settings_manager, max_workers: Optional[int] = None
+) -> ModImportResult:
+    """Import the animation settings of every character in a mod folder.
+
+    Args:
+        root: Mod folder, or a ``characters`` folder inside one.
+        settings_manager: Manager to receive the animation settings.
+        max_workers: Parser thread count; see ``parse_character_files``.
+
+    Returns:
+        The import result, with ``animation_count`` filled in.
+    """
+    result = collect_mod_characters(root, max_workers)
+    apply_mod_import(result, settings_manager)
+    return result
+
+
+__all__ = [
+    "CharacterImport",
+    "ModImportResult",
+    "ModIndex",
+    "apply_mod_import",
+    "build_animation_settings",
+    "collect_mod_characters",
+    "import_mod_folder",
+    "index_mod_folder",
+    "parse_character_file",
+    "parse_character_files",
+]
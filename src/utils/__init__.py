@@ -5,6 +5,7 @@
 Modules:
     app_config: Persistent application configuration backed by JSON.
     dependencies_checker: Verification of required external tools.
+    image_pool: Process-wide pool of decoded atlas images.
     settings_manager: Per-animation and per-spritesheet override settings.
     translation_manager: Qt translation loading and language detection.
     transparency_utils: Alpha channel and transparency helpers.
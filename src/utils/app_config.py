@@ -1,8 +1,17 @@
-"""Persistent application configuration backed by a JSON file."""
+"""Persistent application configuration backed by a JSON file.
+
+Setters update the in-memory settings and schedule a write, so a burst of
+changes is saved once; every write replaces the file atomically.
+"""
 
 import os
 import json
 
+from utils.persistence import DebouncedWriter, atomic_write_text
+
+OVERRIDES_STORE_FILENAME = "settings_overrides.db"
+METADATA_CACHE_DIRNAME = "metadata_cache"
+
 
 class AppConfig:
     """Manage persistent application settings stored in a JSON file.
@@ -164,6 +173,7 @@ class AppConfig:
             )
         self.config_path = os.path.abspath(config_path)
         self.settings = dict(self.DEFAULTS)
+        self._writer = DebouncedWriter(self._write_scheduled, name="config")
 
         if not os.path.isfile(self.config_path):
             print(
@@ -186,7 +196,7 @@ class AppConfig:
         )
 
     def set_extraction_defaults(self, **kwargs):
-        """Update extraction defaults and persist to disk.
+        """Update extraction defaults and schedule a save.
 
         Args:
             **kwargs: Key-value pairs to merge into extraction defaults.
@@ -194,7 +204,6 @@ class AppConfig:
         defaults = self.get_extraction_defaults()
         defaults.update(kwargs)
         self.set("extraction_defaults", defaults)
-        self.save()
 
     def get_editor_settings(self):
         """Return a copy of the editor settings."""
@@ -228,16 +237,57 @@ class AppConfig:
                 pass
 
     def save(self):
-        """Write the current settings to the config file."""
+        """Write the current settings to the config file now.
 
+        The file is replaced atomically and any scheduled save is dropped.
+        """
+
+        self._writer.cancel()
         try:
-            with open(self.config_path, "w", encoding="utf-8") as f:
-                json.dump(self.settings, f, indent=4)
-            print(f"[Config] Configuration saved to '{self.config_path}'.")
+            self._write_file()
         except Exception as e:
             print(f"[Config] Failed to save configuration: {e}")
             pass
 
+    def flush(self):
+        """Run a scheduled save now, if one is pending."""
+
+        self._writer.flush()
+
+    def _schedule_save(self):
+        self._writer.schedule()
+
+    def _write_file(self):
+        atomic_write_text(self.config_path, json.dumps(self.settings, indent=4))
+        print(f"[Config] Configuration saved to '{self.config_path}'.")
+
+    def _write_scheduled(self):
+        try:
+            self._write_file()
+        except RuntimeError:
+            # Settings changed while being serialised; write them again later.
+            self._writer.schedule()
+        except Exception as e:
+            print(f"[Config] Failed to save configuration: {e}")
+
+    def get_overrides_store_path(self):
+        """Return the path of the per-folder settings override store.
+
+        The store lives next to the config file.
+        """
+
+        return os.path.join(
+            os.path.dirname(self.config_path), OVERRIDES_STORE_FILENAME
+        )
+
+    def get_metadata_cache_dir(self):
+        """Return the directory of the persisted metadata cache.
+
+        The directory lives next to the config file.
+        """
+
+        return os.path.join(os.path.dirname(self.config_path), METADATA_CACHE_DIRNAME)
+
     def migrate(self):
         """Add missing defaults and remove obsolete keys, then save if changed."""
 
@@ -310,7 +360,7 @@ class AppConfig:
         )
 
     def set(self, key, value):
-        """Store a setting value and persist to disk.
+        """Store a setting value and schedule a save.
 
         Args:
             key: Setting name.
@@ -318,7 +368,7 @@ class AppConfig:
         """
         print(f"[Config] Setting '{key}' to: {value}")
         self.settings[key] = value
-        self.save()
+        self._schedule_save()
 
     def get_compression_defaults(self, format_name=None):
         """Return compression defaults for one or all formats.
@@ -413,7 +463,7 @@ class AppConfig:
             if "interface" not in self.settings:
                 self.settings["interface"] = {}
             self.settings["interface"]["last_input_directory"] = directory
-            self.save()
+            self._schedule_save()
 
     def get_last_output_directory(self):
         """Return the last output directory if remembering is enabled."""
@@ -434,7 +484,7 @@ class AppConfig:
             if "interface" not in self.settings:
                 self.settings["interface"] = {}
             self.settings["interface"]["last_output_directory"] = directory
-            self.save()
+            self._schedule_save()
 
     def get_remember_input_directory(self):
         """Return True if the last input directory should be remembered."""
@@ -452,7 +502,7 @@ class AppConfig:
         self.settings["interface"]["remember_input_directory"] = remember
         if not remember:
             self.settings["interface"]["last_input_directory"] = ""
-        self.save()
+        self._schedule_save()
 
     def get_remember_output_directory(self):
         """Return True if the last output directory should be remembered."""
@@ -470,7 +520,7 @@ class AppConfig:
         self.settings["interface"]["remember_output_directory"] = remember
         if not remember:
             self.settings["interface"]["last_output_directory"] = ""
-        self.save()
+        self._schedule_save()
 
     def get_language(self):
         """Return the stored language code, or 'auto' for system default."""
@@ -478,13 +528,13 @@ class AppConfig:
         return self.settings.get("language", "auto")
 
     def set_language(self, language_code):
-        """Set the application language and persist to disk.
+        """Set the application language and schedule a save.
 
         Args:
             language_code: Language code (e.g. 'en', 'es') or 'auto'.
         """
         self.settings["language"] = language_code
-        self.save()
+        self._schedule_save()
 
     def get_effective_language(self):
         """Return the resolved language code.
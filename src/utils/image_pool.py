@@ -0,0 +1,216 @@
+"""Process-wide pool of decoded atlas images.
+
+Provides ``DecodedImagePool``, which decodes an image file to RGBA once and
+hands the same ``Image`` to every caller until the file changes on disk.
+Background detection for unknown sheets, atlas parsing, extraction,
+previews and the editor all read the same atlases, so sharing the decoded
+pixels avoids decoding each file two or three times per run.
+
+Entries are keyed by absolute path, modification time and file size, and
+are reference counted: an image stays in memory while any caller holds it.
+Released entries are kept in least-recently-used order and evicted once the
+pool exceeds its byte budget.
+
+Pooled images are shared between threads and callers. They must be treated
+as read-only and must never be closed; call ``release`` instead.
+"""
+
+from __future__ import annotations
+
+import os
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from threading import Event, Lock
+from typing import Dict, Iterator, Optional, Tuple
+
+from PIL import Image
+
+DEFAULT_POOL_BYTES = 512 * 1024 * 1024
+
+PoolKey = Tuple[str, int, int]
+
+
+@dataclass(eq=False)
+class _PoolEntry:
+    """One decoded image and its reference count."""
+
+    key: PoolKey
+    image: Image.Image
+    nbytes: int
+    refs: int = 0
+
+
+class DecodedImagePool:
+    """Share decoded RGBA images between callers with an LRU byte budget.
+
+    Attributes:
+        max_bytes: Budget for decoded bytes held by released entries.
+        hits: Acquisitions answered without decoding.
+        misses: Acquisitions that had to decode the file.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_POOL_BYTES) -> None:
+        """Create an empty pool.
+
+        Args:
+            max_bytes: Byte budget; entries in use are never evicted, so the
+                pool may exceed it temporarily.
+        """
+        self.max_bytes = max(0, int(max_bytes))
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[PoolKey, _PoolEntry]" = OrderedDict()
+        self._by_image: Dict[int, _PoolEntry] = {}
+        self._loading: Dict[PoolKey, Event] = {}
+        self._cached_bytes = 0
+        self._lock = Lock()
+
+    @property
+    def cached_bytes(self) -> int:
+        """Decoded bytes currently held by the pool."""
+        with self._lock:
+            return self._cached_bytes
+
+    def acquire(self, path: str) -> Image.Image:
+        """Return the decoded RGBA image for ``path``, decoding it if needed.
+
+        Concurrent callers asking for the same file wait for a single decode.
+        Every call must be paired with ``release``.
+
+        Args:
+            path: Image file path.
+
+        Returns:
+            Shared, read-only RGBA ``Image``.
+
+        Raises:
+            OSError: If the file cannot be read or decoded.
+        """
+        key = self._make_key(path)
+        while True:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    entry.refs += 1
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry.image
+                loading = self._loading.get(key)
+                if loading is None:
+                    loading = self._loading[key] = Event()
+                    self.misses += 1
+                    break
+            loading.wait()
+
+        try:
+            with Image.open(path) as source:
+                image = source.convert("RGBA")
+        except BaseException:
+            with self._lock:
+                self._loading.pop(key, None)
+            loading.set()
+            raise
+
+        entry = _PoolEntry(key, image, image.width * image.height * 4, refs=1)
+        with self._lock:
+            self._drop_stale(key)
+            self._entries[key] = entry
+            self._by_image[id(image)] = entry
+            self._cached_bytes += entry.nbytes
+            self._loading.pop(key, None)
+            self._evict()
+        loading.set()
+        return image
+
+    def release(self, image: Optional[Image.Image]) -> None:
+        """Give back an image obtained from ``acquire``.
+
+        Args:
+            image: Pooled image; ``None`` and foreign images are ignored.
+        """
+        if image is None:
+            return
+        with self._lock:
+            entry = self._by_image.get(id(image))
+            if entry is None or entry.image is not image or entry.refs <= 0:
+                return
+            entry.refs -= 1
+            self._evict()
+
+    @contextmanager
+    def lease(self, path: str) -> Iterator[Image.Image]:
+        """Context manager that acquires ``path`` and releases it on exit."""
+        image = self.acquire(path)
+        try:
+            yield image
+        finally:
+            self.release(image)
+
+    def is_pooled(self, image: Optional[Image.Image]) -> bool:
+        """Return ``True`` if ``image`` is currently held by the pool."""
+        if image is None:
+            return False
+        with self._lock:
+            entry = self._by_image.get(id(image))
+            return entry is not None and entry.image is image
+
+    def set_max_bytes(self, max_bytes: int) -> None:
+        """Change the byte budget and evict released entries above it."""
+        with self._lock:
+            self.max_bytes = max(0, int(max_bytes))
+            self._evict()
+
+    def clear(self) -> None:
+        """Drop every released entry. Images still in use are kept."""
+        with self._lock:
+            for key in [k for k, e in self._entries.items() if e.refs == 0]:
+                self._remove(key)
+
+    @staticmethod
+    def _make_key(path: str) -> PoolKey:
+        """Build the cache key for ``path`` from its stat information."""
+        stat = os.stat(path)
+        return (
+            os.path.normcase(os.path.abspath(path)),
+            stat.st_mtime_ns,
+            stat.st_size,
+        )
+
+    def _drop_stale(self, key: PoolKey) -> None:
+        """Forget released entries for the same path with an older stat."""
+        for other in [k for k in self._entries if k[0] == key[0] and k != key]:
+            if self._entries[other].refs == 0:
+                self._remove(other)
+
+    def _evict(self) -> None:
+        """Evict least recently used released entries until within budget."""
+        if self._cached_bytes <= self.max_bytes:
+            return
+        for key in list(self._entries):
+            if self._cached_bytes <= self.max_bytes:
+                break
+            if self._entries[key].refs == 0:
+                self._remove(key)
+
+    def _remove(self, key: PoolKey) -> None:
+        """Remove an entry from the pool without closing its image."""
+        entry = self._entries.pop(key)
+        self._by_image.pop(id(entry.image), None)
+        self._cached_bytes -= entry.nbytes
+
+
+_shared_pool: Optional[DecodedImagePool] = None
+_shared_pool_lock = Lock()
+
+
+def get_image_pool() -> DecodedImagePool:
+    """Return the process-wide decoded image pool, creating it on first use."""
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = DecodedImagePool()
+        return _shared_pool
+
+
+__all__ = ["DEFAULT_POOL_BYTES", "DecodedImagePool", "get_image_pool"]
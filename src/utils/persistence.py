@@ -0,0 +1,343 @@
+"""Write-behind persistence helpers for application and override settings.
+
+Provides ``atomic_write_text`` (temp file plus rename, so a crash never
+leaves a half-written file), ``DebouncedWriter`` (coalesces a burst of
+changes into one write once they have been quiet for a short delay),
+``TrackedDict`` (a dict that reports which top-level keys changed) and
+``OverrideStore`` (a SQLite keyed store for per-spritesheet and
+per-animation overrides, where saving a change rewrites only its row).
+
+Pending writes of every live ``DebouncedWriter`` are flushed when the
+interpreter exits.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import tempfile
+import time
+import weakref
+from threading import Lock, Thread
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+DEFAULT_WRITE_DELAY = 0.5
+
+OverrideKey = Tuple[str, str]
+
+_live_writers: "weakref.WeakSet[DebouncedWriter]" = weakref.WeakSet()
+
+
+def atomic_write_text(path: str, text: str) -> None:
+    """Replace ``path`` with ``text`` in one step.
+
+    Writes to a temporary file in the same directory, flushes it to disk and
+    renames it over the target, so readers see either the old or the new
+    content.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(
+        prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=directory
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as temp_file:
+            temp_file.write(text)
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+class DebouncedWriter:
+    """Run a write callback once changes have been quiet for ``delay``.
+
+    ``schedule`` may be called for every change; a single background thread
+    waits until no change arrived for ``delay`` seconds and then writes
+    once. ``flush`` writes pending changes immediately.
+
+    Attributes:
+        delay: Quiet period in seconds before a scheduled write runs.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[], None],
+        delay: float = DEFAULT_WRITE_DELAY,
+        name: str = "settings",
+    ) -> None:
+        """Create an idle writer.
+
+        Args:
+            write: Callback that persists the current state.
+            delay: Quiet period in seconds.
+            name: Label used for the background thread.
+        """
+        self.delay = delay
+        self._write = write
+        self._name = name
+        self._lock = Lock()
+        self._write_lock = Lock()
+        self._pending = False
+        self._deadline = 0.0
+        self._thread: Optional[Thread] = None
+        _live_writers.add(self)
+
+    @property
+    def pending(self) -> bool:
+        """True if a write has been scheduled but not run yet."""
+        with self._lock:
+            return self._pending
+
+    def schedule(self) -> None:
+        """Request a write after the quiet period, restarting the wait."""
+        with self._lock:
+            self._pending = True
+            self._deadline = time.monotonic() + self.delay
+            if self._thread is None:
+                self._thread = Thread(
+                    target=self._wait_and_write,
+                    name=f"{self._name}-writer",
+                    daemon=True,
+                )
+                self._thread.start()
+
+    def flush(self) -> None:
+        """Run a pending write now, waiting for one already in progress."""
+        with self._write_lock:
+            with self._lock:
+                if not self._pending:
+                    return
+                self._pending = False
+            self._write()
+
+    def cancel(self) -> None:
+        """Drop a pending write without running it."""
+        with self._lock:
+            self._pending = False
+
+    def _wait_and_write(self) -> None:
+        while True:
+            with self._lock:
+                if not self._pending:
+                    self._thread = None
+                    return
+                remaining = self._deadline - time.monotonic()
+                if remaining <= 0:
+                    self._thread = None
+                    break
+            time.sleep(remaining)
+        try:
+            self.flush()
+        except Exception as e:
+            print(f"[DebouncedWriter] Failed to write {self._name}: {e}")
+
+
+@atexit.register
+def _flush_live_writers() -> None:
+    for writer in list(_live_writers):
+        try:
+            writer.flush()
+        except Exception as e:
+            print(f"[DebouncedWriter] Failed to write on exit: {e}")
+
+
+class TrackedDict(dict):
+    """Dict that reports which of its top-level keys change.
+
+    ``on_change`` is called with the key after assignments and deletions,
+    and after ``setdefault``, whose result callers usually go on to modify
+    in place. Other in-place changes to values are not seen. Copies and
+    pickles are plain dicts.
+
+    Attributes:
+        on_change: Callback taking the changed key, or ``None``.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.on_change: Optional[Callable[[Any], None]] = None
+
+    def _changed(self, key) -> None:
+        if self.on_change is not None:
+            self.on_change(key)
+
+    def __setitem__(self, key, value) -> None:
+        super().__setitem__(key, value)
+        self._changed(key)
+
+    def __delitem__(self, key) -> None:
+        super().__delitem__(key)
+        self._changed(key)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+    def setdefault(self, key, default=None):
+        value = super().setdefault(key, default)
+        self._changed(key)
+        return value
+
+    def pop(self, key, *default):
+        found = key in self
+        value = super().pop(key, *default)
+        if found:
+            self._changed(key)
+        return value
+
+    def popitem(self):
+        key, value = super().popitem()
+        self._changed(key)
+        return key, value
+
+    def update(self, *args, **kwargs) -> None:
+        changes = dict(*args, **kwargs)
+        super().update(changes)
+        for key in changes:
+            self._changed(key)
+
+    def clear(self) -> None:
+        keys = list(self)
+        super().clear()
+        for key in keys:
+            self._changed(key)
+
+
+class OverrideStore:
+    """SQLite store of spritesheet and animation overrides.
+
+    Every override is one row keyed by scope, kind and name, so saving a
+    change touches only that row however many overrides are stored, and
+    each batch of changes is committed atomically. Scopes keep the
+    overrides of different input folders apart.
+
+    Attributes:
+        path: Database file path; created on first use.
+    """
+
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS overrides ("
+        "scope TEXT NOT NULL, kind TEXT NOT NULL, name TEXT NOT NULL, "
+        "value TEXT NOT NULL, PRIMARY KEY (scope, kind, name)) WITHOUT ROWID"
+    )
+
+    def __init__(self, path: str) -> None:
+        """Describe the store without opening it.
+
+        Args:
+            path: Database file path.
+        """
+        self.path = path
+        self._connection = None
+        self._lock = Lock()
+
+    def _connect(self):
+        if self._connection is None:
+            import sqlite3
+
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.execute(self._SCHEMA)
+            connection.commit()
+            self._connection = connection
+        return self._connection
+
+    def load(self, scope: str) -> Dict[str, Dict[str, Any]]:
+        """Return every override stored for ``scope``.
+
+        Returns:
+            Dict mapping each kind (e.g. ``"animation"``) to its overrides
+            keyed by name. Unreadable rows are skipped.
+        """
+        overrides: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            try:
+                rows = self._connect().execute(
+                    "SELECT kind, name, value FROM overrides WHERE scope = ?",
+                    (scope,),
+                ).fetchall()
+            except Exception as e:
+                print(f"[OverrideStore] Failed to load overrides: {e}")
+                return overrides
+        for kind, name, value in rows:
+            try:
+                overrides.setdefault(kind, {})[name] = json.loads(value)
+            except ValueError:
+                print(f"[OverrideStore] Skipping unreadable override '{name}'")
+        return overrides
+
+    def write(
+        self,
+        scope: str,
+        upserts: Iterable[Tuple[str, str, str]],
+        deletes: Iterable[OverrideKey] = (),
+    ) -> bool:
+        """Insert, replace and delete overrides in one transaction.
+
+        Args:
+            scope: Scope the overrides belong to.
+            upserts: ``(kind, name, json_value)`` rows to store.
+            deletes: ``(kind, name)`` rows to remove.
+
+        Returns:
+            True if the transaction was committed.
+        """
+        with self._lock:
+            try:
+                connection = self._connect()
+                with connection:
+                    connection.executemany(
+                        "INSERT OR REPLACE INTO overrides (scope, kind, name, value) "
+                        "VALUES (?, ?, ?, ?)",
+                        ((scope, kind, name, value) for kind, name, value in upserts),
+                    )
+                    connection.executemany(
+                        "DELETE FROM overrides "
+                        "WHERE scope = ? AND kind = ? AND name = ?",
+                        ((scope, kind, name) for kind, name in deletes),
+                    )
+                return True
+            except Exception as e:
+                print(f"[OverrideStore] Failed to save overrides: {e}")
+                return False
+
+    def clear(self, scope: str) -> None:
+        """Remove every override stored for ``scope``."""
+        with self._lock:
+            try:
+                connection = self._connect()
+                with connection:
+                    connection.execute(
+                        "DELETE FROM overrides WHERE scope = ?", (scope,)
+                    )
+            except Exception as e:
+                print(f"[OverrideStore] Failed to clear overrides: {e}")
+
+    def close(self) -> None:
+        """Close the database connection; it reopens on next use."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+__all__ = [
+    "DEFAULT_WRITE_DELAY",
+    "DebouncedWriter",
+    "OverrideStore",
+    "TrackedDict",
+    "atomic_write_text",
+]
@@ -4,9 +4,33 @@ Provides a three-tier settings hierarchy: global defaults, per-spritesheet
 overrides, and per-animation overrides. When retrieving settings, values
 merge from global → spritesheet → animation, with later tiers taking
 precedence.
+
+Resolved settings are cached per (spritesheet, animation) pair and returned
+as read-only mappings; any change to the settings invalidates the cache.
+Nested containers such as frame lists are copied for each caller, so
+changing them never reaches the cache or the stored overrides.
+
+Spritesheet and animation overrides can be persisted to an
+``OverrideStore``. Overrides are then scoped to the open input folder and
+every changed entry is written back, one row each, shortly after the
+change.
 """
 
+import copy
+import json
 import os
+from threading import Lock
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Set, Tuple
+
+from utils.persistence import DebouncedWriter, OverrideStore, TrackedDict
+
+SPRITESHEET_KIND = "spritesheet"
+ANIMATION_KIND = "animation"
+
+_NESTED_TYPES = (dict, list, set)
+
+_ResolvedEntry = Tuple[Mapping[str, Any], Tuple[str, ...]]
 
 
 class SettingsManager:
@@ -19,14 +43,141 @@ class SettingsManager:
         global_settings: Default settings applied to all sprites and animations.
         spritesheet_settings: Per-spritesheet setting overrides keyed by filename.
         animation_settings: Per-animation setting overrides keyed by animation name.
+        store: Store the overrides are persisted to, or ``None`` to keep
+            them in memory only.
+        scope: Scope of the overrides currently loaded from ``store``, or
+            ``None`` when no scope is open and changes are not persisted.
     """
 
-    def __init__(self) -> None:
-        """Initialize with empty settings dictionaries."""
+    def __init__(self, store: Optional[OverrideStore] = None) -> None:
+        """Initialize with empty settings dictionaries.
+
+        Args:
+            store: Optional store to persist overrides to once a scope has
+                been opened with ``open_scope``.
+        """
+
+        self.global_settings: dict = TrackedDict()
+        self.spritesheet_settings: dict = TrackedDict()
+        self.animation_settings: dict = TrackedDict()
+        self._generation = 0
+        self._resolved: Dict[Tuple[str, Optional[str]], _ResolvedEntry] = {}
+        self.store = store
+        self.scope: Optional[str] = None
+        self._dirty: Dict[str, Set[str]] = {
+            SPRITESHEET_KIND: set(),
+            ANIMATION_KIND: set(),
+        }
+        self._dirty_lock = Lock()
+        self._writer: Optional[DebouncedWriter] = None
+        if store is not None:
+            self._writer = DebouncedWriter(self._write_dirty, name="overrides")
+        self.global_settings.on_change = self._global_changed
+        self.spritesheet_settings.on_change = self._spritesheet_changed
+        self.animation_settings.on_change = self._animation_changed
+
+    def open_scope(self, directory: str) -> None:
+        """Load the stored overrides of an input folder.
+
+        Pending changes are written to the previous scope first. The
+        in-memory overrides are then replaced by those stored for
+        ``directory``; nothing is deleted from the store.
+
+        Args:
+            directory: Input folder whose overrides to load and persist.
+        """
+
+        self.close_scope()
+        if self.store is None:
+            return
+        self.scope = os.path.normcase(os.path.abspath(directory))
+        stored = self.store.load(self.scope)
+        dict.update(self.spritesheet_settings, stored.get(SPRITESHEET_KIND, {}))
+        dict.update(self.animation_settings, stored.get(ANIMATION_KIND, {}))
+        self._invalidate()
+
+    def close_scope(self, clear: bool = True) -> None:
+        """Write pending changes and stop persisting further ones.
 
-        self.global_settings: dict = {}
-        self.spritesheet_settings: dict = {}
-        self.animation_settings: dict = {}
+        Args:
+            clear: Also drop the in-memory overrides. Without a store the
+                overrides are simply cleared.
+        """
+
+        self.flush()
+        self.scope = None
+        with self._dirty_lock:
+            for keys in self._dirty.values():
+                keys.clear()
+        if clear:
+            dict.clear(self.spritesheet_settings)
+            dict.clear(self.animation_settings)
+            self._invalidate()
+
+    def flush(self) -> None:
+        """Write pending override changes to the store immediately."""
+
+        if self._writer is not None:
+            self._writer.flush()
+
+    def _invalidate(self) -> None:
+        self._generation += 1
+        if self._resolved:
+            self._resolved = {}
+
+    def _global_changed(self, key: str) -> None:
+        self._invalidate()
+
+    def _spritesheet_changed(self, key: str) -> None:
+        self._invalidate()
+        self._mark_dirty(SPRITESHEET_KIND, key)
+
+    def _animation_changed(self, key: str) -> None:
+        self._invalidate()
+        self._mark_dirty(ANIMATION_KIND, key)
+
+    def _mark_dirty(self, kind: str, key: str) -> None:
+        if self.scope is None or self._writer is None:
+            return
+        with self._dirty_lock:
+            self._dirty[kind].add(key)
+        self._writer.schedule()
+
+    def _write_dirty(self) -> None:
+        scope = self.scope
+        with self._dirty_lock:
+            dirty = {kind: keys for kind, keys in self._dirty.items() if keys}
+            self._dirty = {SPRITESHEET_KIND: set(), ANIMATION_KIND: set()}
+        if scope is None or not dirty:
+            return
+
+        sources = {
+            SPRITESHEET_KIND: self.spritesheet_settings,
+            ANIMATION_KIND: self.animation_settings,
+        }
+        upserts = []
+        deletes = []
+        try:
+            for kind, keys in dirty.items():
+                for key in keys:
+                    value = sources[kind].get(key)
+                    if value is None:
+                        deletes.append((kind, key))
+                    else:
+                        encoded = json.dumps(value, separators=(",", ":"), default=str)
+                        upserts.append((kind, key, encoded))
+        except RuntimeError:
+            # A value was modified while it was serialised; try again later.
+            with self._dirty_lock:
+                for kind, keys in dirty.items():
+                    self._dirty[kind].update(keys)
+            self._writer.schedule()
+            return
+
+        if not self.store.write(scope, upserts, deletes):
+            with self._dirty_lock:
+                for kind, keys in dirty.items():
+                    self._dirty[kind].update(keys)
 
     def set_global_settings(self, **kwargs) -> None:
         """Update global settings with the provided key-value pairs.
@@ -48,11 +199,10 @@ class SettingsManager:
             **kwargs: Setting names and values to store.
         """
 
-        self.spritesheet_settings[spritesheet_name] = {}
-        self.spritesheet_settings[spritesheet_name].update(kwargs)
-
-        if self.spritesheet_settings[spritesheet_name] == {}:
-            del self.spritesheet_settings[spritesheet_name]
+        if kwargs:
+            self.spritesheet_settings[spritesheet_name] = dict(kwargs)
+        else:
+            self.spritesheet_settings.pop(spritesheet_name, None)
 
     def set_animation_settings(self, animation_name: str, **kwargs) -> None:
         """Set or replace settings for a specific animation.
@@ -65,11 +215,27 @@ class SettingsManager:
             **kwargs: Setting names and values to store.
         """
 
-        self.animation_settings[animation_name] = {}
-        self.animation_settings[animation_name].update(kwargs)
+        if kwargs:
+            self.animation_settings[animation_name] = dict(kwargs)
+        else:
+            self.animation_settings.pop(animation_name, None)
 
-        if self.animation_settings[animation_name] == {}:
-            del self.animation_settings[animation_name]
+    def set_animation_settings_batch(self, settings_by_animation: dict) -> None:
+        """Set or replace settings for many animations at once.
+
+        Equivalent to calling ``set_animation_settings`` for every entry;
+        empty settings remove the animation's entry.
+
+        Args:
+            settings_by_animation: Settings dictionaries keyed by animation
+                identifier.
+        """
+
+        for animation_name, settings in settings_by_animation.items():
+            if settings:
+                self.animation_settings[animation_name] = dict(settings)
+            else:
+                self.animation_settings.pop(animation_name, None)
 
     def delete_spritesheet_settings(self, spritesheet_name: str) -> None:
         """Remove stored settings for a spritesheet if present.
@@ -91,12 +257,15 @@ class SettingsManager:
         if animation_name in self.animation_settings:
             del self.animation_settings[animation_name]
 
-    def get_settings(self, filename: str, animation_name: str | None = None) -> dict:
+    def get_settings(
+        self, filename: str, animation_name: str | None = None
+    ) -> Mapping[str, Any]:
         """Retrieve merged settings for a spritesheet or animation.
 
-        Builds a settings dictionary by layering global defaults, then
-        spritesheet overrides, then animation overrides. Lookups fall back
-        to basename matching if a full path doesn't match stored keys.
+        Layers global defaults, then spritesheet overrides, then animation
+        overrides. Lookups fall back to basename matching if a full path
+        doesn't match stored keys. The result is cached until any setting
+        changes, so repeated lookups in extraction loops are cheap.
 
         Args:
             filename: Spritesheet filename or path.
@@ -104,10 +273,36 @@ class SettingsManager:
                 settings.
 
         Returns:
-            Merged settings dictionary with all applicable overrides applied.
+            Read-only mapping of the merged settings. Nested dicts, lists and
+            sets are the caller's own copies. Copy the mapping with ``dict()``
+            to adjust values for a single use.
         """
 
-        settings = self.global_settings.copy()
+        key = (filename, animation_name)
+        resolved = self._resolved
+        entry = resolved.get(key)
+        if entry is None:
+            generation = self._generation
+            merged = self._resolve(filename, animation_name)
+            nested = tuple(
+                name
+                for name, value in merged.items()
+                if isinstance(value, _NESTED_TYPES)
+            )
+            entry = (MappingProxyType(merged), nested)
+            # Skip caching if the settings changed while they were merged.
+            if generation == self._generation:
+                resolved[key] = entry
+
+        settings, nested = entry
+        if not nested:
+            return settings
+        # Nested values are shared with the cache and the stored overrides.
+        copies = {name: copy.deepcopy(settings[name]) for name in nested}
+        return MappingProxyType({**settings, **copies})
+
+    def _resolve(self, filename: str, animation_name: Optional[str]) -> dict:
+        settings = dict(self.global_settings)
 
         spritesheet_settings = self.spritesheet_settings.get(filename)
         if not spritesheet_settings:
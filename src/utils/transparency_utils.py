@@ -4,8 +4,10 @@ Provides functions to composite RGBA images over checkerboard or solid
 backgrounds, making transparent regions visible in previews.
 """
 
+import numpy as np
+
 try:
-    from PIL import Image, ImageDraw
+    from PIL import Image
 
     PIL_AVAILABLE = True
 except ImportError:
@@ -35,15 +37,14 @@ def create_checkerboard_background(
     if not PIL_AVAILABLE:
         return None
 
-    img = Image.new("RGB", (width, height), color2)
-    draw = ImageDraw.Draw(img)
-
-    for y in range(0, height, square_size):
-        for x in range(0, width, square_size):
-            if (x // square_size + y // square_size) % 2 == 1:
-                draw.rectangle([x, y, x + square_size, y + square_size], fill=color1)
+    # Build the two alternating pixel rows once, then pick one per row.
+    square_size = max(1, int(square_size))
+    column_parity = (np.arange(width) // square_size) % 2
+    colors = np.array([color2, color1], dtype=np.uint8)
+    lines = np.stack([colors[column_parity], colors[1 - column_parity]])
+    pixels = lines[(np.arange(height) // square_size) % 2]
 
-    return img
+    return Image.fromarray(np.ascontiguousarray(pixels), "RGB")
 
 
 def composite_with_checkerboard(
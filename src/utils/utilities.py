@@ -10,6 +10,8 @@ import sys
 from string import Template
 from PySide6.QtCore import QCoreApplication
 
+_TRAILING_FRAME_NUMBER = re.compile(r"[_\s]*\d{1,4}(?:\.png)?$")
+
 
 class Utilities:
     """Static utility methods for common application tasks.
@@ -90,7 +92,7 @@ class Utilities:
         trailing underscores or whitespace.
         """
 
-        return re.sub(r"[_\s]*\d{1,4}(?:\.png)?$", "", name).rstrip("_").rstrip()
+        return _TRAILING_FRAME_NUMBER.sub("", name).rstrip("_").rstrip()
 
     @staticmethod
     def format_filename(
@@ -0,0 +1,791 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Benchmark the extraction and generation pipelines on synthetic atlases.
+
+This script:
+    1. Generates synthetic spritesheets (Sparrow XML, JSON hash, TXT and an
+       Adobe Spritemap project) with a configurable sprite count, atlas
+       width, animation count and format mix
+    2. Runs ``Extractor.extract_sprites`` on every sheet,
+       ``Extractor.extract_spritemap_project`` on the spritemap project,
+       ``AtlasGenerator.generate`` on the extracted frames and every
+       registered packer on the frame sizes, all headlessly
+    3. Records wall time, per-stage time, peak RSS and output bytes into a
+       JSON result that can be kept as a baseline
+    4. Compares a result against a baseline and flags regressions
+
+Each stage runs ``--repeat`` times and keeps its fastest time, so a single
+slow run caused by other processes does not count as a regression.
+
+Usage:
+    python benchmark_pipeline.py run [options] [--output result.json]
+        [--baseline baseline.json]
+    python benchmark_pipeline.py compare <baseline.json> <result.json>
+
+Example:
+    python benchmark_pipeline.py run --sprites 400 --animations 8 \\
+        --formats xml,spritemap --output baseline.json
+    python benchmark_pipeline.py run --baseline baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Add src to path for imports
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+import psutil
+from PIL import Image, ImageDraw
+
+RESULT_VERSION = 1
+SUPPORTED_FORMATS = ("xml", "json", "txt", "spritemap")
+DEFAULT_TIME_TOLERANCE = 0.15
+DEFAULT_MEMORY_TOLERANCE = 0.15
+DEFAULT_OUTPUT_TOLERANCE = 0.05
+# Differences below these floors are treated as noise.
+MIN_TIME_DELTA_SECONDS = 0.05
+MIN_MEMORY_DELTA_MB = 16.0
+
+
+@dataclass
+class WorkloadSpec:
+    """Shape of the synthetic workload.
+
+    Attributes:
+        sprites: Number of sprites in each generated spritesheet.
+        animations: Number of animations the sprites are split across.
+        atlas_size: Width of the generated atlases in pixels.
+        formats: Metadata formats to generate, one spritesheet each.
+        min_frame_size: Smallest sprite edge in pixels.
+        max_frame_size: Largest sprite edge in pixels.
+        animation_format: Animation format passed to the extractor.
+        frame_format: Frame format passed to the extractor.
+        seed: Seed for sprite sizes and contents.
+    """
+
+    sprites: int = 200
+    animations: int = 8
+    atlas_size: int = 2048
+    formats: List[str] = field(default_factory=lambda: list(SUPPORTED_FORMATS))
+    min_frame_size: int = 32
+    max_frame_size: int = 160
+    animation_format: str = "GIF"
+    frame_format: str = "PNG"
+    seed: int = 1234
+
+
+@dataclass
+class SyntheticSheet:
+    """A generated spritesheet and the files describing it."""
+
+    format: str
+    atlas_path: str
+    metadata_path: str
+    animation_json_path: Optional[str] = None
+
+
+@dataclass
+class Workload:
+    """Generated inputs shared by every benchmark stage.
+
+    Attributes:
+        sheets: Generated spritesheets, one per requested format.
+        frame_groups: Animation name to frame PNG paths, for the generator.
+        frame_sizes: ``(name, width, height)`` of every sprite, for packers.
+    """
+
+    sheets: List[SyntheticSheet]
+    frame_groups: Dict[str, List[str]]
+    frame_sizes: List[Tuple[str, int, int]]
+
+
+@dataclass
+class Regression:
+    """A metric that got worse than the baseline allows."""
+
+    stage: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+    def describe(self) -> str:
+        return (
+            f"{self.stage}: {self.metric} {self.baseline:.4g} -> "
+            f"{self.current:.4g} ({self.ratio - 1.0:+.1%})"
+        )
+
+
+class PeakRssSampler:
+    """Sample this process's resident set size on a background thread.
+
+    Use as a context manager around the code being measured; ``peak_mb``
+    holds the largest RSS seen, including the value at entry and exit.
+    """
+
+    def __init__(self, interval: float = 0.01) -> None:
+        self.interval = interval
+        self.peak_bytes = 0
+        self._process = psutil.Process()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def peak_mb(self) -> float:
+        return self.peak_bytes / (1024 * 1024)
+
+    def _sample(self) -> None:
+        try:
+            rss = self._process.memory_info().rss
+        except psutil.Error:
+            return
+        if rss > self.peak_bytes:
+            self.peak_bytes = rss
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def __enter__(self) -> "PeakRssSampler":
+        self._sample()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._sample()
+
+
+# ---------------------------------------------------------------------------
+# Synthetic workload
+# ---------------------------------------------------------------------------
+
+
+def _draw_sprite(rng: random.Random, width: int, height: int) -> Image.Image:
+    """Draw a sprite with transparent margins and a few colored shapes."""
+    image = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    margin = max(1, min(width, height) // 8)
+    for _ in range(3):
+        x0 = rng.randint(margin, max(margin, width // 2))
+        y0 = rng.randint(margin, max(margin, height // 2))
+        x1 = rng.randint(x0, width - margin)
+        y1 = rng.randint(y0, height - margin)
+        color = tuple(rng.randint(0, 255) for _ in range(3)) + (255,)
+        draw.ellipse((x0, y0, x1, y1), fill=color)
+    return image
+
+
+def _animation_name(index: int) -> str:
+    """Return a digit-free name so frame numbering never merges animations."""
+    letters = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(ord("a") + remainder) + letters
+    return f"anim_{letters}"
+
+
+def _animation_frames(spec: WorkloadSpec) -> List[Tuple[str, int]]:
+    """Return ``(animation_name, frame_count)`` pairs covering every sprite."""
+    animations = max(1, min(spec.animations, spec.sprites))
+    base, extra = divmod(spec.sprites, animations)
+    return [
+        (_animation_name(index), base + (1 if index < extra else 0))
+        for index in range(animations)
+    ]
+
+
+def _shelf_layout(
+    sizes: List[Tuple[int, int]], atlas_width: int
+) -> Tuple[List[Tuple[int, int]], int, int]:
+    """Place sprites left to right in rows; return positions and atlas size."""
+    positions: List[Tuple[int, int]] = []
+    x = y = row_height = used_width = 0
+    for width, height in sizes:
+        if x and x + width > atlas_width:
+            x = 0
+            y += row_height
+            row_height = 0
+        positions.append((x, y))
+        x += width
+        used_width = max(used_width, x)
+        row_height = max(row_height, height)
+    return positions, max(1, used_width), max(1, y + row_height)
+
+
+def _write_metadata(
+    sheet_format: str,
+    path: Path,
+    atlas_name: str,
+    sprites: List[Tuple[str, int, int, int, int]],
+    atlas_size: Tuple[int, int],
+) -> None:
+    """Write ``sprites`` as ``(name, x, y, w, h)`` in the requested format."""
+    if sheet_format == "xml":
+        rows = "".join(
+            f'\t<SubTexture name="{name}" x="{x}" y="{y}" '
+            f'width="{w}" height="{h}"/>\n'
+            for name, x, y, w, h in sprites
+        )
+        text = (
+            '<?xml version="1.0" encoding="utf-8"?>\n'
+            f'<TextureAtlas imagePath="{atlas_name}">\n{rows}</TextureAtlas>\n'
+        )
+    elif sheet_format == "json":
+        frames = {
+            name: {
+                "frame": {"x": x, "y": y, "w": w, "h": h},
+                "rotated": False,
+                "trimmed": False,
+                "spriteSourceSize": {"x": 0, "y": 0, "w": w, "h": h},
+                "sourceSize": {"w": w, "h": h},
+            }
+            for name, x, y, w, h in sprites
+        }
+        meta = {
+            "image": atlas_name,
+            "size": {"w": atlas_size[0], "h": atlas_size[1]},
+            "scale": "1",
+        }
+        text = json.dumps({"frames": frames, "meta": meta}, indent=1)
+    elif sheet_format == "txt":
+        text = "".join(f"{name} = {x} {y} {w} {h}\n" for name, x, y, w, h in sprites)
+    else:
+        raise ValueError(f"Unsupported metadata format: {sheet_format}")
+    path.write_text(text, encoding="utf-8")
+
+
+def _identity_matrix(tx: float = 0.0, ty: float = 0.0) -> List[float]:
+    return [1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, tx, ty, 0, 1]
+
+
+def _write_spritemap_project(
+    directory: Path,
+    sprites: List[Tuple[str, int, int, int, int]],
+    animations: List[Tuple[str, int]],
+    atlas_size: Tuple[int, int],
+) -> Tuple[str, str]:
+    """Write an Animation.json whose symbols show one atlas sprite per frame."""
+    spritemap = {
+        "ATLAS": {
+            "SPRITES": [
+                {
+                    "SPRITE": {
+                        "name": name,
+                        "x": x,
+                        "y": y,
+                        "w": w,
+                        "h": h,
+                        "rotated": False,
+                    }
+                }
+                for name, x, y, w, h in sprites
+            ]
+        },
+        "meta": {
+            "image": "spritemap1.png",
+            "size": {"w": atlas_size[0], "h": atlas_size[1]},
+            "resolution": "1",
+        },
+    }
+    symbols = []
+    sprite_iter = iter(sprites)
+    for animation_name, frame_count in animations:
+        frames = []
+        for index in range(frame_count):
+            name = next(sprite_iter)[0]
+            frames.append(
+                {
+                    "I": index,
+                    "DU": 1,
+                    "E": [{"ASI": {"N": name, "M3D": _identity_matrix()}}],
+                }
+            )
+        symbols.append(
+            {"SN": animation_name, "TL": {"L": [{"LN": "Layer 1", "FR": frames}]}}
+        )
+    document = {
+        "AN": {"N": "benchmark", "SN": "benchmark", "TL": {"L": []}},
+        "SD": {"S": symbols},
+        "MD": {"FRT": 24},
+    }
+    spritemap_path = directory / "spritemap1.json"
+    animation_path = directory / "Animation.json"
+    spritemap_path.write_text(json.dumps(spritemap), encoding="utf-8")
+    animation_path.write_text(json.dumps(document), encoding="utf-8")
+    return str(spritemap_path), str(animation_path)
+
+
+def generate_workload(spec: WorkloadSpec, directory: Path) -> Workload:
+    """Generate synthetic spritesheets and loose frames for ``spec``.
+
+    Every spritesheet holds the same sprites, so stages are comparable
+    across formats.
+
+    Args:
+        spec: Workload shape.
+        directory: Empty directory receiving the generated files.
+
+    Returns:
+        The generated ``Workload``.
+    """
+    unknown = [fmt for fmt in spec.formats if fmt not in SUPPORTED_FORMATS]
+    if unknown:
+        raise ValueError(f"Unsupported formats: {', '.join(unknown)}")
+
+    rng = random.Random(spec.seed)
+    animations = _animation_frames(spec)
+    names: List[str] = []
+    images: List[Image.Image] = []
+    for animation_name, frame_count in animations:
+        width = rng.randint(spec.min_frame_size, spec.max_frame_size)
+        height = rng.randint(spec.min_frame_size, spec.max_frame_size)
+        for index in range(frame_count):
+            names.append(f"{animation_name}{index:04d}")
+            images.append(_draw_sprite(rng, width, height))
+
+    sizes = [image.size for image in images]
+    positions, atlas_width, atlas_height = _shelf_layout(sizes, spec.atlas_size)
+    atlas = Image.new("RGBA", (atlas_width, atlas_height), (0, 0, 0, 0))
+    for image, position in zip(images, positions):
+        atlas.paste(image, position)
+    sprites = [
+        (name, x, y, w, h)
+        for name, (x, y), (w, h) in zip(names, positions, sizes)
+    ]
+
+    sheets: List[SyntheticSheet] = []
+    for sheet_format in spec.formats:
+        sheet_dir = directory / "input" / sheet_format
+        sheet_dir.mkdir(parents=True, exist_ok=True)
+        if sheet_format == "spritemap":
+            atlas_path = sheet_dir / "spritemap1.png"
+            atlas.save(atlas_path)
+            metadata_path, animation_path = _write_spritemap_project(
+                sheet_dir, sprites, animations, atlas.size
+            )
+            sheets.append(
+                SyntheticSheet(
+                    sheet_format, str(atlas_path), metadata_path, animation_path
+                )
+            )
+            continue
+        atlas_path = sheet_dir / f"synthetic_{sheet_format}.png"
+        atlas.save(atlas_path)
+        metadata_path = sheet_dir / f"synthetic_{sheet_format}.{sheet_format}"
+        _write_metadata(sheet_format, metadata_path, atlas_path.name, sprites, atlas.size)
+        sheets.append(SyntheticSheet(sheet_format, str(atlas_path), str(metadata_path)))
+
+    frames_dir = directory / "frames"
+    frames_dir.mkdir(parents=True, exist_ok=True)
+    frame_groups: Dict[str, List[str]] = {}
+    image_iter = iter(zip(names, images))
+    for animation_name, frame_count in animations:
+        paths = frame_groups.setdefault(animation_name, [])
+        for _ in range(frame_count):
+            name, image = next(image_iter)
+            frame_path = frames_dir / f"{name}.png"
+            image.save(frame_path, compress_level=1)
+            paths.append(str(frame_path))
+
+    frame_sizes = [(name, w, h) for name, _x, _y, w, h in sprites]
+    return Workload(sheets, frame_groups, frame_sizes)
+
+
+# ---------------------------------------------------------------------------
+# Stages
+# ---------------------------------------------------------------------------
+
+
+def _directory_bytes(path: Path) -> int:
+    total = 0
+    for root, _dirs, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    return total
+
+
+def _make_extractor(spec: WorkloadSpec):
+    """Create an ``Extractor`` exporting frames and animations for ``spec``."""
+    from core.extractor.extractor import Extractor
+    from utils.app_config import AppConfig
+    from utils.settings_manager import SettingsManager
+    from utils.version import APP_VERSION
+
+    settings_manager = SettingsManager()
+    settings_manager.set_global_settings(
+        **AppConfig.DEFAULTS["extraction_defaults"],
+    )
+    settings_manager.set_global_settings(
+        frame_export=spec.frame_format != "None",
+        frame_format=spec.frame_format,
+        animation_export=spec.animation_format != "None",
+        animation_format=spec.animation_format,
+    )
+    return Extractor(None, APP_VERSION, settings_manager)
+
+
+def _build_stages(
+    spec: WorkloadSpec, workload: Workload
+) -> List[Tuple[str, Callable[[Path], Dict[str, Any]]]]:
+    """Return ``(stage_name, run)`` pairs; ``run`` writes into a directory."""
+    stages: List[Tuple[str, Callable[[Path], Dict[str, Any]]]] = []
+
+    def extract_sheet(sheet: SyntheticSheet):
+        def run(output_dir: Path) -> Dict[str, Any]:
+            extractor = _make_extractor(spec)
+            if sheet.animation_json_path:
+                result = extractor.extract_spritemap_project(
+                    sheet.atlas_path,
+                    sheet.animation_json_path,
+                    sheet.metadata_path,
+                    str(output_dir),
+                    {},
+                )
+            else:
+                result = extractor.extract_sprites(
+                    sheet.atlas_path, sheet.metadata_path, str(output_dir), {}
+                )
+            if result.get("sprites_failed"):
+                raise RuntimeError(f"Extraction failed for {sheet.atlas_path}")
+            return {
+                "items": result.get("frames_generated", 0),
+                "animations": result.get("anims_generated", 0),
+            }
+
+        return run
+
+    for sheet in workload.sheets:
+        if sheet.animation_json_path:
+            name = "extract_spritemap_project"
+        else:
+            name = f"extract_sprites[{sheet.format}]"
+        stages.append((name, extract_sheet(sheet)))
+
+    def generate(output_dir: Path) -> Dict[str, Any]:
+        from core.generator.atlas_generator import AtlasGenerator, GeneratorOptions
+
+        generator = AtlasGenerator()
+        phases: Dict[str, float] = {}
+        last = [time.perf_counter(), None]
+
+        def on_progress(current: int, total: int, message: str) -> None:
+            now = time.perf_counter()
+            if last[1] is not None:
+                phases[last[1]] = round(now - last[0], 6)
+            last[0], last[1] = now, message.rstrip(".")
+
+        generator.set_progress_callback(on_progress)
+        result = generator.generate(
+            workload.frame_groups,
+            str(output_dir / "atlas"),
+            GeneratorOptions(max_width=8192, max_height=8192),
+        )
+        if not result.success:
+            raise RuntimeError("; ".join(result.errors))
+        return {"items": result.frame_count, "phases": phases}
+
+    stages.append(("atlas_generator", generate))
+
+    from packers import list_algorithms
+
+    for algorithm in list_algorithms():
+        algorithm_name = algorithm.get("name", "")
+        if not algorithm_name or algorithm_name == "auto":
+            continue
+
+        def pack_frames(output_dir: Path, algorithm_name=algorithm_name):
+            from core.generator.atlas_generator import GeneratorOptions
+            from packers import pack
+            from packers.packer_types import FrameInput
+
+            frames = [FrameInput(name, w, h) for name, w, h in workload.frame_sizes]
+            options = GeneratorOptions(max_width=8192, max_height=8192)
+            result = pack(algorithm_name, frames, options.to_packer_options())
+            if not result.success:
+                raise RuntimeError(f"{algorithm_name} could not pack the frames")
+            return {
+                "items": len(result.packed_frames),
+                "efficiency": round(result.efficiency, 4),
+            }
+
+        stages.append((f"pack[{algorithm_name}]", pack_frames))
+
+    return stages
+
+
+def run_benchmark(
+    spec: WorkloadSpec,
+    repeat: int = 3,
+    work_dir: Optional[str] = None,
+    stage_filter: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Generate the workload and time every stage.
+
+    Args:
+        spec: Workload shape.
+        repeat: Runs per stage; the fastest time is kept.
+        work_dir: Directory for inputs and outputs; a temporary directory is
+            used and removed when omitted.
+        stage_filter: Only run stages whose name contains this text.
+
+    Returns:
+        JSON-serialisable result dict.
+    """
+    owns_dir = work_dir is None
+    root = Path(work_dir or tempfile.mkdtemp(prefix="ta_benchmark_"))
+    root.mkdir(parents=True, exist_ok=True)
+    try:
+        started = time.perf_counter()
+        workload = generate_workload(spec, root)
+        stages: Dict[str, Dict[str, Any]] = {}
+        with PeakRssSampler() as total_sampler:
+            for stage_name, run in _build_stages(spec, workload):
+                if stage_filter and stage_filter not in stage_name:
+                    continue
+                best: Optional[Dict[str, Any]] = None
+                for attempt in range(max(1, repeat)):
+                    output_dir = root / "output" / f"{len(stages):02d}"
+                    shutil.rmtree(output_dir, ignore_errors=True)
+                    output_dir.mkdir(parents=True)
+                    with PeakRssSampler() as sampler:
+                        stage_start = time.perf_counter()
+                        details = run(output_dir)
+                        seconds = time.perf_counter() - stage_start
+                    measured = {
+                        "seconds": round(seconds, 6),
+                        "peak_rss_mb": round(sampler.peak_mb, 2),
+                        "output_bytes": _directory_bytes(output_dir),
+                        **details,
+                    }
+                    if best is None or seconds < best["seconds"]:
+                        best = measured
+                stages[stage_name] = best
+                print(
+                    f"  {stage_name:<32} {best['seconds']:>9.3f}s "
+                    f"{best['peak_rss_mb']:>9.1f} MB {best['output_bytes']:>12} B"
+                )
+        return {
+            "version": RESULT_VERSION,
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "environment": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "cpu_count": os.cpu_count(),
+            },
+            "spec": asdict(spec),
+            "wall_seconds": round(time.perf_counter() - started, 6),
+            "peak_rss_mb": round(total_sampler.peak_mb, 2),
+            "output_bytes": sum(stage["output_bytes"] for stage in stages.values()),
+            "stages": stages,
+        }
+    finally:
+        if owns_dir:
+            shutil.rmtree(root, ignore_errors=True)
+
+
+# ---------------------------------------------------------------------------
+# Comparison
+# ---------------------------------------------------------------------------
+
+
+def compare_results(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    time_tolerance: float = DEFAULT_TIME_TOLERANCE,
+    memory_tolerance: float = DEFAULT_MEMORY_TOLERANCE,
+    output_tolerance: float = DEFAULT_OUTPUT_TOLERANCE,
+) -> List[Regression]:
+    """Return the stage metrics in ``current`` that regressed from ``baseline``.
+
+    A metric regresses when it grows by more than its tolerance and by more
+    than the noise floor. Stages missing from either result are skipped.
+
+    Args:
+        baseline: Result dict recorded earlier.
+        current: Result dict to check.
+        time_tolerance: Allowed relative growth of stage time.
+        memory_tolerance: Allowed relative growth of peak RSS.
+        output_tolerance: Allowed relative growth of output bytes.
+
+    Returns:
+        List of ``Regression`` entries, empty when nothing regressed.
+    """
+    checks = (
+        ("seconds", time_tolerance, MIN_TIME_DELTA_SECONDS),
+        ("peak_rss_mb", memory_tolerance, MIN_MEMORY_DELTA_MB),
+        ("output_bytes", output_tolerance, 0),
+    )
+    if baseline.get("spec") != current.get("spec"):
+        print("Warning: baseline and current results used different workloads.")
+
+    regressions: List[Regression] = []
+    current_stages = current.get("stages", {})
+    for stage, old in baseline.get("stages", {}).items():
+        new = current_stages.get(stage)
+        if new is None:
+            continue
+        for metric, tolerance, floor in checks:
+            before = float(old.get(metric, 0))
+            after = float(new.get(metric, 0))
+            if after - before > max(before * tolerance, floor):
+                regressions.append(Regression(stage, metric, before, after))
+    return regressions
+
+
+def print_comparison(baseline: Dict[str, Any], current: Dict[str, Any]) -> None:
+    """Print the stage time change between two results."""
+    current_stages = current.get("stages", {})
+    for stage, old in baseline.get("stages", {}).items():
+        new = current_stages.get(stage)
+        if new is None:
+            print(f"  {stage:<32} missing from current result")
+            continue
+        before, after = old.get("seconds", 0), new.get("seconds", 0)
+        change = f"{after / before - 1.0:+.1%}" if before else "n/a"
+        print(f"  {stage:<32} {before:>9.3f}s -> {after:>9.3f}s  {change}")
+
+
+def _load_result(path: str) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as result_file:
+        return json.load(result_file)
+
+
+def _report(baseline: Dict[str, Any], current: Dict[str, Any], args) -> int:
+    print_comparison(baseline, current)
+    regressions = compare_results(
+        baseline,
+        current,
+        time_tolerance=args.time_tolerance,
+        memory_tolerance=args.memory_tolerance,
+        output_tolerance=args.output_tolerance,
+    )
+    if not regressions:
+        print("\nNo regressions.")
+        return 0
+    print(f"\n{len(regressions)} regression(s):")
+    for regression in regressions:
+        print(f"  {regression.describe()}")
+    return 1
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    tolerance_parent = argparse.ArgumentParser(add_help=False)
+    tolerance_parent.add_argument(
+        "--time-tolerance", type=float, default=DEFAULT_TIME_TOLERANCE
+    )
+    tolerance_parent.add_argument(
+        "--memory-tolerance", type=float, default=DEFAULT_MEMORY_TOLERANCE
+    )
+    tolerance_parent.add_argument(
+        "--output-tolerance", type=float, default=DEFAULT_OUTPUT_TOLERANCE
+    )
+
+    defaults = WorkloadSpec()
+    run_parser = subparsers.add_parser(
+        "run", parents=[tolerance_parent], help="Run the benchmark"
+    )
+    run_parser.add_argument("--sprites", type=int, default=defaults.sprites)
+    run_parser.add_argument("--animations", type=int, default=defaults.animations)
+    run_parser.add_argument("--atlas-size", type=int, default=defaults.atlas_size)
+    run_parser.add_argument(
+        "--formats",
+        default=",".join(defaults.formats),
+        help=f"Comma-separated subset of {', '.join(SUPPORTED_FORMATS)}",
+    )
+    run_parser.add_argument(
+        "--frame-size",
+        type=int,
+        nargs=2,
+        metavar=("MIN", "MAX"),
+        default=(defaults.min_frame_size, defaults.max_frame_size),
+    )
+    run_parser.add_argument(
+        "--animation-format", default=defaults.animation_format
+    )
+    run_parser.add_argument("--frame-format", default=defaults.frame_format)
+    run_parser.add_argument("--seed", type=int, default=defaults.seed)
+    run_parser.add_argument("--repeat", type=int, default=3)
+    run_parser.add_argument("--stage", help="Only run stages containing this text")
+    run_parser.add_argument("--work-dir", help="Keep inputs and outputs here")
+    run_parser.add_argument("--output", help="Write the result JSON here")
+    run_parser.add_argument("--baseline", help="Compare against this result")
+
+    compare_parser = subparsers.add_parser(
+        "compare", parents=[tolerance_parent], help="Compare two results"
+    )
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main entry point."""
+    args = _build_parser().parse_args(argv)
+
+    if args.command == "compare":
+        return _report(_load_result(args.baseline), _load_result(args.current), args)
+
+    spec = WorkloadSpec(
+        sprites=args.sprites,
+        animations=args.animations,
+        atlas_size=args.atlas_size,
+        formats=[fmt.strip() for fmt in args.formats.split(",") if fmt.strip()],
+        min_frame_size=min(args.frame_size),
+        max_frame_size=max(args.frame_size),
+        animation_format=args.animation_format,
+        frame_format=args.frame_format,
+        seed=args.seed,
+    )
+    print(f"Running benchmark: {asdict(spec)}")
+    result = run_benchmark(
+        spec, repeat=args.repeat, work_dir=args.work_dir, stage_filter=args.stage
+    )
+    print(
+        f"\nWall time: {result['wall_seconds']:.2f}s, "
+        f"peak RSS: {result['peak_rss_mb']:.1f} MB, "
+        f"output: {result['output_bytes']} bytes"
+    )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as result_file:
+            json.dump(result, result_file, indent=2)
+        print(f"Result written to {args.output}")
+
+    if args.baseline:
+        print(f"\nComparing against {args.baseline}:")
+        return _report(_load_result(args.baseline), result, args)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Tests for array-based atlas compositing."""
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+import numpy as np
+from PIL import Image
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from exporters.atlas_compositor import AtlasCompositor, AtlasPlacement
+
+
+def _random_sprite(seed: int, size: tuple[int, int]) -> Image.Image:
+    rng = np.random.default_rng(seed)
+    width, height = size
+    pixels = rng.integers(0, 256, (height, width, 4), dtype=np.uint8)
+    return Image.fromarray(pixels)
+
+
+def test_compositor_copies_pixels_exactly():
+    sprite_a = _random_sprite(1, (10, 6))
+    sprite_b = _random_sprite(2, (4, 8))
+
+    atlas = AtlasCompositor(20, 12).composite(
+        [AtlasPlacement(sprite_a, 0, 0), AtlasPlacement(sprite_b, 12, 2)]
+    )
+    result = np.asarray(atlas)
+
+    # Semi-transparent pixels must survive untouched (no alpha blending).
+    assert np.array_equal(result[0:6, 0:10], np.asarray(sprite_a))
+    assert np.array_equal(result[2:10, 12:16], np.asarray(sprite_b))
+    assert not result[6:, :10].any()
+
+
+def test_compositor_rotation_matches_pil_transpose():
+    sprite = _random_sprite(3, (7, 3))
+
+    atlas = AtlasCompositor(3, 7).composite([AtlasPlacement(sprite, 0, 0, -1)])
+
+    expected = sprite.transpose(Image.Transpose.ROTATE_270)
+    assert np.array_equal(np.asarray(atlas), np.asarray(expected))
+
+
+def test_compositor_clips_sprites_outside_atlas():
+    sprite = _random_sprite(4, (8, 8))
+
+    atlas = AtlasCompositor(6, 6).composite([AtlasPlacement(sprite, 2, -3)])
+    result = np.asarray(atlas)
+
+    assert np.array_equal(result[0:5, 2:6], np.asarray(sprite)[3:8, 0:4])
+    assert not result[:, :2].any()
+
+
+def test_parallel_stripes_match_serial_output():
+    placements = [
+        AtlasPlacement(_random_sprite(seed, (9, 13)), (seed % 6) * 10, (seed // 6) * 15)
+        for seed in range(30)
+    ]
+
+    serial = AtlasCompositor(60, 75, max_workers=1).composite(placements)
+    parallel = AtlasCompositor(60, 75, max_workers=4).composite(placements)
+
+    assert np.array_equal(np.asarray(serial), np.asarray(parallel))
+
+
+def test_compositor_converts_non_rgba_inputs():
+    rgb_sprite = Image.new("RGB", (4, 4), (10, 20, 30))
+
+    atlas = AtlasCompositor(4, 4).composite([AtlasPlacement(rgb_sprite, 0, 0)])
+
+    assert atlas.mode == "RGBA"
+    assert atlas.getpixel((1, 1)) == (10, 20, 30, 255)
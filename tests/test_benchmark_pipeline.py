@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Tests for the pipeline benchmark's workload generation and comparison."""
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+sys.path.insert(0, str(PROJECT_ROOT / "tests"))
+
+from benchmark_pipeline import (  # noqa: E402
+    WorkloadSpec,
+    compare_results,
+    generate_workload,
+    run_benchmark,
+)
+
+
+def _result(seconds: float, peak_rss_mb: float = 100.0, output_bytes: int = 1000):
+    return {
+        "spec": {},
+        "stages": {
+            "stage": {
+                "seconds": seconds,
+                "peak_rss_mb": peak_rss_mb,
+                "output_bytes": output_bytes,
+            }
+        },
+    }
+
+
+def test_synthetic_sheets_parse_to_the_same_sprites(tmp_path: Path):
+    from core.extractor.atlas_processor import AtlasProcessor
+
+    spec = WorkloadSpec(sprites=12, animations=3, formats=["xml", "json", "txt"])
+    workload = generate_workload(spec, tmp_path)
+
+    assert sorted(workload.frame_groups) == ["anim_a", "anim_b", "anim_c"]
+    for sheet in workload.sheets:
+        processor = AtlasProcessor(sheet.atlas_path, sheet.metadata_path)
+        try:
+            assert len(processor.sprites) == 12, sheet.format
+        finally:
+            processor.close()
+
+
+def test_packer_stages_are_recorded():
+    spec = WorkloadSpec(sprites=8, animations=2, formats=[])
+
+    result = run_benchmark(spec, repeat=1, stage_filter="pack[")
+
+    assert result["stages"]
+    assert all(name.startswith("pack[") for name in result["stages"])
+    assert all(stage["items"] == 8 for stage in result["stages"].values())
+
+
+def test_compare_flags_only_growth_beyond_tolerance_and_noise():
+    baseline = _result(1.0)
+
+    assert compare_results(baseline, _result(1.1)) == []
+    assert compare_results(_result(0.01), _result(0.03)) == []
+
+    regressions = compare_results(baseline, _result(1.5, output_bytes=2000))
+    assert [(r.stage, r.metric) for r in regressions] == [
+        ("stage", "seconds"),
+        ("stage", "output_bytes"),
+    ]
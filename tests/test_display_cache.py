@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Tests for cached display frames and checkerboard backgrounds."""
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+
+@pytest.fixture
+def qt_app():
+    """Create a Qt application so pixmaps can be allocated."""
+    from PySide6.QtWidgets import QApplication
+
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
+def _frame(color=(255, 0, 0, 128), size=8):
+    from PySide6.QtGui import QColor, QPixmap
+
+    pixmap = QPixmap(size, size)
+    pixmap.fill(QColor(*color))
+    return pixmap
+
+
+def test_composed_frames_are_reused(qt_app):
+    from gui.display_cache import BACKGROUND_CHECKERED, DisplayFrameCache
+
+    cache = DisplayFrameCache()
+    frame = _frame()
+
+    first = cache.get(frame, 2.0, BACKGROUND_CHECKERED)
+    second = cache.get(frame, 2.0, BACKGROUND_CHECKERED)
+    rescaled = cache.get(frame, 1.0, BACKGROUND_CHECKERED)
+
+    assert second is first
+    assert first.width() == 16
+    assert rescaled.width() == 8
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_other_configurations_are_evicted_first(qt_app):
+    from gui.display_cache import BACKGROUND_NONE, DisplayFrameCache
+
+    frame_bytes = 8 * 8 * 4
+    cache = DisplayFrameCache(max_bytes=2 * frame_bytes)
+    frames = [_frame() for _ in range(3)]
+
+    cache.get(frames[0], 1.5, BACKGROUND_NONE)
+    for frame in frames:
+        cache.get(frame, 1.0, BACKGROUND_NONE)
+
+    # The stale 1.5x entry made room first, then the third frame pushed out
+    # the least recently used one.
+    assert len(cache) == 2
+    cache.get(frames[2], 1.0, BACKGROUND_NONE)
+    cache.get(frames[1], 1.0, BACKGROUND_NONE)
+    assert cache.hits == 2
+    cache.get(frames[0], 1.0, BACKGROUND_NONE)
+    assert cache.hits == 2
+
+
+def test_full_cache_keeps_caching_new_frames(qt_app):
+    from gui.display_cache import BACKGROUND_NONE, DisplayFrameCache
+
+    cache = DisplayFrameCache(max_bytes=4 * 8 * 8 * 4)
+    for frame in [_frame() for _ in range(4)]:
+        cache.get(frame, 1.0, BACKGROUND_NONE)
+
+    # A regenerated animation brings new pixmaps with the same settings.
+    regenerated = [_frame((0, 255, 0, 255)) for _ in range(4)]
+    for frame in regenerated:
+        cache.get(frame, 1.0, BACKGROUND_NONE)
+    for frame in regenerated:
+        cache.get(frame, 1.0, BACKGROUND_NONE)
+
+    assert cache.hits == 4
+    assert cache.cached_bytes == 4 * 8 * 8 * 4
+
+
+def test_checkerboard_brush_and_image_match(qt_app):
+    from gui.display_cache import checkerboard_brush
+    from utils.transparency_utils import create_checkerboard_background
+
+    tile = checkerboard_brush(4, (10, 10, 10), (200, 200, 200)).texture().toImage()
+    image = create_checkerboard_background(8, 8, 4, (10, 10, 10), (200, 200, 200))
+
+    assert checkerboard_brush(4, (10, 10, 10), (200, 200, 200)) is checkerboard_brush(
+        4, (10, 10, 10), (200, 200, 200)
+    )
+    assert tile.pixelColor(0, 0).red() == 10
+    assert tile.pixelColor(4, 0).red() == 200
+    assert image.getpixel((0, 0)) == (200, 200, 200)
+    assert image.getpixel((4, 0)) == (10, 10, 10)
+    # Squares are exactly square_size wide; no one-pixel overlap.
+    assert image.getpixel((4, 4)) == (200, 200, 200)
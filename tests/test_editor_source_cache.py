@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Tests for the editor's cache of parsed animation sources."""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import sys
+
+from PIL import Image
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from core.editor.source_cache import EditorSourceCache  # noqa: E402
+
+
+def _write_sheet(directory: Path, name: str, frames: int = 3) -> tuple:
+    atlas_path = directory / f"{name}.png"
+    Image.new("RGBA", (16 * frames, 16), (255, 0, 0, 255)).save(atlas_path)
+    subtextures = "".join(
+        f'<SubTexture name="idle{index:04d}" x="{index * 16}" y="0" '
+        f'width="16" height="16"/>'
+        for index in range(frames)
+    )
+    metadata_path = directory / f"{name}.xml"
+    metadata_path.write_text(
+        f'<TextureAtlas imagePath="{name}.png">{subtextures}</TextureAtlas>',
+        encoding="utf-8",
+    )
+    return str(atlas_path), str(metadata_path)
+
+
+def test_sheet_is_parsed_once_and_frames_stream(tmp_path: Path):
+    cache = EditorSourceCache()
+    atlas_path, metadata_path = _write_sheet(tmp_path, "sheet")
+
+    first = cache.get_sprite_processor(atlas_path, metadata_path)
+    second = cache.get_sprite_processor(atlas_path, metadata_path)
+    sprites = first.match_animation_sprites("idle")
+    frames = list(first.iter_frames(sprites))
+
+    assert second is first
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert [name for name, _image, _meta in frames] == [
+        "idle0000",
+        "idle0001",
+        "idle0002",
+    ]
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_changed_metadata_rebuilds_source(tmp_path: Path):
+    cache = EditorSourceCache()
+    atlas_path, metadata_path = _write_sheet(tmp_path, "sheet")
+    old = cache.get_sprite_processor(atlas_path, metadata_path)
+
+    _write_sheet(tmp_path, "sheet", frames=2)
+    os.utime(metadata_path, ns=(0, 10**9))
+    new = cache.get_sprite_processor(atlas_path, metadata_path)
+
+    assert new is not old
+    assert len(new.sprites) == 2
+    assert old.sprites is None
+    cache.clear()
+
+
+def test_least_recently_used_source_is_closed(tmp_path: Path):
+    cache = EditorSourceCache(max_entries=1)
+    first = cache.get_sprite_processor(*_write_sheet(tmp_path, "first"))
+    cache.get_sprite_processor(*_write_sheet(tmp_path, "second"))
+
+    assert len(cache) == 1
+    assert first.sprites is None
+    cache.clear()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Tests for the bounded encode-and-write pipeline used by frame export."""
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+import threading
+
+import numpy as np
+from PIL import Image
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from core.extractor.animation_processor import AnimationProcessor  # noqa: E402
+from core.extractor.encode_pipeline import EncodedFile, EncodePipeline  # noqa: E402
+from core.extractor.extractor import Extractor  # noqa: E402
+from core.extractor.frame_exporter import FrameExporter  # noqa: E402
+from core.extractor.sprite_processor import SpriteProcessor  # noqa: E402
+from utils.settings_manager import SettingsManager  # noqa: E402
+
+
+def _frames(count: int):
+    rng = np.random.default_rng(3)
+    return [
+        (f"frame{i:02d}", rng.integers(0, 256, (24, 32, 4), dtype=np.uint8), {})
+        for i in range(count)
+    ]
+
+
+def _export(tmp_path: Path, encoder=None) -> Path:
+    """Export 12 frames; queued frames are only counted by the encoder."""
+    exporter = FrameExporter(str(tmp_path), "test", lambda img, _: img, encoder)
+    frames = _frames(12)
+    written = exporter.save_frames(
+        frames,
+        set(range(len(frames))),
+        "sheet",
+        "anim",
+        1.0,
+        {"frame_format": "PNG", "filename_format": "Standardized"},
+    )
+    assert written == (len(frames) if encoder is None else 0)
+    return tmp_path / "anim"
+
+
+def test_pipeline_output_matches_inline_export(tmp_path: Path):
+    inline_dir = _export(tmp_path / "inline")
+
+    pipeline = EncodePipeline(max_workers=4)
+    batch = pipeline.batch()
+    piped_dir = _export(tmp_path / "piped", batch)
+    assert batch.wait() == 12
+    assert batch.take_written() == {"frame": 12}
+    pipeline.shutdown()
+
+    inline_files = sorted(p.name for p in inline_dir.iterdir())
+    assert inline_files == sorted(p.name for p in piped_dir.iterdir())
+    for name in inline_files:
+        assert (inline_dir / name).read_bytes() == (piped_dir / name).read_bytes()
+        with Image.open(piped_dir / name) as image:
+            assert image.size == (32, 24)
+
+
+def test_submit_blocks_when_over_budget(tmp_path: Path):
+    release = threading.Event()
+    pipeline = EncodePipeline(max_workers=2, max_pending_bytes=100)
+
+    def slow_job(path):
+        def job():
+            release.wait(5)
+            return EncodedFile(str(path), b"data")
+
+        return job
+
+    first = pipeline.submit(slow_job(tmp_path / "a.bin"), 80)
+    admitted = threading.Event()
+
+    def submit_second():
+        pipeline.submit(slow_job(tmp_path / "b.bin"), 80)
+        admitted.set()
+
+    thread = threading.Thread(target=submit_second)
+    thread.start()
+    assert not admitted.wait(0.2)
+    assert pipeline.pending_bytes == 80
+
+    release.set()
+    assert first.result(5) is True
+    assert admitted.wait(5)
+    thread.join(5)
+    pipeline.shutdown()
+
+    assert pipeline.pending_bytes == 0
+    assert (tmp_path / "b.bin").read_bytes() == b"data"
+
+
+def test_batch_reports_failed_jobs(tmp_path: Path):
+    pipeline = EncodePipeline(max_workers=1)
+    batch = pipeline.batch()
+
+    def broken():
+        raise ValueError("cannot encode")
+
+    batch.submit(broken, 10)
+    batch.submit(lambda: EncodedFile(str(tmp_path / "ok.bin"), b"1"), 10)
+
+    assert batch.wait() == 1
+    pipeline.shutdown()
+    assert pipeline.pending_bytes == 0
+
+
+def test_processor_counts_only_files_written(tmp_path: Path):
+    frames = _frames(3)
+    atlas = Image.fromarray(np.concatenate([frame[1] for frame in frames], axis=1))
+    sprites = [
+        {"name": f"walk{i:04d}", "x": i * 32, "y": 0, "width": 32, "height": 24}
+        for i in range(3)
+    ]
+    settings = SettingsManager()
+    settings.set_global_settings(
+        frame_export=True,
+        frame_format="PNG",
+        animation_export=True,
+        animation_format="APNG",
+        filename_format="Standardized",
+        scale=1.0,
+    )
+    # A directory in place of the animation file makes its write fail.
+    (tmp_path / "sheet - walk.png").mkdir()
+
+    pipeline = EncodePipeline(max_workers=2)
+    processor = AnimationProcessor(
+        SpriteProcessor(atlas, sprites).lazy_animations(),
+        "sheet.png",
+        str(tmp_path),
+        settings,
+        "test",
+        encode_pipeline=pipeline,
+    )
+    assert processor.process_animations() == (3, 0)
+    processor.dispose()
+    pipeline.shutdown()
+
+
+def test_extract_sprites_stops_the_pipeline_it_started(tmp_path: Path):
+    frames = _frames(2)
+    Image.fromarray(np.concatenate([frame[1] for frame in frames], axis=1)).save(
+        tmp_path / "sheet.png"
+    )
+    (tmp_path / "sheet.xml").write_text(
+        '<TextureAtlas imagePath="sheet.png">'
+        '<SubTexture name="walk0000" x="0" y="0" width="32" height="24"/>'
+        '<SubTexture name="walk0001" x="32" y="0" width="32" height="24"/>'
+        "</TextureAtlas>",
+        encoding="utf-8",
+    )
+    settings = SettingsManager()
+    settings.set_global_settings(
+        frame_export=True,
+        frame_format="PNG",
+        animation_export=False,
+        filename_format="Standardized",
+        scale=1.0,
+    )
+    extractor = Extractor(None, "test", settings)
+
+    result = extractor.extract_sprites(
+        str(tmp_path / "sheet.png"),
+        str(tmp_path / "sheet.xml"),
+        str(tmp_path / "out"),
+        {},
+    )
+
+    assert result["frames_generated"] == 2
+    assert extractor._encode_pipeline is None
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Tests for exporter packing through the packers subsystem."""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import sys
+
+import numpy as np
+from PIL import Image
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from exporters import ExporterRegistry, ExportOptions  # noqa: E402
+
+
+def _make_sprites(count: int):
+    rng = np.random.default_rng(7)
+    sprites = []
+    images = {}
+    for index in range(count):
+        width, height = (int(v) for v in rng.integers(8, 64, size=2))
+        name = f"sprite_{index:03d}"
+        sprites.append({"name": name, "x": 0, "y": 0, "width": width, "height": height})
+        pixels = rng.integers(0, 256, (height, width, 4), dtype=np.uint8)
+        images[name] = Image.fromarray(pixels)
+    return sprites, images
+
+
+def test_exporter_uses_requested_packer(tmp_path: Path):
+    sprites, images = _make_sprites(40)
+
+    result = ExporterRegistry.export_file(
+        sprites,
+        images,
+        str(tmp_path / "atlas"),
+        "json-hash",
+        ExportOptions(packer="skyline", heuristic="bottom_left"),
+    )
+
+    assert result.success, result.errors
+    metadata = json.loads(Path(result.metadata_path).read_text(encoding="utf-8"))
+    assert len(metadata["frames"]) == 40
+
+
+def test_rotated_sprites_round_trip(tmp_path: Path):
+    sprites, images = _make_sprites(30)
+
+    result = ExporterRegistry.export_file(
+        sprites,
+        images,
+        str(tmp_path / "atlas"),
+        "json-hash",
+        ExportOptions(packer="maxrects", allow_rotation=True, padding=0),
+    )
+
+    assert result.success, result.errors
+    atlas = Image.open(result.atlas_path)
+    metadata = json.loads(Path(result.metadata_path).read_text(encoding="utf-8"))
+    for name, entry in metadata["frames"].items():
+        rect = entry["frame"]
+        crop = atlas.crop(
+            (rect["x"], rect["y"], rect["x"] + rect["w"], rect["y"] + rect["h"])
+        )
+        if entry["rotated"]:
+            crop = crop.transpose(Image.Transpose.ROTATE_90)
+        assert np.array_equal(np.asarray(crop), np.asarray(images[name])), name
+
+
+def test_padding_surrounds_the_atlas_edges(tmp_path: Path):
+    sprites, images = _make_sprites(20)
+
+    for packer in ("auto", "maxrects", "skyline", "shelf", "guillotine"):
+        result = ExporterRegistry.export_file(
+            sprites,
+            images,
+            str(tmp_path / packer / "atlas"),
+            "json-hash",
+            ExportOptions(packer=packer, padding=2, power_of_two=False),
+        )
+
+        assert result.success, result.errors
+        metadata = json.loads(Path(result.metadata_path).read_text(encoding="utf-8"))
+        size = metadata["meta"]["size"]
+        frames = [entry["frame"] for entry in metadata["frames"].values()]
+        assert min(frame["x"] for frame in frames) >= 2, packer
+        assert min(frame["y"] for frame in frames) >= 2, packer
+        assert max(frame["x"] + frame["w"] for frame in frames) <= size["w"] - 2
+        assert max(frame["y"] + frame["h"] for frame in frames) <= size["h"] - 2
+
+
+def test_unknown_packer_reports_error(tmp_path: Path):
+    sprites, images = _make_sprites(3)
+
+    result = ExporterRegistry.export_file(
+        sprites,
+        images,
+        str(tmp_path / "atlas"),
+        "json-hash",
+        ExportOptions(packer="does-not-exist"),
+    )
+
+    assert not result.success
+    assert "does-not-exist" in result.errors[0].message
+
+
+def test_oversized_sprites_fail_to_pack(tmp_path: Path):
+    sprites, images = _make_sprites(10)
+
+    result = ExporterRegistry.export_file(
+        sprites,
+        images,
+        str(tmp_path / "atlas"),
+        "json-hash",
+        ExportOptions(max_width=32, max_height=32),
+    )
+
+    assert not result.success
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Tests for the extract tab's spritesheet and animation lists."""
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from PySide6.QtWidgets import QApplication, QWidget  # noqa: E402
+
+from core.extractor.spritesheet_scanner import SpritesheetEntry  # noqa: E402
+from gui.extract_tab_widget import ExtractTabWidget  # noqa: E402
+from utils.persistence import OverrideStore  # noqa: E402
+from utils.settings_manager import SettingsManager  # noqa: E402
+
+
+class AppConfigStub:
+    def get_extraction_defaults(self) -> dict:
+        return {}
+
+    def get(self, key: str, default=None):
+        if key == "interface":
+            return {"duration_input_type": "fps"}
+        return default
+
+
+class ExtractTabAppStub(QWidget):
+    def __init__(self):
+        super().__init__()
+        self.app_config = AppConfigStub()
+        self.settings_manager = SimpleNamespace(global_settings={})
+        self.data_dict: dict = {}
+        self.replace_rules: list[str] = []
+        self.variable_delay = False
+        self.fnf_idle_loop = False
+
+    def start_process(self):
+        pass
+
+    def create_find_and_replace_window(self):
+        pass
+
+    def create_settings_window(self):
+        pass
+
+    def show_compression_settings(self):
+        pass
+
+
+@pytest.fixture(scope="module")
+def qt_app():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+def _dispose(app, *widgets):
+    """Delete widgets now so none outlives the QApplication at exit."""
+    for widget in widgets:
+        widget.deleteLater()
+    # Event type 0 delivers every posted event, deferred deletes included.
+    app.sendPostedEvents(None, 0)
+
+
+def test_scan_batches_skip_duplicates_without_searching_the_list(
+    qt_app, monkeypatch
+):
+    parent = ExtractTabAppStub()
+    widget = ExtractTabWidget(parent, use_existing_ui=False)
+    widget._scan_worker = object()
+    monkeypatch.setattr(
+        widget.listbox_png,
+        "find_item_by_text",
+        lambda text: pytest.fail("list searched for " + text),
+    )
+    entries = [
+        SpritesheetEntry(f"sheet{index}.png", f"/in/sheet{index}.png", {})
+        for index in range(2000)
+    ]
+
+    widget._on_scan_entries_found(widget._scan_id, entries[:1500])
+    widget._on_scan_entries_found(widget._scan_id, entries[1000:])
+
+    assert widget.listbox_png.count() == 2000
+    assert widget.listbox_png.item(1999).text() == "sheet1999.png"
+    assert len(parent.data_dict) == 2000
+    _dispose(qt_app, widget, parent)
+
+
+def test_deleted_editor_composite_stays_deleted_after_reload(qt_app, tmp_path: Path):
+    store_path = tmp_path / "overrides.db"
+    parent = ExtractTabAppStub()
+    parent.settings_manager = SettingsManager(store=OverrideStore(str(store_path)))
+    parent.settings_manager.open_scope(str(tmp_path))
+    parent.settings_manager.set_spritesheet_settings(
+        "bf.png",
+        scale=2.0,
+        editor_composites={"combo": {"frames": []}, "other": {"frames": []}},
+    )
+    parent.settings_manager.flush()
+
+    widget = ExtractTabWidget(parent, use_existing_ui=False)
+    widget.listbox_png.blockSignals(True)
+    widget.listbox_png.setCurrentItem(widget.listbox_png.add_item("bf.png"))
+    widget.listbox_data.setCurrentItem(
+        widget.listbox_data.add_item("combo", {"type": "editor_composite"})
+    )
+    widget.delete_selected_animations()
+    _dispose(qt_app, widget, parent)
+    parent.settings_manager.close_scope()
+    parent.settings_manager.store.close()
+
+    reopened = SettingsManager(store=OverrideStore(str(store_path)))
+    reopened.open_scope(str(tmp_path))
+    assert reopened.spritesheet_settings["bf.png"] == {
+        "scale": 2.0,
+        "editor_composites": {"other": {"frames": []}},
+    }
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Tests for bulk FNF mod-folder imports."""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from utils.FNF.character_data import CharacterData  # noqa: E402
+from utils.FNF.mod_importer import (  # noqa: E402
+    import_mod_folder,
+    index_mod_folder,
+)
+from utils.settings_manager import SettingsManager  # noqa: E402
+
+
+def _psych_character(image: str, names) -> dict:
+    return {
+        "image": image,
+        "scale": 1,
+        "flip_x": False,
+        "no_antialiasing": False,
+        "animations": [
+            {
+                "name": name,
+                "anim": name,
+                "fps": 24,
+                "loop": name.startswith("idle"),
+                "indices": [],
+                "offsets": [index, -index],
+            }
+            for index, name in enumerate(names)
+        ],
+    }
+
+
+CODENAME_CHARACTER = """<?xml version="1.0" encoding="utf-8"?>
+<character scale="2">
+  <anim name="danceLeft" anim="GF Dancing Beat" fps="24" loop="false" indices="0..14"/>
+  <anim name="sad0001" anim="gf sad" fps="12" loop="true"/>
+</character>
+"""
+
+
+def _write_mod(root: Path) -> Path:
+    (root / "characters").mkdir(parents=True)
+    (root / "data" / "characters").mkdir(parents=True)
+    (root / "images" / "characters").mkdir(parents=True)
+    (root / "characters" / "bf.json").write_text(
+        json.dumps(_psych_character("characters/BOYFRIEND", ["idle0000", "singLEFT"])),
+        encoding="utf-8",
+    )
+    (root / "characters" / "bf-car.json").write_text(
+        json.dumps(_psych_character("characters/BOYFRIEND_CAR", ["idle"])),
+        encoding="utf-8",
+    )
+    (root / "characters" / "notes.json").write_text("{}", encoding="utf-8")
+    (root / "data" / "characters" / "gf.xml").write_text(
+        CODENAME_CHARACTER, encoding="utf-8"
+    )
+    for name in ("BOYFRIEND", "gf"):
+        (root / "images" / "characters" / f"{name}.png").write_bytes(b"")
+    (root / "images" / "characters" / "BOYFRIEND.xml").write_text(
+        "<TextureAtlas/>", encoding="utf-8"
+    )
+    return root
+
+
+def test_index_walks_characters_and_images_once(tmp_path: Path):
+    mod = _write_mod(tmp_path / "mod")
+
+    index = index_mod_folder(str(mod))
+
+    assert [Path(p).name for p in index.character_files] == [
+        "bf-car.json",
+        "bf.json",
+        "notes.json",
+        "gf.xml",
+    ]
+    assert set(index.images) == {"characters/boyfriend", "characters/gf"}
+    assert index.resolve_image("characters/BOYFRIEND") == str(
+        mod / "images" / "characters" / "BOYFRIEND.png"
+    )
+    assert index.resolve_image("gf.png") == str(mod / "images" / "characters" / "gf.png")
+    assert index.resolve_image("characters/missing") is None
+
+
+def test_bulk_import_matches_file_by_file_import(tmp_path: Path):
+    mod = _write_mod(tmp_path / "mod")
+    index = index_mod_folder(str(mod))
+
+    sequential = SettingsManager()
+    loader = CharacterData()
+    for file_path in index.character_files:
+        loader._process_character_file(file_path, sequential)
+
+    bulk = SettingsManager()
+    result = import_mod_folder(str(mod), bulk, max_workers=4)
+
+    assert bulk.animation_settings == sequential.animation_settings
+    assert result.animation_count == len(bulk.animation_settings) == 5
+    assert [Path(p).name for p in result.skipped] == ["notes.json"]
+    assert [Path(c.file_path).name for c in result.missing_atlases] == [
+        "bf-car.json"
+    ]
+    assert bulk.animation_settings["BOYFRIEND.png/idle"]["delay"] == 0
+    assert bulk.animation_settings["gf.png/danceLeft"]["indices"] == [0, 14]
+    assert bulk.animation_settings["gf.png/sad"]["scale"] == 2.0
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Tests for memoized frame scaling."""
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+import sys
+
+import numpy as np
+from PIL import Image
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from core.extractor.frame_scaler import FrameScaler  # noqa: E402
+from core.extractor.image_utils import scale_image  # noqa: E402
+
+
+def _frame(seed: int, size=(16, 12)) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    width, height = size
+    return rng.integers(0, 256, (height, width, 4), dtype=np.uint8)
+
+
+def test_identical_frames_reuse_scaled_result():
+    scaler = FrameScaler("Lanczos")
+    held_pose = _frame(1)
+
+    first = scaler.scale(held_pose, 2.5)
+    second = scaler.scale(held_pose.copy(), 2.5)
+
+    assert second is first
+    assert (scaler.hits, scaler.misses) == (1, 1)
+    expected = scale_image(Image.fromarray(held_pose), 2.5, "Lanczos")
+    assert np.array_equal(np.asarray(first), np.asarray(expected))
+
+
+def test_scale_and_method_are_part_of_the_key():
+    scaler = FrameScaler("Bicubic")
+    frame = _frame(2)
+
+    scaler.scale(frame, 2)
+    scaler.scale(frame, -2)
+    scaler.scale(frame, 2, "Lanczos")
+
+    assert scaler.hits == 0
+    assert scaler.misses == 3
+
+
+def test_nearest_and_identity_bypass_the_cache():
+    scaler = FrameScaler("Nearest")
+    frame = _frame(3)
+
+    scaled = scaler.scale(frame, 3)
+    scaler.scale(frame, 1, "Lanczos")
+
+    assert scaled.size == (48, 36)
+    assert (scaler.hits, scaler.misses) == (0, 0)
+
+
+def test_cache_evicts_least_recently_used_frames():
+    frame_bytes = 32 * 24 * 4
+    scaler = FrameScaler("Lanczos", max_bytes=frame_bytes * 2)
+    frames = [_frame(seed) for seed in range(3)]
+
+    for frame in frames:
+        scaler.scale(frame, 2)
+    scaler.scale(frames[0], 2)
+
+    assert scaler.hits == 0
+    assert scaler.misses == 4
+
+
+def test_keys_are_content_digests():
+    frame = _frame(4)
+    key = FrameScaler._make_key(frame, 2, "Lanczos")
+
+    assert FrameScaler._make_key(Image.fromarray(frame), 2, "Lanczos")[1] == key[1]
+    assert FrameScaler._make_key(frame[:, ::-1], 2, "Lanczos") != key
+    assert key[1] == hashlib.blake2b(frame.tobytes(), digest_size=16).digest()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Tests for the shared decoded-image pool."""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import sys
+
+from PIL import Image
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from utils.image_pool import DecodedImagePool  # noqa: E402
+
+
+def _save(path: Path, size=(8, 8), color=(255, 0, 0)) -> str:
+    Image.new("RGB", size, color).save(path)
+    return str(path)
+
+
+def test_same_file_is_decoded_once(tmp_path: Path):
+    pool = DecodedImagePool()
+    path = _save(tmp_path / "sheet.png")
+
+    with pool.lease(path) as first:
+        second = pool.acquire(path)
+        pool.release(second)
+
+    assert second is first
+    assert first.mode == "RGBA"
+    assert (pool.hits, pool.misses) == (1, 1)
+    assert pool.is_pooled(first)
+
+
+def test_changed_file_is_decoded_again(tmp_path: Path):
+    pool = DecodedImagePool()
+    path = _save(tmp_path / "sheet.png")
+    with pool.lease(path) as old:
+        pass
+
+    _save(tmp_path / "sheet.png", size=(4, 4), color=(0, 255, 0))
+    os.utime(path, ns=(0, 10**9))
+
+    with pool.lease(path) as new:
+        assert new is not old
+        assert new.size == (4, 4)
+    assert not pool.is_pooled(old)
+    assert pool.cached_bytes == 4 * 4 * 4
+
+
+def test_images_in_use_survive_eviction(tmp_path: Path):
+    pool = DecodedImagePool(max_bytes=8 * 8 * 4)
+    paths = [_save(tmp_path / f"{index}.png") for index in range(3)]
+
+    held = pool.acquire(paths[0])
+    for path in paths[1:]:
+        with pool.lease(path):
+            pass
+
+    assert pool.is_pooled(held)
+    assert pool.cached_bytes == 8 * 8 * 4
+    pool.release(held)
+    pool.clear()
+    assert pool.cached_bytes == 0
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Tests for the batched bbox, crop, and threshold helpers in image_utils."""
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+import numpy as np
+from PIL import Image
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from core.extractor.frame_exporter import FrameExporter  # noqa: E402
+from core.extractor.image_utils import (  # noqa: E402
+    apply_alpha_threshold,
+    crop_frames,
+    crop_to_bbox,
+    frame_bbox,
+    frame_bboxes,
+    shared_bbox,
+)
+
+
+def _sparse_frame(seed: int, size=(40, 30)) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    width, height = size
+    frame = np.zeros((height, width, 4), dtype=np.uint8)
+    top, left = rng.integers(0, height - 5), rng.integers(0, width - 5)
+    frame[top : top + 5, left : left + 5] = rng.integers(1, 256, (5, 5, 4))
+    return frame
+
+
+def _bbox_size(bbox):
+    return bbox[2] - bbox[0], bbox[3] - bbox[1]
+
+
+def test_frame_bboxes_match_per_frame_results():
+    frames = [_sparse_frame(seed) for seed in range(12)]
+    frames.append(np.zeros((30, 40, 4), dtype=np.uint8))
+    frames.append(_sparse_frame(99, size=(16, 20)))
+
+    assert frame_bboxes(frames) == [frame_bbox(frame) for frame in frames]
+    assert frame_bboxes(frames, threshold=128) == [
+        frame_bbox(frame, threshold=128) for frame in frames
+    ]
+
+
+def test_shared_bbox_is_union_of_frame_bboxes():
+    frames = [_sparse_frame(seed) for seed in range(8)]
+    frames.append(Image.fromarray(_sparse_frame(50, size=(12, 50))))
+    boxes = [box for box in frame_bboxes(frames) if box]
+
+    expected = (
+        min(box[0] for box in boxes),
+        min(box[1] for box in boxes),
+        max(box[2] for box in boxes),
+        max(box[3] for box in boxes),
+    )
+    assert shared_bbox(frames) == expected
+    assert shared_bbox(np.stack(frames[:8])) == shared_bbox(frames[:8])
+
+
+def test_shared_bbox_of_empty_frames_is_none():
+    empty = [np.zeros((8, 8, 4), dtype=np.uint8) for _ in range(3)]
+
+    assert shared_bbox(empty) is None
+    assert shared_bbox([]) is None
+
+
+def test_crop_frames_matches_crop_then_threshold_and_keeps_sources():
+    frames = [_sparse_frame(seed) for seed in range(6)]
+    originals = [frame.copy() for frame in frames]
+    bbox = shared_bbox(frames)
+
+    cropped = crop_frames(frames, bbox, alpha_threshold=0.5)
+
+    for frame, result in zip(originals, cropped):
+        expected = apply_alpha_threshold(crop_to_bbox(frame.copy(), bbox), 0.5)
+        assert np.array_equal(result, expected)
+        assert result.flags["C_CONTIGUOUS"]
+    for frame, original in zip(frames, originals):
+        assert np.array_equal(frame, original)
+
+
+def test_frame_export_crops_with_batched_bboxes(tmp_path: Path):
+    frames = [_sparse_frame(seed) for seed in range(4)]
+    frames.append(np.zeros((30, 40, 4), dtype=np.uint8))
+    image_tuples = [(f"f{index}", frame, {}) for index, frame in enumerate(frames)]
+    settings = {"frame_format": "PNG", "filename_format": "Standardized"}
+
+    for crop_option, expected in (
+        ("Frame based", [(5, 5)] * 4),
+        ("Animation based", [_bbox_size(shared_bbox(frames))] * 4),
+    ):
+        exporter = FrameExporter(str(tmp_path / crop_option), "test", lambda i, _: i)
+        written = exporter.save_frames(
+            image_tuples,
+            set(range(len(frames))),
+            "sheet",
+            "anim",
+            1.0,
+            {**settings, "crop_option": crop_option},
+        )
+
+        assert written == 4
+        sizes = []
+        for path in sorted((tmp_path / crop_option / "anim").iterdir()):
+            with Image.open(path) as image:
+                sizes.append(image.size)
+        assert sizes == expected
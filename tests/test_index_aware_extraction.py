@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Tests for choosing an animation's frames before cropping them."""
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+import numpy as np
+import pytest
+from PIL import Image
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from core.extractor.animation_processor import AnimationProcessor  # noqa: E402
+from core.extractor.sprite_processor import SpriteProcessor  # noqa: E402
+from parsers.sprite_table import SpriteTable  # noqa: E402
+from utils.settings_manager import SettingsManager  # noqa: E402
+
+
+def _sheet(frame_count: int = 12):
+    rng = np.random.default_rng(5)
+    atlas = Image.fromarray(
+        rng.integers(1, 256, (16, frame_count * 8, 4), dtype=np.uint8)
+    )
+    # Listed out of name order to check that selection follows sorted names.
+    sprites = [
+        {
+            "name": f"sing{frame:04d}",
+            "x": frame * 8,
+            "y": 0,
+            "width": 8,
+            "height": 16,
+            "frameX": 0,
+            "frameY": 0,
+            "frameWidth": 8,
+            "frameHeight": 16,
+            "rotated": False,
+        }
+        for frame in reversed(range(frame_count))
+    ]
+    return atlas, sprites
+
+
+class _CountingProcessor(SpriteProcessor):
+    def __init__(self, atlas, sprites):
+        super().__init__(atlas, sprites)
+        self.cropped = []
+
+    def build_frames(self, sprites):
+        self.cropped.extend(sprite["name"] for sprite in sprites)
+        return super().build_frames(sprites)
+
+
+def _export(animations, output_dir: Path, **animation_settings):
+    settings = SettingsManager()
+    settings.set_global_settings(
+        frame_export=True,
+        frame_format="PNG",
+        animation_export=False,
+        animation_format="APNG",
+        filename_format="Standardized",
+        scale=1.0,
+    )
+    settings.set_animation_settings("sheet.png/sing", **animation_settings)
+    processor = AnimationProcessor(
+        animations, "sheet.png", str(output_dir), settings, "test"
+    )
+    counts = processor.process_animations()
+    processor.dispose()
+    exported = {
+        path.name: np.asarray(Image.open(path))
+        for path in sorted((output_dir / "sing").glob("*.png"))
+    }
+    return counts, exported
+
+
+@pytest.mark.parametrize(
+    "animation_settings, expected_crops",
+    [
+        ({"indices": [10, 2, 5]}, 3),
+        ({"indices": [1, 3, 5, 7], "frame_selection": "first_last"}, 2),
+        ({"frame_selection": "0,-2"}, 2),
+        ({"frame_selection": "no_duplicates", "indices": [0, 1]}, 2),
+        ({"frame_selection": "last", "animation_export": True}, 12),
+    ],
+)
+def test_selected_frames_match_the_eager_export(
+    tmp_path: Path, animation_settings, expected_crops
+):
+    atlas, sprites = _sheet()
+    eager = SpriteProcessor(atlas, sprites).process_sprites()
+    expected = _export(eager, tmp_path / "eager", **animation_settings)
+
+    sources = (("dicts", sprites), ("table", SpriteTable.from_sprites(sprites)))
+    for variant, source in sources:
+        processor = _CountingProcessor(atlas, source)
+        actual = _export(
+            processor.lazy_animations(), tmp_path / variant, **animation_settings
+        )
+
+        assert actual[0] == expected[0]
+        assert list(actual[1]) == list(expected[1])
+        for name, pixels in expected[1].items():
+            assert np.array_equal(actual[1][name], pixels)
+        assert len(processor.cropped) == expected_crops
+
+
+def test_identical_metadata_still_collapses_to_one_frame(tmp_path: Path):
+    atlas, _ = _sheet(1)
+    sprites = [
+        {"name": f"sing{frame:04d}", "x": 0, "y": 0, "width": 8, "height": 16}
+        for frame in range(4)
+    ]
+    processor = _CountingProcessor(atlas, sprites)
+
+    counts, exported = _export(
+        processor.lazy_animations(), tmp_path, frame_selection="first_last"
+    )
+
+    assert counts == (1, 0)
+    assert list(exported) == ["sheet - sing0000.png"]
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Tests for lazy, settings-driven sprite materialisation."""
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+import numpy as np
+from PIL import Image
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from core.extractor.animation_processor import AnimationProcessor  # noqa: E402
+from core.extractor.sprite_processor import (  # noqa: E402
+    LazyAnimationMap,
+    SpriteProcessor,
+)
+from utils.settings_manager import SettingsManager  # noqa: E402
+
+
+def _sheet():
+    rng = np.random.default_rng(11)
+    atlas = Image.fromarray(rng.integers(0, 256, (32, 64, 4), dtype=np.uint8))
+    sprites = []
+    for anim_index, prefix in enumerate(("idle", "walk", "jump", "fall")):
+        for frame in range(2):
+            sprites.append(
+                {
+                    "name": f"{prefix}{frame:04d}",
+                    "x": anim_index * 16,
+                    "y": frame * 16,
+                    "width": 16,
+                    "height": 16,
+                }
+            )
+    sprites.append({"name": "broken0000", "x": 0})
+    return atlas, sprites
+
+
+class _CountingProcessor(SpriteProcessor):
+    def __init__(self, atlas, sprites):
+        super().__init__(atlas, sprites)
+        self.built = []
+
+    def build_frames(self, sprites):
+        self.built.append(sprites[0]["name"])
+        return super().build_frames(sprites)
+
+
+def test_lazy_map_matches_eager_grouping():
+    atlas, sprites = _sheet()
+    processor = SpriteProcessor(atlas, sprites)
+
+    eager = processor.process_sprites()
+    lazy = processor.lazy_animations()
+
+    assert isinstance(lazy, LazyAnimationMap)
+    assert list(lazy) == list(eager) == ["idle", "walk", "jump", "fall"]
+    assert lazy.sprite_count("walk") == 2
+    for name, frames in eager.items():
+        for expected, actual in zip(frames, lazy[name]):
+            assert expected[0] == actual[0]
+            assert np.array_equal(expected[1], actual[1])
+
+
+def test_only_exported_animations_are_cropped(tmp_path: Path):
+    atlas, sprites = _sheet()
+    processor = _CountingProcessor(atlas, sprites)
+    settings = SettingsManager()
+    settings.set_global_settings(
+        frame_export=False,
+        animation_export=False,
+        frame_format="PNG",
+        filename_format="Standardized",
+        scale=1.0,
+    )
+    settings.set_animation_settings("sheet.png/walk", frame_export=True)
+
+    animation_processor = AnimationProcessor(
+        processor.lazy_animations(),
+        "sheet.png",
+        str(tmp_path),
+        settings,
+        "test",
+    )
+    frames_generated, anims_generated = animation_processor.process_animations()
+    animation_processor.dispose()
+
+    assert processor.built == ["walk0000"]
+    assert (frames_generated, anims_generated) == (2, 0)
+    assert len(list((tmp_path / "walk").iterdir())) == 2
+    assert not (tmp_path / "idle").exists()
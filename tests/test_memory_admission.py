@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Tests for predictive memory admission control."""
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+import threading
+
+from PIL import Image
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from core.extractor import memory_admission  # noqa: E402
+from core.extractor.memory_admission import (  # noqa: E402
+    MemoryAdmission,
+    MemoryEstimate,
+    estimate_extraction_memory,
+)
+
+
+def test_estimate_reads_header_and_sprite_count(tmp_path: Path):
+    atlas = tmp_path / "sheet.png"
+    Image.new("RGB", (100, 50)).save(atlas)
+    metadata = tmp_path / "sheet.xml"
+    metadata.write_text(
+        "<TextureAtlas>" + '<SubTexture name="a"/>' * 3 + "</TextureAtlas>",
+        encoding="utf-8",
+    )
+
+    estimate = estimate_extraction_memory(str(atlas), str(metadata), scale=2)
+
+    assert estimate.sprite_count == 3
+    assert estimate.atlas_bytes == 100 * 50 * 3 + 100 * 50 * 4
+    assert estimate.encoder_bytes > estimate_extraction_memory(str(atlas)).encoder_bytes
+    assert estimate_extraction_memory(str(tmp_path / "missing.png")).total_bytes == 0
+
+
+def test_small_files_flow_while_large_file_waits():
+    admission = MemoryAdmission(100)
+    first = admission.acquire("a", MemoryEstimate(atlas_bytes=60))
+    admitted = threading.Event()
+
+    def admit_large():
+        reservation = admission.acquire("large", MemoryEstimate(atlas_bytes=80))
+        admitted.set()
+        admission.release(reservation)
+
+    thread = threading.Thread(target=admit_large)
+    thread.start()
+    small = admission.acquire("small", MemoryEstimate(atlas_bytes=30))
+    assert small is not None
+    assert not admitted.wait(0.2)
+
+    admission.release(small)
+    admission.release(first)
+    assert admitted.wait(5)
+    thread.join(5)
+    assert admission.reserved_bytes == 0
+    assert [r.label for r in admission.history] == ["small", "a", "large"]
+
+
+def test_oversized_file_is_admitted_alone():
+    admission = MemoryAdmission(100)
+
+    reservation = admission.acquire("huge", MemoryEstimate(atlas_bytes=500))
+
+    assert reservation.reserved_bytes == 100
+    admission.release(reservation)
+    assert admission.reserved_bytes == 0
+
+
+def test_starving_waiter_blocks_newer_admissions(monkeypatch):
+    monkeypatch.setattr(memory_admission, "STARVATION_TIMEOUT", 0.05)
+    admission = MemoryAdmission(100)
+    first = admission.acquire("a", MemoryEstimate(atlas_bytes=60))
+    order = []
+
+    def admit(label, size):
+        reservation = admission.acquire(
+            label, MemoryEstimate(atlas_bytes=size), poll_interval=0.01
+        )
+        order.append(label)
+        return reservation
+
+    large = threading.Thread(target=admit, args=("large", 80))
+    large.start()
+    threading.Event().wait(0.2)
+
+    # Would fit next to "a", but the starving large file goes first.
+    small = threading.Thread(target=admit, args=("small", 10))
+    small.start()
+    threading.Event().wait(0.2)
+    assert order == []
+
+    admission.release(first)
+    large.join(5)
+    small.join(5)
+    assert order == ["large", "small"]
+
+
+def test_history_keeps_only_recent_reservations(monkeypatch):
+    monkeypatch.setattr(memory_admission, "HISTORY_LIMIT", 3)
+    admission = MemoryAdmission(100)
+
+    for index in range(5):
+        admission.release(
+            admission.acquire(f"file{index}", MemoryEstimate(atlas_bytes=10))
+        )
+
+    assert [r.label for r in admission.history] == ["file2", "file3", "file4"]
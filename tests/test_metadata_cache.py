@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Tests for the shared metadata parse cache."""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import sys
+from threading import Thread
+import time
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from core.extractor.metadata_cache import MetadataCache  # noqa: E402
+from parsers.sprite_table import SpriteTable  # noqa: E402
+
+XML_TEMPLATE = """<?xml version="1.0" encoding="utf-8"?>
+<TextureAtlas imagePath="sheet.png">
+{subtextures}
+</TextureAtlas>
+"""
+
+
+def _write_xml(path: Path, names) -> Path:
+    subtextures = "\n".join(
+        f'  <SubTexture name="{name}" x="{index * 4}" y="0" width="4" height="4"/>'
+        for index, name in enumerate(names)
+    )
+    path.write_text(XML_TEMPLATE.format(subtextures=subtextures), encoding="utf-8")
+    return path
+
+
+def _touch_later(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_repeated_parse_is_served_from_memory(tmp_path: Path):
+    xml_path = _write_xml(tmp_path / "sheet.xml", ["idle0000", "idle0001"])
+    cache = MetadataCache()
+
+    first = cache.parse(str(xml_path))
+    second = cache.parse(str(xml_path))
+
+    assert second is first
+    assert len(first.sprites) == 2
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_changed_file_is_parsed_again(tmp_path: Path):
+    xml_path = _write_xml(tmp_path / "sheet.xml", ["idle0000"])
+    cache = MetadataCache()
+    first = cache.parse(str(xml_path))
+
+    _write_xml(xml_path, ["idle0000", "walk0000", "walk0001"])
+    _touch_later(xml_path)
+    second = cache.parse(str(xml_path))
+
+    assert second is not first
+    assert len(second.sprites) == 3
+    assert cache.misses == 2
+
+
+def test_animation_names_are_cached_per_variant(tmp_path: Path):
+    xml_path = _write_xml(tmp_path / "sheet.xml", ["idle0000"])
+    cache = MetadataCache()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return {"idle"}
+
+    names = cache.animation_names(str(xml_path), loader, variant="xml")
+    names.add("mutated")
+
+    assert cache.animation_names(str(xml_path), loader, variant="xml") == {"idle"}
+    assert len(calls) == 1
+    cache.animation_names(str(xml_path), loader, variant="other")
+    assert len(calls) == 2
+
+    cache.invalidate(str(xml_path))
+    cache.animation_names(str(xml_path), loader, variant="xml")
+    assert len(calls) == 3
+
+
+def test_parsed_animation_names_share_the_extraction_parse(tmp_path: Path, monkeypatch):
+    from parsers.parser_registry import ParserRegistry
+
+    xml_path = _write_xml(tmp_path / "sheet.xml", ["idle0000", "idle0001", "walk0000"])
+    cache = MetadataCache()
+    parse_file = ParserRegistry.parse_file
+    parsed = []
+
+    def counting_parse_file(path, *args, **kwargs):
+        parsed.append(path)
+        return parse_file(path, *args, **kwargs)
+
+    monkeypatch.setattr(ParserRegistry, "parse_file", counting_parse_file)
+
+    names = cache.parsed_animation_names(str(xml_path))
+    result = cache.parse(str(xml_path))
+
+    assert names == {"idle", "walk"}
+    assert parsed == [str(xml_path)]
+    assert len(result.sprites) == 3
+
+
+def test_app_config_names_the_metadata_cache_dir(tmp_path: Path):
+    from utils.app_config import AppConfig
+
+    config = AppConfig(config_path=str(tmp_path / "app_config.cfg"))
+
+    assert config.get_metadata_cache_dir() == str(tmp_path / "metadata_cache")
+
+
+def test_disk_cache_survives_a_new_instance(tmp_path: Path):
+    xml_path = _write_xml(tmp_path / "sheet.xml", ["idle0000", "idle0001"])
+    cache_dir = tmp_path / "cache"
+    original = MetadataCache(cache_dir=str(cache_dir)).parse(str(xml_path))
+    MetadataCache(cache_dir=str(cache_dir)).animation_names(
+        str(xml_path), lambda: {"idle"}, variant="xml"
+    )
+
+    restored_cache = MetadataCache(cache_dir=str(cache_dir))
+    restored = restored_cache.parse(str(xml_path))
+
+    assert restored_cache.hits == 1 and restored_cache.misses == 0
+    assert isinstance(restored.sprites, SpriteTable)
+    assert restored.sprites.to_dicts() == original.sprites.to_dicts()
+    assert restored.parser_name == original.parser_name
+    assert restored_cache.animation_names(
+        str(xml_path), lambda: set(), variant="xml"
+    ) == {"idle"}
+
+
+def test_corrupt_disk_cache_is_replaced_by_a_fresh_parse(tmp_path: Path):
+    xml_path = _write_xml(tmp_path / "sheet.xml", ["idle0000", "idle0001"])
+    cache_dir = tmp_path / "cache"
+    MetadataCache(cache_dir=str(cache_dir)).parse(str(xml_path))
+    (cache_file,) = cache_dir.iterdir()
+    cache_file.write_bytes(cache_file.read_bytes()[:40])
+
+    cache = MetadataCache(cache_dir=str(cache_dir))
+    result = cache.parse(str(xml_path))
+
+    assert len(result.sprites) == 2
+    assert cache.misses == 1
+    assert MetadataCache(cache_dir=str(cache_dir)).parse(str(xml_path)) is not None
+    assert cache_file.stat().st_size > 40
+
+
+def test_concurrent_saves_leave_one_complete_file(tmp_path: Path):
+    xml_path = _write_xml(tmp_path / "sheet.xml", ["idle0000", "idle0001"])
+    cache_dir = tmp_path / "cache"
+    caches = [MetadataCache(cache_dir=str(cache_dir)) for _ in range(8)]
+    threads = [Thread(target=cache.parse, args=[str(xml_path)]) for cache in caches]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert [path.suffix for path in cache_dir.iterdir()] == [".npz"]
+    restored = MetadataCache(cache_dir=str(cache_dir))
+    assert len(restored.parse(str(xml_path)).sprites) == 2
+    assert restored.misses == 0
+
+
+def test_prune_disk_drops_stale_and_oldest_files(tmp_path: Path):
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    now = time.time()
+    for index, age in enumerate([0, 10, 20, 10_000]):
+        path = cache_dir / f"entry{index}.npz"
+        path.write_bytes(b"x" * 100)
+        os.utime(path, (now - age, now - age))
+    (cache_dir / ".entry0.npz.abc.tmp").write_bytes(b"x")
+    os.utime(cache_dir / ".entry0.npz.abc.tmp", (now, now))
+    cache = MetadataCache(cache_dir=str(cache_dir))
+
+    removed = cache.prune_disk(max_bytes=200, max_age=1000)
+
+    assert removed == 3
+    assert sorted(path.name for path in cache_dir.iterdir()) == [
+        "entry0.npz",
+        "entry1.npz",
+    ]
+
+
+def test_lru_limit_evicts_oldest_file(tmp_path: Path):
+    paths = [_write_xml(tmp_path / f"sheet_{i}.xml", ["a0000"]) for i in range(3)]
+    cache = MetadataCache(max_entries=2)
+
+    for path in paths:
+        cache.parse(str(path))
+    cache.parse(str(paths[0]))
+
+    assert len(cache) == 2
+    assert cache.misses == 4
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Tests for multi-page atlases and their lazily decoded pages."""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import sys
+
+import numpy as np
+from PIL import Image
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from core.extractor.animation_processor import AnimationProcessor  # noqa: E402
+from core.extractor.atlas_pages import AtlasPages  # noqa: E402
+from core.extractor.atlas_processor import AtlasProcessor  # noqa: E402
+from core.extractor.metadata_cache import MetadataCache  # noqa: E402
+from core.extractor.sprite_processor import SpriteProcessor  # noqa: E402
+from utils.settings_manager import SettingsManager  # noqa: E402
+
+SPINE_ATLAS = """
+hero.png
+size: 32, 16
+format: RGBA8888
+filter: Linear, Linear
+repeat: none
+idle0000
+  rotate: false
+  xy: 0, 0
+  size: 16, 16
+  orig: 16, 16
+  offset: 0, 0
+  index: -1
+
+hero2.png
+size: 32, 16
+format: RGBA8888
+filter: Linear, Linear
+repeat: none
+idle0001
+  rotate: false
+  xy: 16, 0
+  size: 16, 16
+  orig: 16, 16
+  offset: 0, 0
+  index: -1
+"""
+
+
+def _write_page(path: Path, value: int) -> Path:
+    pixels = np.full((16, 32, 4), value, dtype=np.uint8)
+    pixels[..., 3] = 255
+    Image.fromarray(pixels).save(path)
+    return path
+
+
+def _write_phaser_project(directory: Path, pages: int = 3) -> Path:
+    textures = []
+    for page in range(pages):
+        _write_page(directory / f"sheet-{page}.png", 40 * (page + 1))
+        textures.append(
+            {
+                "image": f"sheet-{page}.png",
+                "frames": [
+                    {
+                        "filename": f"anim{page}{frame:04d}",
+                        "frame": {"x": frame * 16, "y": 0, "w": 16, "h": 16},
+                    }
+                    for frame in range(2)
+                ],
+            }
+        )
+    metadata_path = directory / "sheet.json"
+    metadata_path.write_text(json.dumps({"textures": textures}), encoding="utf-8")
+    return metadata_path
+
+
+def test_spine_page_headers_become_pages(tmp_path: Path):
+    atlas_path = tmp_path / "hero.atlas"
+    atlas_path.write_text(SPINE_ATLAS, encoding="utf-8")
+
+    result = MetadataCache().parse(str(atlas_path))
+
+    assert result.pages == ["hero.png", "hero2.png"]
+    assert result.sprites.names == ["idle0000", "idle0001"]
+    assert [dict(sprite).get("page", 0) for sprite in result.sprites] == [0, 1]
+
+
+def test_pages_are_decoded_on_demand_and_released(tmp_path: Path, monkeypatch):
+    metadata_path = _write_phaser_project(tmp_path)
+    peak_loaded = []
+    original_array = AtlasPages.array
+
+    def tracking_array(self, page):
+        pixels = original_array(self, page)
+        peak_loaded.append(len(self.loaded_pages))
+        return pixels
+
+    monkeypatch.setattr(AtlasPages, "array", tracking_array)
+
+    atlas_processor = AtlasProcessor(
+        str(tmp_path / "sheet-0.png"), str(metadata_path)
+    )
+    pages = atlas_processor.pages
+    assert atlas_processor.atlas is None
+    assert len(pages) == 3 and pages.loaded_pages == []
+
+    settings = SettingsManager()
+    settings.set_global_settings(
+        frame_export=True,
+        frame_format="PNG",
+        animation_export=False,
+        filename_format="Standardized",
+        scale=1.0,
+    )
+    settings.set_animation_settings("sheet-0.png/anim1", frame_export=False)
+    sprite_processor = SpriteProcessor(
+        atlas_processor.atlas,
+        atlas_processor.sprites,
+        owns_atlas=False,
+        pages=pages,
+    )
+    animation_processor = AnimationProcessor(
+        sprite_processor.lazy_animations(),
+        str(tmp_path / "sheet-0.png"),
+        str(tmp_path / "out"),
+        settings,
+        "test",
+    )
+    counts = animation_processor.process_animations()
+
+    assert counts == (4, 0)
+    assert max(peak_loaded) == 1
+    assert pages.loaded_pages == []
+    exported = Image.open(tmp_path / "out" / "anim2" / "sheet-0 - anim20001.png")
+    assert exported.getpixel((0, 0)) == (120, 120, 120, 255)
+
+    animation_processor.dispose()
+    sprite_processor.dispose()
+    atlas_processor.close()
+
+
+def test_sprites_on_missing_pages_are_dropped(tmp_path: Path):
+    metadata_path = _write_phaser_project(tmp_path)
+    (tmp_path / "sheet-1.png").unlink()
+
+    atlas_processor = AtlasProcessor(
+        str(tmp_path / "sheet-0.png"), str(metadata_path)
+    )
+
+    assert [sprite["name"] for sprite in atlas_processor.sprites] == [
+        "anim00000",
+        "anim00001",
+        "anim20000",
+        "anim20001",
+    ]
+    atlas_processor.close()
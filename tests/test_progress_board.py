@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Tests for sampled worker progress during batch extraction."""
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+import pytest
+from PIL import Image
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from core.extractor.extractor import Extractor  # noqa: E402
+from core.extractor.progress_board import ProgressBoard, ProgressTotals  # noqa: E402
+from utils.image_pool import get_image_pool  # noqa: E402
+from utils.settings_manager import SettingsManager  # noqa: E402
+
+
+@pytest.fixture
+def qt_app():
+    """Create a Qt application so worker signals can be delivered."""
+    from PySide6.QtWidgets import QApplication
+
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
+def _write_sheet(directory: Path, name: str, frame_count: int) -> None:
+    Image.new("RGBA", (frame_count * 8, 8), (200, 40, 40, 255)).save(
+        directory / f"{name}.png"
+    )
+    rows = "".join(
+        f'<SubTexture name="walk{frame:04d}" x="{frame * 8}" y="0" '
+        f'width="8" height="8"/>'
+        for frame in range(frame_count)
+    )
+    (directory / f"{name}.xml").write_text(
+        f'<TextureAtlas imagePath="{name}.png">{rows}</TextureAtlas>',
+        encoding="utf-8",
+    )
+
+
+def test_board_sums_worker_slots_and_tracks_latest_file():
+    board = ProgressBoard()
+    first = board.add_worker("Worker 1")
+    second = board.add_worker("Worker 2")
+
+    first.start("a.png")
+    second.start("b.png")
+    first.finish(frames=3, anims=1)
+    first.idle()
+    second.finish(failed=1)
+
+    assert board.totals() == ProgressTotals(files=2, frames=3, anims=1, failed=1)
+    assert board.last_started() == "b.png"
+    assert first.current is None and second.current == "b.png"
+
+
+def test_batch_progress_is_sampled_from_worker_slots(
+    tmp_path: Path, qt_app, monkeypatch
+):
+    input_dir = tmp_path / "in"
+    input_dir.mkdir()
+    for index in range(3):
+        _write_sheet(input_dir, f"sheet{index}", 2 + index)
+    (input_dir / "broken.gif").write_bytes(b"")
+
+    settings = SettingsManager()
+    settings.set_global_settings(
+        frame_export=True,
+        frame_format="PNG",
+        animation_export=False,
+        filename_format="Standardized",
+        scale=1.0,
+    )
+    progress = []
+    statistics = []
+    failures = []
+
+    extractor = Extractor(
+        lambda current, total, status: progress.append((current, total)),
+        "test",
+        settings,
+        statistics_callback=lambda *totals: statistics.append(totals),
+        error_prompt_callback=lambda filename, error: failures.append(filename)
+        or True,
+    )
+    monkeypatch.setattr(extractor, "_resolve_cpu_threads", lambda: 2)
+    extractor.process_directory(
+        str(input_dir),
+        str(tmp_path / "out"),
+        spritesheet_list=[
+            "sheet0.png",
+            "sheet1.png",
+            "broken.gif",
+            "sheet2.png",
+        ],
+    )
+
+    assert failures == ["broken.gif"]
+    assert statistics[-1] == (9, 0, 1)
+    assert progress[-1] == (4, 4)
+    assert len(progress) < 20
+    assert len(list((tmp_path / "out").rglob("*.png"))) == 9
+    assert get_image_pool().cached_bytes == 0
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Tests for debounced config saves and persisted settings overrides."""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import sqlite3
+import sys
+import time
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from utils.app_config import AppConfig  # noqa: E402
+from utils.persistence import DebouncedWriter, OverrideStore  # noqa: E402
+from utils.settings_manager import SettingsManager  # noqa: E402
+
+
+def _stored_rows(path: Path):
+    with sqlite3.connect(path) as connection:
+        return connection.execute(
+            "SELECT scope, kind, name FROM overrides ORDER BY name"
+        ).fetchall()
+
+
+def test_debounced_writer_coalesces_bursts():
+    writes = []
+    writer = DebouncedWriter(lambda: writes.append(time.monotonic()), delay=0.05)
+
+    for _ in range(20):
+        writer.schedule()
+    assert writes == []
+
+    deadline = time.monotonic() + 2
+    while not writes and time.monotonic() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.1)
+    assert len(writes) == 1
+    assert not writer.pending
+
+    writer.schedule()
+    writer.flush()
+    assert len(writes) == 2
+
+
+def test_config_setters_defer_and_replace_the_file(tmp_path: Path):
+    config_path = tmp_path / "app_config.cfg"
+    config = AppConfig(str(config_path))
+    config._writer.delay = 60
+
+    config.set_extraction_defaults(scale=2.0)
+    config.set_language("es")
+    assert json.loads(config_path.read_text())["language"] == "auto"
+
+    config.flush()
+    saved = json.loads(config_path.read_text())
+    assert saved["language"] == "es"
+    assert saved["extraction_defaults"]["scale"] == 2.0
+    assert [path.name for path in tmp_path.iterdir()] == ["app_config.cfg"]
+    assert config.get_overrides_store_path() == str(
+        tmp_path / "settings_overrides.db"
+    )
+
+
+def test_overrides_round_trip_per_folder(tmp_path: Path):
+    store_path = tmp_path / "overrides.db"
+    settings = SettingsManager(store=OverrideStore(str(store_path)))
+    settings.open_scope(str(tmp_path / "mod"))
+    settings.set_spritesheet_settings("bf.png", scale=2.0)
+    settings.set_animation_settings_batch(
+        {f"bf.png/anim{index}": {"fps": index} for index in range(500)}
+    )
+    settings.animation_settings.setdefault("bf.png/anim1", {})["offset"] = [3, 4]
+    settings.delete_animation_settings("bf.png/anim2")
+    settings.open_scope(str(tmp_path / "other"))
+
+    assert settings.animation_settings == {}
+    settings.set_animation_settings("gf.png/idle", fps=12)
+    settings.close_scope()
+    settings.store.close()
+
+    reopened = SettingsManager(store=OverrideStore(str(store_path)))
+    reopened.open_scope(str(tmp_path / "mod"))
+    assert reopened.spritesheet_settings == {"bf.png": {"scale": 2.0}}
+    assert len(reopened.animation_settings) == 499
+    assert reopened.animation_settings["bf.png/anim1"] == {"fps": 1, "offset": [3, 4]}
+    assert reopened.get_settings("bf.png", "bf.png/anim7")["fps"] == 7
+    reopened.open_scope(str(tmp_path / "other"))
+    assert reopened.animation_settings == {"gf.png/idle": {"fps": 12}}
+
+
+def test_only_changed_overrides_are_written(tmp_path: Path, monkeypatch):
+    store = OverrideStore(str(tmp_path / "overrides.db"))
+    settings = SettingsManager(store=store)
+    settings.open_scope(str(tmp_path))
+    settings.set_animation_settings_batch(
+        {f"sheet.png/anim{index}": {"fps": 24} for index in range(1000)}
+    )
+    settings.flush()
+
+    written = []
+    original_write = OverrideStore.write
+
+    def recording_write(self, scope, upserts, deletes=()):
+        upserts, deletes = list(upserts), list(deletes)
+        written.append((upserts, deletes))
+        return original_write(self, scope, upserts, deletes)
+
+    monkeypatch.setattr(OverrideStore, "write", recording_write)
+    settings.set_animation_settings("sheet.png/anim5", fps=12)
+    settings.delete_animation_settings("sheet.png/anim6")
+    settings.flush()
+
+    assert len(written) == 1
+    upserts, deletes = written[0]
+    assert [(kind, name) for kind, name, _ in upserts] == [
+        ("animation", "sheet.png/anim5")
+    ]
+    assert deletes == [("animation", "sheet.png/anim6")]
+    assert len(_stored_rows(tmp_path / "overrides.db")) == 999
+
+
+def test_overrides_outside_a_scope_are_not_persisted(tmp_path: Path):
+    store_path = tmp_path / "overrides.db"
+    settings = SettingsManager(store=OverrideStore(str(store_path)))
+    settings.set_animation_settings("sheet.png/idle", fps=30)
+    settings.flush()
+    assert settings.animation_settings == {"sheet.png/idle": {"fps": 30}}
+
+    settings.open_scope(str(tmp_path))
+    settings.close_scope(clear=False)
+    settings.set_animation_settings("sheet.png/walk", fps=12)
+    settings.flush()
+
+    assert _stored_rows(store_path) == []
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Tests for cached, read-only settings resolution."""
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+import numpy as np
+import pytest
+from PIL import Image
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from core.extractor.animation_processor import AnimationProcessor  # noqa: E402
+from core.extractor.sprite_processor import SpriteProcessor  # noqa: E402
+from utils.settings_manager import SettingsManager  # noqa: E402
+
+
+def _manager() -> SettingsManager:
+    settings = SettingsManager()
+    settings.set_global_settings(fps=24, scale=1.0)
+    settings.set_spritesheet_settings("bf.png", scale=2.0)
+    settings.set_animation_settings("bf.png/idle", fps=12)
+    return settings
+
+
+def test_resolved_settings_are_cached_and_read_only():
+    settings = _manager()
+
+    resolved = settings.get_settings("bf.png", "bf.png/idle")
+
+    assert dict(resolved) == {"fps": 12, "scale": 2.0}
+    assert settings.get_settings("bf.png", "bf.png/idle") is resolved
+    with pytest.raises(TypeError):
+        resolved["fps"] = 30
+    assert settings.get_settings("chars/bf.png", "chars/bf.png/idle") == resolved
+
+
+def test_nested_values_cannot_corrupt_the_cache():
+    settings = _manager()
+    settings.set_animation_settings(
+        "bf.png/idle", indices=[0, 1], alignment_overrides={"frames": {"a": [1, 2]}}
+    )
+
+    resolved = settings.get_settings("bf.png", "bf.png/idle")
+    resolved["indices"].append(5)
+    resolved["alignment_overrides"]["frames"]["a"][0] = 9
+
+    again = settings.get_settings("bf.png", "bf.png/idle")
+    assert again["indices"] == [0, 1]
+    assert again["alignment_overrides"] == {"frames": {"a": [1, 2]}}
+    assert settings.animation_settings["bf.png/idle"]["indices"] == [0, 1]
+    assert settings.get_settings("bf.png") is settings.get_settings("bf.png")
+
+
+@pytest.mark.parametrize(
+    "change, animation_name, key, expected",
+    [
+        (lambda s: s.set_global_settings(loop=True), None, "loop", True),
+        (lambda s: s.global_settings.__setitem__("fps", 30), None, "fps", 30),
+        (
+            lambda s: s.set_spritesheet_settings("bf.png", scale=3.0),
+            "bf.png/idle",
+            "scale",
+            3.0,
+        ),
+        (
+            lambda s: s.set_animation_settings("bf.png/idle", fps=6),
+            "bf.png/idle",
+            "fps",
+            6,
+        ),
+        (
+            lambda s: s.set_animation_settings_batch({"bf.png/idle": {"fps": 6}}),
+            "bf.png/idle",
+            "fps",
+            6,
+        ),
+        (
+            lambda s: s.animation_settings.setdefault("bf.png/idle", {}).update(fps=6),
+            "bf.png/idle",
+            "fps",
+            6,
+        ),
+    ],
+)
+def test_any_change_invalidates_resolved_settings(
+    change, animation_name, key, expected
+):
+    settings = _manager()
+    before = settings.get_settings("bf.png", animation_name)
+
+    change(settings)
+
+    after = settings.get_settings("bf.png", animation_name)
+    assert after is not before
+    assert after[key] == expected
+
+
+def test_deleting_overrides_falls_back_to_lower_tiers():
+    settings = _manager()
+    assert settings.get_settings("bf.png", "bf.png/idle")["fps"] == 12
+
+    settings.delete_animation_settings("bf.png/idle")
+    settings.delete_spritesheet_settings("bf.png")
+
+    assert dict(settings.get_settings("bf.png", "bf.png/idle")) == {
+        "fps": 24,
+        "scale": 1.0,
+    }
+
+
+def test_idle_loop_export_leaves_settings_untouched(tmp_path: Path):
+    atlas = Image.fromarray(
+        np.random.default_rng(3).integers(1, 256, (8, 16, 4), dtype=np.uint8)
+    )
+    sprites = [
+        {"name": f"idle{frame:04d}", "x": frame * 8, "y": 0, "width": 8, "height": 8}
+        for frame in range(2)
+    ]
+    settings = SettingsManager()
+    settings.set_global_settings(
+        animation_export=True,
+        animation_format="APNG",
+        frame_export=False,
+        fnf_idle_loop=True,
+        delay=250,
+        scale=1.0,
+    )
+    processor = AnimationProcessor(
+        SpriteProcessor(atlas, sprites).lazy_animations(),
+        "sheet.png",
+        str(tmp_path),
+        settings,
+        "test",
+    )
+
+    assert processor.process_animations() == (0, 1)
+    processor.dispose()
+    assert settings.get_settings("sheet.png", "sheet.png/idle")["delay"] == 250
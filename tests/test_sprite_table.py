@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Tests for columnar sprite storage and vectorised sprite validation."""
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from parsers.parser_types import (  # noqa: E402
+    ContentError,
+    ParserErrorCode,
+    normalize_sprite,
+    validate_sprites,
+)
+from parsers.sprite_table import SpriteTable  # noqa: E402
+
+RAW_SPRITES = [
+    {"name": "idle0000", "x": "0", "y": 0, "width": 4, "height": 4},
+    {"name": "idle0001", "x": 4, "y": 0, "width": 0, "height": 4},
+    {"x": 8, "y": 0, "width": 4, "height": 4},
+    {"name": "idle0002", "x": "abc", "y": 0, "width": 4, "height": 4},
+    {
+        "name": "walk0000",
+        "x": 0,
+        "y": 4,
+        "width": 4,
+        "height": 2,
+        "frameX": -1,
+        "frameY": -2,
+        "frameWidth": 6,
+        "rotated": True,
+        "pivotX": "0.5",
+    },
+    {"name": "walk0001", "x": 4, "y": 4, "width": 4, "height": 4, "frameX": None},
+]
+
+
+def _normalize_individually(sprites):
+    normalized, failed = [], []
+    for index, sprite in enumerate(sprites):
+        try:
+            normalized.append(normalize_sprite(sprite))
+        except (ContentError, TypeError, ValueError):
+            failed.append(index)
+    return normalized, failed
+
+
+def test_validation_matches_per_sprite_normalization():
+    expected, failed = _normalize_individually(RAW_SPRITES)
+
+    result = validate_sprites(RAW_SPRITES, "sheet.xml")
+
+    assert isinstance(result.sprites, SpriteTable)
+    assert list(result.sprites) == expected
+    assert [error.code for error in result.errors] == [
+        ParserErrorCode.ZERO_DIMENSION,
+        ParserErrorCode.MISSING_REQUIRED_KEY,
+        ParserErrorCode.INVALID_VALUE_TYPE,
+        ParserErrorCode.SPRITE_PARSE_FAILED,
+    ]
+    assert [error.sprite_name for error in result.errors] == [
+        "idle0001",
+        "sprite_2",
+        "idle0002",
+        "walk0001",
+    ]
+    assert len(failed) == result.error_count
+
+
+def test_records_behave_like_sprite_dicts():
+    table = validate_sprites(RAW_SPRITES).sprites
+    record = table[-1]
+
+    assert record["name"] == "walk0000"
+    assert record["frameHeight"] == 2
+    assert record.get("pivotX") == 0.5
+    assert record.get("pivotY") is None
+    assert "pivotY" not in table[0]
+    assert table[0]["name"] is sys.intern("idle0000")
+    assert isinstance(record["x"], int) and isinstance(record["rotated"], bool)
+    assert table.to_dicts()[0] == dict(table[0])
+    assert table.take([1, 0]).names == ["walk0000", "idle0000"]
+    assert table.column("width").tolist() == [4, 4]
+
+
+def test_all_failed_sprites_produce_empty_table_warning():
+    result = validate_sprites([{"name": "a", "width": 0, "height": 0}])
+
+    assert not result.is_valid
+    assert len(result.sprites) == 0
+    assert result.warnings[0].code == ParserErrorCode.EMPTY_SPRITE_LIST
+
+
+def test_sprite_processor_crops_tables_like_dicts():
+    from core.extractor.sprite_processor import SpriteProcessor
+    from PIL import Image
+
+    pixels = np.arange(8 * 8 * 4, dtype=np.uint8).reshape(8, 8, 4)
+    atlas = Image.fromarray(pixels, "RGBA")
+    table = validate_sprites(RAW_SPRITES).sprites
+
+    from_table = SpriteProcessor(atlas, table, owns_atlas=False)
+    from_dicts = SpriteProcessor(atlas, table.to_dicts(), owns_atlas=False)
+    table_groups = from_table.process_sprites()
+    dict_groups = from_dicts.process_sprites()
+
+    assert list(table_groups) == list(dict_groups) == ["idle", "walk"]
+    for name in table_groups:
+        for left, right in zip(table_groups[name], dict_groups[name]):
+            assert left[0] == right[0]
+            assert left[2] == right[2]
+            assert np.array_equal(left[1], right[1])
+    assert from_table.match_animation_sprites("walk").names == ["walk0000"]
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Tests for input-folder spritesheet discovery."""
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+import sys
+import time
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from core.extractor.spritesheet_scanner import SpritesheetScanner  # noqa: E402
+
+ANIMATION_DOCUMENT = {
+    "AN": {"N": "scene", "TL": {"L": []}},
+    "SD": {"S": []},
+    "MD": {"FRT": 24},
+}
+
+
+def _touch(path: Path, text: str = "x") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def _age_directories(root: Path) -> None:
+    """Backdate directory mtimes so their listings are cacheable."""
+    past = time.time() - 60
+    for directory, subdirectories, _files in os.walk(root):
+        os.utime(directory, (past, past))
+
+
+def _build_tree(root: Path) -> None:
+    for name in ("b.png", "a.png", "a.xml", "b.txt", "b.json", "c.webp"):
+        _touch(root / name)
+    for folder in ("anim", "plain"):
+        _touch(root / folder / "sheet.png")
+    _touch(root / "anim" / "sheet.json", "{}")
+    _touch(root / "anim" / "Animation.json", json.dumps(ANIMATION_DOCUMENT))
+
+
+def test_scan_matches_companions_and_nested_spritemaps(tmp_path: Path):
+    _build_tree(tmp_path)
+
+    entries = list(SpritesheetScanner().scan(str(tmp_path)))
+
+    assert [entry.display_name for entry in entries] == [
+        "a.png",
+        "b.png",
+        "c.webp",
+        "anim/sheet.png",
+    ]
+    assert entries[0].data_files == {"xml": str(tmp_path / "a.xml")}
+    assert entries[1].data_files == {
+        "txt": str(tmp_path / "b.txt"),
+        "json": str(tmp_path / "b.json"),
+    }
+    spritemap = entries[3].data_files["spritemap"]
+    assert spritemap["animation_json"] == str(tmp_path / "anim" / "Animation.json")
+    assert spritemap["symbol_map"] == {}
+
+
+def test_rescan_reuses_unchanged_listings(tmp_path: Path):
+    _build_tree(tmp_path)
+    _age_directories(tmp_path)
+    scanner = SpritesheetScanner()
+
+    list(scanner.scan(str(tmp_path)))
+    first_reads = scanner.listings_read
+    list(scanner.scan(str(tmp_path)))
+    assert scanner.listings_read == first_reads
+
+    _touch(tmp_path / "d.png")
+    entries = list(scanner.scan(str(tmp_path)))
+    assert scanner.listings_read == first_reads + 1
+    assert "d.png" in [entry.display_name for entry in entries]
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Cold-start import checks for the GUI entry point.
+
+Imports ``Main`` and the startup tab in a fresh interpreter with
+``-X importtime``, then checks that modules meant to load on first use stay
+unloaded and that the import time stays within budget. The budget can be
+raised on slow machines with ``STARTUP_IMPORT_BUDGET_MS``.
+"""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import subprocess
+import sys
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+SRC_DIR = PROJECT_ROOT / "src"
+
+STARTUP_IMPORTS = "import Main, gui.extract_tab_widget"
+STARTUP_MODULES = ("Main", "gui.extract_tab_widget")
+DEFERRED_MODULES = (
+    "wand",
+    "numpy",
+    "requests",
+    "core.extractor.extractor",
+    "core.extractor.spritemap.renderer",
+    "core.generator",
+    "gui.editor_tab_widget",
+    "gui.generate_tab_widget",
+    "gui.help_window",
+    "gui.settings_window",
+    "utils.update_checker",
+    "utils.FNF.character_data",
+)
+IMPORT_BUDGET_MS = int(os.environ.get("STARTUP_IMPORT_BUDGET_MS", "1500"))
+
+
+def _fake_magick(directory: Path) -> None:
+    """Satisfy the import-time ImageMagick check without its error dialog.
+
+    The check only looks for a ``magick`` executable on ``PATH``.
+    """
+    script = directory / "magick"
+    script.write_text("#!/bin/sh\nexit 0\n", encoding="utf-8")
+    script.chmod(0o755)
+    (directory / "magick.bat").write_text("@exit /b 0\n", encoding="utf-8")
+
+
+def _import_profile(tmp_path: Path):
+    _fake_magick(tmp_path)
+    env = dict(os.environ)
+    env["PATH"] = str(tmp_path) + os.pathsep + env.get("PATH", "")
+    env["PYTHONPATH"] = str(SRC_DIR)
+    env["QT_QPA_PLATFORM"] = "offscreen"
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", STARTUP_IMPORTS],
+        cwd=SRC_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert completed.returncode == 0, completed.stderr[-2000:]
+
+    cumulative_us = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        try:
+            cumulative_us[name.strip()] = int(cumulative)
+        except ValueError:
+            continue
+    return cumulative_us
+
+
+def test_startup_defers_heavy_modules_and_stays_in_budget(tmp_path: Path):
+    pytest.importorskip("PySide6")
+
+    profile = _import_profile(tmp_path)
+
+    assert [name for name in DEFERRED_MODULES if name in profile] == []
+    startup_ms = sum(profile[name] for name in STARTUP_MODULES) / 1000
+    assert startup_ms <= IMPORT_BUDGET_MS, (
+        f"Startup imports took {startup_ms:.0f} ms "
+        f"(budget {IMPORT_BUDGET_MS} ms)"
+    )
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Tests for background detection and keying on unknown spritesheets."""
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+import threading
+
+import numpy as np
+from PIL import Image
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from parsers.unknown_parser import UnknownParser  # noqa: E402
+
+
+def _sheet() -> Image.Image:
+    pixels = np.zeros((40, 60, 4), dtype=np.uint8)
+    pixels[..., :3] = (250, 0, 250)
+    pixels[..., 3] = 255
+    pixels[10:20, 10:30, :3] = (5, 255, 5)
+    pixels[0, :8, :3] = (0, 0, 0)
+    return Image.fromarray(pixels)
+
+
+def test_edge_histograms_find_background_colors():
+    image = _sheet()
+
+    assert UnknownParser._detect_background_color(image) == (250, 0, 250)
+    # The black top-left corner is weighted like the other corners.
+    assert UnknownParser._detect_background_colors(image, max_colors=3) == [
+        (250, 0, 250),
+        (0, 0, 0),
+    ]
+    assert not UnknownParser._has_transparency(image)
+
+
+def test_keying_only_clears_matching_pixels():
+    keyed = np.asarray(UnknownParser._apply_color_keying(_sheet(), (250, 0, 250)))
+
+    assert keyed[5, 40, 3] == 0
+    # Far from the key on every channel; must not match through uint8 wraparound.
+    assert keyed[15, 15, 3] == 255
+    assert keyed[0, 0, 3] == 255
+    assert UnknownParser._has_transparency(Image.fromarray(keyed))
+
+
+def test_worker_threads_use_recorded_or_default_choice(tmp_path: Path):
+    keyed_path = str(tmp_path / "keyed.png")
+    UnknownParser.set_background_choices({keyed_path: UnknownParser.KEY_BACKGROUND})
+    decisions = {}
+
+    def decide():
+        decisions["keyed"] = UnknownParser._should_apply_color_keying(
+            (250, 0, 250), None, keyed_path
+        )
+        decisions["other"] = UnknownParser._should_apply_color_keying(
+            (250, 0, 250), None, str(tmp_path / "other.png")
+        )
+
+    try:
+        thread = threading.Thread(target=decide)
+        thread.start()
+        thread.join(5)
+    finally:
+        UnknownParser.clear_background_choices()
+
+    assert decisions == {"keyed": True, "other": False}
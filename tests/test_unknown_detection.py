@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Tests for cached and cancellable detection on metadata-less sheets."""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from threading import Event
+import sys
+
+import numpy as np
+import pytest
+from PIL import Image
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from parsers.unknown_parser import DetectionCancelled, UnknownParser  # noqa: E402
+
+
+def _write_sheet(path: Path, blobs: int = 2) -> Path:
+    pixels = np.zeros((40, 60, 4), dtype=np.uint8)
+    for index in range(blobs):
+        pixels[3:20, 3 + index * 20 : 15 + index * 20] = 255
+    Image.fromarray(pixels).save(path)
+    return path
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    UnknownParser.clear_detection_cache()
+    yield
+    UnknownParser.clear_detection_cache()
+
+
+@pytest.fixture
+def detection_calls(monkeypatch):
+    calls = []
+    original = UnknownParser._find_sprites_in_image
+
+    def counting(image, cancel_event=None):
+        calls.append(1)
+        return original(image, cancel_event)
+
+    monkeypatch.setattr(UnknownParser, "_find_sprites_in_image", counting)
+    return calls
+
+
+def test_detection_is_reused_until_the_file_changes(tmp_path, detection_calls):
+    sheet = _write_sheet(tmp_path / "sheet.png")
+
+    _, first = UnknownParser.parse_unknown_image(str(sheet))
+    first[0]["x"] = -1
+    _, second = UnknownParser.parse_unknown_image(str(sheet))
+
+    assert len(detection_calls) == 1
+    assert len(second) == 2 and second[0]["x"] == 3
+
+    _write_sheet(sheet, blobs=3)
+    stat = sheet.stat()
+    os.utime(sheet, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    _, third = UnknownParser.parse_unknown_image(str(sheet))
+
+    assert len(detection_calls) == 2
+    assert len(third) == 3
+
+
+def test_cancelled_detection_raises_and_is_not_cached(tmp_path, detection_calls):
+    sheet = _write_sheet(tmp_path / "sheet.png")
+    cancel_event = Event()
+    cancel_event.set()
+    parser = UnknownParser(str(tmp_path), sheet.name, cancel_event=cancel_event)
+
+    with pytest.raises(DetectionCancelled):
+        parser.get_data()
+
+    names = UnknownParser(str(tmp_path), sheet.name).get_data()
+
+    assert names == {"sprite_001", "sprite_002"}
+    assert len(detection_calls) == 2
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Tests for grid-layout detection on metadata-less spritesheets."""
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+from threading import Event
+
+import numpy as np
+import pytest
+from PIL import Image
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from parsers.unknown_parser import DetectionCancelled, UnknownParser  # noqa: E402
+
+
+def _grid_sheet(columns=4, rows=3, cell=32, empty_tail=1) -> Image.Image:
+    pixels = np.zeros((rows * cell, columns * cell, 4), dtype=np.uint8)
+    for row in range(rows):
+        for column in range(columns):
+            if row == rows - 1 and column >= columns - empty_tail:
+                continue
+            x, y = column * cell, row * cell
+            pixels[y + 4 : y + 28, x + 12 : x + 22] = 255
+            # Detached fragment inside the same cell, like a separate limb.
+            pixels[y + 6 : y + 9, x + 3 : x + 7] = 255
+    return Image.fromarray(pixels)
+
+
+def test_grid_sheet_yields_cell_ordered_frames():
+    sprites = UnknownParser._find_sprites_in_image(_grid_sheet())
+
+    assert len(sprites) == 11
+    assert {(s["width"], s["height"]) for s in sprites} == {(32, 32)}
+    assert [(s["x"], s["y"]) for s in sprites[:5]] == [
+        (0, 0),
+        (32, 0),
+        (64, 0),
+        (96, 0),
+        (0, 32),
+    ]
+    assert sprites[-1]["name"] == "sprite_011"
+
+
+def test_irregular_sheet_falls_back_to_regions():
+    pixels = np.zeros((40, 50, 4), dtype=np.uint8)
+    pixels[2:23, 3:30] = 255
+    pixels[25:38, 33:47] = 255
+    pixels[5:15, 30:45] = 255
+
+    sprites = UnknownParser._find_sprites_in_image(Image.fromarray(pixels))
+
+    assert UnknownParser._find_grid_sprites(np.asarray(pixels)[..., 3] > 0) == []
+    assert len(sprites) == 2
+
+
+def test_cells_holding_several_sprites_fall_back_to_regions():
+    # Two sprites side by side above a third: the only pitch that fits the
+    # columns is the full width, which would merge the top pair.
+    pixels = np.zeros((100, 60, 4), dtype=np.uint8)
+    pixels[5:45, 3:27] = 255
+    pixels[5:45, 33:57] = 255
+    pixels[55:95, 15:45] = 255
+
+    sprites = UnknownParser._find_sprites_in_image(Image.fromarray(pixels))
+
+    assert UnknownParser._find_grid_sprites(pixels[..., 3] > 0) == []
+    assert [(s["x"], s["y"], s["width"], s["height"]) for s in sprites] == [
+        (3, 5, 24, 40),
+        (33, 5, 24, 40),
+        (15, 55, 30, 40),
+    ]
+
+
+def test_single_row_strip_is_a_grid():
+    sprites = UnknownParser._find_sprites_in_image(_grid_sheet(rows=1, empty_tail=0))
+
+    assert [(s["x"], s["width"], s["height"]) for s in sprites] == [
+        (0, 32, 32),
+        (32, 32, 32),
+        (64, 32, 32),
+        (96, 32, 32),
+    ]
+
+
+def test_single_cell_is_not_a_grid():
+    pixels = np.zeros((40, 40), dtype=bool)
+    pixels[4:36, 4:36] = True
+
+    assert UnknownParser._find_grid_sprites(pixels) == []
+
+
+class _EventSetAfter(Event):
+    """Event that reports itself set after a number of checks."""
+
+    def __init__(self, checks: int):
+        super().__init__()
+        self.checks = checks
+
+    def is_set(self) -> bool:
+        self.checks -= 1
+        return self.checks < 0
+
+
+def test_cancel_interrupts_grid_detection():
+    cancel_event = _EventSetAfter(checks=10)
+
+    with pytest.raises(DetectionCancelled):
+        UnknownParser._find_sprites_in_image(_grid_sheet(), cancel_event)
+
+    # Stopped at the eleventh check, while the 96 rows were being labelled.
+    assert cancel_event.checks == -1
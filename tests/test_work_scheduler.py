@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Tests for cost-aware extraction queue scheduling."""
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+from PIL import Image
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from core.extractor.work_scheduler import (  # noqa: E402
+    DEFAULT_SECONDS_PER_UNIT,
+    CostCalibration,
+    FileCost,
+    build_schedule_report,
+    estimate_file_cost,
+    predict_makespan,
+    schedule_longest_first,
+)
+
+SETTINGS = {
+    "frame_export": True,
+    "frame_format": "PNG",
+    "animation_export": True,
+    "animation_format": "GIF",
+    "scale": 1.0,
+}
+
+
+def _sheet(tmp_path: Path, name: str, size, animations: int) -> Path:
+    atlas = tmp_path / f"{name}.png"
+    Image.new("RGBA", size).save(atlas)
+    entries = "".join(
+        f'<SubTexture name="anim{index} {frame:04d}"/>'
+        for index in range(animations)
+        for frame in range(3)
+    )
+    (tmp_path / f"{name}.xml").write_text(
+        f"<TextureAtlas>{entries}</TextureAtlas>", encoding="utf-8"
+    )
+    return atlas
+
+
+def test_estimate_counts_sprites_animations_and_formats(tmp_path: Path):
+    atlas = _sheet(tmp_path, "sheet", (200, 100), animations=4)
+    metadata = str(tmp_path / "sheet.xml")
+
+    cost = estimate_file_cost("sheet.png", str(atlas), metadata, SETTINGS)
+    frames_only = estimate_file_cost(
+        "sheet.png",
+        str(atlas),
+        metadata,
+        dict(SETTINGS, animation_export=False),
+    )
+
+    assert (cost.pixels, cost.sprite_count, cost.animation_count) == (20000, 12, 4)
+    assert cost.output_weight == 4.0
+    assert frames_only.cost < cost.cost
+
+
+def test_large_atlases_are_scheduled_first(tmp_path: Path):
+    costs = []
+    for name, size in (("small", (64, 64)), ("huge", (2048, 2048)), ("mid", (512, 512))):
+        atlas = _sheet(tmp_path, name, size, animations=2)
+        costs.append(
+            estimate_file_cost(
+                f"{name}.png", str(atlas), str(tmp_path / f"{name}.xml"), SETTINGS
+            )
+        )
+
+    ordered = [item.filename for item in schedule_longest_first(costs)]
+
+    assert ordered == ["huge.png", "mid.png", "small.png"]
+
+
+def test_longest_first_shortens_predicted_makespan():
+    jobs = [1.0] * 6 + [6.0]
+
+    assert predict_makespan(jobs, 3) == 8.0
+    assert predict_makespan(sorted(jobs, reverse=True), 3) == 6.0
+
+
+def test_spritemaps_stay_last_without_memory_admission():
+    costs = [
+        FileCost("project.png", cost=50.0, is_spritemap=True),
+        FileCost("small.png", cost=1.0),
+        FileCost("large.png", cost=10.0),
+    ]
+
+    assert [item.filename for item in schedule_longest_first(costs)] == [
+        "project.png",
+        "large.png",
+        "small.png",
+    ]
+    ordered = schedule_longest_first(costs, spritemaps_last=True)
+    assert [item.filename for item in ordered] == [
+        "large.png",
+        "small.png",
+        "project.png",
+    ]
+
+
+def test_report_predicts_with_calibration_from_earlier_runs():
+    costs = [FileCost("a", cost=4.0), FileCost("b", cost=2.0), FileCost("c", cost=2.0)]
+    durations = {"a": 2.0, "b": 1.0, "c": 1.0}
+
+    report = build_schedule_report(costs, durations, 2, 2.1, seconds_per_unit=1.0)
+
+    assert report.seconds_per_unit == 1.0
+    assert report.measured_seconds_per_unit == 0.5
+    assert report.predicted_makespan == 4.0
+    assert report.ideal_makespan == 2.0
+    assert build_schedule_report(costs, {}, 2, 1.0, seconds_per_unit=1.0) is None
+
+
+def test_calibration_learns_from_finished_runs():
+    calibration = CostCalibration()
+    costs = [FileCost("a", cost=4.0), FileCost("b", cost=2.0)]
+
+    calibration.update(costs, {})
+    assert calibration.seconds_per_unit == DEFAULT_SECONDS_PER_UNIT
+
+    calibration.update(costs, {"a": 4.0, "b": 2.0})
+    assert calibration.seconds_per_unit == 1.0
+    calibration.update(costs, {"a": 2.0, "b": 1.0})
+    assert calibration.seconds_per_unit == 0.75
+    assert calibration.runs == 2